@@ -9,6 +9,10 @@ __all__.extend(graph.__all__)
 from . import algorithms
 from . import adjacency_list
 from . import adjacency_matrix
+from . import compressed_sparse_row
+from . import shortest_path_engine
+from . import dynamic_topological_order
+from . import edgelist
 
 from .algorithms import (
     breadth_first_search,
@@ -17,12 +21,31 @@ from .algorithms import (
     minimum_spanning_tree_parallel,
     strongly_connected_components,
     depth_first_search,
+    iter_bfs,
+    iter_dfs,
     shortest_paths,
     all_pair_shortest_paths,
     topological_sort,
     topological_sort_parallel,
     max_flow,
-    find_bridges
+    find_bridges,
+    find_articulation_points,
+    biconnected_components
 )
 
 __all__.extend(algorithms.__all__)
+
+from .shortest_path_engine import (
+    ShortestPathEngine
+)
+__all__.extend(shortest_path_engine.__all__)
+
+from .dynamic_topological_order import (
+    DynamicTopologicalOrder
+)
+__all__.extend(dynamic_topological_order.__all__)
+
+from .edgelist import (
+    read_edgelist
+)
+__all__.extend(edgelist.__all__)
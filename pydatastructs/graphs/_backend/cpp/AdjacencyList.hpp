@@ -5,10 +5,13 @@
 #include <Python.h>
 #include <vector>
 #include <unordered_map>
+#include <unordered_set>
 #include <string>
 #include <algorithm>
 #include "AdjacencyListGraphNode.hpp"
 #include "GraphEdge.hpp"
+#include "SequenceReader.hpp"
+#include "TypedArray.hpp"
 #include "../../../utils/_backend/cpp/utils.hpp"
 
 extern PyTypeObject AdjacencyListGraphType;
@@ -18,12 +21,19 @@ typedef struct {
     PyObject_HEAD
     PyObject* dict;
     std::vector<AdjacencyListGraphNode *> nodes;
-    std::unordered_map<std::string, GraphEdge*> edges;
+    std::unordered_map<int64_t, GraphEdge*> edges;
     std::unordered_map<std::string, AdjacencyListGraphNode*> node_map;
     std::unordered_map<int, AdjacencyListGraphNode*> id_map;
     std::unordered_map<int, std::string> id_to_name;
     std::unordered_map<std::string, int> name_to_id;
     int next_id;
+    // Numbers of edges ending at every vertex, by id. The numbers
+    // of edges starting at them are the sizes of their adjacency.
+    std::vector<int64_t> in_degrees;
+    // Ids of the sources of the incoming edges of every vertex,
+    // kept only if track_in is set.
+    bool track_in;
+    std::unordered_map<int, std::unordered_set<int>> in_neighbors;
 
 } AdjacencyListGraph;
 
@@ -43,22 +53,52 @@ static void AdjacencyListGraph_dealloc(AdjacencyListGraph* self) {
     self->id_to_name.clear();
     self->name_to_id.clear();
 
+    using in_map = std::unordered_map<int, std::unordered_set<int>>;
+    using degree_vector = std::vector<int64_t>;
+    self->in_neighbors.~in_map();
+    self->in_degrees.~degree_vector();
+
     Py_TYPE(self)->tp_free(reinterpret_cast<PyObject*>(self));
 }
 
+// Adds the node to the graph and returns its id. The internal_id
+// of a node is overwritten whenever it's added to another graph, so
+// the ids of the vertices are always read from the maps of the graph.
+static int AdjacencyListGraph_insert_node(AdjacencyListGraph* self, AdjacencyListGraphNode* node) {
+    int id = self->next_id++;
+    node->internal_id = id;
+
+    Py_INCREF(node);
+    self->nodes.push_back(node);
+    self->node_map[node->name] = node;
+    self->id_map[id] = node;
+    self->id_to_name[id] = node->name;
+    self->name_to_id[node->name] = id;
+    self->in_degrees.push_back(0);
+    return id;
+}
+
+static int AdjacencyListGraph_id(AdjacencyListGraph* self, AdjacencyListGraphNode* node) {
+    return self->name_to_id.find(node->name)->second;
+}
+
 static PyObject* AdjacencyListGraph_new(PyTypeObject* type, PyObject* args, PyObject* kwds) {
     AdjacencyListGraph* self = reinterpret_cast<AdjacencyListGraph*>(type->tp_alloc(type, 0));
     if (!self)
         return NULL;
 
     new (&self->nodes) std::vector<AdjacencyListGraphNode*>();
-    new (&self->edges) std::unordered_map<std::string, GraphEdge*>();
+    new (&self->edges) std::unordered_map<int64_t, GraphEdge*>();
     new (&self->node_map) std::unordered_map<std::string, AdjacencyListGraphNode*>();
     new (&self->id_map) std::unordered_map<int, AdjacencyListGraphNode*>();
     new (&self->id_to_name) std::unordered_map<int, std::string>();
     new (&self->name_to_id) std::unordered_map<std::string, int>();
+    new (&self->in_neighbors) std::unordered_map<int, std::unordered_set<int>>();
+    new (&self->in_degrees) std::vector<int64_t>();
 
     self->next_id = 0;
+    PyObject* track_in = kwds ? PyDict_GetItemString(kwds, "in_neighbors") : NULL;
+    self->track_in = track_in && PyObject_IsTrue(track_in);
 
     Py_ssize_t num_args = PyTuple_Size(args);
     for (Py_ssize_t i = 0; i < num_args; ++i) {
@@ -74,14 +114,7 @@ static PyObject* AdjacencyListGraph_new(PyTypeObject* type, PyObject* args, PyOb
             return NULL;
         }
 
-        node->internal_id = self->next_id++;
-
-        Py_INCREF(node);
-        self->nodes.push_back(node);
-        self->node_map[node->name] = node;
-        self->id_map[node->internal_id] = node;
-        self->id_to_name[node->internal_id] = node->name;
-        self->name_to_id[node->name] = node->internal_id;
+        AdjacencyListGraph_insert_node(self, node);
     }
 
     PyObject* impl_str = PyUnicode_FromString("adjacency_list");
@@ -95,8 +128,17 @@ static PyObject* AdjacencyListGraph_new(PyTypeObject* type, PyObject* args, PyOb
     return reinterpret_cast<PyObject*>(self);
 }
 
-static std::string make_edge_key(const std::string& source, const std::string& target) {
-    return source + "_" + target;
+// Edges are keyed by the internal ids of their end points.
+static int64_t make_edge_key(int source_id, int target_id) {
+    return (static_cast<int64_t>(source_id) << 32) | static_cast<uint32_t>(target_id);
+}
+
+static int edge_key_source(int64_t key) {
+    return static_cast<int>(key >> 32);
+}
+
+static int edge_key_target(int64_t key) {
+    return static_cast<int>(static_cast<uint32_t>(key));
 }
 
 static PyObject* AdjacencyListGraph_add_vertex(AdjacencyListGraph* self, PyObject* args) {
@@ -119,15 +161,39 @@ static PyObject* AdjacencyListGraph_add_vertex(AdjacencyListGraph* self, PyObjec
         return NULL;
     }
 
-    node->internal_id = self->next_id++;
+    AdjacencyListGraph_insert_node(self, node);
 
-    Py_INCREF(node);
-    self->nodes.push_back(node);
-    self->node_map[node->name] = node;
-    self->id_map[node->internal_id] = node;
-    self->id_to_name[node->internal_id] = node->name;
-    self->name_to_id[node->name] = node->internal_id;
+    Py_RETURN_NONE;
+}
+
+static PyObject* AdjacencyListGraph_add_vertices_from(AdjacencyListGraph* self, PyObject* args) {
+    PyObject* names_obj;
+    if (!PyArg_ParseTuple(args, "O", &names_obj))
+        return NULL;
+
+    SequenceReader names;
+    if (SequenceReader_open(&names, names_obj) < 0)
+        return NULL;
+
+    std::string name;
+    for (Py_ssize_t i = 0; i < names.size; i++) {
+        if (SequenceReader_name(&names, i, name) < 0) {
+            SequenceReader_close(&names);
+            return NULL;
+        }
+        if (self->node_map.find(name) != self->node_map.end())
+            continue;
+
+        PyObject* node_obj = PyObject_CallFunction(reinterpret_cast<PyObject*>(&AdjacencyListGraphNodeType), "s", name.c_str());
+        if (!node_obj) {
+            SequenceReader_close(&names);
+            return NULL;
+        }
+        AdjacencyListGraph_insert_node(self, reinterpret_cast<AdjacencyListGraphNode*>(node_obj));
+        Py_DECREF(node_obj);
+    }
 
+    SequenceReader_close(&names);
     Py_RETURN_NONE;
 }
 
@@ -185,6 +251,92 @@ static PyObject* AdjacencyListGraph_neighbors(AdjacencyListGraph* self, PyObject
     return neighbors_list;
 }
 
+// Calls visit for every vertex with an edge to the one with the
+// given id, read from the in-neighbor sets if they are kept,
+// otherwise found by scanning every vertex.
+template <typename Visit>
+static void AdjacencyListGraph_sources(AdjacencyListGraph* self, int id, Visit visit) {
+    if (self->track_in) {
+        auto it = self->in_neighbors.find(id);
+        if (it == self->in_neighbors.end())
+            return;
+        for (int source_id : it->second)
+            visit(self->id_map[source_id]);
+        return;
+    }
+    const std::string& name = self->id_to_name[id];
+    for (AdjacencyListGraphNode* node : self->nodes)
+        if (node->adjacent.find(name) != node->adjacent.end())
+            visit(node);
+}
+
+static PyObject* AdjacencyListGraph_predecessors(AdjacencyListGraph* self, PyObject* args) {
+    const char* node_name_c;
+    if (!PyArg_ParseTuple(args, "s", &node_name_c))
+        return NULL;
+
+    auto it = self->name_to_id.find(node_name_c);
+    if (it == self->name_to_id.end()) {
+        PyErr_SetString(PyExc_KeyError, "Node not found");
+        return NULL;
+    }
+
+    PyObject* predecessors_list = PyList_New(0);
+    if (!predecessors_list) return NULL;
+
+    bool failed = false;
+    AdjacencyListGraph_sources(self, it->second, [&](AdjacencyListGraphNode* node) {
+        if (!failed && PyList_Append(predecessors_list, reinterpret_cast<PyObject*>(node)) < 0)
+            failed = true;
+    });
+    if (failed) {
+        Py_DECREF(predecessors_list);
+        return NULL;
+    }
+    return predecessors_list;
+}
+
+static PyObject* AdjacencyListGraph_in_degree(AdjacencyListGraph* self, PyObject* args) {
+    const char* node_name_c;
+    if (!PyArg_ParseTuple(args, "s", &node_name_c))
+        return NULL;
+
+    auto it = self->name_to_id.find(node_name_c);
+    if (it == self->name_to_id.end()) {
+        PyErr_SetString(PyExc_KeyError, "Node not found");
+        return NULL;
+    }
+
+    return PyLong_FromLongLong(self->in_degrees[it->second]);
+}
+
+static PyObject* AdjacencyListGraph_degree(AdjacencyListGraph* self, PyObject* args) {
+    const char* node_name_c;
+    if (!PyArg_ParseTuple(args, "s", &node_name_c))
+        return NULL;
+
+    auto it = self->node_map.find(node_name_c);
+    if (it == self->node_map.end()) {
+        PyErr_SetString(PyExc_KeyError, "Node not found");
+        return NULL;
+    }
+    return PyLong_FromSize_t(it->second->adjacent.size());
+}
+
+static PyObject* AdjacencyListGraph_degrees(AdjacencyListGraph* self, PyObject* args, PyObject* kwds) {
+    int incoming = 0;
+    static const char* kwlist[] = {"incoming", NULL};
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "|p", const_cast<char**>(kwlist), &incoming))
+        return NULL;
+
+    std::vector<int64_t> degrees;
+    degrees.reserve(self->nodes.size());
+    for (AdjacencyListGraphNode* node : self->nodes)
+        degrees.push_back(incoming ? self->in_degrees[AdjacencyListGraph_id(self, node)]
+                                   : static_cast<int64_t>(node->adjacent.size()));
+    return int64_array(degrees);
+}
+
 static PyObject* AdjacencyListGraph_remove_vertex(AdjacencyListGraph* self, PyObject* args) {
     const char* name_c;
     if (!PyArg_ParseTuple(args, "s", &name_c))
@@ -208,31 +360,67 @@ static PyObject* AdjacencyListGraph_remove_vertex(AdjacencyListGraph* self, PyOb
     self->name_to_id.erase(name);
     self->id_to_name.erase(id);
 
-    Py_XDECREF(node_to_remove);
-
-    for (auto& node_pair : self->id_map) {
-        AdjacencyListGraphNode* node = node_pair.second;
-        auto adj_it = node->adjacent.find(name);
-        if (adj_it != node->adjacent.end()) {
-            Py_XDECREF(adj_it->second);
-            node->adjacent.erase(adj_it);
+    auto erase_edge = [self](int64_t key) {
+        auto edge_it = self->edges.find(key);
+        if (edge_it != self->edges.end()) {
+            Py_XDECREF(edge_it->second);
+            self->edges.erase(edge_it);
+        }
+    };
+
+    for (const auto& adj_pair : node_to_remove->adjacent) {
+        auto target_it = self->name_to_id.find(adj_pair.first);
+        if (target_it == self->name_to_id.end())
+            continue;
+        self->in_degrees[target_it->second]--;
+        if (self->track_in) {
+            erase_edge(make_edge_key(id, target_it->second));
+            self->in_neighbors[target_it->second].erase(id);
         }
     }
+    self->in_degrees[id] = 0;
+
+    if (self->track_in) {
+        // Only the edges at the vertex are visited, the incoming
+        // ones being read from the in-neighbor sets.
+        erase_edge(make_edge_key(id, id));
+        auto in_it = self->in_neighbors.find(id);
+        if (in_it != self->in_neighbors.end()) {
+            for (int source_id : in_it->second) {
+                auto source_it = self->id_map.find(source_id);
+                if (source_id == id || source_it == self->id_map.end())
+                    continue;
+                AdjacencyListGraphNode* node = source_it->second;
+                auto adj_it = node->adjacent.find(name);
+                if (adj_it != node->adjacent.end()) {
+                    Py_XDECREF(adj_it->second);
+                    node->adjacent.erase(adj_it);
+                }
+                erase_edge(make_edge_key(source_id, id));
+            }
+            self->in_neighbors.erase(in_it);
+        }
+    } else {
+        for (auto& node_pair : self->id_map) {
+            AdjacencyListGraphNode* node = node_pair.second;
+            auto adj_it = node->adjacent.find(name);
+            if (adj_it != node->adjacent.end()) {
+                Py_XDECREF(adj_it->second);
+                node->adjacent.erase(adj_it);
+            }
+        }
 
-    for (auto it = self->edges.begin(); it != self->edges.end(); ) {
-        const std::string& key = it->first;
-        size_t underscore = key.find('_');
-        std::string src = key.substr(0, underscore);
-        std::string dst = key.substr(underscore + 1);
-
-        if (src == name || dst == name) {
-            Py_XDECREF(it->second);
-            it = self->edges.erase(it);
-        } else {
-            ++it;
+        for (auto it = self->edges.begin(); it != self->edges.end(); ) {
+            if (edge_key_source(it->first) == id || edge_key_target(it->first) == id) {
+                Py_XDECREF(it->second);
+                it = self->edges.erase(it);
+            } else {
+                ++it;
+            }
         }
     }
 
+    Py_XDECREF(node_to_remove);
     Py_RETURN_NONE;
 }
 
@@ -243,8 +431,12 @@ static PyObject* AdjacencyListGraph_get_edge(AdjacencyListGraph* self, PyObject*
     if (!PyArg_ParseTuple(args, "ss", &source_c, &target_c))
         return NULL;
 
-    std::string key = make_edge_key(source_c, target_c);
-    auto it = self->edges.find(key);
+    auto it_source = self->name_to_id.find(source_c);
+    auto it_target = self->name_to_id.find(target_c);
+    if (it_source == self->name_to_id.end() || it_target == self->name_to_id.end())
+        Py_RETURN_NONE;
+
+    auto it = self->edges.find(make_edge_key(it_source->second, it_target->second));
     if (it != self->edges.end()) {
         Py_INCREF(it->second);
         return reinterpret_cast<PyObject*>(it->second);
@@ -262,22 +454,26 @@ static PyObject* AdjacencyListGraph_remove_edge(AdjacencyListGraph* self, PyObje
     std::string source(source_c);
     std::string target(target_c);
 
-    auto it_source = self->node_map.find(source);
-    auto it_target = self->node_map.find(target);
-    if (it_source == self->node_map.end() || it_target == self->node_map.end()) {
+    auto it_source = self->name_to_id.find(source);
+    auto it_target = self->name_to_id.find(target);
+    if (it_source == self->name_to_id.end() || it_target == self->name_to_id.end()) {
         PyErr_SetString(PyExc_KeyError, "Source or target node not found");
         return NULL;
     }
 
-    AdjacencyListGraphNode* source_node = it_source->second;
+    int source_id = it_source->second, target_id = it_target->second;
+    AdjacencyListGraphNode* source_node = self->id_map[source_id];
 
     auto adj_it = source_node->adjacent.find(target);
     if (adj_it != source_node->adjacent.end()) {
         Py_XDECREF(adj_it->second);
         source_node->adjacent.erase(adj_it);
+        self->in_degrees[target_id]--;
+        if (self->track_in)
+            self->in_neighbors[target_id].erase(source_id);
     }
 
-    std::string key = make_edge_key(source, target);
+    int64_t key = make_edge_key(source_id, target_id);
     auto edge_it = self->edges.find(key);
     if (edge_it != self->edges.end()) {
         Py_XDECREF(edge_it->second);
@@ -287,6 +483,35 @@ static PyObject* AdjacencyListGraph_remove_edge(AdjacencyListGraph* self, PyObje
     Py_RETURN_NONE;
 }
 
+// Adds the edge with the given value between the vertices with
+// the given ids, replacing an existing one.
+static int AdjacencyListGraph_link(AdjacencyListGraph* self, int source_id,
+                                   int target_id, PyObject* value) {
+    AdjacencyListGraphNode* source_node = self->id_map[source_id];
+    AdjacencyListGraphNode* target_node = self->id_map[target_id];
+    PyObject* edge_args = PyTuple_Pack(3, reinterpret_cast<PyObject*>(source_node), reinterpret_cast<PyObject*>(target_node), value);
+    if (!edge_args)
+        return -1;
+    PyObject* edge_obj = PyObject_CallObject(reinterpret_cast<PyObject*>(&GraphEdgeType), edge_args);
+    Py_DECREF(edge_args);
+    if (!edge_obj)
+        return -1;
+
+    GraphEdge*& slot = self->edges[make_edge_key(source_id, target_id)];
+    Py_XDECREF(slot);
+    slot = reinterpret_cast<GraphEdge*>(edge_obj);
+
+    auto adj_it = source_node->adjacent.find(target_node->name);
+    if (adj_it == source_node->adjacent.end()) {
+        Py_INCREF(target_node);
+        source_node->adjacent[target_node->name] = reinterpret_cast<PyObject*>(target_node);
+        self->in_degrees[target_id]++;
+        if (self->track_in)
+            self->in_neighbors[target_id].insert(source_id);
+    }
+    return 0;
+}
+
 static PyObject* AdjacencyListGraph_add_edge(AdjacencyListGraph* self, PyObject* args) {
     const char* source_cstr;
     const char* target_cstr;
@@ -297,59 +522,118 @@ static PyObject* AdjacencyListGraph_add_edge(AdjacencyListGraph* self, PyObject*
         return NULL;
     }
 
-    std::string source(source_cstr);
-    std::string target(target_cstr);
-
-    if (self->node_map.find(source) == self->node_map.end()) {
+    auto it_source = self->name_to_id.find(source_cstr);
+    if (it_source == self->name_to_id.end()) {
         PyErr_SetString(PyExc_ValueError, "Source node does not exist");
         return NULL;
     }
-    if (self->node_map.find(target) == self->node_map.end()) {
+    auto it_target = self->name_to_id.find(target_cstr);
+    if (it_target == self->name_to_id.end()) {
         PyErr_SetString(PyExc_ValueError, "Target node does not exist");
         return NULL;
     }
 
-    AdjacencyListGraphNode* source_node = self->node_map[source];
-    AdjacencyListGraphNode* target_node = self->node_map[target];
+    if (AdjacencyListGraph_link(self, it_source->second, it_target->second, value) < 0)
+        return NULL;
+    Py_RETURN_NONE;
+}
 
-    PyObject* edge_args = PyTuple_Pack(3, reinterpret_cast<PyObject*>(source_node), reinterpret_cast<PyObject*>(target_node), value);
-    if (!edge_args) return NULL;
+static PyObject* AdjacencyListGraph_add_edges_from(AdjacencyListGraph* self, PyObject* args) {
+    PyObject* sources_obj;
+    PyObject* targets_obj;
+    PyObject* weights_obj = Py_None;
 
-    PyObject* edge_obj = PyObject_CallObject(reinterpret_cast<PyObject*>(&GraphEdgeType), edge_args);
-    Py_DECREF(edge_args);
+    if (!PyArg_ParseTuple(args, "OO|O", &sources_obj, &targets_obj, &weights_obj))
+        return NULL;
 
-    if (!edge_obj)
+    SequenceReader sources, targets, weights;
+    if (SequenceReader_open(&sources, sources_obj) < 0)
+        return NULL;
+    if (SequenceReader_open(&targets, targets_obj) < 0) {
+        SequenceReader_close(&sources);
         return NULL;
+    }
+    bool weighted = weights_obj != Py_None;
+    if (weighted && SequenceReader_open(&weights, weights_obj) < 0) {
+        SequenceReader_close(&sources);
+        SequenceReader_close(&targets);
+        return NULL;
+    }
 
-    std::string key = make_edge_key(source, target);
+    auto close_all = [&]() {
+        SequenceReader_close(&sources);
+        SequenceReader_close(&targets);
+        if (weighted)
+            SequenceReader_close(&weights);
+    };
+
+    Py_ssize_t num_edges = sources.size;
+    if (targets.size != num_edges || (weighted && weights.size != num_edges)) {
+        close_all();
+        PyErr_SetString(PyExc_ValueError, "sources, targets and weights must have the same length");
+        return NULL;
+    }
 
-    auto it = self->edges.find(key);
-    if (it != self->edges.end()) {
-        Py_XDECREF(it->second);
-        it->second = reinterpret_cast<GraphEdge*>(edge_obj);
-    } else {
-        self->edges[key] = reinterpret_cast<GraphEdge*>(edge_obj);
+    std::vector<int> source_ids(num_edges), target_ids(num_edges);
+    std::string source, target;
+    for (Py_ssize_t i = 0; i < num_edges; i++) {
+        if (SequenceReader_name(&sources, i, source) < 0 ||
+            SequenceReader_name(&targets, i, target) < 0) {
+            close_all();
+            return NULL;
+        }
+        auto it_source = self->name_to_id.find(source);
+        if (it_source == self->name_to_id.end()) {
+            close_all();
+            PyErr_Format(PyExc_ValueError, "Vertex %s is not present in the graph", source.c_str());
+            return NULL;
+        }
+        auto it_target = self->name_to_id.find(target);
+        if (it_target == self->name_to_id.end()) {
+            close_all();
+            PyErr_Format(PyExc_ValueError, "Vertex %s is not present in the graph", target.c_str());
+            return NULL;
+        }
+        source_ids[i] = it_source->second;
+        target_ids[i] = it_target->second;
     }
 
-    auto adj_it = source_node->adjacent.find(target);
-    if (adj_it == source_node->adjacent.end()) {
-        Py_INCREF(target_node);
-        source_node->adjacent[target] = reinterpret_cast<PyObject*>(target_node);
+    for (Py_ssize_t i = 0; i < num_edges; i++) {
+        PyObject* value = Py_None;
+        if (weighted) {
+            value = SequenceReader_item(&weights, i);
+            if (!value) {
+                close_all();
+                return NULL;
+            }
+        } else {
+            Py_INCREF(value);
+        }
+        int status = AdjacencyListGraph_link(self, source_ids[i], target_ids[i], value);
+        Py_DECREF(value);
+        if (status < 0) {
+            close_all();
+            return NULL;
+        }
     }
 
+    close_all();
     Py_RETURN_NONE;
 }
 
-
-
-
 static PyMethodDef AdjacencyListGraph_methods[] = {
     {"add_vertex", (PyCFunction)AdjacencyListGraph_add_vertex, METH_VARARGS, "Add a vertex to the graph"},
     {"add_edge", (PyCFunction)AdjacencyListGraph_add_edge, METH_VARARGS, "Add an edge to the graph"},
+    {"add_vertices_from", (PyCFunction)AdjacencyListGraph_add_vertices_from, METH_VARARGS, "Add vertices with the given names to the graph"},
+    {"add_edges_from", (PyCFunction)AdjacencyListGraph_add_edges_from, METH_VARARGS, "Add edges from parallel sequences of sources, targets and weights"},
     {"is_adjacent", (PyCFunction)AdjacencyListGraph_is_adjacent, METH_VARARGS, "Check adjacency between two nodes"},
     {"num_vertices", (PyCFunction)AdjacencyListGraph_num_vertices, METH_NOARGS, "Number of vertices"},
     {"num_edges", (PyCFunction)AdjacencyListGraph_num_edges, METH_NOARGS, "Number of edges"},
     {"neighbors", (PyCFunction)AdjacencyListGraph_neighbors, METH_VARARGS, "Get neighbors of a node"},
+    {"predecessors", (PyCFunction)AdjacencyListGraph_predecessors, METH_VARARGS, "Get the vertices with an edge to a node"},
+    {"in_degree", (PyCFunction)AdjacencyListGraph_in_degree, METH_VARARGS, "Number of edges ending at a node"},
+    {"degree", (PyCFunction)AdjacencyListGraph_degree, METH_VARARGS, "Number of edges starting at a node"},
+    {"degrees", (PyCFunction)AdjacencyListGraph_degrees, METH_VARARGS | METH_KEYWORDS, "Numbers of edges starting, or ending, at every vertex"},
     {"remove_vertex", (PyCFunction)AdjacencyListGraph_remove_vertex, METH_VARARGS, "Remove a vertex"},
     {"get_edge", (PyCFunction)AdjacencyListGraph_get_edge, METH_VARARGS, "Get edge between source and target"},
     {"remove_edge", (PyCFunction)AdjacencyListGraph_remove_edge, METH_VARARGS, "Remove edge between source and target"},
@@ -9,6 +9,8 @@
 #include "AdjacencyMatrixGraphNode.hpp"
 #include "GraphEdge.hpp"
 #include "GraphNode.hpp"
+#include "SequenceReader.hpp"
+#include "TypedArray.hpp"
 
 extern PyTypeObject AdjacencyMatrixGraphNodeType;
 
@@ -19,6 +21,12 @@ typedef struct {
     std::unordered_map<std::string, std::unordered_map<std::string,bool> > matrix;
     std::unordered_map<std::string, AdjacencyMatrixGraphNode *> node_map;
     std::unordered_map<std::string, GraphEdge *> edge_weights;
+    // Number of edges, and numbers of edges starting and ending at
+    // every vertex by position in nodes.
+    int64_t edge_count;
+    std::unordered_map<std::string, size_t> ids;
+    std::vector<int64_t> out_degrees;
+    std::vector<int64_t> in_degrees;
 } AdjacencyMatrixGraph;
 
 static void AdjacencyMatrixGraph_dealloc(AdjacencyMatrixGraph* self)
@@ -36,6 +44,12 @@ static void AdjacencyMatrixGraph_dealloc(AdjacencyMatrixGraph* self)
     self->node_map.clear();
     self->matrix.clear();
 
+    using id_map = std::unordered_map<std::string, size_t>;
+    using degree_vector = std::vector<int64_t>;
+    self->ids.~id_map();
+    self->out_degrees.~degree_vector();
+    self->in_degrees.~degree_vector();
+
     Py_XDECREF(self->dict);
 
     Py_TYPE(self)->tp_free(reinterpret_cast<PyObject*>(self));
@@ -50,6 +64,10 @@ static PyObject* AdjacencyMatrixGraph_new(PyTypeObject* type, PyObject* args, Py
         new (&self->node_map) std::unordered_map<std::string, AdjacencyMatrixGraphNode*>();
         new (&self->matrix) std::unordered_map<std::string, std::unordered_map<std::string, bool> >();
         new (&self->edge_weights) std::unordered_map<std::string, GraphEdge*>();
+        new (&self->ids) std::unordered_map<std::string, size_t>();
+        new (&self->out_degrees) std::vector<int64_t>();
+        new (&self->in_degrees) std::vector<int64_t>();
+        self->edge_count = 0;
 
         PyObject* vertices;
         if (!PyArg_ParseTuple(args, "O", &vertices)) {
@@ -77,7 +95,10 @@ static PyObject* AdjacencyMatrixGraph_new(PyTypeObject* type, PyObject* args, Py
             self->nodes.push_back(node);
             self->node_map[name] = node;
             self->matrix[name] = std::unordered_map<std::string, bool>();
+            self->ids[name] = self->nodes.size() - 1;
         }
+        self->out_degrees.assign(self->nodes.size(), 0);
+        self->in_degrees.assign(self->nodes.size(), 0);
 
         PyObject* impl_str = PyUnicode_FromString("adjacency_matrix");
 
@@ -92,6 +113,20 @@ static PyObject* AdjacencyMatrixGraph_new(PyTypeObject* type, PyObject* args, Py
     return reinterpret_cast<PyObject*>(self);
 }
 
+// Sets the entry of the matrix for the edge from src to dst, counting
+// the edge if it was not present.
+static void AdjacencyMatrixGraph_set(AdjacencyMatrixGraph* self, const std::string& src,
+                                     const std::string& dst, bool present) {
+    bool& entry = self->matrix[src][dst];
+    if (entry != present) {
+        const int64_t change = present ? 1 : -1;
+        self->edge_count += change;
+        self->out_degrees[self->ids[src]] += change;
+        self->in_degrees[self->ids[dst]] += change;
+    }
+    entry = present;
+}
+
 static PyObject* AdjacencyMatrixGraph_add_edge(AdjacencyMatrixGraph* self, PyObject* args, PyObject* kwds)
 {
     const char *source, *target;
@@ -110,7 +145,7 @@ static PyObject* AdjacencyMatrixGraph_add_edge(AdjacencyMatrixGraph* self, PyObj
         return NULL;
     }
 
-    self->matrix[src][dst] = true;
+    AdjacencyMatrixGraph_set(self, src, dst, true);
 
     if (cost_obj != Py_None) {
     double cost = PyFloat_AsDouble(cost_obj);
@@ -143,7 +178,9 @@ static PyObject* AdjacencyMatrixGraph_remove_edge(AdjacencyMatrixGraph* self, Py
     std::string dst(target);
 
     if (self->matrix.find(src) != self->matrix.end()) {
-        self->matrix[src][dst] = false;
+        auto& row = self->matrix[src];
+        if (row.find(dst) != row.end())
+            AdjacencyMatrixGraph_set(self, src, dst, false);
         self->edge_weights.erase(src + "_" + dst);
     }
 
@@ -183,14 +220,40 @@ static PyObject* AdjacencyMatrixGraph_num_vertices(AdjacencyMatrixGraph* self, P
 
 static PyObject* AdjacencyMatrixGraph_num_edges(AdjacencyMatrixGraph* self, PyObject* Py_UNUSED(ignored))
 {
-    size_t count = 0;
-    for (const auto& row : self->matrix) {
-        for (const auto& entry : row.second) {
-            if (entry.second)
-                count++;
-        }
+    return PyLong_FromLongLong(self->edge_count);
+}
+
+static PyObject* AdjacencyMatrixGraph_degree_of(AdjacencyMatrixGraph* self, PyObject* args,
+                                                const std::vector<int64_t>& degrees) {
+    const char *node;
+    if (!PyArg_ParseTuple(args, "s", &node))
+        return NULL;
+
+    auto it = self->ids.find(node);
+    if (it == self->ids.end()) {
+        PyErr_SetString(PyExc_KeyError, "Node not found");
+        return NULL;
     }
-    return PyLong_FromSize_t(count);
+    return PyLong_FromLongLong(degrees[it->second]);
+}
+
+static PyObject* AdjacencyMatrixGraph_degree(AdjacencyMatrixGraph* self, PyObject* args)
+{
+    return AdjacencyMatrixGraph_degree_of(self, args, self->out_degrees);
+}
+
+static PyObject* AdjacencyMatrixGraph_in_degree(AdjacencyMatrixGraph* self, PyObject* args)
+{
+    return AdjacencyMatrixGraph_degree_of(self, args, self->in_degrees);
+}
+
+static PyObject* AdjacencyMatrixGraph_degrees(AdjacencyMatrixGraph* self, PyObject* args, PyObject* kwds)
+{
+    int incoming = 0;
+    static const char* kwlist[] = {"incoming", NULL};
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "|p", const_cast<char**>(kwlist), &incoming))
+        return NULL;
+    return int64_array(incoming ? self->in_degrees : self->out_degrees);
 }
 
 static PyObject* AdjacencyMatrixGraph_get_edge(AdjacencyMatrixGraph* self, PyObject* args)
@@ -202,6 +265,7 @@ static PyObject* AdjacencyMatrixGraph_get_edge(AdjacencyMatrixGraph* self, PyObj
     std::string key = std::string(source) + "_" + std::string(target);
     auto it = self->edge_weights.find(key);
     if (it != self->edge_weights.end()) {
+        Py_INCREF(it->second);
         return reinterpret_cast<PyObject*>(it->second);
     }
     Py_RETURN_NONE;
@@ -225,12 +289,110 @@ static PyObject* AdjacencyMatrixGraph_is_adjacent(AdjacencyMatrixGraph* self, Py
     Py_RETURN_FALSE;
 }
 
+static PyObject* AdjacencyMatrixGraph_add_edges_from(AdjacencyMatrixGraph* self, PyObject* args)
+{
+    PyObject *sources_obj, *targets_obj, *weights_obj = Py_None;
+    if (!PyArg_ParseTuple(args, "OO|O", &sources_obj, &targets_obj, &weights_obj))
+        return NULL;
+
+    SequenceReader sources, targets, weights;
+    if (SequenceReader_open(&sources, sources_obj) < 0)
+        return NULL;
+    if (SequenceReader_open(&targets, targets_obj) < 0) {
+        SequenceReader_close(&sources);
+        return NULL;
+    }
+    bool weighted = weights_obj != Py_None;
+    if (weighted && SequenceReader_open(&weights, weights_obj) < 0) {
+        SequenceReader_close(&sources);
+        SequenceReader_close(&targets);
+        return NULL;
+    }
+
+    auto close_all = [&]() {
+        SequenceReader_close(&sources);
+        SequenceReader_close(&targets);
+        if (weighted)
+            SequenceReader_close(&weights);
+    };
+
+    Py_ssize_t num_edges = sources.size;
+    if (targets.size != num_edges || (weighted && weights.size != num_edges)) {
+        close_all();
+        PyErr_SetString(PyExc_ValueError, "sources, targets and weights must have the same length");
+        return NULL;
+    }
+
+    std::vector<std::string> source_names(num_edges), target_names(num_edges);
+    for (Py_ssize_t i = 0; i < num_edges; i++) {
+        if (SequenceReader_name(&sources, i, source_names[i]) < 0 ||
+            SequenceReader_name(&targets, i, target_names[i]) < 0) {
+            close_all();
+            return NULL;
+        }
+        if (self->matrix.find(source_names[i]) == self->matrix.end() ||
+            self->matrix.find(target_names[i]) == self->matrix.end()) {
+            close_all();
+            PyErr_Format(PyExc_ValueError, "Vertex %s or %s not in graph",
+                         source_names[i].c_str(), target_names[i].c_str());
+            return NULL;
+        }
+    }
+
+    for (Py_ssize_t i = 0; i < num_edges; i++) {
+        const std::string& src = source_names[i];
+        const std::string& dst = target_names[i];
+        AdjacencyMatrixGraph_set(self, src, dst, true);
+        if (!weighted)
+            continue;
+
+        PyObject* cost_obj = SequenceReader_item(&weights, i);
+        if (!cost_obj) {
+            close_all();
+            return NULL;
+        }
+        if (cost_obj == Py_None) {
+            Py_DECREF(cost_obj);
+            continue;
+        }
+        double cost = PyFloat_AsDouble(cost_obj);
+        Py_DECREF(cost_obj);
+        if (PyErr_Occurred()) {
+            close_all();
+            return NULL;
+        }
+
+        PyObject* edge_args = Py_BuildValue("OOd", reinterpret_cast<PyObject*>(self->node_map[src]), reinterpret_cast<PyObject*>(self->node_map[dst]), cost);
+        if (!edge_args) {
+            close_all();
+            return NULL;
+        }
+        PyObject* edge_obj = PyObject_CallObject(reinterpret_cast<PyObject*>(&GraphEdgeType), edge_args);
+        Py_DECREF(edge_args);
+        if (!edge_obj) {
+            close_all();
+            return NULL;
+        }
+
+        GraphEdge*& slot = self->edge_weights[src + "_" + dst];
+        Py_XDECREF(slot);
+        slot = reinterpret_cast<GraphEdge*>(edge_obj);
+    }
+
+    close_all();
+    Py_RETURN_NONE;
+}
+
 static PyMethodDef AdjacencyMatrixGraph_methods[] = {
     {"add_edge", (PyCFunction)AdjacencyMatrixGraph_add_edge, METH_VARARGS | METH_KEYWORDS, "Add an edge between two nodes."},
+    {"add_edges_from", (PyCFunction)AdjacencyMatrixGraph_add_edges_from, METH_VARARGS, "Add edges from parallel sequences of sources, targets and weights."},
     {"remove_edge", (PyCFunction)AdjacencyMatrixGraph_remove_edge, METH_VARARGS, "Remove an edge between two nodes."},
     {"neighbors", (PyCFunction)AdjacencyMatrixGraph_neighbors, METH_VARARGS, "Return neighbors of a node."},
     {"num_vertices", (PyCFunction)AdjacencyMatrixGraph_num_vertices, METH_NOARGS, "Return number of vertices."},
     {"num_edges", (PyCFunction)AdjacencyMatrixGraph_num_edges, METH_NOARGS, "Return number of edges."},
+    {"degree", (PyCFunction)AdjacencyMatrixGraph_degree, METH_VARARGS, "Return number of edges starting at a node."},
+    {"in_degree", (PyCFunction)AdjacencyMatrixGraph_in_degree, METH_VARARGS, "Return number of edges ending at a node."},
+    {"degrees", (PyCFunction)AdjacencyMatrixGraph_degrees, METH_VARARGS | METH_KEYWORDS, "Return numbers of edges starting, or ending, at every vertex."},
     {"get_edge", (PyCFunction)AdjacencyMatrixGraph_get_edge, METH_VARARGS, "Return the edge object between two nodes if exists."},
     {"is_adjacent", (PyCFunction)AdjacencyMatrixGraph_is_adjacent, METH_VARARGS, "Check if there is an edge between two nodes."},
     {NULL}
@@ -4,9 +4,21 @@
 #include <string>
 #include <unordered_set>
 #include <variant>
+#include <tuple>
+#include <cstring>
+#include <cmath>
+#include <limits>
+#include <atomic>
+#include <deque>
+#include <map>
+#include <memory>
+#include <array>
 #include "GraphEdge.hpp"
 #include "AdjacencyList.hpp"
 #include "AdjacencyMatrix.hpp"
+#include "CompressedSparseRow.hpp"
+#include "WorkerPool.hpp"
+#include "TypedArray.hpp"
 
 static PyObject* breadth_first_search_adjacency_list(PyObject* self, PyObject* args, PyObject* kwargs) {
     PyObject* graph_obj;
@@ -173,6 +185,7 @@ static PyObject* minimum_spanning_tree_prim_adjacency_list(PyObject* self, PyObj
     struct EdgeTuple {
         int source_id;
         int target_id;
+        GraphEdge* edge;
         std::variant<std::monostate, int64_t, double, std::string> value;
         DataType value_type;
 
@@ -193,134 +206,94 @@ static PyObject* minimum_spanning_tree_prim_adjacency_list(PyObject* self, PyObj
     std::unordered_set<int> visited;
 
     PyObject* mst_graph = PyObject_CallObject(reinterpret_cast<PyObject*>(&AdjacencyListGraphType), nullptr);
+    if (!mst_graph)
+        return nullptr;
     AdjacencyListGraph* mst = reinterpret_cast<AdjacencyListGraph*>(mst_graph);
+    if (graph->nodes.empty())
+        return mst_graph;
 
-    int start_id = graph->nodes[0]->internal_id;
-    visited.insert(start_id);
-
-    AdjacencyListGraphNode* start_node = graph->id_map[start_id];
-    std::string start_name = graph->id_to_name[start_id];
-
-    Py_INCREF(start_node);
-    mst->nodes.push_back(start_node);
-    mst->node_map[start_name] = start_node;
-    mst->id_map[start_id] = start_node;
-    mst->id_to_name[start_id] = start_name;
-    mst->name_to_id[start_name] = start_id;
-
-    for (const auto& [adj_name, _] : start_node->adjacent) {
-        int adj_id = graph->name_to_id[adj_name];
-        std::string key = make_edge_key(start_name, adj_name);
-        GraphEdge* edge = graph->edges[key];
-
-        EdgeTuple et;
-        et.source_id = start_id;
-        et.target_id = adj_id;
-        et.value_type = edge->value_type;
-
-        switch (edge->value_type) {
-            case DataType::Int:
-                et.value = std::get<int64_t>(edge->value);
-                break;
-            case DataType::Double:
-                et.value = std::get<double>(edge->value);
-                break;
-            case DataType::String:
-                et.value = std::get<std::string>(edge->value);
-                break;
-            default:
-                et.value = std::monostate{};
-        }
-
-        pq.push(et);
-    }
-
-    while (!pq.empty()) {
-        EdgeTuple edge = pq.top();
-        pq.pop();
-
-        if (visited.count(edge.target_id)) continue;
-        visited.insert(edge.target_id);
-
-        int u_id = edge.source_id;
-        int v_id = edge.target_id;
-        std::string u_name = graph->id_to_name[u_id];
-        std::string v_name = graph->id_to_name[v_id];
-
-        for (auto [id, name] : std::vector<std::pair<int, std::string>>{{u_id, u_name}, {v_id, v_name}}) {
-            if (!mst->id_map.count(id)) {
-                AdjacencyListGraphNode* node = graph->id_map[id];
-                Py_INCREF(node);
-                mst->nodes.push_back(node);
-                mst->node_map[name] = node;
-                mst->id_map[id] = node;
-                mst->id_to_name[id] = name;
-                mst->name_to_id[name] = id;
-            }
-        }
-
-        AdjacencyListGraphNode* u = mst->id_map[u_id];
-        AdjacencyListGraphNode* v = mst->id_map[v_id];
-
-        Py_INCREF(v);
-        Py_INCREF(u);
-        u->adjacent[v_name] = reinterpret_cast<PyObject*>(v);
-        v->adjacent[u_name] = reinterpret_cast<PyObject*>(u);
-
-        std::string key_uv = make_edge_key(u_name, v_name);
-        GraphEdge* new_edge = PyObject_New(GraphEdge, &GraphEdgeType);
-        PyObject_Init(reinterpret_cast<PyObject*>(new_edge), &GraphEdgeType);
-        new (&new_edge->value) std::variant<std::monostate, int64_t, double, std::string>(edge.value);
-        new_edge->value_type = edge.value_type;
-        Py_INCREF(u);
-        Py_INCREF(v);
-        new_edge->source = reinterpret_cast<PyObject*>(u);
-        new_edge->target = reinterpret_cast<PyObject*>(v);
-        mst->edges[key_uv] = new_edge;
-
-        std::string key_vu = make_edge_key(v_name, u_name);
-        GraphEdge* new_edge_rev = PyObject_New(GraphEdge, &GraphEdgeType);
-        PyObject_Init(reinterpret_cast<PyObject*>(new_edge_rev), &GraphEdgeType);
-        new (&new_edge_rev->value) std::variant<std::monostate, int64_t, double, std::string>(edge.value);
-        new_edge_rev->value_type = edge.value_type;
-        Py_INCREF(u);
-        Py_INCREF(v);
-        new_edge_rev->source = reinterpret_cast<PyObject*>(v);
-        new_edge_rev->target = reinterpret_cast<PyObject*>(u);
-        mst->edges[key_vu] = new_edge_rev;
-
-        AdjacencyListGraphNode* next_node = graph->id_map[v_id];
-        for (const auto& [adj_name, _] : next_node->adjacent) {
+    // The tree is built over new nodes with the names and data of
+    // the vertices, so that linking them leaves the graph unchanged.
+    std::vector<int> mst_ids(graph->next_id, -1);
+    auto add_vertex = [&](int id) {
+        AdjacencyListGraphNode* node = graph->id_map[id];
+        PyObject* data = AdjacencyListGraphNode_get_data(node, nullptr);
+        if (!data)
+            return -1;
+        PyObject* node_obj = PyObject_CallFunction(reinterpret_cast<PyObject*>(&AdjacencyListGraphNodeType),
+                                                   "sO", node->name.c_str(), data);
+        Py_DECREF(data);
+        if (!node_obj)
+            return -1;
+        mst_ids[id] = AdjacencyListGraph_insert_node(mst, reinterpret_cast<AdjacencyListGraphNode*>(node_obj));
+        Py_DECREF(node_obj);
+        return 0;
+    };
+    auto push_edges = [&](int u_id) {
+        for (const auto& [adj_name, _] : graph->id_map[u_id]->adjacent) {
             int adj_id = graph->name_to_id[adj_name];
             if (visited.count(adj_id)) continue;
 
-            std::string key = make_edge_key(v_name, adj_name);
-            GraphEdge* adj_edge = graph->edges[key];
+            GraphEdge* edge = graph->edges[make_edge_key(u_id, adj_id)];
 
-            EdgeTuple adj_et;
-            adj_et.source_id = v_id;
-            adj_et.target_id = adj_id;
-            adj_et.value_type = adj_edge->value_type;
+            EdgeTuple et;
+            et.source_id = u_id;
+            et.target_id = adj_id;
+            et.edge = edge;
+            et.value_type = edge->value_type;
 
-            switch (adj_edge->value_type) {
+            switch (edge->value_type) {
                 case DataType::Int:
-                    adj_et.value = std::get<int64_t>(adj_edge->value);
+                    et.value = std::get<int64_t>(edge->value);
                     break;
                 case DataType::Double:
-                    adj_et.value = std::get<double>(adj_edge->value);
+                    et.value = std::get<double>(edge->value);
                     break;
                 case DataType::String:
-                    adj_et.value = std::get<std::string>(adj_edge->value);
+                    et.value = std::get<std::string>(edge->value);
                     break;
                 default:
-                    adj_et.value = std::monostate{};
+                    et.value = std::monostate{};
             }
 
-            pq.push(adj_et);
+            pq.push(et);
+        }
+    };
+
+    int start_id = AdjacencyListGraph_id(graph, graph->nodes[0]);
+    visited.insert(start_id);
+    if (add_vertex(start_id) < 0) {
+        Py_DECREF(mst_graph);
+        return nullptr;
+    }
+    push_edges(start_id);
+
+    while (!pq.empty()) {
+        EdgeTuple edge = pq.top();
+        pq.pop();
+
+        if (visited.count(edge.target_id)) continue;
+        visited.insert(edge.target_id);
+        if (add_vertex(edge.target_id) < 0) {
+            Py_DECREF(mst_graph);
+            return nullptr;
+        }
+
+        int u_id = mst_ids[edge.source_id];
+        int v_id = mst_ids[edge.target_id];
+        PyObject* value = GraphEdge_get_value(edge.edge, nullptr);
+        if (!value || AdjacencyListGraph_link(mst, u_id, v_id, value) < 0 ||
+            AdjacencyListGraph_link(mst, v_id, u_id, value) < 0) {
+            Py_XDECREF(value);
+            Py_DECREF(mst_graph);
+            return nullptr;
         }
+        Py_DECREF(value);
+
+        push_edges(edge.target_id);
     }
 
-    return reinterpret_cast<PyObject*>(mst);
+    return mst_graph;
 }
 
 static PyObject* shortest_paths_dijkstra_adjacency_list(PyObject* self, PyObject* args, PyObject* kwargs) {
@@ -336,15 +309,12 @@ static PyObject* shortest_paths_dijkstra_adjacency_list(PyObject* self, PyObject
     }
 
     AdjacencyListGraph* graph = reinterpret_cast<AdjacencyListGraph*>(graph_obj);
-    const size_t V = graph->node_map.size();
+    const size_t V = graph->next_id;
 
     std::vector<std::vector<std::pair<int, double>>> adj(V);
     for (const auto& [edge_key, edge] : graph->edges) {
-        size_t delim = edge_key.find('_');
-        std::string u_name = edge_key.substr(0, delim);
-        std::string v_name = edge_key.substr(delim + 1);
-        int u = graph->name_to_id[u_name];
-        int v = graph->name_to_id[v_name];
+        int u = edge_key_source(edge_key);
+        int v = edge_key_target(edge_key);
 
         double weight = 0.0;
         if (edge->value_type == DataType::Int)
@@ -386,8 +356,9 @@ static PyObject* shortest_paths_dijkstra_adjacency_list(PyObject* self, PyObject
     PyObject* pred_dict = PyDict_New();
     if (!dist_dict || !pred_dict) return nullptr;
 
-    for (int id = 0; id < static_cast<int>(V); ++id) {
-        const std::string& name = graph->id_to_name[id];
+    for (AdjacencyListGraphNode* node : graph->nodes) {
+        const int id = AdjacencyListGraph_id(graph, node);
+        const std::string& name = node->name;
         PyObject* dval = PyFloat_FromDouble(dist[id]);
         if (!dval || PyDict_SetItemString(dist_dict, name.c_str(), dval) < 0) {
             Py_XDECREF(dval);
@@ -398,8 +369,9 @@ static PyObject* shortest_paths_dijkstra_adjacency_list(PyObject* self, PyObject
         Py_DECREF(dval);
     }
 
-    for (int id = 0; id < static_cast<int>(V); ++id) {
-        const std::string& name = graph->id_to_name[id];
+    for (AdjacencyListGraphNode* node : graph->nodes) {
+        const int id = AdjacencyListGraph_id(graph, node);
+        const std::string& name = node->name;
         PyObject* py_pred;
         if (pred[id] == -1) {
             Py_INCREF(Py_None);
@@ -457,3 +429,4068 @@ static PyObject* shortest_paths_dijkstra_adjacency_list(PyObject* self, PyObject
     PyTuple_SetItem(result, 1, pred_dict);
     return result;
 }
+
+// Calls operation(curr, next, *varargs, **kwargs_dict) and returns
+// 1 to continue the traversal, 0 to stop it and -1 on error.
+static int call_traversal_operation(PyObject* operation, PyObject* curr, PyObject* next,
+                                    PyObject* varargs, PyObject* kwargs_dict) {
+    Py_ssize_t extra = (varargs && PyTuple_Check(varargs)) ? PyTuple_Size(varargs) : 0;
+    PyObject* final_args = PyTuple_New(2 + extra);
+    if (!final_args)
+        return -1;
+    Py_INCREF(curr);
+    Py_INCREF(next);
+    PyTuple_SET_ITEM(final_args, 0, curr);
+    PyTuple_SET_ITEM(final_args, 1, next);
+    for (Py_ssize_t i = 0; i < extra; ++i) {
+        PyObject* item = PyTuple_GET_ITEM(varargs, i);
+        Py_INCREF(item);
+        PyTuple_SET_ITEM(final_args, 2 + i, item);
+    }
+
+    PyObject* result = PyObject_Call(operation, final_args, kwargs_dict);
+    Py_DECREF(final_args);
+    if (!result)
+        return -1;
+    int status = PyObject_IsTrue(result);
+    Py_DECREF(result);
+    return status;
+}
+
+static PyObject* breadth_first_search_csr(PyObject* self, PyObject* args, PyObject* kwargs) {
+    PyObject* graph_obj;
+    const char* source_name;
+    PyObject* operation;
+    PyObject* varargs = nullptr;
+    PyObject* kwargs_dict = nullptr;
+    static const char* kwlist[] = {"graph", "source_node", "operation", "args", "kwargs", nullptr};
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "O!sO|OO", const_cast<char**>(kwlist),
+                                     &CompressedSparseRowGraphType, &graph_obj,
+                                     &source_name, &operation,
+                                     &varargs, &kwargs_dict)) {
+        return nullptr;
+    }
+
+    CompressedSparseRowGraph* graph = reinterpret_cast<CompressedSparseRowGraph*>(graph_obj);
+    int64_t source = CompressedSparseRowGraph_find(graph, source_name);
+    if (source < 0)
+        return nullptr;
+    CompressedSparseRowGraph_build(graph);
+
+    std::vector<char> visited(graph->nodes.size(), 0);
+    std::vector<int64_t> queue;
+    queue.reserve(graph->nodes.size());
+    queue.push_back(source);
+    visited[source] = 1;
+
+    for (size_t head = 0; head < queue.size(); ++head) {
+        int64_t u = queue[head];
+        for (int64_t i = graph->offsets[u]; i < graph->offsets[u + 1]; ++i) {
+            int64_t v = graph->targets[i];
+            if (visited[v])
+                continue;
+            int status = call_traversal_operation(operation,
+                                                  reinterpret_cast<PyObject*>(graph->nodes[u]),
+                                                  reinterpret_cast<PyObject*>(graph->nodes[v]),
+                                                  varargs, kwargs_dict);
+            if (status < 0)
+                return nullptr;
+            if (status == 0)
+                Py_RETURN_NONE;
+            visited[v] = 1;
+            queue.push_back(v);
+        }
+    }
+
+    Py_RETURN_NONE;
+}
+
+static PyObject* minimum_spanning_tree_prim_csr(PyObject* self, PyObject* args, PyObject* kwargs) {
+    PyObject* graph_obj;
+    static const char* kwlist[] = {"graph", nullptr};
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "O!", const_cast<char**>(kwlist),
+                                     &CompressedSparseRowGraphType, &graph_obj)) {
+        return nullptr;
+    }
+
+    CompressedSparseRowGraph* graph = reinterpret_cast<CompressedSparseRowGraph*>(graph_obj);
+    CompressedSparseRowGraph_build(graph);
+    const int64_t V = static_cast<int64_t>(graph->nodes.size());
+
+    PyObject* vertices = PyTuple_New(V);
+    if (!vertices)
+        return nullptr;
+    for (int64_t u = 0; u < V; ++u) {
+        Py_INCREF(graph->nodes[u]);
+        PyTuple_SET_ITEM(vertices, u, reinterpret_cast<PyObject*>(graph->nodes[u]));
+    }
+    PyObject* mst_obj = PyObject_CallObject(reinterpret_cast<PyObject*>(&CompressedSparseRowGraphType), vertices);
+    Py_DECREF(vertices);
+    if (!mst_obj)
+        return nullptr;
+    CompressedSparseRowGraph* mst = reinterpret_cast<CompressedSparseRowGraph*>(mst_obj);
+    if (V == 0)
+        return mst_obj;
+
+    using PQEntry = std::tuple<double, int64_t, int64_t>;
+    std::priority_queue<PQEntry, std::vector<PQEntry>, std::greater<>> pq;
+    std::vector<char> visited(V, 0);
+    auto relax = [&](int64_t u) {
+        visited[u] = 1;
+        for (int64_t i = graph->offsets[u]; i < graph->offsets[u + 1]; ++i) {
+            int64_t v = graph->targets[i];
+            if (!visited[v] && !std::isnan(graph->weights[i]))
+                pq.push({graph->weights[i], u, v});
+        }
+    };
+
+    relax(0);
+    while (!pq.empty()) {
+        auto [w, u, v] = pq.top();
+        pq.pop();
+        if (visited[v])
+            continue;
+        mst->pending_sources.push_back(u);
+        mst->pending_targets.push_back(v);
+        mst->pending_weights.push_back(w);
+        mst->pending_sources.push_back(v);
+        mst->pending_targets.push_back(u);
+        mst->pending_weights.push_back(w);
+        relax(v);
+    }
+    CompressedSparseRowGraph_build(mst);
+
+    return mst_obj;
+}
+
+static PyObject* shortest_paths_dijkstra_csr(PyObject* self, PyObject* args, PyObject* kwargs) {
+    PyObject* graph_obj;
+    const char* source_name;
+    const char* target_name = "";
+
+    static const char* kwlist[] = {"graph", "source_node", "target_node", nullptr};
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "O!s|s", const_cast<char**>(kwlist),
+                                     &CompressedSparseRowGraphType, &graph_obj,
+                                     &source_name, &target_name)) {
+        return nullptr;
+    }
+
+    CompressedSparseRowGraph* graph = reinterpret_cast<CompressedSparseRowGraph*>(graph_obj);
+    int64_t source = CompressedSparseRowGraph_find(graph, source_name);
+    if (source < 0)
+        return nullptr;
+    int64_t target = -1;
+    if (strlen(target_name) > 0) {
+        target = CompressedSparseRowGraph_find(graph, target_name);
+        if (target < 0)
+            return nullptr;
+    }
+    CompressedSparseRowGraph_build(graph);
+
+    const int64_t V = static_cast<int64_t>(graph->nodes.size());
+    std::vector<double> dist(V, std::numeric_limits<double>::infinity());
+    std::vector<int64_t> pred(V, -1);
+    using PQEntry = std::pair<double, int64_t>;
+    std::priority_queue<PQEntry, std::vector<PQEntry>, std::greater<>> pq;
+
+    dist[source] = 0.0;
+    pq.push({0.0, source});
+    while (!pq.empty()) {
+        auto [u_dist, u] = pq.top();
+        pq.pop();
+        if (u_dist > dist[u])
+            continue;
+        for (int64_t i = graph->offsets[u]; i < graph->offsets[u + 1]; ++i) {
+            double weight = graph->weights[i];
+            if (std::isnan(weight) || weight < 0)
+                continue;
+            int64_t v = graph->targets[i];
+            if (u_dist + weight < dist[v]) {
+                dist[v] = u_dist + weight;
+                pred[v] = u;
+                pq.push({dist[v], v});
+            }
+        }
+    }
+
+    PyObject* dist_dict = PyDict_New();
+    PyObject* pred_dict = PyDict_New();
+    if (!dist_dict || !pred_dict) {
+        Py_XDECREF(dist_dict);
+        Py_XDECREF(pred_dict);
+        return nullptr;
+    }
+    for (int64_t u = 0; u < V; ++u) {
+        const char* name = graph->nodes[u]->name.c_str();
+        PyObject* dval = PyFloat_FromDouble(dist[u]);
+        PyObject* pval;
+        if (pred[u] == -1) {
+            Py_INCREF(Py_None);
+            pval = Py_None;
+        } else {
+            pval = PyUnicode_FromString(graph->nodes[pred[u]]->name.c_str());
+        }
+        if (!dval || !pval ||
+            PyDict_SetItemString(dist_dict, name, dval) < 0 ||
+            PyDict_SetItemString(pred_dict, name, pval) < 0) {
+            Py_XDECREF(dval);
+            Py_XDECREF(pval);
+            Py_DECREF(dist_dict);
+            Py_DECREF(pred_dict);
+            return nullptr;
+        }
+        Py_DECREF(dval);
+        Py_DECREF(pval);
+    }
+
+    if (target >= 0) {
+        Py_DECREF(dist_dict);
+        return Py_BuildValue("(dN)", dist[target], pred_dict);
+    }
+    return Py_BuildValue("(NN)", dist_dict, pred_dict);
+}
+
+// Read-only view of a weighted digraph stored in compressed
+// sparse row form over dense vertex ids.
+struct ArcView {
+    const int64_t* offsets;
+    const int64_t* targets;
+    const double* weights;
+};
+
+struct ArcArrays {
+    std::vector<int64_t> offsets;
+    std::vector<int64_t> targets;
+    std::vector<double> weights;
+
+    ArcView view() const {
+        return {offsets.data(), targets.data(), weights.data()};
+    }
+};
+
+// Groups (u, v, w) arcs by u, or by v if reverse is true.
+static void build_arc_arrays(ArcArrays& out, int64_t V,
+                             const std::vector<std::tuple<int64_t, int64_t, double>>& arcs,
+                             bool reverse) {
+    out.offsets.assign(V + 1, 0);
+    out.targets.resize(arcs.size());
+    out.weights.resize(arcs.size());
+    for (const auto& [u, v, w] : arcs)
+        out.offsets[(reverse ? v : u) + 1]++;
+    for (int64_t u = 0; u < V; ++u)
+        out.offsets[u + 1] += out.offsets[u];
+    std::vector<int64_t> cursor(out.offsets.begin(), out.offsets.end() - 1);
+    for (const auto& [u, v, w] : arcs) {
+        int64_t from = reverse ? v : u;
+        int64_t slot = cursor[from]++;
+        out.targets[slot] = reverse ? u : v;
+        out.weights[slot] = w;
+    }
+}
+
+static void adjacency_list_arcs(AdjacencyListGraph* graph,
+                                std::vector<std::tuple<int64_t, int64_t, double>>& arcs) {
+    arcs.reserve(graph->edges.size());
+    for (const auto& [edge_key, edge] : graph->edges) {
+        double weight;
+        if (edge->value_type == DataType::Int)
+            weight = static_cast<double>(std::get<int64_t>(edge->value));
+        else if (edge->value_type == DataType::Double)
+            weight = std::get<double>(edge->value);
+        else
+            continue;
+        arcs.emplace_back(edge_key_source(edge_key), edge_key_target(edge_key), weight);
+    }
+}
+
+static void csr_arcs(CompressedSparseRowGraph* graph,
+                     std::vector<std::tuple<int64_t, int64_t, double>>& arcs) {
+    const int64_t V = static_cast<int64_t>(graph->nodes.size());
+    arcs.reserve(graph->targets.size());
+    for (int64_t u = 0; u < V; ++u)
+        for (int64_t i = graph->offsets[u]; i < graph->offsets[u + 1]; ++i)
+            arcs.emplace_back(u, graph->targets[i], graph->weights[i]);
+}
+
+// Runs Dijkstra from source over fwd and from target over bwd,
+// always advancing the side with the smaller tentative distance,
+// and stops once the two frontiers can no longer improve the best
+// source-target path found so far. Arcs with negative or nan
+// weights are ignored. On return pred holds the predecessors of
+// the vertices on the shortest path.
+static double bidirectional_dijkstra_kernel(ArcView fwd, ArcView bwd, int64_t V,
+                                            int64_t source, int64_t target,
+                                            std::vector<int64_t>& pred) {
+    const double inf = std::numeric_limits<double>::infinity();
+    pred.assign(V, -1);
+    if (source == target)
+        return 0.0;
+
+    std::vector<double> dist[2] = {std::vector<double>(V, inf), std::vector<double>(V, inf)};
+    std::vector<int64_t> parent[2] = {std::vector<int64_t>(V, -1), std::vector<int64_t>(V, -1)};
+    using PQEntry = std::pair<double, int64_t>;
+    std::priority_queue<PQEntry, std::vector<PQEntry>, std::greater<>> pq[2];
+    const ArcView views[2] = {fwd, bwd};
+
+    dist[0][source] = 0.0;
+    dist[1][target] = 0.0;
+    pq[0].push({0.0, source});
+    pq[1].push({0.0, target});
+    double best = inf;
+    int64_t meet = -1;
+
+    while (!pq[0].empty() && !pq[1].empty()) {
+        if (pq[0].top().first + pq[1].top().first >= best)
+            break;
+        int side = pq[0].top().first <= pq[1].top().first ? 0 : 1;
+        auto [d, u] = pq[side].top();
+        pq[side].pop();
+        if (d > dist[side][u])
+            continue;
+        const ArcView& arcs = views[side];
+        for (int64_t i = arcs.offsets[u]; i < arcs.offsets[u + 1]; ++i) {
+            double weight = arcs.weights[i];
+            if (!(weight >= 0))
+                continue;
+            int64_t v = arcs.targets[i];
+            double d_v = d + weight;
+            if (d_v < dist[side][v]) {
+                dist[side][v] = d_v;
+                parent[side][v] = u;
+                pq[side].push({d_v, v});
+            }
+            if (d_v + dist[1 - side][v] < best) {
+                best = d_v + dist[1 - side][v];
+                meet = v;
+            }
+        }
+    }
+
+    if (meet == -1)
+        return inf;
+    for (int64_t v = meet; parent[0][v] != -1; v = parent[0][v])
+        pred[v] = parent[0][v];
+    for (int64_t v = meet; parent[1][v] != -1; v = parent[1][v])
+        pred[parent[1][v]] = v;
+    return best;
+}
+
+// Computes the A* heuristic of a vertex, either by calling
+// heuristic(name, target_name) or as the euclidean distance
+// between the coordinates of the vertex and of the target.
+struct AStarHeuristic {
+    PyObject* heuristic;
+    PyObject* coordinates;
+    PyObject* target_name;
+    std::vector<double> goal;
+};
+
+static int a_star_coordinates(PyObject* coordinates, const std::string& name, std::vector<double>& point) {
+    PyObject* item = PyDict_Check(coordinates) ?
+        PyDict_GetItemString(coordinates, name.c_str()) : nullptr;
+    if (!item) {
+        if (!PyErr_Occurred())
+            PyErr_Format(PyExc_KeyError, "No coordinates for vertex %s", name.c_str());
+        return -1;
+    }
+    PyObject* fast = PySequence_Fast(item, "coordinates must be sequences of numbers");
+    if (!fast)
+        return -1;
+    Py_ssize_t n = PySequence_Fast_GET_SIZE(fast);
+    point.resize(n);
+    for (Py_ssize_t k = 0; k < n; ++k) {
+        point[k] = PyFloat_AsDouble(PySequence_Fast_GET_ITEM(fast, k));
+        if (point[k] == -1.0 && PyErr_Occurred()) {
+            Py_DECREF(fast);
+            return -1;
+        }
+    }
+    Py_DECREF(fast);
+    return 0;
+}
+
+static int a_star_estimate(AStarHeuristic& h, const std::string& name, double& estimate) {
+    if (h.heuristic != Py_None) {
+        PyObject* result = PyObject_CallFunction(h.heuristic, "sO", name.c_str(), h.target_name);
+        if (!result)
+            return -1;
+        estimate = PyFloat_AsDouble(result);
+        Py_DECREF(result);
+        return (estimate == -1.0 && PyErr_Occurred()) ? -1 : 0;
+    }
+    std::vector<double> point;
+    if (a_star_coordinates(h.coordinates, name, point) < 0)
+        return -1;
+    double sum = 0.0;
+    for (size_t k = 0; k < point.size() && k < h.goal.size(); ++k)
+        sum += (point[k] - h.goal[k]) * (point[k] - h.goal[k]);
+    estimate = std::sqrt(sum);
+    return 0;
+}
+
+// A* search which stops as soon as target is popped. Vertices
+// are reopened when their distance improves, so admissible but
+// inconsistent heuristics still give shortest paths. Returns -1
+// with a Python exception set if the heuristic fails.
+static int a_star_kernel(ArcView arcs, int64_t V, int64_t source, int64_t target,
+                         AStarHeuristic& h, const std::vector<const std::string*>& names,
+                         double& distance, std::vector<int64_t>& pred) {
+    const double inf = std::numeric_limits<double>::infinity();
+    const double unknown = std::numeric_limits<double>::quiet_NaN();
+    std::vector<double> dist(V, inf), estimate(V, unknown);
+    pred.assign(V, -1);
+    using PQEntry = std::tuple<double, double, int64_t>;
+    std::priority_queue<PQEntry, std::vector<PQEntry>, std::greater<>> pq;
+
+    dist[source] = 0.0;
+    if (a_star_estimate(h, *names[source], estimate[source]) < 0)
+        return -1;
+    pq.push({estimate[source], 0.0, source});
+    distance = inf;
+    while (!pq.empty()) {
+        auto [f, d, u] = pq.top();
+        pq.pop();
+        if (d > dist[u])
+            continue;
+        if (u == target) {
+            distance = d;
+            break;
+        }
+        for (int64_t i = arcs.offsets[u]; i < arcs.offsets[u + 1]; ++i) {
+            double weight = arcs.weights[i];
+            if (!(weight >= 0))
+                continue;
+            int64_t v = arcs.targets[i];
+            double d_v = d + weight;
+            if (d_v < dist[v]) {
+                if (std::isnan(estimate[v]) && a_star_estimate(h, *names[v], estimate[v]) < 0)
+                    return -1;
+                dist[v] = d_v;
+                pred[v] = u;
+                pq.push({d_v + estimate[v], d_v, v});
+            }
+        }
+    }
+    return 0;
+}
+
+// Builds (distance, predecessors) for the vertices given as
+// (id, name) pairs, mapping predecessor ids to names.
+static PyObject* point_to_point_result(double distance, const std::vector<int64_t>& pred,
+                                       const std::vector<std::pair<int64_t, const std::string*>>& vertices,
+                                       const std::vector<const std::string*>& names) {
+    PyObject* pred_dict = PyDict_New();
+    if (!pred_dict)
+        return nullptr;
+    for (const auto& [id, name] : vertices) {
+        PyObject* pval;
+        if (pred[id] == -1) {
+            Py_INCREF(Py_None);
+            pval = Py_None;
+        } else {
+            pval = PyUnicode_FromString(names[pred[id]]->c_str());
+        }
+        if (!pval || PyDict_SetItemString(pred_dict, name->c_str(), pval) < 0) {
+            Py_XDECREF(pval);
+            Py_DECREF(pred_dict);
+            return nullptr;
+        }
+        Py_DECREF(pval);
+    }
+    return Py_BuildValue("(dN)", distance, pred_dict);
+}
+
+static void adjacency_list_names(AdjacencyListGraph* graph,
+                                 std::vector<std::pair<int64_t, const std::string*>>& vertices,
+                                 std::vector<const std::string*>& names) {
+    names.assign(graph->next_id, nullptr);
+    for (AdjacencyListGraphNode* node : graph->nodes) {
+        const int id = AdjacencyListGraph_id(graph, node);
+        vertices.emplace_back(id, &node->name);
+        names[id] = &node->name;
+    }
+}
+
+static void csr_names(CompressedSparseRowGraph* graph,
+                      std::vector<std::pair<int64_t, const std::string*>>& vertices,
+                      std::vector<const std::string*>& names) {
+    for (size_t u = 0; u < graph->nodes.size(); ++u) {
+        vertices.emplace_back(static_cast<int64_t>(u), &graph->nodes[u]->name);
+        names.push_back(&graph->nodes[u]->name);
+    }
+}
+
+static int adjacency_list_endpoints(AdjacencyListGraph* graph, const char* source_name,
+                                    const char* target_name, int64_t& source, int64_t& target) {
+    auto it_source = graph->name_to_id.find(source_name);
+    if (it_source == graph->name_to_id.end()) {
+        PyErr_Format(PyExc_KeyError, "Vertex %s is not present in the graph", source_name);
+        return -1;
+    }
+    auto it_target = graph->name_to_id.find(target_name);
+    if (it_target == graph->name_to_id.end()) {
+        PyErr_Format(PyExc_KeyError, "Vertex %s is not present in the graph", target_name);
+        return -1;
+    }
+    source = it_source->second;
+    target = it_target->second;
+    return 0;
+}
+
+static PyObject* shortest_paths_bidirectional_dijkstra_adjacency_list(PyObject* self, PyObject* args, PyObject* kwargs) {
+    PyObject* graph_obj;
+    const char* source_name;
+    const char* target_name;
+
+    static const char* kwlist[] = {"graph", "source_node", "target_node", nullptr};
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "O!ss", const_cast<char**>(kwlist),
+                                     &AdjacencyListGraphType, &graph_obj,
+                                     &source_name, &target_name)) {
+        return nullptr;
+    }
+    if (target_name[0] == '\0') {
+        PyErr_SetString(PyExc_ValueError, "bidirectional_dijkstra requires a target.");
+        return nullptr;
+    }
+
+    AdjacencyListGraph* graph = reinterpret_cast<AdjacencyListGraph*>(graph_obj);
+    int64_t source, target;
+    if (adjacency_list_endpoints(graph, source_name, target_name, source, target) < 0)
+        return nullptr;
+
+    const int64_t V = graph->next_id;
+    std::vector<std::tuple<int64_t, int64_t, double>> arcs;
+    adjacency_list_arcs(graph, arcs);
+    ArcArrays fwd, bwd;
+    build_arc_arrays(fwd, V, arcs, false);
+    build_arc_arrays(bwd, V, arcs, true);
+
+    std::vector<int64_t> pred;
+    double distance = bidirectional_dijkstra_kernel(fwd.view(), bwd.view(), V, source, target, pred);
+
+    std::vector<std::pair<int64_t, const std::string*>> vertices;
+    std::vector<const std::string*> names;
+    adjacency_list_names(graph, vertices, names);
+    return point_to_point_result(distance, pred, vertices, names);
+}
+
+static PyObject* shortest_paths_bidirectional_dijkstra_csr(PyObject* self, PyObject* args, PyObject* kwargs) {
+    PyObject* graph_obj;
+    const char* source_name;
+    const char* target_name;
+
+    static const char* kwlist[] = {"graph", "source_node", "target_node", nullptr};
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "O!ss", const_cast<char**>(kwlist),
+                                     &CompressedSparseRowGraphType, &graph_obj,
+                                     &source_name, &target_name)) {
+        return nullptr;
+    }
+    if (target_name[0] == '\0') {
+        PyErr_SetString(PyExc_ValueError, "bidirectional_dijkstra requires a target.");
+        return nullptr;
+    }
+
+    CompressedSparseRowGraph* graph = reinterpret_cast<CompressedSparseRowGraph*>(graph_obj);
+    int64_t source = CompressedSparseRowGraph_find(graph, source_name);
+    if (source < 0)
+        return nullptr;
+    int64_t target = CompressedSparseRowGraph_find(graph, target_name);
+    if (target < 0)
+        return nullptr;
+    CompressedSparseRowGraph_build(graph);
+
+    const int64_t V = static_cast<int64_t>(graph->nodes.size());
+    std::vector<std::tuple<int64_t, int64_t, double>> arcs;
+    csr_arcs(graph, arcs);
+    ArcArrays bwd;
+    build_arc_arrays(bwd, V, arcs, true);
+    ArcView fwd = {graph->offsets.data(), graph->targets.data(), graph->weights.data()};
+
+    std::vector<int64_t> pred;
+    double distance = bidirectional_dijkstra_kernel(fwd, bwd.view(), V, source, target, pred);
+
+    std::vector<std::pair<int64_t, const std::string*>> vertices;
+    std::vector<const std::string*> names;
+    csr_names(graph, vertices, names);
+    return point_to_point_result(distance, pred, vertices, names);
+}
+
+static int parse_a_star_heuristic(AStarHeuristic& h, PyObject* heuristic, PyObject* coordinates,
+                                  const char* target_name) {
+    h.heuristic = heuristic;
+    h.coordinates = coordinates;
+    h.target_name = nullptr;
+    if (heuristic == Py_None && coordinates == Py_None) {
+        PyErr_SetString(PyExc_ValueError, "a_star requires either a heuristic or coordinates.");
+        return -1;
+    }
+    if (heuristic == Py_None && a_star_coordinates(coordinates, target_name, h.goal) < 0)
+        return -1;
+    h.target_name = PyUnicode_FromString(target_name);
+    return h.target_name ? 0 : -1;
+}
+
+static PyObject* shortest_paths_a_star_adjacency_list(PyObject* self, PyObject* args, PyObject* kwargs) {
+    PyObject* graph_obj;
+    const char* source_name;
+    const char* target_name;
+    PyObject* heuristic = Py_None;
+    PyObject* coordinates = Py_None;
+
+    static const char* kwlist[] = {"graph", "source_node", "target_node", "heuristic", "coordinates", nullptr};
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "O!ss|OO", const_cast<char**>(kwlist),
+                                     &AdjacencyListGraphType, &graph_obj,
+                                     &source_name, &target_name, &heuristic, &coordinates)) {
+        return nullptr;
+    }
+    if (target_name[0] == '\0') {
+        PyErr_SetString(PyExc_ValueError, "a_star requires a target.");
+        return nullptr;
+    }
+
+    AdjacencyListGraph* graph = reinterpret_cast<AdjacencyListGraph*>(graph_obj);
+    int64_t source, target;
+    if (adjacency_list_endpoints(graph, source_name, target_name, source, target) < 0)
+        return nullptr;
+    AStarHeuristic h;
+    if (parse_a_star_heuristic(h, heuristic, coordinates, target_name) < 0)
+        return nullptr;
+
+    const int64_t V = graph->next_id;
+    std::vector<std::tuple<int64_t, int64_t, double>> arcs;
+    adjacency_list_arcs(graph, arcs);
+    ArcArrays fwd;
+    build_arc_arrays(fwd, V, arcs, false);
+
+    std::vector<std::pair<int64_t, const std::string*>> vertices;
+    std::vector<const std::string*> names;
+    adjacency_list_names(graph, vertices, names);
+
+    double distance;
+    std::vector<int64_t> pred;
+    int status = a_star_kernel(fwd.view(), V, source, target, h, names, distance, pred);
+    Py_DECREF(h.target_name);
+    if (status < 0)
+        return nullptr;
+    return point_to_point_result(distance, pred, vertices, names);
+}
+
+static PyObject* shortest_paths_a_star_csr(PyObject* self, PyObject* args, PyObject* kwargs) {
+    PyObject* graph_obj;
+    const char* source_name;
+    const char* target_name;
+    PyObject* heuristic = Py_None;
+    PyObject* coordinates = Py_None;
+
+    static const char* kwlist[] = {"graph", "source_node", "target_node", "heuristic", "coordinates", nullptr};
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "O!ss|OO", const_cast<char**>(kwlist),
+                                     &CompressedSparseRowGraphType, &graph_obj,
+                                     &source_name, &target_name, &heuristic, &coordinates)) {
+        return nullptr;
+    }
+    if (target_name[0] == '\0') {
+        PyErr_SetString(PyExc_ValueError, "a_star requires a target.");
+        return nullptr;
+    }
+
+    CompressedSparseRowGraph* graph = reinterpret_cast<CompressedSparseRowGraph*>(graph_obj);
+    int64_t source = CompressedSparseRowGraph_find(graph, source_name);
+    if (source < 0)
+        return nullptr;
+    int64_t target = CompressedSparseRowGraph_find(graph, target_name);
+    if (target < 0)
+        return nullptr;
+    AStarHeuristic h;
+    if (parse_a_star_heuristic(h, heuristic, coordinates, target_name) < 0)
+        return nullptr;
+    CompressedSparseRowGraph_build(graph);
+
+    const int64_t V = static_cast<int64_t>(graph->nodes.size());
+    ArcView fwd = {graph->offsets.data(), graph->targets.data(), graph->weights.data()};
+    std::vector<std::pair<int64_t, const std::string*>> vertices;
+    std::vector<const std::string*> names;
+    csr_names(graph, vertices, names);
+
+    double distance;
+    std::vector<int64_t> pred;
+    int status = a_star_kernel(fwd, V, source, target, h, names, distance, pred);
+    Py_DECREF(h.target_name);
+    if (status < 0)
+        return nullptr;
+    return point_to_point_result(distance, pred, vertices, names);
+}
+
+// Groups the neighbors of every vertex of an adjacency list graph,
+// weighted or not, into offsets and targets over internal ids.
+static void adjacency_list_neighbors(AdjacencyListGraph* graph,
+                                     std::vector<int64_t>& offsets,
+                                     std::vector<int64_t>& targets) {
+    offsets.assign(graph->next_id + 1, 0);
+    for (AdjacencyListGraphNode* node : graph->nodes)
+        offsets[AdjacencyListGraph_id(graph, node) + 1] = static_cast<int64_t>(node->adjacent.size());
+    for (int64_t u = 0; u < graph->next_id; ++u)
+        offsets[u + 1] += offsets[u];
+    targets.assign(offsets.back(), -1);
+    for (AdjacencyListGraphNode* node : graph->nodes) {
+        int64_t slot = offsets[AdjacencyListGraph_id(graph, node)];
+        for (const auto& [adj_name, adj_obj] : node->adjacent) {
+            auto it = graph->name_to_id.find(adj_name);
+            if (it != graph->name_to_id.end())
+                targets[slot++] = it->second;
+        }
+    }
+}
+
+// Sources of the incoming edges of every vertex by id, read from
+// the in-neighbor sets of a graph which keeps them.
+static void adjacency_list_in_neighbors(AdjacencyListGraph* graph,
+                                        std::vector<int64_t>& offsets,
+                                        std::vector<int64_t>& targets) {
+    offsets.assign(graph->next_id + 1, 0);
+    for (const auto& [v, sources] : graph->in_neighbors)
+        offsets[v + 1] = static_cast<int64_t>(sources.size());
+    for (int64_t v = 0; v < graph->next_id; ++v)
+        offsets[v + 1] += offsets[v];
+    targets.resize(offsets.back());
+    for (const auto& [v, sources] : graph->in_neighbors)
+        std::copy(sources.begin(), sources.end(), targets.begin() + offsets[v]);
+}
+
+// Level synchronous breadth first search. The vertices of every
+// level are split into contiguous blocks, one per worker of a pool
+// which lives for the whole traversal. Each worker claims unvisited
+// neighbors with a compare and swap on parent and appends them to
+// a private buffer, and the buffers are concatenated into the next
+// frontier at the barrier, all without holding the GIL. visit is
+// then called with the GIL held for every new level and returns 1
+// to continue, 0 to stop or -1 on error.
+template <typename Visit>
+static int level_parallel_bfs(const int64_t* offsets, const int64_t* targets, int64_t V,
+                              int64_t source, int num_threads, Visit visit) {
+    std::vector<std::atomic<int64_t>> parent(V);
+    for (int64_t v = 0; v < V; ++v)
+        parent[v].store(-1, std::memory_order_relaxed);
+    parent[source].store(source, std::memory_order_relaxed);
+
+    std::vector<int64_t> frontier(1, source), next;
+    int status = 1;
+    Py_BEGIN_ALLOW_THREADS
+    WorkerPool pool(num_threads);
+    std::vector<std::vector<int64_t>> buffers(pool.size());
+    auto expand = [&](int t) {
+        std::vector<int64_t>& buffer = buffers[t];
+        buffer.clear();
+        auto [lo, hi] = pool.block(t, static_cast<int64_t>(frontier.size()));
+        for (int64_t k = lo; k < hi; ++k) {
+            int64_t u = frontier[k];
+            for (int64_t i = offsets[u]; i < offsets[u + 1]; ++i) {
+                int64_t v = targets[i];
+                if (v < 0 || parent[v].load(std::memory_order_relaxed) != -1)
+                    continue;
+                int64_t unvisited = -1;
+                if (parent[v].compare_exchange_strong(unvisited, u, std::memory_order_relaxed))
+                    buffer.push_back(v);
+            }
+        }
+    };
+    while (!frontier.empty()) {
+        pool.run(expand);
+        next.clear();
+        for (const std::vector<int64_t>& buffer : buffers)
+            next.insert(next.end(), buffer.begin(), buffer.end());
+        frontier.swap(next);
+        if (frontier.empty())
+            break;
+        Py_BLOCK_THREADS
+        status = visit(frontier, parent);
+        Py_UNBLOCK_THREADS
+        if (status <= 0)
+            break;
+    }
+    Py_END_ALLOW_THREADS
+    return status;
+}
+
+static PyObject* breadth_first_search_parallel_adjacency_list(PyObject* self, PyObject* args, PyObject* kwargs) {
+    PyObject* graph_obj;
+    const char* source_name;
+    int num_threads;
+    PyObject* operation;
+    PyObject* varargs = nullptr;
+    PyObject* kwargs_dict = nullptr;
+    static const char* kwlist[] = {"graph", "source_node", "num_threads", "operation", "args", "kwargs", nullptr};
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "O!siO|OO", const_cast<char**>(kwlist),
+                                     &AdjacencyListGraphType, &graph_obj,
+                                     &source_name, &num_threads, &operation,
+                                     &varargs, &kwargs_dict)) {
+        return nullptr;
+    }
+
+    AdjacencyListGraph* graph = reinterpret_cast<AdjacencyListGraph*>(graph_obj);
+    auto it = graph->name_to_id.find(source_name);
+    if (it == graph->name_to_id.end()) {
+        PyErr_Format(PyExc_KeyError, "Vertex %s is not present in the graph", source_name);
+        return nullptr;
+    }
+
+    std::vector<int64_t> offsets, targets;
+    adjacency_list_neighbors(graph, offsets, targets);
+    auto visit = [&](const std::vector<int64_t>& level,
+                     const std::vector<std::atomic<int64_t>>& parent) {
+        for (int64_t v : level) {
+            int64_t u = parent[v].load(std::memory_order_relaxed);
+            int status = call_traversal_operation(operation,
+                                                  reinterpret_cast<PyObject*>(graph->id_map[u]),
+                                                  reinterpret_cast<PyObject*>(graph->id_map[v]),
+                                                  varargs, kwargs_dict);
+            if (status <= 0)
+                return status;
+        }
+        return 1;
+    };
+    if (level_parallel_bfs(offsets.data(), targets.data(), graph->next_id,
+                           it->second, num_threads, visit) < 0)
+        return nullptr;
+    Py_RETURN_NONE;
+}
+
+static PyObject* breadth_first_search_parallel_csr(PyObject* self, PyObject* args, PyObject* kwargs) {
+    PyObject* graph_obj;
+    const char* source_name;
+    int num_threads;
+    PyObject* operation;
+    PyObject* varargs = nullptr;
+    PyObject* kwargs_dict = nullptr;
+    static const char* kwlist[] = {"graph", "source_node", "num_threads", "operation", "args", "kwargs", nullptr};
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "O!siO|OO", const_cast<char**>(kwlist),
+                                     &CompressedSparseRowGraphType, &graph_obj,
+                                     &source_name, &num_threads, &operation,
+                                     &varargs, &kwargs_dict)) {
+        return nullptr;
+    }
+
+    CompressedSparseRowGraph* graph = reinterpret_cast<CompressedSparseRowGraph*>(graph_obj);
+    int64_t source = CompressedSparseRowGraph_find(graph, source_name);
+    if (source < 0)
+        return nullptr;
+    CompressedSparseRowGraph_build(graph);
+
+    auto visit = [&](const std::vector<int64_t>& level,
+                     const std::vector<std::atomic<int64_t>>& parent) {
+        for (int64_t v : level) {
+            int64_t u = parent[v].load(std::memory_order_relaxed);
+            int status = call_traversal_operation(operation,
+                                                  reinterpret_cast<PyObject*>(graph->nodes[u]),
+                                                  reinterpret_cast<PyObject*>(graph->nodes[v]),
+                                                  varargs, kwargs_dict);
+            if (status <= 0)
+                return status;
+        }
+        return 1;
+    };
+    if (level_parallel_bfs(graph->offsets.data(), graph->targets.data(),
+                           static_cast<int64_t>(graph->nodes.size()),
+                           source, num_threads, visit) < 0)
+        return nullptr;
+    Py_RETURN_NONE;
+}
+
+// Transposes offsets and targets over V vertices.
+static void transpose_arrays(const int64_t* offsets, const int64_t* targets, int64_t V,
+                             std::vector<int64_t>& in_offsets, std::vector<int64_t>& in_targets) {
+    in_offsets.assign(V + 1, 0);
+    for (int64_t i = 0; i < offsets[V]; ++i)
+        if (targets[i] >= 0)
+            in_offsets[targets[i] + 1]++;
+    for (int64_t v = 0; v < V; ++v)
+        in_offsets[v + 1] += in_offsets[v];
+    in_targets.resize(in_offsets[V]);
+    std::vector<int64_t> cursor(in_offsets.begin(), in_offsets.end() - 1);
+    for (int64_t u = 0; u < V; ++u)
+        for (int64_t i = offsets[u]; i < offsets[u + 1]; ++i)
+            if (targets[i] >= 0)
+                in_targets[cursor[targets[i]]++] = u;
+}
+
+// Breadth first search from source which, if direction_optimizing
+// is set, performs the levels whose frontier has more than 1/alpha
+// of the unchecked edges bottom up, i.e., by scanning the incoming
+// edges of the unvisited vertices for one in the frontier, and
+// returns to top down steps once the frontier has fewer than 1/beta
+// of the vertices. alpha and beta are the values suggested by
+// Beamer et al. transpose() is called before the first bottom up
+// level and returns the incoming edges as a pair of offsets and
+// sources. visit_order holds the reached vertices level by level;
+// parent and depth are -1 for the unreached ones.
+template <typename Transpose>
+static void direction_optimizing_bfs(const int64_t* offsets, const int64_t* targets, int64_t V,
+                                     int64_t source, bool direction_optimizing,
+                                     Transpose transpose,
+                                     std::vector<int64_t>& visit_order,
+                                     std::vector<int64_t>& parent,
+                                     std::vector<int64_t>& depth) {
+    const int64_t alpha = 14, beta = 24;
+    parent.assign(V, -1);
+    depth.assign(V, -1);
+    visit_order.clear();
+    visit_order.reserve(V);
+    parent[source] = source;
+    depth[source] = 0;
+    visit_order.push_back(source);
+
+    const int64_t* in_offsets = nullptr;
+    const int64_t* in_targets = nullptr;
+    int64_t frontier_edges = offsets[source + 1] - offsets[source];
+    int64_t unchecked_edges = offsets[V] - frontier_edges;
+    bool bottom_up = false;
+    size_t head = 0;
+    for (int64_t level = 0; head < visit_order.size(); ++level) {
+        size_t lo = head, hi = visit_order.size();
+        if (direction_optimizing) {
+            if (!bottom_up && frontier_edges * alpha > unchecked_edges)
+                bottom_up = true;
+            else if (bottom_up && static_cast<int64_t>(hi - lo) * beta < V)
+                bottom_up = false;
+        }
+        if (bottom_up) {
+            if (!in_offsets)
+                std::tie(in_offsets, in_targets) = transpose();
+            for (int64_t v = 0; v < V; ++v) {
+                if (parent[v] != -1)
+                    continue;
+                for (int64_t i = in_offsets[v]; i < in_offsets[v + 1]; ++i) {
+                    int64_t u = in_targets[i];
+                    if (depth[u] == level) {
+                        parent[v] = u;
+                        depth[v] = level + 1;
+                        visit_order.push_back(v);
+                        break;
+                    }
+                }
+            }
+        } else {
+            for (size_t k = lo; k < hi; ++k) {
+                int64_t u = visit_order[k];
+                for (int64_t i = offsets[u]; i < offsets[u + 1]; ++i) {
+                    int64_t v = targets[i];
+                    if (v >= 0 && parent[v] == -1) {
+                        parent[v] = u;
+                        depth[v] = level + 1;
+                        visit_order.push_back(v);
+                    }
+                }
+            }
+        }
+        head = hi;
+        frontier_edges = 0;
+        for (size_t k = hi; k < visit_order.size(); ++k)
+            frontier_edges += offsets[visit_order[k] + 1] - offsets[visit_order[k]];
+        unchecked_edges -= frontier_edges;
+    }
+}
+
+// Returns (visit_order, parent, depth) as arrays if operation is
+// None, otherwise calls operation(parent_node, node, *varargs) for
+// every reached vertex in the order of discovery.
+template <typename Node>
+static PyObject* search_tree_result(const std::vector<int64_t>& visit_order,
+                                                    const std::vector<int64_t>& parent,
+                                                    const std::vector<int64_t>& depth,
+                                                    PyObject* operation, PyObject* varargs,
+                                                    Node node) {
+    if (operation == Py_None) {
+        PyObject* order_obj = int64_array(visit_order);
+        PyObject* parent_obj = order_obj ? int64_array(parent) : nullptr;
+        PyObject* depth_obj = parent_obj ? int64_array(depth) : nullptr;
+        if (!depth_obj) {
+            Py_XDECREF(order_obj);
+            Py_XDECREF(parent_obj);
+            return nullptr;
+        }
+        return Py_BuildValue("(NNN)", order_obj, parent_obj, depth_obj);
+    }
+    for (size_t k = 1; k < visit_order.size(); ++k) {
+        int64_t v = visit_order[k];
+        int status = call_traversal_operation(operation, node(parent[v]), node(v),
+                                              varargs, nullptr);
+        if (status < 0)
+            return nullptr;
+        if (status == 0)
+            break;
+    }
+    Py_RETURN_NONE;
+}
+
+static PyObject* breadth_first_search_levels_adjacency_list(PyObject* self, PyObject* args, PyObject* kwargs) {
+    PyObject* graph_obj;
+    const char* source_name;
+    int direction_optimizing = 0;
+    PyObject* operation = Py_None;
+    PyObject* varargs = nullptr;
+    static const char* kwlist[] = {"graph", "source_node", "direction_optimizing", "operation", "args", nullptr};
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "O!s|pOO", const_cast<char**>(kwlist),
+                                     &AdjacencyListGraphType, &graph_obj,
+                                     &source_name, &direction_optimizing,
+                                     &operation, &varargs)) {
+        return nullptr;
+    }
+
+    AdjacencyListGraph* graph = reinterpret_cast<AdjacencyListGraph*>(graph_obj);
+    auto it = graph->name_to_id.find(source_name);
+    if (it == graph->name_to_id.end()) {
+        PyErr_Format(PyExc_KeyError, "Vertex %s is not present in the graph", source_name);
+        return nullptr;
+    }
+
+    std::vector<int64_t> offsets, targets, in_offsets, in_targets, visit_order, parent, depth;
+    adjacency_list_neighbors(graph, offsets, targets);
+    auto transpose = [&]() {
+        if (graph->track_in)
+            adjacency_list_in_neighbors(graph, in_offsets, in_targets);
+        else
+            transpose_arrays(offsets.data(), targets.data(), graph->next_id, in_offsets, in_targets);
+        return std::make_pair(in_offsets.data(), in_targets.data());
+    };
+    direction_optimizing_bfs(offsets.data(), targets.data(), graph->next_id, it->second,
+                             direction_optimizing, transpose, visit_order, parent, depth);
+    return search_tree_result(visit_order, parent, depth, operation, varargs,
+        [graph](int64_t u) { return reinterpret_cast<PyObject*>(graph->id_map[u]); });
+}
+
+static PyObject* breadth_first_search_levels_csr(PyObject* self, PyObject* args, PyObject* kwargs) {
+    PyObject* graph_obj;
+    const char* source_name;
+    int direction_optimizing = 0;
+    PyObject* operation = Py_None;
+    PyObject* varargs = nullptr;
+    static const char* kwlist[] = {"graph", "source_node", "direction_optimizing", "operation", "args", nullptr};
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "O!s|pOO", const_cast<char**>(kwlist),
+                                     &CompressedSparseRowGraphType, &graph_obj,
+                                     &source_name, &direction_optimizing,
+                                     &operation, &varargs)) {
+        return nullptr;
+    }
+
+    CompressedSparseRowGraph* graph = reinterpret_cast<CompressedSparseRowGraph*>(graph_obj);
+    int64_t source = CompressedSparseRowGraph_find(graph, source_name);
+    if (source < 0)
+        return nullptr;
+    CompressedSparseRowGraph_build(graph);
+
+    std::vector<int64_t> visit_order, parent, depth;
+    auto transpose = [graph]() {
+        CompressedSparseRowGraph_transpose(graph);
+        return std::make_pair(graph->in_offsets.data(), graph->in_targets.data());
+    };
+    direction_optimizing_bfs(graph->offsets.data(), graph->targets.data(),
+                             static_cast<int64_t>(graph->nodes.size()), source,
+                             direction_optimizing, transpose, visit_order, parent, depth);
+    return search_tree_result(visit_order, parent, depth, operation, varargs,
+        [graph](int64_t u) { return reinterpret_cast<PyObject*>(graph->nodes[u]); });
+}
+
+// Groups the neighbors of every vertex of an adjacency matrix graph
+// into offsets and targets, numbering the vertices in the order in
+// which they are stored.
+static void adjacency_matrix_neighbors(AdjacencyMatrixGraph* graph,
+                                       std::vector<int64_t>& offsets,
+                                       std::vector<int64_t>& targets) {
+    std::unordered_map<std::string, int64_t> ids;
+    for (size_t u = 0; u < graph->nodes.size(); ++u)
+        ids[reinterpret_cast<GraphNode*>(graph->nodes[u])->name] = static_cast<int64_t>(u);
+    offsets.assign(1, 0);
+    targets.clear();
+    for (AdjacencyMatrixGraphNode* node : graph->nodes) {
+        auto row = graph->matrix.find(reinterpret_cast<GraphNode*>(node)->name);
+        if (row != graph->matrix.end()) {
+            for (const auto& [adj_name, connected] : row->second) {
+                auto it = ids.find(adj_name);
+                if (connected && it != ids.end())
+                    targets.push_back(it->second);
+            }
+        }
+        offsets.push_back(static_cast<int64_t>(targets.size()));
+    }
+}
+
+static int64_t adjacency_matrix_find(AdjacencyMatrixGraph* graph, const char* name) {
+    for (size_t u = 0; u < graph->nodes.size(); ++u)
+        if (reinterpret_cast<GraphNode*>(graph->nodes[u])->name == name)
+            return static_cast<int64_t>(u);
+    PyErr_Format(PyExc_KeyError, "Vertex %s is not present in the graph", name);
+    return -1;
+}
+
+static PyObject* breadth_first_search_levels_adjacency_matrix(PyObject* self, PyObject* args, PyObject* kwargs) {
+    PyObject* graph_obj;
+    const char* source_name;
+    int direction_optimizing = 0;
+    PyObject* operation = Py_None;
+    PyObject* varargs = nullptr;
+    static const char* kwlist[] = {"graph", "source_node", "direction_optimizing", "operation", "args", nullptr};
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "O!s|pOO", const_cast<char**>(kwlist),
+                                     &AdjacencyMatrixGraphType, &graph_obj,
+                                     &source_name, &direction_optimizing,
+                                     &operation, &varargs)) {
+        return nullptr;
+    }
+
+    AdjacencyMatrixGraph* graph = reinterpret_cast<AdjacencyMatrixGraph*>(graph_obj);
+    int64_t source = adjacency_matrix_find(graph, source_name);
+    if (source < 0)
+        return nullptr;
+
+    const int64_t V = static_cast<int64_t>(graph->nodes.size());
+    std::vector<int64_t> offsets, targets, in_offsets, in_targets, visit_order, parent, depth;
+    adjacency_matrix_neighbors(graph, offsets, targets);
+    auto transpose = [&]() {
+        transpose_arrays(offsets.data(), targets.data(), V, in_offsets, in_targets);
+        return std::make_pair(in_offsets.data(), in_targets.data());
+    };
+    direction_optimizing_bfs(offsets.data(), targets.data(), V, source,
+                             direction_optimizing, transpose, visit_order, parent, depth);
+    return search_tree_result(visit_order, parent, depth, operation, varargs,
+        [graph](int64_t u) { return reinterpret_cast<PyObject*>(graph->nodes[u]); });
+}
+
+// Depth first search from source which, like the Python version,
+// marks the neighbors of a vertex as discovered when it is popped
+// from the stack.
+static void depth_first_search_tree(const int64_t* offsets, const int64_t* targets, int64_t V,
+                                    int64_t source, std::vector<int64_t>& visit_order,
+                                    std::vector<int64_t>& parent, std::vector<int64_t>& depth) {
+    parent.assign(V, -1);
+    depth.assign(V, -1);
+    visit_order.assign(1, source);
+    parent[source] = source;
+    depth[source] = 0;
+    std::vector<int64_t> stack(1, source);
+    while (!stack.empty()) {
+        int64_t u = stack.back();
+        stack.pop_back();
+        for (int64_t i = offsets[u]; i < offsets[u + 1]; ++i) {
+            int64_t v = targets[i];
+            if (v >= 0 && parent[v] == -1) {
+                parent[v] = u;
+                depth[v] = depth[u] + 1;
+                visit_order.push_back(v);
+                stack.push_back(v);
+            }
+        }
+    }
+}
+
+static PyObject* depth_first_search_tree_adjacency_list(PyObject* self, PyObject* args, PyObject* kwargs) {
+    PyObject* graph_obj;
+    const char* source_name;
+    PyObject* operation = Py_None;
+    PyObject* varargs = nullptr;
+    static const char* kwlist[] = {"graph", "source_node", "operation", "args", nullptr};
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "O!s|OO", const_cast<char**>(kwlist),
+                                     &AdjacencyListGraphType, &graph_obj,
+                                     &source_name, &operation, &varargs)) {
+        return nullptr;
+    }
+
+    AdjacencyListGraph* graph = reinterpret_cast<AdjacencyListGraph*>(graph_obj);
+    auto it = graph->name_to_id.find(source_name);
+    if (it == graph->name_to_id.end()) {
+        PyErr_Format(PyExc_KeyError, "Vertex %s is not present in the graph", source_name);
+        return nullptr;
+    }
+
+    std::vector<int64_t> offsets, targets, visit_order, parent, depth;
+    adjacency_list_neighbors(graph, offsets, targets);
+    depth_first_search_tree(offsets.data(), targets.data(), graph->next_id, it->second,
+                            visit_order, parent, depth);
+    return search_tree_result(visit_order, parent, depth, operation, varargs,
+        [graph](int64_t u) { return reinterpret_cast<PyObject*>(graph->id_map[u]); });
+}
+
+static PyObject* depth_first_search_tree_adjacency_matrix(PyObject* self, PyObject* args, PyObject* kwargs) {
+    PyObject* graph_obj;
+    const char* source_name;
+    PyObject* operation = Py_None;
+    PyObject* varargs = nullptr;
+    static const char* kwlist[] = {"graph", "source_node", "operation", "args", nullptr};
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "O!s|OO", const_cast<char**>(kwlist),
+                                     &AdjacencyMatrixGraphType, &graph_obj,
+                                     &source_name, &operation, &varargs)) {
+        return nullptr;
+    }
+
+    AdjacencyMatrixGraph* graph = reinterpret_cast<AdjacencyMatrixGraph*>(graph_obj);
+    int64_t source = adjacency_matrix_find(graph, source_name);
+    if (source < 0)
+        return nullptr;
+
+    std::vector<int64_t> offsets, targets, visit_order, parent, depth;
+    adjacency_matrix_neighbors(graph, offsets, targets);
+    depth_first_search_tree(offsets.data(), targets.data(),
+                            static_cast<int64_t>(graph->nodes.size()), source,
+                            visit_order, parent, depth);
+    return search_tree_result(visit_order, parent, depth, operation, varargs,
+        [graph](int64_t u) { return reinterpret_cast<PyObject*>(graph->nodes[u]); });
+}
+
+static PyObject* depth_first_search_tree_csr(PyObject* self, PyObject* args, PyObject* kwargs) {
+    PyObject* graph_obj;
+    const char* source_name;
+    PyObject* operation = Py_None;
+    PyObject* varargs = nullptr;
+    static const char* kwlist[] = {"graph", "source_node", "operation", "args", nullptr};
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "O!s|OO", const_cast<char**>(kwlist),
+                                     &CompressedSparseRowGraphType, &graph_obj,
+                                     &source_name, &operation, &varargs)) {
+        return nullptr;
+    }
+
+    CompressedSparseRowGraph* graph = reinterpret_cast<CompressedSparseRowGraph*>(graph_obj);
+    int64_t source = CompressedSparseRowGraph_find(graph, source_name);
+    if (source < 0)
+        return nullptr;
+    CompressedSparseRowGraph_build(graph);
+
+    std::vector<int64_t> visit_order, parent, depth;
+    depth_first_search_tree(graph->offsets.data(), graph->targets.data(),
+                            static_cast<int64_t>(graph->nodes.size()), source,
+                            visit_order, parent, depth);
+    return search_tree_result(visit_order, parent, depth, operation, varargs,
+        [graph](int64_t u) { return reinterpret_cast<PyObject*>(graph->nodes[u]); });
+}
+
+// Iterator over the (vertex, parent, depth) triples of a breadth or
+// depth first search, advancing the search natively batch_size
+// vertices at a time. Adjacency list and matrix graphs are copied
+// into offsets and targets when the iterator is created, while CSR
+// graphs are read in place and must not be modified meanwhile.
+typedef struct {
+    PyObject_HEAD
+    PyObject* graph;
+    CompressedSparseRowGraph* csr;
+    std::vector<int64_t> offsets;
+    std::vector<int64_t> targets;
+    std::vector<std::string> names;
+    int64_t num_vertices;
+    int64_t num_edges;
+    bool depth_first;
+    Py_ssize_t batch_size;
+    std::vector<char> visited;
+    std::deque<std::pair<int64_t, int64_t>> queue;
+    std::vector<std::tuple<int64_t, int64_t, int64_t>> stack;
+    std::vector<std::tuple<int64_t, int64_t, int64_t>> batch;
+    size_t next;
+} GraphSearchIterator;
+
+static void GraphSearchIterator_dealloc(GraphSearchIterator* self) {
+    using int_vector = std::vector<int64_t>;
+    using name_vector = std::vector<std::string>;
+    using char_vector = std::vector<char>;
+    using queue_type = std::deque<std::pair<int64_t, int64_t>>;
+    using triple_vector = std::vector<std::tuple<int64_t, int64_t, int64_t>>;
+    self->offsets.~int_vector();
+    self->targets.~int_vector();
+    self->names.~name_vector();
+    self->visited.~char_vector();
+    self->queue.~queue_type();
+    self->stack.~triple_vector();
+    self->batch.~triple_vector();
+    Py_XDECREF(self->graph);
+    Py_TYPE(self)->tp_free(reinterpret_cast<PyObject*>(self));
+}
+
+static const int64_t* GraphSearchIterator_offsets(GraphSearchIterator* self) {
+    return self->csr ? self->csr->offsets.data() : self->offsets.data();
+}
+
+static const int64_t* GraphSearchIterator_targets(GraphSearchIterator* self) {
+    return self->csr ? self->csr->targets.data() : self->targets.data();
+}
+
+// Runs the search until at least batch_size more vertices have been
+// discovered or it is exhausted.
+static int GraphSearchIterator_advance(GraphSearchIterator* self) {
+    if (self->csr) {
+        CompressedSparseRowGraph* graph = self->csr;
+        if (static_cast<int64_t>(graph->nodes.size()) != self->num_vertices ||
+            static_cast<int64_t>(graph->targets.size()) != self->num_edges ||
+            !graph->pending_targets.empty()) {
+            PyErr_SetString(PyExc_RuntimeError, "graph changed during iteration");
+            return -1;
+        }
+    }
+    const int64_t* offsets = GraphSearchIterator_offsets(self);
+    const int64_t* targets = GraphSearchIterator_targets(self);
+    self->batch.clear();
+    self->next = 0;
+    size_t limit = static_cast<size_t>(self->batch_size);
+
+    if (self->depth_first) {
+        while (self->batch.size() < limit && !self->stack.empty()) {
+            auto& [u, i, d] = self->stack.back();
+            if (i == offsets[u + 1]) {
+                self->stack.pop_back();
+                continue;
+            }
+            int64_t v = targets[i++], parent = u, depth = d + 1;
+            if (v >= 0 && !self->visited[v]) {
+                self->visited[v] = 1;
+                self->batch.emplace_back(v, parent, depth);
+                self->stack.emplace_back(v, offsets[v], depth);
+            }
+        }
+    } else {
+        while (self->batch.size() < limit && !self->queue.empty()) {
+            auto [u, d] = self->queue.front();
+            self->queue.pop_front();
+            for (int64_t i = offsets[u]; i < offsets[u + 1]; ++i) {
+                int64_t v = targets[i];
+                if (v >= 0 && !self->visited[v]) {
+                    self->visited[v] = 1;
+                    self->batch.emplace_back(v, u, d + 1);
+                    self->queue.emplace_back(v, d + 1);
+                }
+            }
+        }
+    }
+    return 0;
+}
+
+static PyObject* GraphSearchIterator_name(GraphSearchIterator* self, int64_t u) {
+    const std::string& name = self->csr ? self->csr->nodes[u]->name : self->names[u];
+    return PyUnicode_FromStringAndSize(name.data(), name.size());
+}
+
+static PyObject* GraphSearchIterator_iternext(GraphSearchIterator* self) {
+    if (self->next == self->batch.size()) {
+        if (GraphSearchIterator_advance(self) < 0)
+            return nullptr;
+        if (self->batch.empty())
+            return nullptr;
+    }
+    auto [v, u, d] = self->batch[self->next++];
+    PyObject* vertex = GraphSearchIterator_name(self, v);
+    if (!vertex)
+        return nullptr;
+    PyObject* parent;
+    if (u < 0) {
+        parent = Py_None;
+        Py_INCREF(parent);
+    } else if (!(parent = GraphSearchIterator_name(self, u))) {
+        Py_DECREF(vertex);
+        return nullptr;
+    }
+    return Py_BuildValue("(NNL)", vertex, parent, static_cast<long long>(d));
+}
+
+inline PyTypeObject GraphSearchIteratorType = {
+    PyVarObject_HEAD_INIT(NULL, 0)
+    "_graph.GraphSearchIterator",                   // tp_name
+    sizeof(GraphSearchIterator),                    // tp_basicsize
+    0,                                               // tp_itemsize
+    (destructor)GraphSearchIterator_dealloc,        // tp_dealloc
+    0,                                               // tp_vectorcall_offset
+    0,                                               // tp_getattr
+    0,                                               // tp_setattr
+    0,                                               // tp_as_async
+    0,                                               // tp_repr
+    0,                                               // tp_as_number
+    0,                                               // tp_as_sequence
+    0,                                               // tp_as_mapping
+    0,                                               // tp_hash
+    0,                                               // tp_call
+    0,                                               // tp_str
+    0,                                               // tp_getattro
+    0,                                               // tp_setattro
+    0,                                               // tp_as_buffer
+    Py_TPFLAGS_DEFAULT,                              // tp_flags
+    "Iterator over the vertices reached by a graph search", // tp_doc
+    0,                                               // tp_traverse
+    0,                                               // tp_clear
+    0,                                               // tp_richcompare
+    0,                                               // tp_weaklistoffset
+    PyObject_SelfIter,                               // tp_iter
+    (iternextfunc)GraphSearchIterator_iternext,     // tp_iternext
+};
+
+// Creates an iterator whose first item is (source, None, 0).
+static PyObject* graph_search_iterator(PyObject* graph_obj, int64_t source, int64_t V,
+                                       bool depth_first, Py_ssize_t batch_size) {
+    if (batch_size < 1) {
+        PyErr_SetString(PyExc_ValueError, "batch_size must be positive.");
+        return nullptr;
+    }
+    if (PyType_Ready(&GraphSearchIteratorType) < 0)
+        return nullptr;
+    GraphSearchIterator* self = PyObject_New(GraphSearchIterator, &GraphSearchIteratorType);
+    if (!self)
+        return nullptr;
+    new (&self->offsets) std::vector<int64_t>();
+    new (&self->targets) std::vector<int64_t>();
+    new (&self->names) std::vector<std::string>();
+    new (&self->visited) std::vector<char>(V, 0);
+    new (&self->queue) std::deque<std::pair<int64_t, int64_t>>();
+    new (&self->stack) std::vector<std::tuple<int64_t, int64_t, int64_t>>();
+    new (&self->batch) std::vector<std::tuple<int64_t, int64_t, int64_t>>();
+    Py_INCREF(graph_obj);
+    self->graph = graph_obj;
+    self->csr = nullptr;
+    self->num_vertices = V;
+    self->num_edges = 0;
+    self->depth_first = depth_first;
+    self->batch_size = batch_size;
+    self->next = 0;
+    self->visited[source] = 1;
+    self->batch.emplace_back(source, -1, 0);
+    return reinterpret_cast<PyObject*>(self);
+}
+
+static PyObject* graph_search_iterator_adjacency_list(PyObject* args, PyObject* kwargs, bool depth_first) {
+    PyObject* graph_obj;
+    const char* source_name;
+    Py_ssize_t batch_size = 1024;
+    static const char* kwlist[] = {"graph", "source_node", "batch_size", nullptr};
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "O!s|n", const_cast<char**>(kwlist),
+                                     &AdjacencyListGraphType, &graph_obj,
+                                     &source_name, &batch_size)) {
+        return nullptr;
+    }
+
+    AdjacencyListGraph* graph = reinterpret_cast<AdjacencyListGraph*>(graph_obj);
+    auto it = graph->name_to_id.find(source_name);
+    if (it == graph->name_to_id.end()) {
+        PyErr_Format(PyExc_KeyError, "Vertex %s is not present in the graph", source_name);
+        return nullptr;
+    }
+    GraphSearchIterator* self = reinterpret_cast<GraphSearchIterator*>(
+        graph_search_iterator(graph_obj, it->second, graph->next_id, depth_first, batch_size));
+    if (!self)
+        return nullptr;
+    adjacency_list_neighbors(graph, self->offsets, self->targets);
+    self->names.resize(graph->next_id);
+    for (AdjacencyListGraphNode* node : graph->nodes)
+        self->names[AdjacencyListGraph_id(graph, node)] = node->name;
+    if (depth_first)
+        self->stack.emplace_back(it->second, self->offsets[it->second], 0);
+    else
+        self->queue.emplace_back(it->second, 0);
+    return reinterpret_cast<PyObject*>(self);
+}
+
+static PyObject* graph_search_iterator_adjacency_matrix(PyObject* args, PyObject* kwargs, bool depth_first) {
+    PyObject* graph_obj;
+    const char* source_name;
+    Py_ssize_t batch_size = 1024;
+    static const char* kwlist[] = {"graph", "source_node", "batch_size", nullptr};
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "O!s|n", const_cast<char**>(kwlist),
+                                     &AdjacencyMatrixGraphType, &graph_obj,
+                                     &source_name, &batch_size)) {
+        return nullptr;
+    }
+
+    AdjacencyMatrixGraph* graph = reinterpret_cast<AdjacencyMatrixGraph*>(graph_obj);
+    int64_t source = adjacency_matrix_find(graph, source_name);
+    if (source < 0)
+        return nullptr;
+    const int64_t V = static_cast<int64_t>(graph->nodes.size());
+    GraphSearchIterator* self = reinterpret_cast<GraphSearchIterator*>(
+        graph_search_iterator(graph_obj, source, V, depth_first, batch_size));
+    if (!self)
+        return nullptr;
+    adjacency_matrix_neighbors(graph, self->offsets, self->targets);
+    for (AdjacencyMatrixGraphNode* node : graph->nodes)
+        self->names.push_back(reinterpret_cast<GraphNode*>(node)->name);
+    if (depth_first)
+        self->stack.emplace_back(source, self->offsets[source], 0);
+    else
+        self->queue.emplace_back(source, 0);
+    return reinterpret_cast<PyObject*>(self);
+}
+
+static PyObject* graph_search_iterator_csr(PyObject* args, PyObject* kwargs, bool depth_first) {
+    PyObject* graph_obj;
+    const char* source_name;
+    Py_ssize_t batch_size = 1024;
+    static const char* kwlist[] = {"graph", "source_node", "batch_size", nullptr};
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "O!s|n", const_cast<char**>(kwlist),
+                                     &CompressedSparseRowGraphType, &graph_obj,
+                                     &source_name, &batch_size)) {
+        return nullptr;
+    }
+
+    CompressedSparseRowGraph* graph = reinterpret_cast<CompressedSparseRowGraph*>(graph_obj);
+    int64_t source = CompressedSparseRowGraph_find(graph, source_name);
+    if (source < 0)
+        return nullptr;
+    CompressedSparseRowGraph_build(graph);
+    GraphSearchIterator* self = reinterpret_cast<GraphSearchIterator*>(
+        graph_search_iterator(graph_obj, source, static_cast<int64_t>(graph->nodes.size()),
+                              depth_first, batch_size));
+    if (!self)
+        return nullptr;
+    self->csr = graph;
+    self->num_edges = static_cast<int64_t>(graph->targets.size());
+    if (depth_first)
+        self->stack.emplace_back(source, graph->offsets[source], 0);
+    else
+        self->queue.emplace_back(source, 0);
+    return reinterpret_cast<PyObject*>(self);
+}
+
+static PyObject* bfs_iterator_adjacency_list(PyObject* self, PyObject* args, PyObject* kwargs) {
+    return graph_search_iterator_adjacency_list(args, kwargs, false);
+}
+
+static PyObject* bfs_iterator_adjacency_matrix(PyObject* self, PyObject* args, PyObject* kwargs) {
+    return graph_search_iterator_adjacency_matrix(args, kwargs, false);
+}
+
+static PyObject* bfs_iterator_csr(PyObject* self, PyObject* args, PyObject* kwargs) {
+    return graph_search_iterator_csr(args, kwargs, false);
+}
+
+static PyObject* dfs_iterator_adjacency_list(PyObject* self, PyObject* args, PyObject* kwargs) {
+    return graph_search_iterator_adjacency_list(args, kwargs, true);
+}
+
+static PyObject* dfs_iterator_adjacency_matrix(PyObject* self, PyObject* args, PyObject* kwargs) {
+    return graph_search_iterator_adjacency_matrix(args, kwargs, true);
+}
+
+static PyObject* dfs_iterator_csr(PyObject* self, PyObject* args, PyObject* kwargs) {
+    return graph_search_iterator_csr(args, kwargs, true);
+}
+
+// Builds (distances, predecessors) for the vertices given as
+// (id, name) pairs, or (distances[target], predecessors) if target
+// is not -1.
+static PyObject* single_source_result(const std::vector<double>& dist, const std::vector<int64_t>& pred,
+                                      int64_t target,
+                                      const std::vector<std::pair<int64_t, const std::string*>>& vertices,
+                                      const std::vector<const std::string*>& names) {
+    if (target != -1)
+        return point_to_point_result(dist[target], pred, vertices, names);
+    PyObject* dist_dict = PyDict_New();
+    if (!dist_dict)
+        return nullptr;
+    for (const auto& [id, name] : vertices) {
+        PyObject* dval = PyFloat_FromDouble(dist[id]);
+        if (!dval || PyDict_SetItemString(dist_dict, name->c_str(), dval) < 0) {
+            Py_XDECREF(dval);
+            Py_DECREF(dist_dict);
+            return nullptr;
+        }
+        Py_DECREF(dval);
+    }
+    PyObject* result = point_to_point_result(0.0, pred, vertices, names);
+    if (!result) {
+        Py_DECREF(dist_dict);
+        return nullptr;
+    }
+    PyObject* pred_dict = PyTuple_GET_ITEM(result, 1);
+    Py_INCREF(pred_dict);
+    Py_DECREF(result);
+    return Py_BuildValue("(NN)", dist_dict, pred_dict);
+}
+
+// Delta-stepping of Meyer and Sanders. Vertices are kept in buckets
+// of width delta by tentative distance. The smallest bucket is
+// emptied by relaxing the light edges, no longer than delta, of its
+// vertices until no vertex falls back into it, and then the heavy
+// edges of all the vertices it held. Each relaxation round runs on
+// the workers of a pool in two phases: the vertices are split into
+// blocks whose workers collect the improving requests, grouped by the
+// worker owning their target, and then every worker applies the
+// requests for the vertices it owns, so no two workers write the
+// same distance. Must be called without holding the GIL.
+static void delta_stepping_kernel(ArcView arcs, int64_t V, int64_t source, int64_t target,
+                                  int num_threads, double delta,
+                                  std::vector<double>& dist, std::vector<int64_t>& pred) {
+    const int64_t E = arcs.offsets[V];
+    if (!(delta > 0)) {
+        double max_weight = 0.0;
+        for (int64_t i = 0; i < E; ++i)
+            if (arcs.weights[i] > max_weight)
+                max_weight = arcs.weights[i];
+        delta = max_weight * V / std::max<int64_t>(E, 1);
+        if (!(delta > 0))
+            delta = 1.0;
+    }
+    dist.assign(V, std::numeric_limits<double>::infinity());
+    pred.assign(V, -1);
+    dist[source] = 0.0;
+
+    struct Request {
+        int64_t v;
+        double d;
+        int64_t u;
+    };
+    WorkerPool pool(num_threads);
+    const int T = pool.size();
+    std::vector<std::vector<std::vector<Request>>> requests(T, std::vector<std::vector<Request>>(T));
+    std::vector<std::vector<int64_t>> improved(T);
+    const std::vector<int64_t>* vertices = nullptr;
+    bool light = true;
+
+    auto generate = [&](int t) {
+        for (std::vector<Request>& out : requests[t])
+            out.clear();
+        auto [lo, hi] = pool.block(t, static_cast<int64_t>(vertices->size()));
+        for (int64_t k = lo; k < hi; ++k) {
+            int64_t u = (*vertices)[k];
+            double d = dist[u];
+            for (int64_t i = arcs.offsets[u]; i < arcs.offsets[u + 1]; ++i) {
+                double w = arcs.weights[i];
+                if (!(w >= 0) || (w <= delta) != light)
+                    continue;
+                int64_t v = arcs.targets[i];
+                if (d + w < dist[v])
+                    requests[t][v % T].push_back({v, d + w, u});
+            }
+        }
+    };
+    auto apply = [&](int o) {
+        improved[o].clear();
+        for (int t = 0; t < T; ++t) {
+            for (const Request& r : requests[t][o]) {
+                if (r.d < dist[r.v]) {
+                    dist[r.v] = r.d;
+                    pred[r.v] = r.u;
+                    improved[o].push_back(r.v);
+                }
+            }
+        }
+    };
+    auto relax = [&](const std::vector<int64_t>& from, bool is_light) {
+        vertices = &from;
+        light = is_light;
+        pool.run(generate);
+        pool.run(apply);
+    };
+
+    auto bucket_of = [delta](double d) {
+        return static_cast<int64_t>(std::floor(d / delta));
+    };
+    std::map<int64_t, std::vector<int64_t>> buckets;
+    buckets[0].push_back(source);
+    std::vector<int64_t> frontier, next, settled;
+    std::vector<int64_t> in_frontier(V, -1), in_settled(V, -1);
+    int64_t round = 0;
+    while (!buckets.empty()) {
+        auto first = buckets.begin();
+        const int64_t i = first->first;
+        frontier.swap(first->second);
+        buckets.erase(first);
+        if (target != -1 && dist[target] < i * delta)
+            break;
+
+        settled.clear();
+        while (!frontier.empty()) {
+            ++round;
+            next.clear();
+            for (int64_t v : frontier) {
+                if (bucket_of(dist[v]) != i || in_frontier[v] == round)
+                    continue;
+                in_frontier[v] = round;
+                next.push_back(v);
+                if (in_settled[v] != i) {
+                    in_settled[v] = i;
+                    settled.push_back(v);
+                }
+            }
+            relax(next, true);
+            frontier.clear();
+            for (const std::vector<int64_t>& vs : improved) {
+                for (int64_t v : vs) {
+                    int64_t b = bucket_of(dist[v]);
+                    if (b == i)
+                        frontier.push_back(v);
+                    else
+                        buckets[b].push_back(v);
+                }
+            }
+        }
+        relax(settled, false);
+        for (const std::vector<int64_t>& vs : improved)
+            for (int64_t v : vs)
+                buckets[bucket_of(dist[v])].push_back(v);
+    }
+}
+
+static int parse_delta(PyObject* delta_obj, double& delta) {
+    delta = 0.0;
+    if (delta_obj == Py_None)
+        return 0;
+    delta = PyFloat_AsDouble(delta_obj);
+    if (delta == -1.0 && PyErr_Occurred())
+        return -1;
+    if (!(delta > 0)) {
+        PyErr_SetString(PyExc_ValueError, "delta must be positive.");
+        return -1;
+    }
+    return 0;
+}
+
+static PyObject* shortest_paths_delta_stepping_adjacency_list(PyObject* self, PyObject* args, PyObject* kwargs) {
+    PyObject* graph_obj;
+    const char* source_name;
+    const char* target_name = "";
+    int num_threads = 1;
+    PyObject* delta_obj = Py_None;
+
+    static const char* kwlist[] = {"graph", "source_node", "target_node", "num_threads", "delta", nullptr};
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "O!s|siO", const_cast<char**>(kwlist),
+                                     &AdjacencyListGraphType, &graph_obj,
+                                     &source_name, &target_name, &num_threads, &delta_obj)) {
+        return nullptr;
+    }
+    double delta;
+    if (parse_delta(delta_obj, delta) < 0)
+        return nullptr;
+
+    AdjacencyListGraph* graph = reinterpret_cast<AdjacencyListGraph*>(graph_obj);
+    int64_t source, target = -1;
+    if (target_name[0] != '\0') {
+        if (adjacency_list_endpoints(graph, source_name, target_name, source, target) < 0)
+            return nullptr;
+    } else if (adjacency_list_endpoints(graph, source_name, source_name, source, source) < 0) {
+        return nullptr;
+    }
+
+    const int64_t V = graph->next_id;
+    std::vector<std::tuple<int64_t, int64_t, double>> arcs;
+    adjacency_list_arcs(graph, arcs);
+    ArcArrays fwd;
+    build_arc_arrays(fwd, V, arcs, false);
+
+    std::vector<double> dist;
+    std::vector<int64_t> pred;
+    Py_BEGIN_ALLOW_THREADS
+    delta_stepping_kernel(fwd.view(), V, source, target, num_threads, delta, dist, pred);
+    Py_END_ALLOW_THREADS
+
+    std::vector<std::pair<int64_t, const std::string*>> vertices;
+    std::vector<const std::string*> names;
+    adjacency_list_names(graph, vertices, names);
+    return single_source_result(dist, pred, target, vertices, names);
+}
+
+static PyObject* shortest_paths_delta_stepping_csr(PyObject* self, PyObject* args, PyObject* kwargs) {
+    PyObject* graph_obj;
+    const char* source_name;
+    const char* target_name = "";
+    int num_threads = 1;
+    PyObject* delta_obj = Py_None;
+
+    static const char* kwlist[] = {"graph", "source_node", "target_node", "num_threads", "delta", nullptr};
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "O!s|siO", const_cast<char**>(kwlist),
+                                     &CompressedSparseRowGraphType, &graph_obj,
+                                     &source_name, &target_name, &num_threads, &delta_obj)) {
+        return nullptr;
+    }
+    double delta;
+    if (parse_delta(delta_obj, delta) < 0)
+        return nullptr;
+
+    CompressedSparseRowGraph* graph = reinterpret_cast<CompressedSparseRowGraph*>(graph_obj);
+    int64_t source = CompressedSparseRowGraph_find(graph, source_name);
+    if (source < 0)
+        return nullptr;
+    int64_t target = -1;
+    if (target_name[0] != '\0') {
+        target = CompressedSparseRowGraph_find(graph, target_name);
+        if (target < 0)
+            return nullptr;
+    }
+    CompressedSparseRowGraph_build(graph);
+
+    const int64_t V = static_cast<int64_t>(graph->nodes.size());
+    ArcView fwd = {graph->offsets.data(), graph->targets.data(), graph->weights.data()};
+    std::vector<double> dist;
+    std::vector<int64_t> pred;
+    Py_BEGIN_ALLOW_THREADS
+    delta_stepping_kernel(fwd, V, source, target, num_threads, delta, dist, pred);
+    Py_END_ALLOW_THREADS
+
+    std::vector<std::pair<int64_t, const std::string*>> vertices;
+    std::vector<const std::string*> names;
+    csr_names(graph, vertices, names);
+    return single_source_result(dist, pred, target, vertices, names);
+}
+
+// Relaxes dist_i[j0:j1] through a pivot k, whose row is dist_k,
+// at distance d_ik. Branch free and without aliasing, so that the
+// loop is vectorized on targets having blend instructions.
+static inline void floyd_warshall_row(double* __restrict dist_i, int64_t* __restrict pred_i,
+                                      const double* __restrict dist_k, const int64_t* __restrict pred_k,
+                                      double d_ik, int64_t j0, int64_t j1) {
+    for (int64_t j = j0; j < j1; ++j) {
+        const double d = d_ik + dist_k[j];
+        const bool shorter = d < dist_i[j];
+        dist_i[j] = shorter ? d : dist_i[j];
+        pred_i[j] = shorter ? pred_k[j] : pred_i[j];
+    }
+}
+
+// Relaxes the distances of the tile of rows [i0, i0 + B) and
+// columns [j0, j0 + B) through the pivots [k0, k0 + B). The row
+// of a pivot can only be shortened through itself if it lies on
+// a negative cycle, which is reported anyway, so it is skipped.
+static void floyd_warshall_tile(double* dist, int64_t* pred, int64_t V,
+                                int64_t k0, int64_t i0, int64_t j0, int64_t B) {
+    const double inf = std::numeric_limits<double>::infinity();
+    const int64_t k1 = std::min(k0 + B, V), i1 = std::min(i0 + B, V), j1 = std::min(j0 + B, V);
+    for (int64_t k = k0; k < k1; ++k) {
+        for (int64_t i = i0; i < i1; ++i) {
+            const double d_ik = dist[i * V + k];
+            if (i == k || d_ik == inf)
+                continue;
+            floyd_warshall_row(dist + i * V, pred + i * V, dist + k * V, pred + k * V, d_ik, j0, j1);
+        }
+    }
+}
+
+// Floyd-Warshall over the row major V x V distance and predecessor
+// matrices, blocked as in Venkataraman et al. For every diagonal
+// tile, the tile itself is closed first, then the tiles sharing its
+// rows or columns, and then all the others, each of which only reads
+// one tile of the pivot rows and one of the pivot columns, so the
+// working set of every step fits in cache. Must be called without
+// holding the GIL.
+static void floyd_warshall_kernel(std::vector<double>& dist, std::vector<int64_t>& pred, int64_t V) {
+    const int64_t B = 64;
+    double* d = dist.data();
+    int64_t* p = pred.data();
+    for (int64_t k0 = 0; k0 < V; k0 += B) {
+        floyd_warshall_tile(d, p, V, k0, k0, k0, B);
+        for (int64_t j0 = 0; j0 < V; j0 += B)
+            if (j0 != k0)
+                floyd_warshall_tile(d, p, V, k0, k0, j0, B);
+        for (int64_t i0 = 0; i0 < V; i0 += B)
+            if (i0 != k0)
+                floyd_warshall_tile(d, p, V, k0, i0, k0, B);
+        for (int64_t i0 = 0; i0 < V; i0 += B) {
+            if (i0 == k0)
+                continue;
+            for (int64_t j0 = 0; j0 < V; j0 += B)
+                if (j0 != k0)
+                    floyd_warshall_tile(d, p, V, k0, i0, j0, B);
+        }
+    }
+}
+
+// Fills dist_dict and pred_dict with a dictionary per vertex of
+// the distances to, and predecessors of, the vertices it reaches.
+static int floyd_warshall_dicts(const std::vector<double>& dist, const std::vector<int64_t>& pred, int64_t V,
+                                const std::vector<std::pair<int64_t, const std::string*>>& vertices,
+                                const std::vector<const std::string*>& names,
+                                PyObject* dist_dict, PyObject* pred_dict) {
+    const double inf = std::numeric_limits<double>::infinity();
+    for (const auto& [u, name_u] : vertices) {
+        PyObject* dist_row = PyDict_New();
+        if (!dist_row || PyDict_SetItemString(dist_dict, name_u->c_str(), dist_row) < 0) {
+            Py_XDECREF(dist_row);
+            return -1;
+        }
+        Py_DECREF(dist_row);
+        PyObject* pred_row = PyDict_New();
+        if (!pred_row || PyDict_SetItemString(pred_dict, name_u->c_str(), pred_row) < 0) {
+            Py_XDECREF(pred_row);
+            return -1;
+        }
+        Py_DECREF(pred_row);
+        for (const auto& [v, name_v] : vertices) {
+            const double d = dist[u * V + v];
+            if (d == inf)
+                continue;
+            PyObject* dval = PyFloat_FromDouble(d);
+            if (!dval || PyDict_SetItemString(dist_row, name_v->c_str(), dval) < 0) {
+                Py_XDECREF(dval);
+                return -1;
+            }
+            Py_DECREF(dval);
+            PyObject* pval = PyUnicode_FromString(names[pred[u * V + v]]->c_str());
+            if (!pval || PyDict_SetItemString(pred_row, name_v->c_str(), pval) < 0) {
+                Py_XDECREF(pval);
+                return -1;
+            }
+            Py_DECREF(pval);
+        }
+    }
+    return 0;
+}
+
+// Fills the V x V matrices with the edges of arcs, keeping the
+// lightest of parallel ones, and zero distances from the given
+// vertices to themselves, runs Floyd-Warshall and returns either
+// the matrices or the dictionaries of distances and predecessors
+// of the reachable pairs, keyed by the names of the vertices.
+static PyObject* floyd_warshall(ArcView arcs, int64_t V,
+                                const std::vector<std::pair<int64_t, const std::string*>>& vertices,
+                                const std::vector<const std::string*>& names, int matrix) {
+    const double inf = std::numeric_limits<double>::infinity();
+    std::vector<double> dist(V * V, inf);
+    std::vector<int64_t> pred(V * V, -1);
+    for (const auto& [u, name] : vertices) {
+        dist[u * V + u] = 0.0;
+        pred[u * V + u] = u;
+    }
+    for (int64_t u = 0; u < V; ++u) {
+        for (int64_t i = arcs.offsets[u]; i < arcs.offsets[u + 1]; ++i) {
+            const int64_t v = arcs.targets[i];
+            if (arcs.weights[i] < dist[u * V + v]) {
+                dist[u * V + v] = arcs.weights[i];
+                pred[u * V + v] = u;
+            }
+        }
+    }
+
+    Py_BEGIN_ALLOW_THREADS
+    floyd_warshall_kernel(dist, pred, V);
+    Py_END_ALLOW_THREADS
+
+    for (const auto& [u, name] : vertices) {
+        if (dist[u * V + u] < 0) {
+            PyErr_SetString(PyExc_ValueError, "Graph contains a negative weight cycle.");
+            return nullptr;
+        }
+    }
+    if (matrix) {
+        PyObject* dist_array = double_array(dist);
+        if (!dist_array)
+            return nullptr;
+        PyObject* pred_array = int64_array(pred);
+        if (!pred_array) {
+            Py_DECREF(dist_array);
+            return nullptr;
+        }
+        return Py_BuildValue("(NN)", dist_array, pred_array);
+    }
+
+    PyObject* dist_dict = PyDict_New();
+    PyObject* pred_dict = PyDict_New();
+    if (!dist_dict || !pred_dict ||
+        floyd_warshall_dicts(dist, pred, V, vertices, names, dist_dict, pred_dict) < 0) {
+        Py_XDECREF(dist_dict);
+        Py_XDECREF(pred_dict);
+        return nullptr;
+    }
+    return Py_BuildValue("(NN)", dist_dict, pred_dict);
+}
+
+static PyObject* all_pair_shortest_paths_floyd_warshall_adjacency_list(PyObject* self, PyObject* args, PyObject* kwargs) {
+    PyObject* graph_obj;
+    int matrix = 0;
+
+    static const char* kwlist[] = {"graph", "matrix", nullptr};
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "O!|p", const_cast<char**>(kwlist),
+                                     &AdjacencyListGraphType, &graph_obj, &matrix)) {
+        return nullptr;
+    }
+    AdjacencyListGraph* graph = reinterpret_cast<AdjacencyListGraph*>(graph_obj);
+
+    const int64_t V = graph->next_id;
+    std::vector<std::tuple<int64_t, int64_t, double>> arcs;
+    adjacency_list_arcs(graph, arcs);
+    ArcArrays fwd;
+    build_arc_arrays(fwd, V, arcs, false);
+
+    std::vector<std::pair<int64_t, const std::string*>> vertices;
+    std::vector<const std::string*> names;
+    adjacency_list_names(graph, vertices, names);
+    return floyd_warshall(fwd.view(), V, vertices, names, matrix);
+}
+
+static PyObject* all_pair_shortest_paths_floyd_warshall_csr(PyObject* self, PyObject* args, PyObject* kwargs) {
+    PyObject* graph_obj;
+    int matrix = 0;
+
+    static const char* kwlist[] = {"graph", "matrix", nullptr};
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "O!|p", const_cast<char**>(kwlist),
+                                     &CompressedSparseRowGraphType, &graph_obj, &matrix)) {
+        return nullptr;
+    }
+    CompressedSparseRowGraph* graph = reinterpret_cast<CompressedSparseRowGraph*>(graph_obj);
+    CompressedSparseRowGraph_build(graph);
+
+    const int64_t V = static_cast<int64_t>(graph->nodes.size());
+    ArcView fwd = {graph->offsets.data(), graph->targets.data(), graph->weights.data()};
+    std::vector<std::pair<int64_t, const std::string*>> vertices;
+    std::vector<const std::string*> names;
+    csr_names(graph, vertices, names);
+    return floyd_warshall(fwd, V, vertices, names, matrix);
+}
+
+// Iterator over the rows of Johnson's algorithm. The weighted edges
+// are copied and reweighted with the potentials of the vertices when
+// it is created, so the graph is never modified and may change
+// meanwhile, and the rows are computed batch by batch by running
+// Dijkstra algorithm from the sources on the workers of a pool.
+typedef struct {
+    PyObject_HEAD
+    ArcArrays arcs;
+    std::vector<double> potentials;
+    std::vector<std::string> names;
+    std::vector<int64_t> sources;
+    int64_t num_vertices;
+    bool matrix;
+    WorkerPool* pool;
+    std::vector<std::vector<double>> dist;
+    std::vector<std::vector<int64_t>> pred;
+    size_t start;
+    size_t count;
+    size_t next;
+} JohnsonIterator;
+
+static void JohnsonIterator_dealloc(JohnsonIterator* self) {
+    using double_vector = std::vector<double>;
+    using name_vector = std::vector<std::string>;
+    using int_vector = std::vector<int64_t>;
+    using double_rows = std::vector<std::vector<double>>;
+    using int_rows = std::vector<std::vector<int64_t>>;
+    self->arcs.~ArcArrays();
+    self->potentials.~double_vector();
+    self->names.~name_vector();
+    self->sources.~int_vector();
+    self->dist.~double_rows();
+    self->pred.~int_rows();
+    delete self->pool;
+    Py_TYPE(self)->tp_free(reinterpret_cast<PyObject*>(self));
+}
+
+// Finds the potentials with Bellman-Ford algorithm from a virtual
+// vertex joined to all the others and makes the weights of arcs
+// non-negative with them. Returns false on negative cycles. Must be
+// called without holding the GIL.
+static bool johnson_reweight(ArcArrays& arcs, int64_t V, std::vector<double>& potentials) {
+    potentials.assign(V, 0.0);
+    bool changed = true;
+    for (int64_t round = 0; round <= V && changed; ++round) {
+        changed = false;
+        for (int64_t u = 0; u < V; ++u) {
+            for (int64_t i = arcs.offsets[u]; i < arcs.offsets[u + 1]; ++i) {
+                const double d = potentials[u] + arcs.weights[i];
+                if (d < potentials[arcs.targets[i]]) {
+                    potentials[arcs.targets[i]] = d;
+                    changed = true;
+                }
+            }
+        }
+    }
+    if (changed)
+        return false;
+    for (int64_t u = 0; u < V; ++u)
+        for (int64_t i = arcs.offsets[u]; i < arcs.offsets[u + 1]; ++i)
+            arcs.weights[i] = std::max(0.0, arcs.weights[i] + potentials[u] -
+                                       potentials[arcs.targets[i]]);
+    return true;
+}
+
+static void johnson_dijkstra(const ArcArrays& arcs, const std::vector<double>& potentials,
+                             int64_t source, std::vector<double>& dist, std::vector<int64_t>& pred) {
+    const double inf = std::numeric_limits<double>::infinity();
+    const int64_t V = static_cast<int64_t>(potentials.size());
+    dist.assign(V, inf);
+    pred.assign(V, -1);
+    dist[source] = 0.0;
+    pred[source] = source;
+    using Item = std::pair<double, int64_t>;
+    std::priority_queue<Item, std::vector<Item>, std::greater<Item>> pq;
+    pq.emplace(0.0, source);
+    while (!pq.empty()) {
+        auto [d, u] = pq.top();
+        pq.pop();
+        if (d > dist[u])
+            continue;
+        for (int64_t i = arcs.offsets[u]; i < arcs.offsets[u + 1]; ++i) {
+            const int64_t v = arcs.targets[i];
+            if (d + arcs.weights[i] < dist[v]) {
+                dist[v] = d + arcs.weights[i];
+                pred[v] = u;
+                pq.emplace(dist[v], v);
+            }
+        }
+    }
+    for (int64_t v = 0; v < V; ++v)
+        if (dist[v] != inf)
+            dist[v] += potentials[v] - potentials[source];
+}
+
+// Computes the rows of the next batch of sources, which the workers
+// of the pool claim one by one.
+static void JohnsonIterator_advance(JohnsonIterator* self) {
+    self->start += self->count;
+    self->next = 0;
+    const size_t count = self->count =
+        std::min(self->dist.size(), self->sources.size() - self->start);
+    std::atomic<size_t> cursor(0);
+    Py_BEGIN_ALLOW_THREADS
+    self->pool->run([self, count, &cursor](int) {
+        for (size_t k = cursor++; k < count; k = cursor++)
+            johnson_dijkstra(self->arcs, self->potentials, self->sources[self->start + k],
+                             self->dist[k], self->pred[k]);
+    });
+    Py_END_ALLOW_THREADS
+}
+
+static PyObject* JohnsonIterator_row(JohnsonIterator* self, const std::vector<double>& dist,
+                                     const std::vector<int64_t>& pred) {
+    if (self->matrix) {
+        PyObject* dist_array = double_array(dist);
+        if (!dist_array)
+            return nullptr;
+        PyObject* pred_array = int64_array(pred);
+        if (!pred_array) {
+            Py_DECREF(dist_array);
+            return nullptr;
+        }
+        return Py_BuildValue("(NN)", dist_array, pred_array);
+    }
+    PyObject* dist_dict = PyDict_New();
+    PyObject* pred_dict = PyDict_New();
+    if (!dist_dict || !pred_dict) {
+        Py_XDECREF(dist_dict);
+        Py_XDECREF(pred_dict);
+        return nullptr;
+    }
+    for (int64_t v = 0; v < self->num_vertices; ++v) {
+        if (pred[v] == -1)
+            continue;
+        PyObject* dval = PyFloat_FromDouble(dist[v]);
+        PyObject* pval = PyUnicode_FromString(self->names[pred[v]].c_str());
+        if (!dval || !pval ||
+            PyDict_SetItemString(dist_dict, self->names[v].c_str(), dval) < 0 ||
+            PyDict_SetItemString(pred_dict, self->names[v].c_str(), pval) < 0) {
+            Py_XDECREF(dval);
+            Py_XDECREF(pval);
+            Py_DECREF(dist_dict);
+            Py_DECREF(pred_dict);
+            return nullptr;
+        }
+        Py_DECREF(dval);
+        Py_DECREF(pval);
+    }
+    return Py_BuildValue("(NN)", dist_dict, pred_dict);
+}
+
+static PyObject* JohnsonIterator_iternext(JohnsonIterator* self) {
+    if (self->next == self->count) {
+        if (self->start + self->count == self->sources.size())
+            return nullptr;
+        JohnsonIterator_advance(self);
+    }
+    const size_t k = self->next++;
+    const int64_t u = self->sources[self->start + k];
+    PyObject* row = JohnsonIterator_row(self, self->dist[k], self->pred[k]);
+    if (!row)
+        return nullptr;
+    PyObject* vertex = self->matrix ? PyLong_FromLongLong(u) : PyUnicode_FromString(self->names[u].c_str());
+    if (!vertex) {
+        Py_DECREF(row);
+        return nullptr;
+    }
+    PyObject* result = Py_BuildValue("(NOO)", vertex, PyTuple_GET_ITEM(row, 0), PyTuple_GET_ITEM(row, 1));
+    Py_DECREF(row);
+    return result;
+}
+
+inline PyTypeObject JohnsonIteratorType = {
+    PyVarObject_HEAD_INIT(NULL, 0)
+    "_graph.JohnsonIterator",                        // tp_name
+    sizeof(JohnsonIterator),                         // tp_basicsize
+    0,                                               // tp_itemsize
+    (destructor)JohnsonIterator_dealloc,             // tp_dealloc
+    0,                                               // tp_vectorcall_offset
+    0,                                               // tp_getattr
+    0,                                               // tp_setattr
+    0,                                               // tp_as_async
+    0,                                               // tp_repr
+    0,                                               // tp_as_number
+    0,                                               // tp_as_sequence
+    0,                                               // tp_as_mapping
+    0,                                               // tp_hash
+    0,                                               // tp_call
+    0,                                               // tp_str
+    0,                                               // tp_getattro
+    0,                                               // tp_setattro
+    0,                                               // tp_as_buffer
+    Py_TPFLAGS_DEFAULT,                              // tp_flags
+    "Iterator over the rows of Johnson's algorithm", // tp_doc
+    0,                                               // tp_traverse
+    0,                                               // tp_clear
+    0,                                               // tp_richcompare
+    0,                                               // tp_weaklistoffset
+    PyObject_SelfIter,                               // tp_iter
+    (iternextfunc)JohnsonIterator_iternext,          // tp_iternext
+};
+
+// Creates the iterator over the given arcs, names by vertex number
+// and present vertices, raising ValueError on negative cycles. Each
+// batch holds 16 rows per worker.
+static PyObject* johnson_iterator(std::vector<std::tuple<int64_t, int64_t, double>>& arcs,
+                                  std::vector<std::string>& names, std::vector<int64_t>& sources,
+                                  int matrix, int num_workers) {
+    if (PyType_Ready(&JohnsonIteratorType) < 0)
+        return nullptr;
+    JohnsonIterator* self = PyObject_New(JohnsonIterator, &JohnsonIteratorType);
+    if (!self)
+        return nullptr;
+    const int64_t V = static_cast<int64_t>(names.size());
+    new (&self->arcs) ArcArrays();
+    new (&self->potentials) std::vector<double>();
+    new (&self->names) std::vector<std::string>(std::move(names));
+    new (&self->sources) std::vector<int64_t>(std::move(sources));
+    new (&self->dist) std::vector<std::vector<double>>();
+    new (&self->pred) std::vector<std::vector<int64_t>>();
+    self->num_vertices = V;
+    self->matrix = matrix;
+    self->pool = nullptr;
+    self->start = 0;
+    self->count = 0;
+    self->next = 0;
+
+    bool reweighted;
+    Py_BEGIN_ALLOW_THREADS
+    arcs.erase(std::remove_if(arcs.begin(), arcs.end(),
+                              [](const auto& arc) { return std::isnan(std::get<2>(arc)); }),
+               arcs.end());
+    build_arc_arrays(self->arcs, V, arcs, false);
+    reweighted = johnson_reweight(self->arcs, V, self->potentials);
+    Py_END_ALLOW_THREADS
+    if (!reweighted) {
+        Py_DECREF(self);
+        PyErr_SetString(PyExc_ValueError, "Graph contains a negative weight cycle.");
+        return nullptr;
+    }
+    self->pool = new WorkerPool(num_workers);
+    self->dist.resize(16 * self->pool->size());
+    self->pred.resize(16 * self->pool->size());
+    return reinterpret_cast<PyObject*>(self);
+}
+
+static PyObject* all_pair_shortest_paths_johnson_adjacency_list(PyObject* self, PyObject* args, PyObject* kwargs) {
+    PyObject* graph_obj;
+    int matrix = 0;
+    int num_workers = 1;
+
+    static const char* kwlist[] = {"graph", "matrix", "num_workers", nullptr};
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "O!|pi", const_cast<char**>(kwlist),
+                                     &AdjacencyListGraphType, &graph_obj, &matrix, &num_workers)) {
+        return nullptr;
+    }
+    AdjacencyListGraph* graph = reinterpret_cast<AdjacencyListGraph*>(graph_obj);
+
+    std::vector<std::tuple<int64_t, int64_t, double>> arcs;
+    adjacency_list_arcs(graph, arcs);
+    std::vector<std::string> names(graph->next_id);
+    std::vector<int64_t> sources;
+    for (AdjacencyListGraphNode* node : graph->nodes) {
+        const int id = AdjacencyListGraph_id(graph, node);
+        names[id] = node->name;
+        sources.push_back(id);
+    }
+    std::sort(sources.begin(), sources.end());
+    return johnson_iterator(arcs, names, sources, matrix, num_workers);
+}
+
+static PyObject* all_pair_shortest_paths_johnson_csr(PyObject* self, PyObject* args, PyObject* kwargs) {
+    PyObject* graph_obj;
+    int matrix = 0;
+    int num_workers = 1;
+
+    static const char* kwlist[] = {"graph", "matrix", "num_workers", nullptr};
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "O!|pi", const_cast<char**>(kwlist),
+                                     &CompressedSparseRowGraphType, &graph_obj, &matrix, &num_workers)) {
+        return nullptr;
+    }
+    CompressedSparseRowGraph* graph = reinterpret_cast<CompressedSparseRowGraph*>(graph_obj);
+    CompressedSparseRowGraph_build(graph);
+
+    std::vector<std::tuple<int64_t, int64_t, double>> arcs;
+    csr_arcs(graph, arcs);
+    std::vector<std::string> names;
+    std::vector<int64_t> sources;
+    for (size_t u = 0; u < graph->nodes.size(); ++u) {
+        names.push_back(graph->nodes[u]->name);
+        sources.push_back(static_cast<int64_t>(u));
+    }
+    return johnson_iterator(arcs, names, sources, matrix, num_workers);
+}
+
+static void adjacency_matrix_arcs(AdjacencyMatrixGraph* graph,
+                                  std::vector<std::tuple<int64_t, int64_t, double>>& arcs) {
+    std::unordered_map<std::string, int64_t> ids;
+    for (size_t u = 0; u < graph->nodes.size(); ++u)
+        ids[reinterpret_cast<GraphNode*>(graph->nodes[u])->name] = static_cast<int64_t>(u);
+    for (const auto& [key, edge] : graph->edge_weights) {
+        double weight;
+        if (edge->value_type == DataType::Int)
+            weight = static_cast<double>(std::get<int64_t>(edge->value));
+        else if (edge->value_type == DataType::Double)
+            weight = std::get<double>(edge->value);
+        else
+            continue;
+        auto source = ids.find(reinterpret_cast<GraphNode*>(edge->source)->name);
+        auto target = ids.find(reinterpret_cast<GraphNode*>(edge->target)->name);
+        if (source != ids.end() && target != ids.end())
+            arcs.emplace_back(source->second, target->second, weight);
+    }
+}
+
+// Scratch space of a Dijkstra search. An entry of dist and pred is
+// valid only if the matching entry of stamp equals epoch, and a vertex
+// is settled only if its entry of done does, so a new search starts
+// by incrementing epoch instead of clearing arrays sized to the graph.
+struct EngineSearch {
+    using Item = std::pair<double, int64_t>;
+
+    ArcArrays arcs;
+    std::vector<double> dist;
+    std::vector<int64_t> pred;
+    std::vector<uint64_t> stamp;
+    std::vector<uint64_t> done;
+    std::vector<Item> heap;
+    uint64_t epoch = 0;
+    int64_t source = -1;
+
+    void init(int64_t V) {
+        dist.assign(V, 0.0);
+        pred.assign(V, -1);
+        stamp.assign(V, 0);
+        done.assign(V, 0);
+    }
+
+    void start(int64_t s) {
+        ++epoch;
+        source = s;
+        dist[s] = 0.0;
+        pred[s] = -1;
+        stamp[s] = epoch;
+        heap.assign(1, {0.0, s});
+    }
+
+    double distance(int64_t v) const {
+        return stamp[v] == epoch ? dist[v] : std::numeric_limits<double>::infinity();
+    }
+
+    double top() const {
+        return heap.front().first;
+    }
+
+    // Settles the closest unsettled vertex and returns it, or -1 if
+    // there are none left.
+    int64_t settle() {
+        while (!heap.empty()) {
+            std::pop_heap(heap.begin(), heap.end(), std::greater<Item>());
+            auto [d, u] = heap.back();
+            heap.pop_back();
+            if (done[u] == epoch)
+                continue;
+            done[u] = epoch;
+            for (int64_t i = arcs.offsets[u]; i < arcs.offsets[u + 1]; ++i) {
+                const int64_t v = arcs.targets[i];
+                const double d_v = d + arcs.weights[i];
+                if (stamp[v] != epoch || d_v < dist[v]) {
+                    stamp[v] = epoch;
+                    dist[v] = d_v;
+                    pred[v] = u;
+                    heap.emplace_back(d_v, v);
+                    std::push_heap(heap.begin(), heap.end(), std::greater<Item>());
+                }
+            }
+            return u;
+        }
+        return -1;
+    }
+
+    // Appends the vertices from v back to the source.
+    void path(int64_t v, std::vector<int64_t>& out) const {
+        for (; v != -1; v = pred[v])
+            out.push_back(v);
+    }
+};
+
+struct EngineState {
+    std::vector<std::string> names;
+    std::unordered_map<std::string, int64_t> ids;
+    bool bidirectional;
+    EngineSearch forward;
+    EngineSearch backward;
+
+    // Finds a shortest path from s to t, appending its vertices to
+    // path, and returns its length. Consecutive unidirectional queries
+    // from the same source continue the same search.
+    double query(int64_t s, int64_t t, std::vector<int64_t>& path) {
+        const double inf = std::numeric_limits<double>::infinity();
+        if (!bidirectional) {
+            if (forward.source != s)
+                forward.start(s);
+            while (forward.done[t] != forward.epoch)
+                if (forward.settle() == -1)
+                    return inf;
+            const size_t begin = path.size();
+            forward.path(t, path);
+            std::reverse(path.begin() + begin, path.end());
+            return forward.dist[t];
+        }
+
+        forward.start(s);
+        backward.start(t);
+        double best = inf;
+        int64_t middle = -1;
+        while (!forward.heap.empty() && !backward.heap.empty() &&
+               forward.top() + backward.top() < best) {
+            const bool forth = forward.top() <= backward.top();
+            EngineSearch& side = forth ? forward : backward;
+            EngineSearch& other = forth ? backward : forward;
+            const int64_t u = side.settle();
+            if (u == -1)
+                break;
+            if (side.distance(u) + other.distance(u) < best) {
+                best = side.distance(u) + other.distance(u);
+                middle = u;
+            }
+            for (int64_t i = side.arcs.offsets[u]; i < side.arcs.offsets[u + 1]; ++i) {
+                const int64_t v = side.arcs.targets[i];
+                if (side.distance(v) + other.distance(v) < best) {
+                    best = side.distance(v) + other.distance(v);
+                    middle = v;
+                }
+            }
+        }
+        forward.source = -1;
+        if (middle == -1)
+            return inf;
+        const size_t begin = path.size();
+        forward.path(middle, path);
+        std::reverse(path.begin() + begin, path.end());
+        path.pop_back();
+        backward.path(middle, path);
+        return best;
+    }
+};
+
+typedef struct {
+    PyObject_HEAD
+    EngineState* state;
+} ShortestPathEngine;
+
+static void ShortestPathEngine_dealloc(ShortestPathEngine* self) {
+    delete self->state;
+    Py_TYPE(self)->tp_free(reinterpret_cast<PyObject*>(self));
+}
+
+static PyObject* ShortestPathEngine_new(PyTypeObject* type, PyObject* args, PyObject* kwargs) {
+    PyObject* graph_obj;
+    const char* algorithm;
+    static const char* kwlist[] = {"graph", "algorithm", nullptr};
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "Os", const_cast<char**>(kwlist),
+                                     &graph_obj, &algorithm)) {
+        return nullptr;
+    }
+    std::string name(algorithm);
+    if (name != "dijkstra" && name != "bidirectional_dijkstra") {
+        PyErr_Format(PyExc_NotImplementedError,
+                     "Currently %s algorithm isn't implemented for shortest path engines.", algorithm);
+        return nullptr;
+    }
+
+    std::unique_ptr<EngineState> state(new EngineState());
+    std::vector<std::tuple<int64_t, int64_t, double>> arcs;
+    if (PyObject_TypeCheck(graph_obj, &AdjacencyListGraphType)) {
+        AdjacencyListGraph* graph = reinterpret_cast<AdjacencyListGraph*>(graph_obj);
+        adjacency_list_arcs(graph, arcs);
+        state->names.resize(graph->next_id);
+        for (AdjacencyListGraphNode* node : graph->nodes)
+            state->names[AdjacencyListGraph_id(graph, node)] = node->name;
+    } else if (PyObject_TypeCheck(graph_obj, &AdjacencyMatrixGraphType)) {
+        AdjacencyMatrixGraph* graph = reinterpret_cast<AdjacencyMatrixGraph*>(graph_obj);
+        adjacency_matrix_arcs(graph, arcs);
+        for (AdjacencyMatrixGraphNode* node : graph->nodes)
+            state->names.push_back(reinterpret_cast<GraphNode*>(node)->name);
+    } else if (PyObject_TypeCheck(graph_obj, &CompressedSparseRowGraphType)) {
+        CompressedSparseRowGraph* graph = reinterpret_cast<CompressedSparseRowGraph*>(graph_obj);
+        CompressedSparseRowGraph_build(graph);
+        csr_arcs(graph, arcs);
+        for (AdjacencyListGraphNode* node : graph->nodes)
+            state->names.push_back(node->name);
+    } else {
+        PyErr_SetString(PyExc_TypeError, "Expected a graph with the C++ backend.");
+        return nullptr;
+    }
+
+    const int64_t V = static_cast<int64_t>(state->names.size());
+    arcs.erase(std::remove_if(arcs.begin(), arcs.end(),
+                              [](const auto& arc) { return !(std::get<2>(arc) >= 0); }),
+               arcs.end());
+    for (int64_t u = 0; u < V; ++u)
+        if (!state->names[u].empty())
+            state->ids[state->names[u]] = u;
+    state->bidirectional = name == "bidirectional_dijkstra";
+    build_arc_arrays(state->forward.arcs, V, arcs, false);
+    state->forward.init(V);
+    if (state->bidirectional) {
+        build_arc_arrays(state->backward.arcs, V, arcs, true);
+        state->backward.init(V);
+    }
+
+    ShortestPathEngine* self = reinterpret_cast<ShortestPathEngine*>(type->tp_alloc(type, 0));
+    if (!self)
+        return nullptr;
+    self->state = state.release();
+    return reinterpret_cast<PyObject*>(self);
+}
+
+static int ShortestPathEngine_id(ShortestPathEngine* self, PyObject* name_obj, int64_t& id) {
+    PyObject* str = PyObject_Str(name_obj);
+    if (!str)
+        return -1;
+    const char* name = PyUnicode_AsUTF8(str);
+    if (!name) {
+        Py_DECREF(str);
+        return -1;
+    }
+    auto it = self->state->ids.find(name);
+    if (it == self->state->ids.end()) {
+        PyErr_Format(PyExc_ValueError, "Vertex %s is not present in the graph.", name);
+        Py_DECREF(str);
+        return -1;
+    }
+    Py_DECREF(str);
+    id = it->second;
+    return 0;
+}
+
+static PyObject* ShortestPathEngine_query(ShortestPathEngine* self, PyObject* args, PyObject* kwargs) {
+    PyObject* source_obj;
+    PyObject* target_obj;
+    static const char* kwlist[] = {"source", "target", nullptr};
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "OO", const_cast<char**>(kwlist),
+                                     &source_obj, &target_obj)) {
+        return nullptr;
+    }
+    int64_t s, t;
+    if (ShortestPathEngine_id(self, source_obj, s) < 0 || ShortestPathEngine_id(self, target_obj, t) < 0)
+        return nullptr;
+    std::vector<int64_t> path;
+    double distance;
+    Py_BEGIN_ALLOW_THREADS
+    distance = self->state->query(s, t, path);
+    Py_END_ALLOW_THREADS
+
+    PyObject* path_list = PyList_New(path.size());
+    if (!path_list)
+        return nullptr;
+    for (size_t i = 0; i < path.size(); ++i) {
+        const std::string& name = self->state->names[path[i]];
+        PyObject* item = PyUnicode_FromStringAndSize(name.data(), name.size());
+        if (!item) {
+            Py_DECREF(path_list);
+            return nullptr;
+        }
+        PyList_SET_ITEM(path_list, i, item);
+    }
+    return Py_BuildValue("(dN)", distance, path_list);
+}
+
+// Converts the items of a sequence of names to vertex numbers.
+static int ShortestPathEngine_ids(ShortestPathEngine* self, PyObject* names, std::vector<int64_t>& ids) {
+    PyObject* seq = PySequence_Fast(names, "sources and targets must be sequences.");
+    if (!seq)
+        return -1;
+    const Py_ssize_t n = PySequence_Fast_GET_SIZE(seq);
+    ids.resize(n);
+    for (Py_ssize_t i = 0; i < n; ++i) {
+        if (ShortestPathEngine_id(self, PySequence_Fast_GET_ITEM(seq, i), ids[i]) < 0) {
+            Py_DECREF(seq);
+            return -1;
+        }
+    }
+    Py_DECREF(seq);
+    return 0;
+}
+
+static PyObject* ShortestPathEngine_query_many(ShortestPathEngine* self, PyObject* args, PyObject* kwargs) {
+    PyObject* sources_obj;
+    PyObject* targets_obj;
+    int paths = 0;
+    static const char* kwlist[] = {"sources", "targets", "paths", nullptr};
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "OO|p", const_cast<char**>(kwlist),
+                                     &sources_obj, &targets_obj, &paths)) {
+        return nullptr;
+    }
+    std::vector<int64_t> sources, targets;
+    if (ShortestPathEngine_ids(self, sources_obj, sources) < 0 ||
+        ShortestPathEngine_ids(self, targets_obj, targets) < 0)
+        return nullptr;
+    if (sources.size() != targets.size()) {
+        PyErr_SetString(PyExc_ValueError, "sources and targets must have the same length.");
+        return nullptr;
+    }
+
+    const size_t n = sources.size();
+    std::vector<double> distances(n);
+    std::vector<int64_t> offsets(n + 1, 0), vertices;
+    Py_BEGIN_ALLOW_THREADS
+    std::vector<size_t> order(n);
+    for (size_t i = 0; i < n; ++i)
+        order[i] = i;
+    std::stable_sort(order.begin(), order.end(),
+                     [&sources](size_t a, size_t b) { return sources[a] < sources[b]; });
+    std::vector<std::vector<int64_t>> found(paths ? n : 0);
+    std::vector<int64_t> path;
+    for (size_t i : order) {
+        path.clear();
+        distances[i] = self->state->query(sources[i], targets[i], path);
+        if (paths)
+            found[i].swap(path);
+    }
+    for (size_t i = 0; i < found.size(); ++i) {
+        vertices.insert(vertices.end(), found[i].begin(), found[i].end());
+        offsets[i + 1] = static_cast<int64_t>(vertices.size());
+    }
+    Py_END_ALLOW_THREADS
+
+    PyObject* distance_array = double_array(distances);
+    if (!distance_array || !paths)
+        return distance_array;
+    PyObject* offset_array = int64_array(offsets);
+    PyObject* vertex_array = offset_array ? int64_array(vertices) : nullptr;
+    if (!vertex_array) {
+        Py_DECREF(distance_array);
+        Py_XDECREF(offset_array);
+        return nullptr;
+    }
+    return Py_BuildValue("(NNN)", distance_array, offset_array, vertex_array);
+}
+
+static PyMethodDef ShortestPathEngine_methods[] = {
+    {"query", (PyCFunction)ShortestPathEngine_query, METH_VARARGS | METH_KEYWORDS, "Shortest path between two vertices"},
+    {"query_many", (PyCFunction)ShortestPathEngine_query_many, METH_VARARGS | METH_KEYWORDS, "Shortest path distances between pairs of vertices"},
+    {NULL}
+};
+
+inline PyTypeObject ShortestPathEngineType = {
+    PyVarObject_HEAD_INIT(NULL, 0)
+    "_graph.ShortestPathEngine",                     // tp_name
+    sizeof(ShortestPathEngine),                      // tp_basicsize
+    0,                                               // tp_itemsize
+    (destructor)ShortestPathEngine_dealloc,          // tp_dealloc
+    0,                                               // tp_vectorcall_offset
+    0,                                               // tp_getattr
+    0,                                               // tp_setattr
+    0,                                               // tp_as_async
+    0,                                               // tp_repr
+    0,                                               // tp_as_number
+    0,                                               // tp_as_sequence
+    0,                                               // tp_as_mapping
+    0,                                               // tp_hash
+    0,                                               // tp_call
+    0,                                               // tp_str
+    0,                                               // tp_getattro
+    0,                                               // tp_setattro
+    0,                                               // tp_as_buffer
+    Py_TPFLAGS_DEFAULT,                              // tp_flags
+    "Answers repeated shortest path queries on a static graph", // tp_doc
+    0,                                               // tp_traverse
+    0,                                               // tp_clear
+    0,                                               // tp_richcompare
+    0,                                               // tp_weaklistoffset
+    0,                                               // tp_iter
+    0,                                               // tp_iternext
+    ShortestPathEngine_methods,                      // tp_methods
+    0,                                               // tp_members
+    0,                                               // tp_getset
+    0,                                               // tp_base
+    0,                                               // tp_dict
+    0,                                               // tp_descr_get
+    0,                                               // tp_descr_set
+    0,                                               // tp_dictoffset
+    0,                                               // tp_init
+    0,                                               // tp_alloc
+    ShortestPathEngine_new,                          // tp_new
+};
+
+// Residual network of a graph. Arc 2*i is the i-th edge and arc
+// 2*i + 1 is its reverse, so the reverse of any arc a is a ^ 1. The
+// arcs leaving u are arcs[offsets[u]] to arcs[offsets[u + 1] - 1].
+struct FlowNetwork {
+    std::vector<int64_t> offsets;
+    std::vector<int64_t> arcs;
+    std::vector<int64_t> heads;
+    std::vector<double> capacity;
+};
+
+static void build_flow_network(FlowNetwork& net, int64_t V,
+                               const std::vector<std::tuple<int64_t, int64_t, double>>& edges) {
+    const size_t E = edges.size();
+    net.offsets.assign(V + 1, 0);
+    net.arcs.resize(2*E);
+    net.heads.resize(2*E);
+    net.capacity.assign(2*E, 0.0);
+    for (size_t i = 0; i < E; ++i) {
+        const auto& [u, v, w] = edges[i];
+        net.heads[2*i] = v;
+        net.heads[2*i + 1] = u;
+        net.capacity[2*i] = std::isnan(w) ? 0.0 : w;
+        net.offsets[u + 1]++;
+        net.offsets[v + 1]++;
+    }
+    for (int64_t u = 0; u < V; ++u)
+        net.offsets[u + 1] += net.offsets[u];
+    std::vector<int64_t> cursor(net.offsets.begin(), net.offsets.end() - 1);
+    for (size_t a = 0; a < 2*E; ++a)
+        net.arcs[cursor[net.heads[a ^ 1]]++] = static_cast<int64_t>(a);
+}
+
+static double max_flow_edmonds_karp_kernel(FlowNetwork& net, int64_t s, int64_t t) {
+    const int64_t V = static_cast<int64_t>(net.offsets.size()) - 1;
+    std::vector<int64_t> parent(V), queue(V);
+    double flow = 0.0;
+    while (s != t) {
+        std::fill(parent.begin(), parent.end(), -1);
+        parent[s] = -2;
+        size_t head = 0, tail = 0;
+        queue[tail++] = s;
+        while (head < tail && parent[t] == -1) {
+            const int64_t u = queue[head++];
+            for (int64_t i = net.offsets[u]; i < net.offsets[u + 1]; ++i) {
+                const int64_t a = net.arcs[i];
+                const int64_t v = net.heads[a];
+                if (parent[v] == -1 && net.capacity[a] > 0) {
+                    parent[v] = a;
+                    queue[tail++] = v;
+                }
+            }
+        }
+        if (parent[t] == -1)
+            break;
+
+        double path_flow = std::numeric_limits<double>::infinity();
+        for (int64_t v = t; v != s; v = net.heads[parent[v] ^ 1])
+            path_flow = std::min(path_flow, net.capacity[parent[v]]);
+        for (int64_t v = t; v != s; v = net.heads[parent[v] ^ 1]) {
+            net.capacity[parent[v]] -= path_flow;
+            net.capacity[parent[v] ^ 1] += path_flow;
+        }
+        flow += path_flow;
+    }
+    return flow;
+}
+
+static double max_flow_dinic_kernel(FlowNetwork& net, int64_t s, int64_t t) {
+    const int64_t V = static_cast<int64_t>(net.offsets.size()) - 1;
+    std::vector<int64_t> level(V), queue(V), current(V), stack, path;
+    double flow = 0.0;
+    while (s != t) {
+        std::fill(level.begin(), level.end(), -1);
+        level[s] = 0;
+        size_t head = 0, tail = 0;
+        queue[tail++] = s;
+        while (head < tail) {
+            const int64_t u = queue[head++];
+            for (int64_t i = net.offsets[u]; i < net.offsets[u + 1]; ++i) {
+                const int64_t a = net.arcs[i];
+                const int64_t v = net.heads[a];
+                if (level[v] == -1 && net.capacity[a] > 0) {
+                    level[v] = level[u] + 1;
+                    queue[tail++] = v;
+                }
+            }
+        }
+        if (level[t] == -1)
+            break;
+
+        std::copy(net.offsets.begin(), net.offsets.end() - 1, current.begin());
+        stack.assign(1, s);
+        path.clear();
+        while (!stack.empty()) {
+            const int64_t u = stack.back();
+            if (u == t) {
+                double path_flow = std::numeric_limits<double>::infinity();
+                for (int64_t a : path)
+                    path_flow = std::min(path_flow, net.capacity[a]);
+                for (int64_t a : path) {
+                    net.capacity[a] -= path_flow;
+                    net.capacity[a ^ 1] += path_flow;
+                }
+                flow += path_flow;
+                stack.assign(1, s);
+                path.clear();
+                continue;
+            }
+            bool advanced = false;
+            for (; current[u] < net.offsets[u + 1]; ++current[u]) {
+                const int64_t a = net.arcs[current[u]];
+                const int64_t v = net.heads[a];
+                if (net.capacity[a] > 0 && level[v] == level[u] + 1) {
+                    stack.push_back(v);
+                    path.push_back(a);
+                    advanced = true;
+                    break;
+                }
+            }
+            if (!advanced) {
+                level[u] = -1;
+                stack.pop_back();
+                if (!path.empty()) {
+                    path.pop_back();
+                    ++current[stack.back()];
+                }
+            }
+        }
+    }
+    return flow;
+}
+
+// Sets the height of every vertex to its distance to t in the
+// residual network, or to V if t is not reachable from it, refills
+// the buckets of active vertices and returns the highest of their
+// heights, or -1 if there are none.
+static int64_t push_relabel_heights(const FlowNetwork& net, int64_t s, int64_t t,
+                                    std::vector<int64_t>& height, std::vector<int64_t>& count,
+                                    std::vector<std::vector<int64_t>>& buckets,
+                                    const std::vector<double>& excess, std::vector<int64_t>& queue) {
+    const int64_t V = static_cast<int64_t>(height.size());
+    std::fill(height.begin(), height.end(), V);
+    std::fill(count.begin(), count.end(), 0);
+    for (auto& bucket : buckets)
+        bucket.clear();
+    height[t] = 0;
+    count[0] = 1;
+    int64_t highest = -1;
+    size_t head = 0, tail = 0;
+    queue[tail++] = t;
+    while (head < tail) {
+        const int64_t u = queue[head++];
+        const int64_t h = height[u] + 1;
+        for (int64_t i = net.offsets[u]; i < net.offsets[u + 1]; ++i) {
+            const int64_t a = net.arcs[i];
+            const int64_t v = net.heads[a];
+            if (height[v] == V && v != s && net.capacity[a ^ 1] > 0) {
+                height[v] = h;
+                count[h]++;
+                queue[tail++] = v;
+                if (excess[v] > 0) {
+                    buckets[h].push_back(v);
+                    highest = h;
+                }
+            }
+        }
+    }
+    return highest;
+}
+
+// First phase of the highest label push-relabel algorithm, with the
+// gap and global relabeling heuristics. It stops once no vertex with
+// excess can reach t anymore, leaving the value of a maximum flow as
+// the excess of t.
+static double max_flow_push_relabel_kernel(FlowNetwork& net, int64_t s, int64_t t) {
+    const int64_t V = static_cast<int64_t>(net.offsets.size()) - 1;
+    if (s == t)
+        return 0.0;
+    std::vector<double> excess(V, 0.0);
+    for (int64_t i = net.offsets[s]; i < net.offsets[s + 1]; ++i) {
+        const int64_t a = net.arcs[i];
+        const double f = net.capacity[a];
+        net.capacity[a] -= f;
+        net.capacity[a ^ 1] += f;
+        excess[net.heads[a]] += f;
+    }
+
+    std::vector<int64_t> height(V), count(V), queue(V);
+    std::vector<std::vector<int64_t>> buckets(V);
+    std::vector<int64_t> current(net.offsets.begin(), net.offsets.end() - 1);
+    int64_t highest = push_relabel_heights(net, s, t, height, count, buckets, excess, queue);
+    int64_t relabels = 0;
+    while (highest >= 0) {
+        if (buckets[highest].empty()) {
+            --highest;
+            continue;
+        }
+        const int64_t u = buckets[highest].back();
+        buckets[highest].pop_back();
+        if (height[u] != highest || excess[u] == 0)
+            continue;
+        const int64_t end = net.offsets[u + 1];
+        while (excess[u] > 0) {
+            if (current[u] == end) {
+                const int64_t old = height[u];
+                if (--count[old] == 0) {
+                    // Gap heuristic, no vertex above the emptied
+                    // height can reach t anymore.
+                    for (int64_t v = 0; v < V; ++v) {
+                        if (old < height[v] && height[v] < V) {
+                            count[height[v]]--;
+                            height[v] = V;
+                        }
+                    }
+                    height[u] = V;
+                    break;
+                }
+                int64_t next = V;
+                for (int64_t i = net.offsets[u]; i < end; ++i) {
+                    const int64_t a = net.arcs[i];
+                    if (net.capacity[a] > 0)
+                        next = std::min(next, height[net.heads[a]] + 1);
+                }
+                height[u] = next;
+                current[u] = net.offsets[u];
+                ++relabels;
+                if (next == V)
+                    break;
+                count[next]++;
+                continue;
+            }
+            const int64_t a = net.arcs[current[u]];
+            const int64_t v = net.heads[a];
+            if (net.capacity[a] > 0 && height[u] == height[v] + 1) {
+                const double f = std::min(excess[u], net.capacity[a]);
+                net.capacity[a] -= f;
+                net.capacity[a ^ 1] += f;
+                excess[u] -= f;
+                if (excess[v] == 0 && v != t)
+                    buckets[height[v]].push_back(v);
+                excess[v] += f;
+            } else {
+                ++current[u];
+            }
+        }
+        if (relabels >= V) {
+            // Global relabeling heuristic, recompute exact heights
+            // once relabels might have drifted far below them.
+            relabels = 0;
+            std::copy(net.offsets.begin(), net.offsets.end() - 1, current.begin());
+            highest = push_relabel_heights(net, s, t, height, count, buckets, excess, queue);
+        } else {
+            highest = std::max(highest, std::min(height[u], V - 1));
+        }
+    }
+    return excess[t];
+}
+
+typedef double (*MaxFlowKernel)(FlowNetwork&, int64_t, int64_t);
+
+// Parses (graph, source, sink) for graphs of the given type, builds
+// their residual network and runs the kernel on it.
+static PyObject* max_flow(PyObject* args, PyObject* kwargs, PyTypeObject* type, MaxFlowKernel kernel) {
+    PyObject* graph_obj;
+    const char* source_name;
+    const char* sink_name;
+    static const char* kwlist[] = {"graph", "source", "sink", nullptr};
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "O!ss", const_cast<char**>(kwlist),
+                                     type, &graph_obj, &source_name, &sink_name)) {
+        return nullptr;
+    }
+
+    std::vector<std::tuple<int64_t, int64_t, double>> edges;
+    int64_t V, s, t;
+    if (type == &AdjacencyListGraphType) {
+        AdjacencyListGraph* graph = reinterpret_cast<AdjacencyListGraph*>(graph_obj);
+        if (adjacency_list_endpoints(graph, source_name, sink_name, s, t) < 0)
+            return nullptr;
+        adjacency_list_arcs(graph, edges);
+        V = graph->next_id;
+    } else if (type == &AdjacencyMatrixGraphType) {
+        AdjacencyMatrixGraph* graph = reinterpret_cast<AdjacencyMatrixGraph*>(graph_obj);
+        s = t = -1;
+        V = static_cast<int64_t>(graph->nodes.size());
+        for (int64_t u = 0; u < V; ++u) {
+            const std::string& name = reinterpret_cast<GraphNode*>(graph->nodes[u])->name;
+            if (name == source_name)
+                s = u;
+            if (name == sink_name)
+                t = u;
+        }
+        if (s == -1 || t == -1) {
+            PyErr_Format(PyExc_KeyError, "Vertex %s is not present in the graph",
+                         s == -1 ? source_name : sink_name);
+            return nullptr;
+        }
+        adjacency_matrix_arcs(graph, edges);
+    } else {
+        CompressedSparseRowGraph* graph = reinterpret_cast<CompressedSparseRowGraph*>(graph_obj);
+        s = CompressedSparseRowGraph_find(graph, source_name);
+        t = s < 0 ? -1 : CompressedSparseRowGraph_find(graph, sink_name);
+        if (t < 0)
+            return nullptr;
+        CompressedSparseRowGraph_build(graph);
+        csr_arcs(graph, edges);
+        V = static_cast<int64_t>(graph->nodes.size());
+    }
+
+    double flow;
+    Py_BEGIN_ALLOW_THREADS
+    FlowNetwork net;
+    build_flow_network(net, V, edges);
+    flow = kernel(net, s, t);
+    Py_END_ALLOW_THREADS
+    return PyFloat_FromDouble(flow);
+}
+
+static PyObject* max_flow_edmonds_karp_adjacency_list(PyObject* self, PyObject* args, PyObject* kwargs) {
+    return max_flow(args, kwargs, &AdjacencyListGraphType, max_flow_edmonds_karp_kernel);
+}
+
+static PyObject* max_flow_edmonds_karp_adjacency_matrix(PyObject* self, PyObject* args, PyObject* kwargs) {
+    return max_flow(args, kwargs, &AdjacencyMatrixGraphType, max_flow_edmonds_karp_kernel);
+}
+
+static PyObject* max_flow_edmonds_karp_csr(PyObject* self, PyObject* args, PyObject* kwargs) {
+    return max_flow(args, kwargs, &CompressedSparseRowGraphType, max_flow_edmonds_karp_kernel);
+}
+
+static PyObject* max_flow_dinic_adjacency_list(PyObject* self, PyObject* args, PyObject* kwargs) {
+    return max_flow(args, kwargs, &AdjacencyListGraphType, max_flow_dinic_kernel);
+}
+
+static PyObject* max_flow_dinic_adjacency_matrix(PyObject* self, PyObject* args, PyObject* kwargs) {
+    return max_flow(args, kwargs, &AdjacencyMatrixGraphType, max_flow_dinic_kernel);
+}
+
+static PyObject* max_flow_dinic_csr(PyObject* self, PyObject* args, PyObject* kwargs) {
+    return max_flow(args, kwargs, &CompressedSparseRowGraphType, max_flow_dinic_kernel);
+}
+
+static PyObject* max_flow_push_relabel_adjacency_list(PyObject* self, PyObject* args, PyObject* kwargs) {
+    return max_flow(args, kwargs, &AdjacencyListGraphType, max_flow_push_relabel_kernel);
+}
+
+static PyObject* max_flow_push_relabel_adjacency_matrix(PyObject* self, PyObject* args, PyObject* kwargs) {
+    return max_flow(args, kwargs, &AdjacencyMatrixGraphType, max_flow_push_relabel_kernel);
+}
+
+static PyObject* max_flow_push_relabel_csr(PyObject* self, PyObject* args, PyObject* kwargs) {
+    return max_flow(args, kwargs, &CompressedSparseRowGraphType, max_flow_push_relabel_kernel);
+}
+
+// Labels the strongly connected components of the vertices u having
+// names[u] set, in the order in which Kosaraju's algorithm finds
+// them, and returns their number. Others are labelled -1. The
+// incoming edges are transposed from the outgoing ones unless
+// in_offsets and in_targets are given.
+static int64_t kosaraju_scc_kernel(const int64_t* offsets, const int64_t* targets,
+                                   const std::vector<const std::string*>& names,
+                                   std::vector<int64_t>& labels,
+                                   const int64_t* in_offsets, const int64_t* in_targets) {
+    const int64_t V = static_cast<int64_t>(names.size());
+    std::vector<char> visited(V, 0);
+    std::vector<int64_t> order;
+    std::vector<std::pair<int64_t, int64_t>> stack;
+    order.reserve(V);
+    for (int64_t root = 0; root < V; ++root) {
+        if (visited[root] || !names[root])
+            continue;
+        visited[root] = 1;
+        stack.emplace_back(root, offsets[root]);
+        while (!stack.empty()) {
+            const int64_t u = stack.back().first;
+            const int64_t i = stack.back().second;
+            if (i < offsets[u + 1]) {
+                stack.back().second++;
+                const int64_t v = targets[i];
+                if (v >= 0 && !visited[v]) {
+                    visited[v] = 1;
+                    stack.emplace_back(v, offsets[v]);
+                }
+            } else {
+                order.push_back(u);
+                stack.pop_back();
+            }
+        }
+    }
+
+    std::vector<int64_t> transposed_offsets, transposed_targets, pending;
+    if (!in_offsets) {
+        transpose_arrays(offsets, targets, V, transposed_offsets, transposed_targets);
+        in_offsets = transposed_offsets.data();
+        in_targets = transposed_targets.data();
+    }
+    labels.assign(V, -1);
+    int64_t count = 0;
+    for (auto it = order.rbegin(); it != order.rend(); ++it) {
+        if (labels[*it] != -1)
+            continue;
+        labels[*it] = count;
+        pending.assign(1, *it);
+        while (!pending.empty()) {
+            const int64_t u = pending.back();
+            pending.pop_back();
+            for (int64_t i = in_offsets[u]; i < in_offsets[u + 1]; ++i) {
+                const int64_t v = in_targets[i];
+                if (labels[v] == -1) {
+                    labels[v] = count;
+                    pending.push_back(v);
+                }
+            }
+        }
+        ++count;
+    }
+    return count;
+}
+
+// Labels the strongly connected components as kosaraju_scc_kernel,
+// in the order in which Tarjan's algorithm finds them, with an
+// explicit stack of (vertex, next arc) frames instead of recursion.
+static int64_t tarjan_scc_kernel(const int64_t* offsets, const int64_t* targets,
+                                 const std::vector<const std::string*>& names,
+                                 std::vector<int64_t>& labels,
+                                 const int64_t*, const int64_t*) {
+    const int64_t V = static_cast<int64_t>(names.size());
+    std::vector<int64_t> indices(V, -1), low_links(V, 0), stack;
+    std::vector<char> on_stack(V, 0);
+    std::vector<std::pair<int64_t, int64_t>> call_stack;
+    labels.assign(V, -1);
+    int64_t index = 0, count = 0;
+    for (int64_t root = 0; root < V; ++root) {
+        if (indices[root] != -1 || !names[root])
+            continue;
+        indices[root] = low_links[root] = index++;
+        stack.push_back(root);
+        on_stack[root] = 1;
+        call_stack.emplace_back(root, offsets[root]);
+        while (!call_stack.empty()) {
+            const int64_t u = call_stack.back().first;
+            const int64_t i = call_stack.back().second;
+            if (i < offsets[u + 1]) {
+                call_stack.back().second++;
+                const int64_t v = targets[i];
+                if (v < 0)
+                    continue;
+                if (indices[v] == -1) {
+                    indices[v] = low_links[v] = index++;
+                    stack.push_back(v);
+                    on_stack[v] = 1;
+                    call_stack.emplace_back(v, offsets[v]);
+                } else if (on_stack[v]) {
+                    low_links[u] = std::min(low_links[u], indices[v]);
+                }
+                continue;
+            }
+            call_stack.pop_back();
+            if (!call_stack.empty()) {
+                const int64_t parent = call_stack.back().first;
+                low_links[parent] = std::min(low_links[parent], low_links[u]);
+            }
+            if (low_links[u] == indices[u]) {
+                int64_t w;
+                do {
+                    w = stack.back();
+                    stack.pop_back();
+                    on_stack[w] = 0;
+                    labels[w] = count;
+                } while (w != u);
+                ++count;
+            }
+        }
+    }
+    return count;
+}
+
+typedef int64_t (*SCCKernel)(const int64_t*, const int64_t*,
+                             const std::vector<const std::string*>&, std::vector<int64_t>&,
+                             const int64_t*, const int64_t*);
+
+// Returns the labels as an array('q') if as_labels is set, otherwise
+// the list of components as sets of names.
+static PyObject* scc_result(const std::vector<int64_t>& labels, int64_t count,
+                            const std::vector<const std::string*>& names, bool as_labels) {
+    if (as_labels)
+        return int64_array(labels);
+    PyObject* components = PyList_New(count);
+    if (!components)
+        return nullptr;
+    for (int64_t c = 0; c < count; ++c) {
+        PyObject* component = PySet_New(nullptr);
+        if (!component) {
+            Py_DECREF(components);
+            return nullptr;
+        }
+        PyList_SET_ITEM(components, c, component);
+    }
+    for (size_t u = 0; u < labels.size(); ++u) {
+        if (labels[u] == -1)
+            continue;
+        PyObject* name = PyUnicode_FromStringAndSize(names[u]->data(), names[u]->size());
+        if (!name || PySet_Add(PyList_GET_ITEM(components, labels[u]), name) < 0) {
+            Py_XDECREF(name);
+            Py_DECREF(components);
+            return nullptr;
+        }
+        Py_DECREF(name);
+    }
+    return components;
+}
+
+// Edges of a graph grouped by vertex number, pointing into the graph
+// itself for CSR graphs and into offsets and targets otherwise, along
+// with the names of the vertices by number, null for removed ones.
+// If incoming is set, the incoming edges are given as well when the
+// graph already keeps them, i.e., for CSR graphs and adjacency lists
+// with in-neighbor sets.
+struct NeighborArrays {
+    std::vector<int64_t> offsets;
+    std::vector<int64_t> targets;
+    std::vector<int64_t> in_offsets;
+    std::vector<int64_t> in_targets;
+    const int64_t* offsets_data;
+    const int64_t* targets_data;
+    const int64_t* in_offsets_data = nullptr;
+    const int64_t* in_targets_data = nullptr;
+    std::vector<const std::string*> names;
+};
+
+static void neighbor_arrays(PyObject* graph_obj, PyTypeObject* type, NeighborArrays& out,
+                            bool incoming = false) {
+    if (type == &AdjacencyListGraphType) {
+        AdjacencyListGraph* graph = reinterpret_cast<AdjacencyListGraph*>(graph_obj);
+        std::vector<std::pair<int64_t, const std::string*>> vertices;
+        adjacency_list_names(graph, vertices, out.names);
+        adjacency_list_neighbors(graph, out.offsets, out.targets);
+        out.offsets_data = out.offsets.data();
+        out.targets_data = out.targets.data();
+        if (incoming && graph->track_in) {
+            adjacency_list_in_neighbors(graph, out.in_offsets, out.in_targets);
+            out.in_offsets_data = out.in_offsets.data();
+            out.in_targets_data = out.in_targets.data();
+        }
+    } else if (type == &AdjacencyMatrixGraphType) {
+        AdjacencyMatrixGraph* graph = reinterpret_cast<AdjacencyMatrixGraph*>(graph_obj);
+        for (AdjacencyMatrixGraphNode* node : graph->nodes)
+            out.names.push_back(&reinterpret_cast<GraphNode*>(node)->name);
+        adjacency_matrix_neighbors(graph, out.offsets, out.targets);
+        out.offsets_data = out.offsets.data();
+        out.targets_data = out.targets.data();
+    } else {
+        CompressedSparseRowGraph* graph = reinterpret_cast<CompressedSparseRowGraph*>(graph_obj);
+        CompressedSparseRowGraph_build(graph);
+        std::vector<std::pair<int64_t, const std::string*>> vertices;
+        csr_names(graph, vertices, out.names);
+        out.offsets_data = graph->offsets.data();
+        out.targets_data = graph->targets.data();
+        if (incoming) {
+            CompressedSparseRowGraph_transpose(graph);
+            out.in_offsets_data = graph->in_offsets.data();
+            out.in_targets_data = graph->in_targets.data();
+        }
+    }
+}
+
+// Parses (graph, labels) for graphs of the given type and runs the
+// kernel on their edges, and on the incoming ones Kosaraju's
+// algorithm walks if the graph keeps them.
+static PyObject* strongly_connected_components(PyObject* args, PyObject* kwargs,
+                                               PyTypeObject* type, SCCKernel kernel) {
+    PyObject* graph_obj;
+    int as_labels = 0;
+    static const char* kwlist[] = {"graph", "labels", nullptr};
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "O!|p", const_cast<char**>(kwlist),
+                                     type, &graph_obj, &as_labels)) {
+        return nullptr;
+    }
+
+    NeighborArrays graph;
+    neighbor_arrays(graph_obj, type, graph, kernel == kosaraju_scc_kernel);
+    std::vector<int64_t> labels;
+    int64_t count;
+    Py_BEGIN_ALLOW_THREADS
+    count = kernel(graph.offsets_data, graph.targets_data, graph.names, labels,
+                   graph.in_offsets_data, graph.in_targets_data);
+    Py_END_ALLOW_THREADS
+    return scc_result(labels, count, graph.names, as_labels);
+}
+
+static PyObject* strongly_connected_components_kosaraju_adjacency_list(PyObject* self, PyObject* args, PyObject* kwargs) {
+    return strongly_connected_components(args, kwargs, &AdjacencyListGraphType, kosaraju_scc_kernel);
+}
+
+static PyObject* strongly_connected_components_kosaraju_adjacency_matrix(PyObject* self, PyObject* args, PyObject* kwargs) {
+    return strongly_connected_components(args, kwargs, &AdjacencyMatrixGraphType, kosaraju_scc_kernel);
+}
+
+static PyObject* strongly_connected_components_kosaraju_csr(PyObject* self, PyObject* args, PyObject* kwargs) {
+    return strongly_connected_components(args, kwargs, &CompressedSparseRowGraphType, kosaraju_scc_kernel);
+}
+
+static PyObject* strongly_connected_components_tarjan_adjacency_list(PyObject* self, PyObject* args, PyObject* kwargs) {
+    return strongly_connected_components(args, kwargs, &AdjacencyListGraphType, tarjan_scc_kernel);
+}
+
+static PyObject* strongly_connected_components_tarjan_adjacency_matrix(PyObject* self, PyObject* args, PyObject* kwargs) {
+    return strongly_connected_components(args, kwargs, &AdjacencyMatrixGraphType, tarjan_scc_kernel);
+}
+
+static PyObject* strongly_connected_components_tarjan_csr(PyObject* self, PyObject* args, PyObject* kwargs) {
+    return strongly_connected_components(args, kwargs, &CompressedSparseRowGraphType, tarjan_scc_kernel);
+}
+
+// Depth first search over the undirected graph underlying the edges,
+// with one pair of arcs for every pair of adjacent vertices whichever
+// directions they are joined in, the tail of arc a being the head of
+// arc a ^ 1. Self loops are dropped.
+struct LowLinks {
+    std::vector<int64_t> arc_offsets;
+    std::vector<int64_t> arcs;
+    std::vector<int64_t> heads;
+    std::vector<std::pair<int64_t, int64_t>> bridges;
+    std::vector<char> cut;
+    std::vector<std::vector<int64_t>> components;
+};
+
+static void low_links_kernel(const int64_t* offsets, const int64_t* targets,
+                             const std::vector<const std::string*>& names, LowLinks& out) {
+    const int64_t V = static_cast<int64_t>(names.size());
+    std::vector<std::pair<int64_t, int64_t>> pairs;
+    for (int64_t u = 0; u < V; ++u) {
+        for (int64_t i = offsets[u]; i < offsets[u + 1]; ++i) {
+            const int64_t v = targets[i];
+            if (v >= 0 && v != u)
+                pairs.emplace_back(std::min(u, v), std::max(u, v));
+        }
+    }
+    std::sort(pairs.begin(), pairs.end());
+    pairs.erase(std::unique(pairs.begin(), pairs.end()), pairs.end());
+    out.heads.resize(2*pairs.size());
+    out.arc_offsets.assign(V + 1, 0);
+    for (size_t e = 0; e < pairs.size(); ++e) {
+        out.heads[2*e] = pairs[e].second;
+        out.heads[2*e + 1] = pairs[e].first;
+        out.arc_offsets[pairs[e].first + 1]++;
+        out.arc_offsets[pairs[e].second + 1]++;
+    }
+    for (int64_t u = 0; u < V; ++u)
+        out.arc_offsets[u + 1] += out.arc_offsets[u];
+    out.arcs.resize(out.heads.size());
+    std::vector<int64_t> cursor(out.arc_offsets.begin(), out.arc_offsets.end() - 1);
+    for (size_t a = 0; a < out.heads.size(); ++a)
+        out.arcs[cursor[out.heads[a ^ 1]]++] = static_cast<int64_t>(a);
+
+    const std::vector<int64_t>& arc_offsets = out.arc_offsets;
+    const std::vector<int64_t>& heads = out.heads;
+    std::vector<int64_t> disc(V, -1), low(V, 0), edge_stack;
+    // Frames of (vertex, arc from its parent, next arc).
+    std::vector<std::tuple<int64_t, int64_t, int64_t>> stack;
+    out.cut.assign(V, 0);
+    int64_t time = 0;
+    for (int64_t root = 0; root < V; ++root) {
+        if (disc[root] != -1 || !names[root])
+            continue;
+        disc[root] = low[root] = time++;
+        int64_t children = 0;
+        stack.emplace_back(root, -1, arc_offsets[root]);
+        while (!stack.empty()) {
+            auto [u, parent_arc, i] = stack.back();
+            if (i < arc_offsets[u + 1]) {
+                std::get<2>(stack.back())++;
+                const int64_t a = out.arcs[i];
+                const int64_t v = heads[a];
+                if ((a ^ 1) == parent_arc)
+                    continue;
+                if (disc[v] == -1) {
+                    disc[v] = low[v] = time++;
+                    edge_stack.push_back(a >> 1);
+                    stack.emplace_back(v, a, arc_offsets[v]);
+                } else if (disc[v] < disc[u]) {
+                    low[u] = std::min(low[u], disc[v]);
+                    edge_stack.push_back(a >> 1);
+                }
+                continue;
+            }
+            stack.pop_back();
+            if (stack.empty())
+                break;
+            const int64_t p = std::get<0>(stack.back());
+            low[p] = std::min(low[p], low[u]);
+            if (low[u] > disc[p])
+                out.bridges.emplace_back(p, u);
+            if (low[u] >= disc[p]) {
+                if (p == root)
+                    ++children;
+                else
+                    out.cut[p] = 1;
+                std::vector<int64_t> component;
+                int64_t e;
+                do {
+                    e = edge_stack.back();
+                    edge_stack.pop_back();
+                    component.push_back(heads[2*e]);
+                    component.push_back(heads[2*e + 1]);
+                } while (e != parent_arc >> 1);
+                std::sort(component.begin(), component.end());
+                component.erase(std::unique(component.begin(), component.end()), component.end());
+                out.components.push_back(std::move(component));
+            }
+        }
+        if (children > 1)
+            out.cut[root] = 1;
+    }
+}
+
+static PyObject* name_object(const std::string* name) {
+    return PyUnicode_FromStringAndSize(name->data(), name->size());
+}
+
+// Parses (graph) for graphs of the given type and runs
+// low_links_kernel on their edges.
+static int low_links(PyObject* args, PyObject* kwargs, PyTypeObject* type,
+                     NeighborArrays& graph, LowLinks& result) {
+    PyObject* graph_obj;
+    static const char* kwlist[] = {"graph", nullptr};
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "O!", const_cast<char**>(kwlist),
+                                     type, &graph_obj)) {
+        return -1;
+    }
+    neighbor_arrays(graph_obj, type, graph);
+    Py_BEGIN_ALLOW_THREADS
+    low_links_kernel(graph.offsets_data, graph.targets_data, graph.names, result);
+    Py_END_ALLOW_THREADS
+    return 0;
+}
+
+static PyObject* find_bridges(PyObject* args, PyObject* kwargs, PyTypeObject* type) {
+    NeighborArrays graph;
+    LowLinks result;
+    if (low_links(args, kwargs, type, graph, result) < 0)
+        return nullptr;
+    std::vector<std::pair<const std::string*, const std::string*>> bridges;
+    for (const auto& [u, v] : result.bridges) {
+        if (*graph.names[u] <= *graph.names[v])
+            bridges.emplace_back(graph.names[u], graph.names[v]);
+        else
+            bridges.emplace_back(graph.names[v], graph.names[u]);
+    }
+    std::sort(bridges.begin(), bridges.end(), [](const auto& x, const auto& y) {
+        return *x.first != *y.first ? *x.first < *y.first : *x.second < *y.second;
+    });
+    PyObject* list = PyList_New(bridges.size());
+    if (!list)
+        return nullptr;
+    for (size_t i = 0; i < bridges.size(); ++i) {
+        PyObject* bridge = Py_BuildValue("(s#s#)",
+            bridges[i].first->data(), static_cast<Py_ssize_t>(bridges[i].first->size()),
+            bridges[i].second->data(), static_cast<Py_ssize_t>(bridges[i].second->size()));
+        if (!bridge) {
+            Py_DECREF(list);
+            return nullptr;
+        }
+        PyList_SET_ITEM(list, i, bridge);
+    }
+    return list;
+}
+
+static PyObject* find_articulation_points(PyObject* args, PyObject* kwargs, PyTypeObject* type) {
+    NeighborArrays graph;
+    LowLinks result;
+    if (low_links(args, kwargs, type, graph, result) < 0)
+        return nullptr;
+    std::vector<const std::string*> points;
+    for (size_t u = 0; u < result.cut.size(); ++u)
+        if (result.cut[u])
+            points.push_back(graph.names[u]);
+    std::sort(points.begin(), points.end(),
+              [](const std::string* x, const std::string* y) { return *x < *y; });
+    PyObject* list = PyList_New(points.size());
+    if (!list)
+        return nullptr;
+    for (size_t i = 0; i < points.size(); ++i) {
+        PyObject* name = name_object(points[i]);
+        if (!name) {
+            Py_DECREF(list);
+            return nullptr;
+        }
+        PyList_SET_ITEM(list, i, name);
+    }
+    return list;
+}
+
+static PyObject* biconnected_components(PyObject* args, PyObject* kwargs, PyTypeObject* type) {
+    NeighborArrays graph;
+    LowLinks result;
+    if (low_links(args, kwargs, type, graph, result) < 0)
+        return nullptr;
+    PyObject* list = PyList_New(result.components.size());
+    if (!list)
+        return nullptr;
+    for (size_t i = 0; i < result.components.size(); ++i) {
+        PyObject* component = PySet_New(nullptr);
+        if (!component) {
+            Py_DECREF(list);
+            return nullptr;
+        }
+        PyList_SET_ITEM(list, i, component);
+        for (int64_t u : result.components[i]) {
+            PyObject* name = name_object(graph.names[u]);
+            if (!name || PySet_Add(component, name) < 0) {
+                Py_XDECREF(name);
+                Py_DECREF(list);
+                return nullptr;
+            }
+            Py_DECREF(name);
+        }
+    }
+    return list;
+}
+
+static PyObject* find_bridges_adjacency_list(PyObject* self, PyObject* args, PyObject* kwargs) {
+    return find_bridges(args, kwargs, &AdjacencyListGraphType);
+}
+
+static PyObject* find_bridges_adjacency_matrix(PyObject* self, PyObject* args, PyObject* kwargs) {
+    return find_bridges(args, kwargs, &AdjacencyMatrixGraphType);
+}
+
+static PyObject* find_bridges_csr(PyObject* self, PyObject* args, PyObject* kwargs) {
+    return find_bridges(args, kwargs, &CompressedSparseRowGraphType);
+}
+
+static PyObject* find_articulation_points_adjacency_list(PyObject* self, PyObject* args, PyObject* kwargs) {
+    return find_articulation_points(args, kwargs, &AdjacencyListGraphType);
+}
+
+static PyObject* find_articulation_points_adjacency_matrix(PyObject* self, PyObject* args, PyObject* kwargs) {
+    return find_articulation_points(args, kwargs, &AdjacencyMatrixGraphType);
+}
+
+static PyObject* find_articulation_points_csr(PyObject* self, PyObject* args, PyObject* kwargs) {
+    return find_articulation_points(args, kwargs, &CompressedSparseRowGraphType);
+}
+
+static PyObject* biconnected_components_adjacency_list(PyObject* self, PyObject* args, PyObject* kwargs) {
+    return biconnected_components(args, kwargs, &AdjacencyListGraphType);
+}
+
+static PyObject* biconnected_components_adjacency_matrix(PyObject* self, PyObject* args, PyObject* kwargs) {
+    return biconnected_components(args, kwargs, &AdjacencyMatrixGraphType);
+}
+
+static PyObject* biconnected_components_csr(PyObject* self, PyObject* args, PyObject* kwargs) {
+    return biconnected_components(args, kwargs, &CompressedSparseRowGraphType);
+}
+
+// Borůvka's algorithm over the undirected graph given by the parallel
+// arrays of sources, targets and weights. The edges still crossing
+// components are kept in per-worker blocks, with their endpoints
+// renamed to the dense numbers of their components. Every round, each
+// worker drops the edges of its block which no longer cross
+// components, compacting the rest in place, and lowers the cheapest
+// edge of the components on both sides with compare and swap, ties
+// broken by position so the chosen edges never close a cycle. The
+// components are then contracted along them in an array backed
+// union-find forest and renumbered, so later rounds touch arrays
+// sized to the shrinking number of components. Edges with nan weights
+// and self loops are ignored. The indices of the edges of the minimum
+// spanning forest are appended to forest. Does not touch Python
+// objects.
+static void boruvka_kernel(const int64_t* sources, const int64_t* targets,
+                           const double* weights, int64_t E, int64_t V,
+                           int num_threads, std::vector<int64_t>& forest) {
+    WorkerPool pool(num_threads);
+    std::vector<int64_t> ends[2] = {std::vector<int64_t>(E), std::vector<int64_t>(E)};
+    std::vector<int64_t> index(E), count(pool.size());
+    std::vector<double> cost(E);
+    pool.run([&](int t) {
+        auto [lo, hi] = pool.block(t, E);
+        for (int64_t e = lo; e < hi; ++e) {
+            ends[0][e] = sources[e];
+            ends[1][e] = targets[e];
+            cost[e] = weights[e];
+            index[e] = e;
+        }
+        count[t] = hi - lo;
+    });
+
+    int64_t C = V;
+    std::vector<int64_t> label(C), parent(C), size(C, 1), roots;
+    // bound[c] is the cost of some edge which was the cheapest of c
+    // at some point, so it is never below the cost of the current one
+    // and lets most edges be rejected without reading it.
+    std::unique_ptr<std::atomic<int64_t>[]> best(new std::atomic<int64_t>[C]);
+    std::unique_ptr<std::atomic<double>[]> bound(new std::atomic<double>[C]);
+    const double inf = std::numeric_limits<double>::infinity();
+    for (int64_t c = 0; c < C; ++c) {
+        label[c] = parent[c] = c;
+        best[c].store(-1, std::memory_order_relaxed);
+        bound[c].store(inf, std::memory_order_relaxed);
+    }
+    auto lower = [&](int64_t c, int64_t k) {
+        if (cost[k] > bound[c].load(std::memory_order_relaxed))
+            return;
+        int64_t f = best[c].load(std::memory_order_acquire);
+        while (f == -1 || cost[k] < cost[f] || (cost[k] == cost[f] && k < f)) {
+            if (best[c].compare_exchange_weak(f, k, std::memory_order_acq_rel)) {
+                bound[c].store(cost[k], std::memory_order_relaxed);
+                return;
+            }
+        }
+    };
+    auto cheapest = [&](int t) {
+        const int64_t lo = pool.block(t, E).first;
+        int64_t k = lo;
+        for (int64_t j = lo; j < lo + count[t]; ++j) {
+            const int64_t a = label[ends[0][j]], b = label[ends[1][j]];
+            if (a == b || std::isnan(cost[j]))
+                continue;
+            ends[0][k] = a;
+            ends[1][k] = b;
+            cost[k] = cost[j];
+            index[k] = index[j];
+            lower(a, k);
+            lower(b, k);
+            ++k;
+        }
+        count[t] = k - lo;
+    };
+    auto find = [&](int64_t c) {
+        while (parent[c] != c) {
+            parent[c] = parent[parent[c]];
+            c = parent[c];
+        }
+        return c;
+    };
+
+    while (true) {
+        pool.run(cheapest);
+        const size_t found = forest.size();
+        for (int64_t c = 0; c < C; ++c) {
+            const int64_t k = best[c].load(std::memory_order_relaxed);
+            if (k == -1)
+                continue;
+            int64_t a = find(ends[0][k]), b = find(ends[1][k]);
+            if (a == b)
+                continue;
+            if (size[a] < size[b])
+                std::swap(a, b);
+            parent[b] = a;
+            size[a] += size[b];
+            forest.push_back(index[k]);
+        }
+        if (forest.size() == found)
+            break;
+        roots.assign(C, -1);
+        int64_t next = 0;
+        for (int64_t c = 0; c < C; ++c) {
+            const int64_t r = find(c);
+            if (roots[r] == -1)
+                roots[r] = next++;
+            label[c] = roots[r];
+        }
+        C = next;
+        for (int64_t c = 0; c < C; ++c) {
+            parent[c] = c;
+            size[c] = 1;
+            best[c].store(-1, std::memory_order_relaxed);
+            bound[c].store(inf, std::memory_order_relaxed);
+        }
+    }
+}
+
+// Returns the spanning tree made of the given edges of a graph of
+// the given type as a graph of the same type, holding both directions
+// of every edge of the tree.
+static PyObject* spanning_tree_graph(PyObject* graph_obj, PyTypeObject* type,
+                                     const std::vector<const std::string*>& names,
+                                     const int64_t* sources_data, const int64_t* targets_data,
+                                     const double* weights_data,
+                                     const std::vector<int64_t>& forest) {
+    const int64_t V = static_cast<int64_t>(names.size());
+    if (type == &CompressedSparseRowGraphType) {
+        CompressedSparseRowGraph* graph = reinterpret_cast<CompressedSparseRowGraph*>(graph_obj);
+        PyObject* vertices = PyTuple_New(V);
+        if (!vertices)
+            return nullptr;
+        for (int64_t u = 0; u < V; ++u) {
+            Py_INCREF(graph->nodes[u]);
+            PyTuple_SET_ITEM(vertices, u, reinterpret_cast<PyObject*>(graph->nodes[u]));
+        }
+        PyObject* mst_obj = PyObject_CallObject(reinterpret_cast<PyObject*>(type), vertices);
+        Py_DECREF(vertices);
+        if (!mst_obj)
+            return nullptr;
+        CompressedSparseRowGraph* mst = reinterpret_cast<CompressedSparseRowGraph*>(mst_obj);
+        for (int64_t e : forest) {
+            mst->pending_sources.push_back(sources_data[e]);
+            mst->pending_targets.push_back(targets_data[e]);
+            mst->pending_weights.push_back(weights_data[e]);
+            mst->pending_sources.push_back(targets_data[e]);
+            mst->pending_targets.push_back(sources_data[e]);
+            mst->pending_weights.push_back(weights_data[e]);
+        }
+        CompressedSparseRowGraph_build(mst);
+        return mst_obj;
+    }
+
+    PyObject* mst_obj;
+    if (type == &AdjacencyListGraphType) {
+        mst_obj = PyObject_CallObject(reinterpret_cast<PyObject*>(type), nullptr);
+        if (!mst_obj)
+            return nullptr;
+        PyObject* vertex_names = PyList_New(0);
+        if (!vertex_names) {
+            Py_DECREF(mst_obj);
+            return nullptr;
+        }
+        for (const std::string* name : names) {
+            if (!name)
+                continue;
+            PyObject* name_obj = name_object(name);
+            if (!name_obj || PyList_Append(vertex_names, name_obj) < 0) {
+                Py_XDECREF(name_obj);
+                Py_DECREF(vertex_names);
+                Py_DECREF(mst_obj);
+                return nullptr;
+            }
+            Py_DECREF(name_obj);
+        }
+        PyObject* added = PyObject_CallMethod(mst_obj, "add_vertices_from", "O", vertex_names);
+        Py_DECREF(vertex_names);
+        if (!added) {
+            Py_DECREF(mst_obj);
+            return nullptr;
+        }
+        Py_DECREF(added);
+    } else {
+        AdjacencyMatrixGraph* graph = reinterpret_cast<AdjacencyMatrixGraph*>(graph_obj);
+        PyObject* vertices = PyTuple_New(V);
+        if (!vertices)
+            return nullptr;
+        for (int64_t u = 0; u < V; ++u) {
+            Py_INCREF(graph->nodes[u]);
+            PyTuple_SET_ITEM(vertices, u, reinterpret_cast<PyObject*>(graph->nodes[u]));
+        }
+        mst_obj = PyObject_CallFunctionObjArgs(reinterpret_cast<PyObject*>(type), vertices, nullptr);
+        Py_DECREF(vertices);
+        if (!mst_obj)
+            return nullptr;
+    }
+    // The edges are added with the values stored in the graph, so
+    // integer weights stay integers.
+    for (int64_t e : forest) {
+        const char* u = names[sources_data[e]]->c_str();
+        const char* v = names[targets_data[e]]->c_str();
+        PyObject* edge = PyObject_CallMethod(graph_obj, "get_edge", "ss", u, v);
+        PyObject* value = edge ? PyObject_GetAttrString(edge, "value") : nullptr;
+        Py_XDECREF(edge);
+        PyObject* forward = value ? PyObject_CallMethod(mst_obj, "add_edge", "ssO", u, v, value) : nullptr;
+        PyObject* backward = forward ? PyObject_CallMethod(mst_obj, "add_edge", "ssO", v, u, value) : nullptr;
+        Py_XDECREF(value);
+        Py_XDECREF(forward);
+        if (!backward) {
+            Py_DECREF(mst_obj);
+            return nullptr;
+        }
+        Py_DECREF(backward);
+    }
+    return mst_obj;
+}
+
+// Parses (graph, num_threads) for graphs of the given type, runs
+// boruvka_kernel on their weighted edges and returns the minimum
+// spanning tree built by spanning_tree_graph.
+static PyObject* minimum_spanning_tree_parallel_boruvka(PyObject* args, PyObject* kwargs,
+                                                        PyTypeObject* type) {
+    PyObject* graph_obj;
+    int num_threads;
+    static const char* kwlist[] = {"graph", "num_threads", nullptr};
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "O!i", const_cast<char**>(kwlist),
+                                     type, &graph_obj, &num_threads)) {
+        return nullptr;
+    }
+
+    std::vector<int64_t> sources, targets;
+    std::vector<double> weights;
+    std::vector<const std::string*> names;
+    const int64_t* sources_data;
+    const int64_t* targets_data;
+    const double* weights_data;
+    if (type == &CompressedSparseRowGraphType) {
+        CompressedSparseRowGraph* graph = reinterpret_cast<CompressedSparseRowGraph*>(graph_obj);
+        CompressedSparseRowGraph_build(graph);
+        std::vector<std::pair<int64_t, const std::string*>> vertices;
+        csr_names(graph, vertices, names);
+        sources.resize(graph->targets.size());
+        for (size_t u = 0; u < names.size(); ++u)
+            std::fill(sources.begin() + graph->offsets[u],
+                      sources.begin() + graph->offsets[u + 1], static_cast<int64_t>(u));
+        targets_data = graph->targets.data();
+        weights_data = graph->weights.data();
+    } else {
+        std::vector<std::tuple<int64_t, int64_t, double>> arcs;
+        if (type == &AdjacencyListGraphType) {
+            AdjacencyListGraph* graph = reinterpret_cast<AdjacencyListGraph*>(graph_obj);
+            std::vector<std::pair<int64_t, const std::string*>> vertices;
+            adjacency_list_names(graph, vertices, names);
+            adjacency_list_arcs(graph, arcs);
+        } else {
+            AdjacencyMatrixGraph* graph = reinterpret_cast<AdjacencyMatrixGraph*>(graph_obj);
+            for (AdjacencyMatrixGraphNode* node : graph->nodes)
+                names.push_back(&reinterpret_cast<GraphNode*>(node)->name);
+            adjacency_matrix_arcs(graph, arcs);
+        }
+        for (const auto& [u, v, w] : arcs) {
+            sources.push_back(u);
+            targets.push_back(v);
+            weights.push_back(w);
+        }
+        targets_data = targets.data();
+        weights_data = weights.data();
+    }
+    sources_data = sources.data();
+
+    std::vector<int64_t> forest;
+    const int64_t E = static_cast<int64_t>(sources.size());
+    const int64_t V = static_cast<int64_t>(names.size());
+    Py_BEGIN_ALLOW_THREADS
+    boruvka_kernel(sources_data, targets_data, weights_data, E, V, num_threads, forest);
+    Py_END_ALLOW_THREADS
+
+    return spanning_tree_graph(graph_obj, type, names, sources_data, targets_data,
+                               weights_data, forest);
+}
+
+static PyObject* minimum_spanning_tree_parallel_boruvka_adjacency_list(PyObject* self, PyObject* args, PyObject* kwargs) {
+    return minimum_spanning_tree_parallel_boruvka(args, kwargs, &AdjacencyListGraphType);
+}
+
+static PyObject* minimum_spanning_tree_parallel_boruvka_adjacency_matrix(PyObject* self, PyObject* args, PyObject* kwargs) {
+    return minimum_spanning_tree_parallel_boruvka(args, kwargs, &AdjacencyMatrixGraphType);
+}
+
+static PyObject* minimum_spanning_tree_parallel_boruvka_csr(PyObject* self, PyObject* args, PyObject* kwargs) {
+    return minimum_spanning_tree_parallel_boruvka(args, kwargs, &CompressedSparseRowGraphType);
+}
+
+// Returns the indices of the edges with non nan weights sorted by
+// weight, ties by index, using a least significant digit radix sort
+// on order preserving integer keys. Digits shared by all the keys,
+// e.g., the high bytes of small integral weights, are skipped.
+static void radix_argsort(const double* weights, int64_t E, std::vector<int64_t>& order) {
+    std::vector<std::pair<uint64_t, int64_t>> items, buffer;
+    items.reserve(E);
+    for (int64_t e = 0; e < E; ++e) {
+        if (std::isnan(weights[e]))
+            continue;
+        const double w = weights[e] == 0.0 ? 0.0 : weights[e];
+        uint64_t bits;
+        std::memcpy(&bits, &w, sizeof(bits));
+        bits = (bits >> 63) ? ~bits : bits | (uint64_t(1) << 63);
+        items.emplace_back(bits, e);
+    }
+    const size_t n = items.size();
+    std::vector<std::array<size_t, 256>> counts(8);
+    for (auto& count : counts)
+        count.fill(0);
+    for (const auto& item : items)
+        for (int d = 0; d < 8; ++d)
+            counts[d][(item.first >> (8*d)) & 0xff]++;
+    buffer.resize(n);
+    for (int d = 0; d < 8; ++d) {
+        std::array<size_t, 256>& count = counts[d];
+        if (n == 0 || count[(items[0].first >> (8*d)) & 0xff] == n)
+            continue;
+        size_t total = 0;
+        for (size_t& c : count) {
+            const size_t here = c;
+            c = total;
+            total += here;
+        }
+        for (const auto& item : items)
+            buffer[count[(item.first >> (8*d)) & 0xff]++] = item;
+        items.swap(buffer);
+    }
+    order.resize(n);
+    for (size_t i = 0; i < n; ++i)
+        order[i] = items[i].second;
+}
+
+// Kruskal's algorithm over the edges of a compressed sparse row graph,
+// taken in the order given by radix_argsort and joined in a union-find
+// forest on vertex numbers kept in arrays. The indices of the edges of
+// the minimum spanning forest, in the order they are picked, are
+// appended to forest.
+static void kruskal_kernel(const int64_t* offsets, const int64_t* targets,
+                           const double* weights, int64_t V, std::vector<int64_t>& sources,
+                           std::vector<int64_t>& forest) {
+    const int64_t E = offsets[V];
+    sources.resize(E);
+    for (int64_t u = 0; u < V; ++u)
+        std::fill(sources.begin() + offsets[u], sources.begin() + offsets[u + 1], u);
+    std::vector<int64_t> order, parent(V), size(V, 1);
+    radix_argsort(weights, E, order);
+    for (int64_t u = 0; u < V; ++u)
+        parent[u] = u;
+    auto find = [&](int64_t u) {
+        while (parent[u] != u) {
+            parent[u] = parent[parent[u]];
+            u = parent[u];
+        }
+        return u;
+    };
+    for (int64_t e : order) {
+        int64_t a = find(sources[e]), b = find(targets[e]);
+        if (a == b)
+            continue;
+        if (size[a] < size[b])
+            std::swap(a, b);
+        parent[b] = a;
+        size[a] += size[b];
+        forest.push_back(e);
+        if (static_cast<int64_t>(forest.size()) == V - 1)
+            break;
+    }
+}
+
+static PyObject* minimum_spanning_tree_kruskal_csr(PyObject* self, PyObject* args, PyObject* kwargs) {
+    PyObject* graph_obj;
+    int as_graph = 1;
+    static const char* kwlist[] = {"graph", "as_graph", nullptr};
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "O!|p", const_cast<char**>(kwlist),
+                                     &CompressedSparseRowGraphType, &graph_obj, &as_graph)) {
+        return nullptr;
+    }
+
+    CompressedSparseRowGraph* graph = reinterpret_cast<CompressedSparseRowGraph*>(graph_obj);
+    CompressedSparseRowGraph_build(graph);
+    std::vector<std::pair<int64_t, const std::string*>> vertices;
+    std::vector<const std::string*> names;
+    csr_names(graph, vertices, names);
+    std::vector<int64_t> sources, forest;
+    const int64_t V = static_cast<int64_t>(names.size());
+    Py_BEGIN_ALLOW_THREADS
+    kruskal_kernel(graph->offsets.data(), graph->targets.data(), graph->weights.data(),
+                   V, sources, forest);
+    Py_END_ALLOW_THREADS
+
+    if (!as_graph)
+        return int64_array(forest);
+    return spanning_tree_graph(graph_obj, &CompressedSparseRowGraphType, names, sources.data(),
+                               graph->targets.data(), graph->weights.data(), forest);
+}
+
+// Kahn's algorithm run one wave at a time on a WorkerPool. In-degrees
+// are counted once into atomic counters, and the vertices of every
+// wave are split between the workers, each lowering the counters of
+// the targets of its vertices and collecting the ones dropping to
+// zero, which form the next wave. The vertices are appended to order
+// wave after wave, wave i occupying the slots from wave_offsets[i] to
+// wave_offsets[i + 1] - 1. Does not touch Python objects.
+static void kahn_waves_kernel(const int64_t* offsets, const int64_t* targets,
+                              const std::vector<const std::string*>& names, int num_threads,
+                              std::vector<int64_t>& order, std::vector<int64_t>& wave_offsets) {
+    const int64_t V = static_cast<int64_t>(names.size());
+    WorkerPool pool(num_threads);
+    std::vector<std::atomic<int64_t>> in_degree(V);
+    for (int64_t v = 0; v < V; ++v)
+        in_degree[v].store(0, std::memory_order_relaxed);
+    pool.run([&](int t) {
+        auto [lo, hi] = pool.block(t, V);
+        for (int64_t i = offsets[lo]; i < offsets[hi]; ++i)
+            if (targets[i] >= 0)
+                in_degree[targets[i]].fetch_add(1, std::memory_order_relaxed);
+    });
+
+    order.clear();
+    wave_offsets.assign(1, 0);
+    for (int64_t u = 0; u < V; ++u)
+        if (names[u] && in_degree[u].load(std::memory_order_relaxed) == 0)
+            order.push_back(u);
+    std::vector<std::vector<int64_t>> buffers(pool.size());
+    int64_t lo_wave = 0, hi_wave = static_cast<int64_t>(order.size());
+    auto lower = [&](int t) {
+        std::vector<int64_t>& buffer = buffers[t];
+        buffer.clear();
+        auto [lo, hi] = pool.block(t, hi_wave - lo_wave);
+        for (int64_t k = lo_wave + lo; k < lo_wave + hi; ++k) {
+            const int64_t u = order[k];
+            for (int64_t i = offsets[u]; i < offsets[u + 1]; ++i) {
+                const int64_t v = targets[i];
+                if (v >= 0 && in_degree[v].fetch_sub(1, std::memory_order_acq_rel) == 1)
+                    buffer.push_back(v);
+            }
+        }
+    };
+    while (lo_wave < hi_wave) {
+        wave_offsets.push_back(hi_wave);
+        pool.run(lower);
+        for (const std::vector<int64_t>& buffer : buffers)
+            order.insert(order.end(), buffer.begin(), buffer.end());
+        lo_wave = hi_wave;
+        hi_wave = static_cast<int64_t>(order.size());
+    }
+}
+
+static PyObject* topological_sort_parallel_kahn(PyObject* args, PyObject* kwargs,
+                                                PyTypeObject* type) {
+    PyObject* graph_obj;
+    int num_threads;
+    int as_waves = 0;
+    static const char* kwlist[] = {"graph", "num_threads", "waves", nullptr};
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "O!i|p", const_cast<char**>(kwlist),
+                                     type, &graph_obj, &num_threads, &as_waves)) {
+        return nullptr;
+    }
+
+    NeighborArrays graph;
+    neighbor_arrays(graph_obj, type, graph);
+    std::vector<int64_t> order, wave_offsets;
+    Py_BEGIN_ALLOW_THREADS
+    kahn_waves_kernel(graph.offsets_data, graph.targets_data, graph.names, num_threads,
+                      order, wave_offsets);
+    Py_END_ALLOW_THREADS
+
+    const size_t live = std::count_if(graph.names.begin(), graph.names.end(),
+                                      [](const std::string* name) { return name != nullptr; });
+    if (order.size() != live) {
+        PyErr_SetString(PyExc_ValueError, "Graph is not acyclic.");
+        return nullptr;
+    }
+    auto names_list = [&](int64_t lo, int64_t hi) -> PyObject* {
+        PyObject* list = PyList_New(hi - lo);
+        if (!list)
+            return nullptr;
+        for (int64_t k = lo; k < hi; ++k) {
+            PyObject* name = name_object(graph.names[order[k]]);
+            if (!name) {
+                Py_DECREF(list);
+                return nullptr;
+            }
+            PyList_SET_ITEM(list, k - lo, name);
+        }
+        return list;
+    };
+    if (!as_waves)
+        return names_list(0, static_cast<int64_t>(order.size()));
+    PyObject* waves = PyList_New(wave_offsets.size() - 1);
+    if (!waves)
+        return nullptr;
+    for (size_t i = 0; i + 1 < wave_offsets.size(); ++i) {
+        PyObject* wave = names_list(wave_offsets[i], wave_offsets[i + 1]);
+        if (!wave) {
+            Py_DECREF(waves);
+            return nullptr;
+        }
+        PyList_SET_ITEM(waves, i, wave);
+    }
+    return waves;
+}
+
+static PyObject* topological_sort_parallel_kahn_adjacency_list(PyObject* self, PyObject* args, PyObject* kwargs) {
+    return topological_sort_parallel_kahn(args, kwargs, &AdjacencyListGraphType);
+}
+
+static PyObject* topological_sort_parallel_kahn_adjacency_matrix(PyObject* self, PyObject* args, PyObject* kwargs) {
+    return topological_sort_parallel_kahn(args, kwargs, &AdjacencyMatrixGraphType);
+}
+
+static PyObject* topological_sort_parallel_kahn_csr(PyObject* self, PyObject* args, PyObject* kwargs) {
+    return topological_sort_parallel_kahn(args, kwargs, &CompressedSparseRowGraphType);
+}
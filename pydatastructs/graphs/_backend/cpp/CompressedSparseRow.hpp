@@ -0,0 +1,640 @@
+#ifndef COMPRESSED_SPARSE_ROW_GRAPH_HPP
+#define COMPRESSED_SPARSE_ROW_GRAPH_HPP
+
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+#include <vector>
+#include <unordered_map>
+#include <string>
+#include <algorithm>
+#include <cmath>
+#include <cstdint>
+#include <limits>
+#include "AdjacencyListGraphNode.hpp"
+#include "GraphEdge.hpp"
+#include "SequenceReader.hpp"
+#include "TypedArray.hpp"
+#include "../../../utils/_backend/cpp/utils.hpp"
+
+extern PyTypeObject CompressedSparseRowGraphType;
+
+typedef struct {
+
+    PyObject_HEAD
+    PyObject* dict;
+    std::vector<AdjacencyListGraphNode*> nodes;
+    std::unordered_map<std::string, int64_t> name_to_id;
+    std::vector<int64_t> offsets;
+    std::vector<int64_t> targets;
+    std::vector<double> weights;
+    std::vector<int64_t> pending_sources;
+    std::vector<int64_t> pending_targets;
+    std::vector<double> pending_weights;
+    std::vector<int64_t> in_offsets;
+    std::vector<int64_t> in_targets;
+
+} CompressedSparseRowGraph;
+
+static void CompressedSparseRowGraph_dealloc(CompressedSparseRowGraph* self) {
+    for (AdjacencyListGraphNode* node : self->nodes) {
+        Py_XDECREF(node);
+    }
+
+    using int_vector = std::vector<int64_t>;
+    using double_vector = std::vector<double>;
+    using node_vector = std::vector<AdjacencyListGraphNode*>;
+    using id_map = std::unordered_map<std::string, int64_t>;
+    self->nodes.~node_vector();
+    self->name_to_id.~id_map();
+    self->offsets.~int_vector();
+    self->targets.~int_vector();
+    self->weights.~double_vector();
+    self->pending_sources.~int_vector();
+    self->pending_targets.~int_vector();
+    self->pending_weights.~double_vector();
+    self->in_offsets.~int_vector();
+    self->in_targets.~int_vector();
+
+    Py_XDECREF(self->dict);
+    Py_TYPE(self)->tp_free(reinterpret_cast<PyObject*>(self));
+}
+
+static int CompressedSparseRowGraph_append_vertex(CompressedSparseRowGraph* self, PyObject* node_obj) {
+    if (get_type_tag(node_obj) != NodeType_::AdjacencyListGraphNode) {
+        PyErr_SetString(PyExc_TypeError, "All vertices must be AdjacencyListGraphNode instances");
+        return -1;
+    }
+
+    AdjacencyListGraphNode* node = reinterpret_cast<AdjacencyListGraphNode*>(node_obj);
+    if (self->name_to_id.find(node->name) != self->name_to_id.end()) {
+        PyErr_Format(PyExc_ValueError, "Duplicate node with name '%s'", node->name.c_str());
+        return -1;
+    }
+
+    Py_INCREF(node);
+    self->name_to_id[node->name] = static_cast<int64_t>(self->nodes.size());
+    self->nodes.push_back(node);
+    self->offsets.push_back(self->offsets.back());
+    self->in_offsets.clear();
+    return 0;
+}
+
+static PyObject* CompressedSparseRowGraph_new(PyTypeObject* type, PyObject* args, PyObject* kwds) {
+    CompressedSparseRowGraph* self = reinterpret_cast<CompressedSparseRowGraph*>(type->tp_alloc(type, 0));
+    if (!self)
+        return NULL;
+
+    new (&self->nodes) std::vector<AdjacencyListGraphNode*>();
+    new (&self->name_to_id) std::unordered_map<std::string, int64_t>();
+    new (&self->offsets) std::vector<int64_t>(1, 0);
+    new (&self->targets) std::vector<int64_t>();
+    new (&self->weights) std::vector<double>();
+    new (&self->pending_sources) std::vector<int64_t>();
+    new (&self->pending_targets) std::vector<int64_t>();
+    new (&self->pending_weights) std::vector<double>();
+    new (&self->in_offsets) std::vector<int64_t>();
+    new (&self->in_targets) std::vector<int64_t>();
+
+    Py_ssize_t num_args = PyTuple_Size(args);
+    for (Py_ssize_t i = 0; i < num_args; ++i) {
+        if (CompressedSparseRowGraph_append_vertex(self, PyTuple_GetItem(args, i)) < 0) {
+            Py_DECREF(self);
+            return NULL;
+        }
+    }
+
+    PyObject* impl_str = PyUnicode_FromString("csr");
+    if (PyObject_SetAttrString(reinterpret_cast<PyObject*>(self), "_impl", impl_str) < 0) {
+        Py_DECREF(impl_str);
+        Py_DECREF(self);
+        PyErr_SetString(PyExc_RuntimeError, "Failed to set _impl attribute");
+        return NULL;
+    }
+
+    Py_DECREF(impl_str);
+    return reinterpret_cast<PyObject*>(self);
+}
+
+// Merges the buffered edges into the offsets/targets/weights arrays.
+// Rows stay sorted by target and a later edge between the same pair
+// of vertices replaces the earlier one.
+static void CompressedSparseRowGraph_build(CompressedSparseRowGraph* self) {
+    if (self->pending_targets.empty())
+        return;
+
+    const int64_t V = static_cast<int64_t>(self->nodes.size());
+    std::vector<int64_t> starts(V + 1, 0);
+    for (int64_t u = 0; u < V; ++u)
+        starts[u + 1] = self->offsets[u + 1] - self->offsets[u];
+    for (int64_t s : self->pending_sources)
+        starts[s + 1]++;
+    for (int64_t u = 0; u < V; ++u)
+        starts[u + 1] += starts[u];
+
+    std::vector<std::pair<int64_t, double>> slots(starts[V]);
+    std::vector<int64_t> cursor(starts.begin(), starts.end() - 1);
+    for (int64_t u = 0; u < V; ++u) {
+        for (int64_t i = self->offsets[u]; i < self->offsets[u + 1]; ++i)
+            slots[cursor[u]++] = {self->targets[i], self->weights[i]};
+    }
+    for (size_t k = 0; k < self->pending_sources.size(); ++k) {
+        int64_t s = self->pending_sources[k];
+        slots[cursor[s]++] = {self->pending_targets[k], self->pending_weights[k]};
+    }
+
+    self->targets.clear();
+    self->weights.clear();
+    self->targets.reserve(slots.size());
+    self->weights.reserve(slots.size());
+    auto by_target = [](const std::pair<int64_t, double>& a, const std::pair<int64_t, double>& b) {
+        return a.first < b.first;
+    };
+    for (int64_t u = 0; u < V; ++u) {
+        auto begin = slots.begin() + starts[u];
+        auto end = slots.begin() + starts[u + 1];
+        std::stable_sort(begin, end, by_target);
+        for (auto it = begin; it != end; ++it) {
+            if (it + 1 != end && (it + 1)->first == it->first)
+                continue;
+            self->targets.push_back(it->first);
+            self->weights.push_back(it->second);
+        }
+        self->offsets[u + 1] = static_cast<int64_t>(self->targets.size());
+    }
+
+    self->pending_sources.clear();
+    self->pending_targets.clear();
+    self->pending_weights.clear();
+    self->pending_sources.shrink_to_fit();
+    self->pending_targets.shrink_to_fit();
+    self->pending_weights.shrink_to_fit();
+    self->in_offsets.clear();
+}
+
+// Builds the incoming edges of every vertex, grouped like the
+// outgoing ones, unless they are still valid from an earlier call.
+static void CompressedSparseRowGraph_transpose(CompressedSparseRowGraph* self) {
+    CompressedSparseRowGraph_build(self);
+    if (!self->in_offsets.empty())
+        return;
+
+    const int64_t V = static_cast<int64_t>(self->nodes.size());
+    self->in_offsets.assign(V + 1, 0);
+    self->in_targets.resize(self->targets.size());
+    for (int64_t v : self->targets)
+        self->in_offsets[v + 1]++;
+    for (int64_t v = 0; v < V; ++v)
+        self->in_offsets[v + 1] += self->in_offsets[v];
+    std::vector<int64_t> cursor(self->in_offsets.begin(), self->in_offsets.end() - 1);
+    for (int64_t u = 0; u < V; ++u)
+        for (int64_t i = self->offsets[u]; i < self->offsets[u + 1]; ++i)
+            self->in_targets[cursor[self->targets[i]]++] = u;
+}
+
+static int64_t CompressedSparseRowGraph_slot(CompressedSparseRowGraph* self, int64_t u, int64_t v) {
+    auto begin = self->targets.begin() + self->offsets[u];
+    auto end = self->targets.begin() + self->offsets[u + 1];
+    auto it = std::lower_bound(begin, end, v);
+    if (it != end && *it == v)
+        return static_cast<int64_t>(it - self->targets.begin());
+    return -1;
+}
+
+static int64_t CompressedSparseRowGraph_find(CompressedSparseRowGraph* self, const char* name) {
+    auto it = self->name_to_id.find(name);
+    if (it == self->name_to_id.end()) {
+        PyErr_Format(PyExc_KeyError, "Node '%s' not found", name);
+        return -1;
+    }
+    return it->second;
+}
+
+static PyObject* CompressedSparseRowGraph_add_vertex(CompressedSparseRowGraph* self, PyObject* args) {
+    PyObject* node_obj;
+    if (!PyArg_ParseTuple(args, "O", &node_obj))
+        return NULL;
+
+    if (CompressedSparseRowGraph_append_vertex(self, node_obj) < 0)
+        return NULL;
+
+    Py_RETURN_NONE;
+}
+
+static PyObject* CompressedSparseRowGraph_remove_vertex(CompressedSparseRowGraph* self, PyObject* args) {
+    const char* name_c;
+    if (!PyArg_ParseTuple(args, "s", &name_c))
+        return NULL;
+
+    int64_t k = CompressedSparseRowGraph_find(self, name_c);
+    if (k < 0)
+        return NULL;
+
+    CompressedSparseRowGraph_build(self);
+    const int64_t V = static_cast<int64_t>(self->nodes.size());
+    std::vector<int64_t> offsets(1, 0);
+    std::vector<int64_t> targets;
+    std::vector<double> weights;
+    offsets.reserve(V);
+    targets.reserve(self->targets.size());
+    weights.reserve(self->weights.size());
+    for (int64_t u = 0; u < V; ++u) {
+        if (u == k)
+            continue;
+        for (int64_t i = self->offsets[u]; i < self->offsets[u + 1]; ++i) {
+            int64_t v = self->targets[i];
+            if (v == k)
+                continue;
+            targets.push_back(v > k ? v - 1 : v);
+            weights.push_back(self->weights[i]);
+        }
+        offsets.push_back(static_cast<int64_t>(targets.size()));
+    }
+    self->offsets.swap(offsets);
+    self->targets.swap(targets);
+    self->weights.swap(weights);
+    self->in_offsets.clear();
+
+    AdjacencyListGraphNode* node = self->nodes[k];
+    self->name_to_id.erase(node->name);
+    self->nodes.erase(self->nodes.begin() + k);
+    for (int64_t i = k; i < V - 1; ++i)
+        self->name_to_id[self->nodes[i]->name] = i;
+    Py_DECREF(node);
+
+    Py_RETURN_NONE;
+}
+
+static PyObject* CompressedSparseRowGraph_add_edge(CompressedSparseRowGraph* self, PyObject* args) {
+    const char* source_c;
+    const char* target_c;
+    PyObject* value = Py_None;
+
+    if (!PyArg_ParseTuple(args, "ss|O", &source_c, &target_c, &value))
+        return NULL;
+
+    auto it_source = self->name_to_id.find(source_c);
+    if (it_source == self->name_to_id.end()) {
+        PyErr_SetString(PyExc_ValueError, "Source node does not exist");
+        return NULL;
+    }
+    auto it_target = self->name_to_id.find(target_c);
+    if (it_target == self->name_to_id.end()) {
+        PyErr_SetString(PyExc_ValueError, "Target node does not exist");
+        return NULL;
+    }
+
+    double weight = std::numeric_limits<double>::quiet_NaN();
+    if (value != Py_None) {
+        weight = PyFloat_AsDouble(value);
+        if (weight == -1.0 && PyErr_Occurred())
+            return NULL;
+    }
+
+    self->pending_sources.push_back(it_source->second);
+    self->pending_targets.push_back(it_target->second);
+    self->pending_weights.push_back(weight);
+
+    Py_RETURN_NONE;
+}
+
+static PyObject* CompressedSparseRowGraph_add_vertices_from(CompressedSparseRowGraph* self, PyObject* args) {
+    PyObject* names_obj;
+    if (!PyArg_ParseTuple(args, "O", &names_obj))
+        return NULL;
+
+    SequenceReader names;
+    if (SequenceReader_open(&names, names_obj) < 0)
+        return NULL;
+
+    std::string name;
+    for (Py_ssize_t i = 0; i < names.size; i++) {
+        if (SequenceReader_name(&names, i, name) < 0) {
+            SequenceReader_close(&names);
+            return NULL;
+        }
+        if (self->name_to_id.find(name) != self->name_to_id.end())
+            continue;
+
+        PyObject* node_obj = PyObject_CallFunction(reinterpret_cast<PyObject*>(&AdjacencyListGraphNodeType), "s", name.c_str());
+        if (!node_obj) {
+            SequenceReader_close(&names);
+            return NULL;
+        }
+        int status = CompressedSparseRowGraph_append_vertex(self, node_obj);
+        Py_DECREF(node_obj);
+        if (status < 0) {
+            SequenceReader_close(&names);
+            return NULL;
+        }
+    }
+
+    SequenceReader_close(&names);
+    Py_RETURN_NONE;
+}
+
+static PyObject* CompressedSparseRowGraph_add_edges_from(CompressedSparseRowGraph* self, PyObject* args) {
+    PyObject *sources_obj, *targets_obj, *weights_obj = Py_None;
+    if (!PyArg_ParseTuple(args, "OO|O", &sources_obj, &targets_obj, &weights_obj))
+        return NULL;
+
+    SequenceReader sources, targets, weights;
+    if (SequenceReader_open(&sources, sources_obj) < 0)
+        return NULL;
+    if (SequenceReader_open(&targets, targets_obj) < 0) {
+        SequenceReader_close(&sources);
+        return NULL;
+    }
+    bool weighted = weights_obj != Py_None;
+    if (weighted && SequenceReader_open(&weights, weights_obj) < 0) {
+        SequenceReader_close(&sources);
+        SequenceReader_close(&targets);
+        return NULL;
+    }
+
+    auto close_all = [&]() {
+        SequenceReader_close(&sources);
+        SequenceReader_close(&targets);
+        if (weighted)
+            SequenceReader_close(&weights);
+    };
+
+    Py_ssize_t num_edges = sources.size;
+    if (targets.size != num_edges || (weighted && weights.size != num_edges)) {
+        close_all();
+        PyErr_SetString(PyExc_ValueError, "sources, targets and weights must have the same length");
+        return NULL;
+    }
+
+    size_t base = self->pending_sources.size();
+    self->pending_sources.reserve(base + num_edges);
+    self->pending_targets.reserve(base + num_edges);
+    self->pending_weights.reserve(base + num_edges);
+
+    auto rollback = [&]() {
+        self->pending_sources.resize(base);
+        self->pending_targets.resize(base);
+        self->pending_weights.resize(base);
+        close_all();
+    };
+
+    std::string name;
+    for (Py_ssize_t i = 0; i < num_edges; i++) {
+        int64_t ids[2];
+        SequenceReader* ends[2] = {&sources, &targets};
+        for (int k = 0; k < 2; k++) {
+            if (SequenceReader_name(ends[k], i, name) < 0) {
+                rollback();
+                return NULL;
+            }
+            auto it = self->name_to_id.find(name);
+            if (it == self->name_to_id.end()) {
+                rollback();
+                PyErr_Format(PyExc_ValueError, "Vertex %s is not present in the graph", name.c_str());
+                return NULL;
+            }
+            ids[k] = it->second;
+        }
+
+        double weight = std::numeric_limits<double>::quiet_NaN();
+        if (weighted) {
+            if (weights.has_view) {
+                weight = SequenceReader_double(&weights, i);
+            } else {
+                PyObject* value = PySequence_Fast_GET_ITEM(weights.fast, i);
+                if (value != Py_None) {
+                    weight = PyFloat_AsDouble(value);
+                    if (weight == -1.0 && PyErr_Occurred()) {
+                        rollback();
+                        return NULL;
+                    }
+                }
+            }
+        }
+
+        self->pending_sources.push_back(ids[0]);
+        self->pending_targets.push_back(ids[1]);
+        self->pending_weights.push_back(weight);
+    }
+
+    close_all();
+    Py_RETURN_NONE;
+}
+
+static PyObject* CompressedSparseRowGraph_remove_edge(CompressedSparseRowGraph* self, PyObject* args) {
+    const char* source_c;
+    const char* target_c;
+    if (!PyArg_ParseTuple(args, "ss", &source_c, &target_c))
+        return NULL;
+
+    int64_t u = CompressedSparseRowGraph_find(self, source_c);
+    if (u < 0)
+        return NULL;
+    int64_t v = CompressedSparseRowGraph_find(self, target_c);
+    if (v < 0)
+        return NULL;
+
+    CompressedSparseRowGraph_build(self);
+    int64_t i = CompressedSparseRowGraph_slot(self, u, v);
+    if (i >= 0) {
+        self->targets.erase(self->targets.begin() + i);
+        self->weights.erase(self->weights.begin() + i);
+        for (size_t w = u + 1; w < self->offsets.size(); ++w)
+            self->offsets[w]--;
+        self->in_offsets.clear();
+    }
+
+    Py_RETURN_NONE;
+}
+
+static PyObject* CompressedSparseRowGraph_get_edge(CompressedSparseRowGraph* self, PyObject* args) {
+    const char* source_c;
+    const char* target_c;
+    if (!PyArg_ParseTuple(args, "ss", &source_c, &target_c))
+        return NULL;
+
+    int64_t u = CompressedSparseRowGraph_find(self, source_c);
+    if (u < 0)
+        return NULL;
+    int64_t v = CompressedSparseRowGraph_find(self, target_c);
+    if (v < 0)
+        return NULL;
+
+    CompressedSparseRowGraph_build(self);
+    int64_t i = CompressedSparseRowGraph_slot(self, u, v);
+    if (i < 0 || std::isnan(self->weights[i]))
+        Py_RETURN_NONE;
+
+    PyObject* value = PyFloat_FromDouble(self->weights[i]);
+    if (!value)
+        return NULL;
+    PyObject* edge_args = PyTuple_Pack(3, reinterpret_cast<PyObject*>(self->nodes[u]),
+                                       reinterpret_cast<PyObject*>(self->nodes[v]), value);
+    Py_DECREF(value);
+    if (!edge_args)
+        return NULL;
+
+    PyObject* edge_obj = PyObject_CallObject(reinterpret_cast<PyObject*>(&GraphEdgeType), edge_args);
+    Py_DECREF(edge_args);
+    return edge_obj;
+}
+
+static PyObject* CompressedSparseRowGraph_is_adjacent(CompressedSparseRowGraph* self, PyObject* args) {
+    const char* node1_c;
+    const char* node2_c;
+    if (!PyArg_ParseTuple(args, "ss", &node1_c, &node2_c))
+        return NULL;
+
+    int64_t u = CompressedSparseRowGraph_find(self, node1_c);
+    if (u < 0)
+        return NULL;
+    auto it = self->name_to_id.find(node2_c);
+    if (it == self->name_to_id.end())
+        Py_RETURN_FALSE;
+
+    CompressedSparseRowGraph_build(self);
+    if (CompressedSparseRowGraph_slot(self, u, it->second) >= 0)
+        Py_RETURN_TRUE;
+    Py_RETURN_FALSE;
+}
+
+static PyObject* CompressedSparseRowGraph_neighbors(CompressedSparseRowGraph* self, PyObject* args) {
+    const char* node_c;
+    if (!PyArg_ParseTuple(args, "s", &node_c))
+        return NULL;
+
+    int64_t u = CompressedSparseRowGraph_find(self, node_c);
+    if (u < 0)
+        return NULL;
+
+    CompressedSparseRowGraph_build(self);
+    int64_t lo = self->offsets[u], hi = self->offsets[u + 1];
+    PyObject* neighbors_list = PyList_New(hi - lo);
+    if (!neighbors_list)
+        return NULL;
+
+    for (int64_t i = lo; i < hi; ++i) {
+        PyObject* node = reinterpret_cast<PyObject*>(self->nodes[self->targets[i]]);
+        Py_INCREF(node);
+        PyList_SET_ITEM(neighbors_list, i - lo, node);
+    }
+
+    return neighbors_list;
+}
+
+static PyObject* CompressedSparseRowGraph_num_vertices(CompressedSparseRowGraph* self, PyObject* Py_UNUSED(ignored)) {
+    return PyLong_FromSize_t(self->nodes.size());
+}
+
+static PyObject* CompressedSparseRowGraph_num_edges(CompressedSparseRowGraph* self, PyObject* Py_UNUSED(ignored)) {
+    CompressedSparseRowGraph_build(self);
+    return PyLong_FromSize_t(self->targets.size());
+}
+
+// Number of edges starting at, or if incoming is set ending at,
+// vertex u of a built graph.
+static int64_t CompressedSparseRowGraph_degree_of(CompressedSparseRowGraph* self, int64_t u, bool incoming) {
+    if (incoming) {
+        CompressedSparseRowGraph_transpose(self);
+        return self->in_offsets[u + 1] - self->in_offsets[u];
+    }
+    return self->offsets[u + 1] - self->offsets[u];
+}
+
+static PyObject* CompressedSparseRowGraph_degree(CompressedSparseRowGraph* self, PyObject* args) {
+    const char* node_c;
+    if (!PyArg_ParseTuple(args, "s", &node_c))
+        return NULL;
+
+    int64_t u = CompressedSparseRowGraph_find(self, node_c);
+    if (u < 0)
+        return NULL;
+    CompressedSparseRowGraph_build(self);
+    return PyLong_FromLongLong(CompressedSparseRowGraph_degree_of(self, u, false));
+}
+
+static PyObject* CompressedSparseRowGraph_in_degree(CompressedSparseRowGraph* self, PyObject* args) {
+    const char* node_c;
+    if (!PyArg_ParseTuple(args, "s", &node_c))
+        return NULL;
+
+    int64_t u = CompressedSparseRowGraph_find(self, node_c);
+    if (u < 0)
+        return NULL;
+    CompressedSparseRowGraph_build(self);
+    return PyLong_FromLongLong(CompressedSparseRowGraph_degree_of(self, u, true));
+}
+
+static PyObject* CompressedSparseRowGraph_degrees(CompressedSparseRowGraph* self, PyObject* args, PyObject* kwds) {
+    int incoming = 0;
+    static const char* kwlist[] = {"incoming", NULL};
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "|p", const_cast<char**>(kwlist), &incoming))
+        return NULL;
+
+    CompressedSparseRowGraph_build(self);
+    const int64_t V = static_cast<int64_t>(self->nodes.size());
+    std::vector<int64_t> degrees(V);
+    for (int64_t u = 0; u < V; ++u)
+        degrees[u] = CompressedSparseRowGraph_degree_of(self, u, incoming);
+    return int64_array(degrees);
+}
+
+static PyMethodDef CompressedSparseRowGraph_methods[] = {
+    {"add_vertex", (PyCFunction)CompressedSparseRowGraph_add_vertex, METH_VARARGS, "Add a vertex to the graph"},
+    {"remove_vertex", (PyCFunction)CompressedSparseRowGraph_remove_vertex, METH_VARARGS, "Remove a vertex"},
+    {"add_edge", (PyCFunction)CompressedSparseRowGraph_add_edge, METH_VARARGS, "Add an edge to the graph"},
+    {"add_vertices_from", (PyCFunction)CompressedSparseRowGraph_add_vertices_from, METH_VARARGS, "Add vertices with the given names to the graph"},
+    {"add_edges_from", (PyCFunction)CompressedSparseRowGraph_add_edges_from, METH_VARARGS, "Add edges from parallel sequences of sources, targets and weights"},
+    {"remove_edge", (PyCFunction)CompressedSparseRowGraph_remove_edge, METH_VARARGS, "Remove edge between source and target"},
+    {"get_edge", (PyCFunction)CompressedSparseRowGraph_get_edge, METH_VARARGS, "Get edge between source and target"},
+    {"is_adjacent", (PyCFunction)CompressedSparseRowGraph_is_adjacent, METH_VARARGS, "Check adjacency between two nodes"},
+    {"neighbors", (PyCFunction)CompressedSparseRowGraph_neighbors, METH_VARARGS, "Get neighbors of a node"},
+    {"num_vertices", (PyCFunction)CompressedSparseRowGraph_num_vertices, METH_NOARGS, "Number of vertices"},
+    {"num_edges", (PyCFunction)CompressedSparseRowGraph_num_edges, METH_NOARGS, "Number of edges"},
+    {"degree", (PyCFunction)CompressedSparseRowGraph_degree, METH_VARARGS, "Number of edges starting at a node"},
+    {"in_degree", (PyCFunction)CompressedSparseRowGraph_in_degree, METH_VARARGS, "Number of edges ending at a node"},
+    {"degrees", (PyCFunction)CompressedSparseRowGraph_degrees, METH_VARARGS | METH_KEYWORDS, "Numbers of edges starting, or ending, at every vertex"},
+    {NULL}
+};
+
+inline PyTypeObject CompressedSparseRowGraphType = {
+    PyVarObject_HEAD_INIT(NULL, 0)                  // ob_base
+    "_graph.CompressedSparseRowGraph",              // tp_name
+    sizeof(CompressedSparseRowGraph),               // tp_basicsize
+    0,                                               // tp_itemsize
+    (destructor)CompressedSparseRowGraph_dealloc,   // tp_dealloc
+    0,                                               // tp_vectorcall_offset or tp_print (depends on Python version)
+    0,                                               // tp_getattr
+    0,                                               // tp_setattr
+    0,                                               // tp_as_async / tp_reserved
+    0,                                               // tp_repr
+    0,                                               // tp_as_number
+    0,                                               // tp_as_sequence
+    0,                                               // tp_as_mapping
+    0,                                               // tp_hash
+    0,                                               // tp_call
+    0,                                               // tp_str
+    0,                                               // tp_getattro
+    0,                                               // tp_setattro
+    0,                                               // tp_as_buffer
+    Py_TPFLAGS_DEFAULT | Py_TPFLAGS_BASETYPE,        // tp_flags
+    "Compressed Sparse Row Graph",                   // tp_doc
+    0,                                               // tp_traverse
+    0,                                               // tp_clear
+    0,                                               // tp_richcompare
+    0,                                               // tp_weaklistoffset
+    0,                                               // tp_iter
+    0,                                               // tp_iternext
+    CompressedSparseRowGraph_methods,               // tp_methods
+    0,                                               // tp_members
+    0,                                               // tp_getset
+    0,                                               // tp_base
+    0,                                               // tp_dict
+    0,                                               // tp_descr_get
+    0,                                               // tp_descr_set
+    offsetof(CompressedSparseRowGraph, dict),       // tp_dictoffset
+    0,                                               // tp_init
+    0,                                               // tp_alloc
+    CompressedSparseRowGraph_new                    // tp_new
+};
+
+#endif
@@ -0,0 +1,266 @@
+#ifndef EDGE_LIST_READER_HPP
+#define EDGE_LIST_READER_HPP
+
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+#include <vector>
+#include <string>
+#include <string_view>
+#include <cstdlib>
+#include <cstdint>
+#include <limits>
+#include "AdjacencyList.hpp"
+#include "CompressedSparseRow.hpp"
+
+// Fields of the edges of one chunk of an edge list. The names
+// point into the buffer of the chunk, released with them.
+struct EdgeListChunk {
+    Py_buffer data{};
+    std::vector<std::string_view> sources;
+    std::vector<std::string_view> targets;
+    std::vector<double> weights;
+    // Set instead of raising, as the chunk is parsed without the
+    // GIL. A line with enough fields has an invalid weight.
+    int64_t bad_line = 0;
+    size_t bad_fields = 0;
+    std::string bad_weight;
+
+    ~EdgeListChunk() {
+        if (data.obj)
+            PyBuffer_Release(&data);
+    }
+};
+
+static bool edgelist_space(char c) {
+    return c == ' ' || c == '\t' || c == '\r' || c == '\f' || c == '\v';
+}
+
+// Splits the lines of data into fields at the delimiter, or at
+// runs of whitespace if it is empty, skipping blank lines and
+// comments, like the Python reader. Returns false on the first
+// line with too few fields or an invalid weight.
+static bool parse_edgelist_chunk(std::string_view data, std::string_view delimiter,
+                                 std::string_view comments, bool weighted,
+                                 int64_t first_line, EdgeListChunk& chunk) {
+    const size_t columns = weighted ? 3 : 2;
+    std::string_view fields[3];
+    std::string weight;
+    int64_t number = first_line;
+    size_t pos = 0;
+    while (pos < data.size()) {
+        size_t end = data.find('\n', pos);
+        if (end == std::string_view::npos)
+            end = data.size();
+        std::string_view line = data.substr(pos, end - pos);
+        pos = end + 1;
+        const int64_t line_number = number++;
+        if (!line.empty() && line.back() == '\r')
+            line.remove_suffix(1);
+
+        size_t first = 0;
+        while (first < line.size() && edgelist_space(line[first]))
+            first++;
+        if (first == line.size() ||
+            (!comments.empty() && line.substr(first, comments.size()) == comments))
+            continue;
+
+        size_t count = 0;
+        if (delimiter.empty()) {
+            for (size_t i = first; i < line.size();) {
+                size_t j = i;
+                while (j < line.size() && !edgelist_space(line[j]))
+                    j++;
+                if (count < columns)
+                    fields[count] = line.substr(i, j - i);
+                count++;
+                while (j < line.size() && edgelist_space(line[j]))
+                    j++;
+                i = j;
+            }
+        } else {
+            for (size_t i = 0;;) {
+                size_t j = line.find(delimiter, i);
+                if (count < columns)
+                    fields[count] = line.substr(i, (j == std::string_view::npos ? line.size() : j) - i);
+                count++;
+                if (j == std::string_view::npos)
+                    break;
+                i = j + delimiter.size();
+            }
+        }
+        if (count < columns) {
+            chunk.bad_line = line_number;
+            chunk.bad_fields = count;
+            return false;
+        }
+
+        chunk.sources.push_back(fields[0]);
+        chunk.targets.push_back(fields[1]);
+        if (weighted) {
+            weight.assign(fields[2]);
+            while (!weight.empty() && edgelist_space(weight.back()))
+                weight.pop_back();
+            char* stop = nullptr;
+            double value = std::strtod(weight.c_str(), &stop);
+            if (weight.empty() || *stop != '\0') {
+                chunk.bad_line = line_number;
+                chunk.bad_fields = count;
+                chunk.bad_weight = weight;
+                return false;
+            }
+            chunk.weights.push_back(value);
+        }
+    }
+    return true;
+}
+
+static PyObject* read_edgelist_chunk(PyObject* args, PyObject* kwargs, PyTypeObject* type,
+                                     EdgeListChunk& chunk, bool& directed) {
+    PyObject* graph_obj;
+    const char* delimiter = nullptr;
+    const char* comments = nullptr;
+    int weighted = 0, is_directed = 1;
+    long long first_line = 1;
+    static const char* kwlist[] = {"graph", "data", "delimiter", "comments", "weighted",
+                                   "directed", "first_line", nullptr};
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "O!y*zz|ppL", const_cast<char**>(kwlist),
+                                     type, &graph_obj, &chunk.data, &delimiter, &comments,
+                                     &weighted, &is_directed, &first_line)) {
+        return nullptr;
+    }
+
+    bool parsed;
+    std::string_view text(static_cast<const char*>(chunk.data.buf), chunk.data.len);
+    std::string_view separator(delimiter ? delimiter : "");
+    std::string_view comment(comments ? comments : "");
+    Py_BEGIN_ALLOW_THREADS
+    parsed = parse_edgelist_chunk(text, separator, comment, weighted, first_line, chunk);
+    Py_END_ALLOW_THREADS
+    if (!parsed) {
+        if (chunk.bad_fields < (weighted ? 3u : 2u))
+            PyErr_Format(PyExc_ValueError, "Line %lld has %zu fields, expected at least %d.",
+                         static_cast<long long>(chunk.bad_line), chunk.bad_fields, weighted ? 3 : 2);
+        else
+            PyErr_Format(PyExc_ValueError, "Line %lld has an invalid weight '%s'.",
+                         static_cast<long long>(chunk.bad_line), chunk.bad_weight.c_str());
+        return nullptr;
+    }
+    directed = is_directed;
+    return graph_obj;
+}
+
+// The names of a chunk are turned into vertices, sources first,
+// then targets, creating the ones not in the graph yet, as
+// add_vertices_from would.
+template <typename Vertex, typename Find, typename Create>
+static int edgelist_vertices(const EdgeListChunk& chunk, std::vector<Vertex>& sources,
+                             std::vector<Vertex>& targets, Find find, Create create) {
+    const std::vector<std::string_view>* names[2] = {&chunk.sources, &chunk.targets};
+    std::vector<Vertex>* vertices[2] = {&sources, &targets};
+    std::string name;
+    for (int k = 0; k < 2; ++k) {
+        vertices[k]->reserve(names[k]->size());
+        for (std::string_view view : *names[k]) {
+            name.assign(view);
+            Vertex vertex;
+            if (!find(name, vertex)) {
+                PyObject* node_obj = PyObject_CallFunction(
+                    reinterpret_cast<PyObject*>(&AdjacencyListGraphNodeType), "s#",
+                    view.data(), static_cast<Py_ssize_t>(view.size()));
+                if (!node_obj || create(node_obj, vertex) < 0) {
+                    Py_XDECREF(node_obj);
+                    return -1;
+                }
+                Py_DECREF(node_obj);
+            }
+            vertices[k]->push_back(vertex);
+        }
+    }
+    return 0;
+}
+
+static PyObject* read_edgelist_chunk_adjacency_list(PyObject* self, PyObject* args, PyObject* kwargs) {
+    EdgeListChunk chunk;
+    bool directed;
+    PyObject* graph_obj = read_edgelist_chunk(args, kwargs, &AdjacencyListGraphType, chunk, directed);
+    if (!graph_obj)
+        return nullptr;
+    AdjacencyListGraph* graph = reinterpret_cast<AdjacencyListGraph*>(graph_obj);
+
+    std::vector<int> sources, targets;
+    auto find = [&](const std::string& name, int& id) {
+        auto it = graph->name_to_id.find(name);
+        if (it == graph->name_to_id.end())
+            return false;
+        id = it->second;
+        return true;
+    };
+    auto create = [&](PyObject* node_obj, int& id) {
+        id = AdjacencyListGraph_insert_node(graph, reinterpret_cast<AdjacencyListGraphNode*>(node_obj));
+        return 0;
+    };
+    if (edgelist_vertices(chunk, sources, targets, find, create) < 0)
+        return nullptr;
+
+    const bool weighted = !chunk.weights.empty();
+    for (int pass = 0; pass < (directed ? 1 : 2); ++pass) {
+        std::vector<int>& from = pass ? targets : sources;
+        std::vector<int>& to = pass ? sources : targets;
+        for (size_t i = 0; i < from.size(); ++i) {
+            PyObject* value = Py_None;
+            if (weighted) {
+                value = PyFloat_FromDouble(chunk.weights[i]);
+                if (!value)
+                    return nullptr;
+            } else {
+                Py_INCREF(value);
+            }
+            int status = AdjacencyListGraph_link(graph, from[i], to[i], value);
+            Py_DECREF(value);
+            if (status < 0)
+                return nullptr;
+        }
+    }
+    Py_RETURN_NONE;
+}
+
+static PyObject* read_edgelist_chunk_csr(PyObject* self, PyObject* args, PyObject* kwargs) {
+    EdgeListChunk chunk;
+    bool directed;
+    PyObject* graph_obj = read_edgelist_chunk(args, kwargs, &CompressedSparseRowGraphType, chunk, directed);
+    if (!graph_obj)
+        return nullptr;
+    CompressedSparseRowGraph* graph = reinterpret_cast<CompressedSparseRowGraph*>(graph_obj);
+
+    std::vector<int64_t> sources, targets;
+    auto find = [&](const std::string& name, int64_t& u) {
+        auto it = graph->name_to_id.find(name);
+        if (it == graph->name_to_id.end())
+            return false;
+        u = it->second;
+        return true;
+    };
+    auto create = [&](PyObject* node_obj, int64_t& u) {
+        u = static_cast<int64_t>(graph->nodes.size());
+        return CompressedSparseRowGraph_append_vertex(graph, node_obj);
+    };
+    if (edgelist_vertices(chunk, sources, targets, find, create) < 0)
+        return nullptr;
+
+    const double nan = std::numeric_limits<double>::quiet_NaN();
+    const size_t n = sources.size();
+    for (int pass = 0; pass < (directed ? 1 : 2); ++pass) {
+        std::vector<int64_t>& from = pass ? targets : sources;
+        std::vector<int64_t>& to = pass ? sources : targets;
+        graph->pending_sources.insert(graph->pending_sources.end(), from.begin(), from.end());
+        graph->pending_targets.insert(graph->pending_targets.end(), to.begin(), to.end());
+        if (chunk.weights.empty())
+            graph->pending_weights.insert(graph->pending_weights.end(), n, nan);
+        else
+            graph->pending_weights.insert(graph->pending_weights.end(),
+                                          chunk.weights.begin(), chunk.weights.end());
+    }
+    Py_RETURN_NONE;
+}
+
+#endif
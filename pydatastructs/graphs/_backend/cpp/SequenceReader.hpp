@@ -0,0 +1,168 @@
+#ifndef SEQUENCE_READER_HPP
+#define SEQUENCE_READER_HPP
+
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+#include <string>
+#include <cstring>
+#include <cstdint>
+
+// Reads the items of a list, tuple, or any other iterable
+// passed to the bulk insertion methods. One dimensional
+// buffers of native numbers (array.array, numpy arrays,
+// memoryviews) are read in place without creating Python
+// objects for their items.
+typedef struct {
+    PyObject* fast;
+    Py_buffer view;
+    bool has_view;
+    char format;
+    Py_ssize_t size;
+} SequenceReader;
+
+static char SequenceReader_format(const Py_buffer* view) {
+    const char* format = view->format ? view->format : "B";
+    if (*format == '@' || *format == '=') {
+        format++;
+    }
+    if (format[0] == '\0' || format[1] != '\0') {
+        return '\0';
+    }
+    switch (format[0]) {
+        case 'b': case 'B': case 'h': case 'H': case 'i': case 'I':
+        case 'l': case 'L': case 'q': case 'Q': case 'n': case 'N':
+        case 'f': case 'd':
+            return format[0];
+        default:
+            return '\0';
+    }
+}
+
+static int SequenceReader_open(SequenceReader* reader, PyObject* obj) {
+    reader->fast = NULL;
+    reader->has_view = false;
+    reader->format = '\0';
+    reader->size = 0;
+
+    if (PyObject_CheckBuffer(obj) && !PyBytes_Check(obj) && !PyByteArray_Check(obj)) {
+        if (PyObject_GetBuffer(obj, &reader->view, PyBUF_RECORDS_RO) == 0) {
+            char format = SequenceReader_format(&reader->view);
+            if (reader->view.ndim == 1 && format != '\0') {
+                reader->has_view = true;
+                reader->format = format;
+                reader->size = reader->view.shape[0];
+                return 0;
+            }
+            PyBuffer_Release(&reader->view);
+        } else {
+            PyErr_Clear();
+        }
+    }
+
+    reader->fast = PySequence_Fast(obj, "expected a sequence");
+    if (!reader->fast) {
+        return -1;
+    }
+    reader->size = PySequence_Fast_GET_SIZE(reader->fast);
+    return 0;
+}
+
+static void SequenceReader_close(SequenceReader* reader) {
+    if (reader->has_view) {
+        PyBuffer_Release(&reader->view);
+        reader->has_view = false;
+    }
+    Py_CLEAR(reader->fast);
+}
+
+template <typename T>
+static T SequenceReader_load(const char* ptr) {
+    T value;
+    std::memcpy(&value, ptr, sizeof(T));
+    return value;
+}
+
+static bool SequenceReader_is_integral(const SequenceReader* reader) {
+    return reader->format != 'f' && reader->format != 'd';
+}
+
+static long long SequenceReader_integer(const SequenceReader* reader, Py_ssize_t i) {
+    const char* ptr = reinterpret_cast<const char*>(reader->view.buf) + i * reader->view.strides[0];
+    switch (reader->format) {
+        case 'b': return SequenceReader_load<signed char>(ptr);
+        case 'B': return SequenceReader_load<unsigned char>(ptr);
+        case 'h': return SequenceReader_load<short>(ptr);
+        case 'H': return SequenceReader_load<unsigned short>(ptr);
+        case 'i': return SequenceReader_load<int>(ptr);
+        case 'I': return SequenceReader_load<unsigned int>(ptr);
+        case 'l': return SequenceReader_load<long>(ptr);
+        case 'L': return static_cast<long long>(SequenceReader_load<unsigned long>(ptr));
+        case 'q': return SequenceReader_load<long long>(ptr);
+        case 'Q': return static_cast<long long>(SequenceReader_load<unsigned long long>(ptr));
+        case 'n': return SequenceReader_load<Py_ssize_t>(ptr);
+        case 'N': return static_cast<long long>(SequenceReader_load<size_t>(ptr));
+        default: return 0;
+    }
+}
+
+static double SequenceReader_double(const SequenceReader* reader, Py_ssize_t i) {
+    const char* ptr = reinterpret_cast<const char*>(reader->view.buf) + i * reader->view.strides[0];
+    if (reader->format == 'f') {
+        return SequenceReader_load<float>(ptr);
+    }
+    if (reader->format == 'd') {
+        return SequenceReader_load<double>(ptr);
+    }
+    return static_cast<double>(SequenceReader_integer(reader, i));
+}
+
+// Stores the vertex name for the i-th item, i.e., str(item).
+static int SequenceReader_name(const SequenceReader* reader, Py_ssize_t i, std::string& name) {
+    if (reader->has_view) {
+        if (SequenceReader_is_integral(reader)) {
+            name = std::to_string(SequenceReader_integer(reader, i));
+            return 0;
+        }
+        PyObject* value = PyFloat_FromDouble(SequenceReader_double(reader, i));
+        if (!value) return -1;
+        PyObject* str = PyObject_Str(value);
+        Py_DECREF(value);
+        if (!str) return -1;
+        name = PyUnicode_AsUTF8(str);
+        Py_DECREF(str);
+        return 0;
+    }
+
+    PyObject* item = PySequence_Fast_GET_ITEM(reader->fast, i);
+    if (PyUnicode_Check(item)) {
+        const char* str = PyUnicode_AsUTF8(item);
+        if (!str) return -1;
+        name = str;
+        return 0;
+    }
+    PyObject* str = PyObject_Str(item);
+    if (!str) return -1;
+    const char* c_str = PyUnicode_AsUTF8(str);
+    if (!c_str) {
+        Py_DECREF(str);
+        return -1;
+    }
+    name = c_str;
+    Py_DECREF(str);
+    return 0;
+}
+
+// Returns a new reference to the i-th item.
+static PyObject* SequenceReader_item(const SequenceReader* reader, Py_ssize_t i) {
+    if (reader->has_view) {
+        if (SequenceReader_is_integral(reader)) {
+            return PyLong_FromLongLong(SequenceReader_integer(reader, i));
+        }
+        return PyFloat_FromDouble(SequenceReader_double(reader, i));
+    }
+    PyObject* item = PySequence_Fast_GET_ITEM(reader->fast, i);
+    Py_INCREF(item);
+    return item;
+}
+
+#endif
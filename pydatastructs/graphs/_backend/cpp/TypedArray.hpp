@@ -0,0 +1,44 @@
+#ifndef TYPED_ARRAY_HPP
+#define TYPED_ARRAY_HPP
+
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+#include <vector>
+#include <cstdint>
+
+// Returns a new array.array of the given typecode holding a copy
+// of the size bytes at data.
+static PyObject* typed_array(const char* typecode, const void* data, size_t size) {
+    PyObject* module = PyImport_ImportModule("array");
+    if (!module)
+        return nullptr;
+    PyObject* result = PyObject_CallMethod(module, "array", "s", typecode);
+    Py_DECREF(module);
+    if (!result)
+        return nullptr;
+    PyObject* bytes = PyBytes_FromStringAndSize(reinterpret_cast<const char*>(data), size);
+    if (!bytes) {
+        Py_DECREF(result);
+        return nullptr;
+    }
+    PyObject* status = PyObject_CallMethod(result, "frombytes", "O", bytes);
+    Py_DECREF(bytes);
+    if (!status) {
+        Py_DECREF(result);
+        return nullptr;
+    }
+    Py_DECREF(status);
+    return result;
+}
+
+// Returns a new array.array('q') holding a copy of values.
+static PyObject* int64_array(const std::vector<int64_t>& values) {
+    return typed_array("q", values.data(), values.size() * sizeof(int64_t));
+}
+
+// Returns a new array.array('d') holding a copy of values.
+static PyObject* double_array(const std::vector<double>& values) {
+    return typed_array("d", values.data(), values.size() * sizeof(double));
+}
+
+#endif
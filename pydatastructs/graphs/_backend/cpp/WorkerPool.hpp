@@ -0,0 +1,101 @@
+#ifndef WORKER_POOL_HPP
+#define WORKER_POOL_HPP
+
+#include <algorithm>
+#include <condition_variable>
+#include <cstdint>
+#include <functional>
+#include <mutex>
+#include <thread>
+#include <utility>
+#include <vector>
+
+// Fixed set of threads which are started once and reused for
+// every parallel step of an algorithm, e.g., every level of a
+// breadth first search. run(task) calls task(0), ..., task(n - 1)
+// concurrently, the calling thread taking worker 0, and returns
+// once all of them have finished, so each call is a barrier.
+// Tasks must not touch Python objects; callers are expected to
+// release the GIL around run.
+class WorkerPool {
+public:
+    explicit WorkerPool(int num_threads)
+        : size_(num_threads < 1 ? 1 : num_threads) {
+        threads_.reserve(size_ - 1);
+        for (int t = 1; t < size_; ++t)
+            threads_.emplace_back([this, t]() { loop(t); });
+    }
+
+    ~WorkerPool() {
+        {
+            std::lock_guard<std::mutex> lock(mutex_);
+            stopping_ = true;
+        }
+        start_.notify_all();
+        for (std::thread& thread : threads_)
+            thread.join();
+    }
+
+    WorkerPool(const WorkerPool&) = delete;
+    WorkerPool& operator=(const WorkerPool&) = delete;
+
+    int size() const {
+        return size_;
+    }
+
+    void run(const std::function<void(int)>& task) {
+        {
+            std::lock_guard<std::mutex> lock(mutex_);
+            task_ = &task;
+            pending_ = size_ - 1;
+            generation_++;
+        }
+        start_.notify_all();
+        task(0);
+        std::unique_lock<std::mutex> lock(mutex_);
+        done_.wait(lock, [this]() { return pending_ == 0; });
+        task_ = nullptr;
+    }
+
+    // Splits [0, n) into size() contiguous blocks and returns the
+    // bounds of the block assigned to worker t.
+    std::pair<int64_t, int64_t> block(int t, int64_t n) const {
+        int64_t chunk = (n + size_ - 1) / size_;
+        int64_t lo = std::min<int64_t>(n, chunk * t);
+        return {lo, std::min<int64_t>(n, lo + chunk)};
+    }
+
+private:
+    void loop(int t) {
+        uint64_t seen = 0;
+        while (true) {
+            const std::function<void(int)>* task;
+            {
+                std::unique_lock<std::mutex> lock(mutex_);
+                start_.wait(lock, [this, seen]() { return stopping_ || generation_ != seen; });
+                if (stopping_)
+                    return;
+                seen = generation_;
+                task = task_;
+            }
+            (*task)(t);
+            {
+                std::lock_guard<std::mutex> lock(mutex_);
+                pending_--;
+            }
+            done_.notify_one();
+        }
+    }
+
+    int size_;
+    std::vector<std::thread> threads_;
+    std::mutex mutex_;
+    std::condition_variable start_;
+    std::condition_variable done_;
+    const std::function<void(int)>* task_ = nullptr;
+    int pending_ = 0;
+    uint64_t generation_ = 0;
+    bool stopping_ = false;
+};
+
+#endif
@@ -8,6 +8,64 @@ static PyMethodDef AlgorithmsMethods[] = {
     {"bfs_adjacency_matrix", (PyCFunction)breadth_first_search_adjacency_matrix, METH_VARARGS | METH_KEYWORDS, "Run BFS on adjacency matrix with callback"},
     {"minimum_spanning_tree_prim_adjacency_list", (PyCFunction)minimum_spanning_tree_prim_adjacency_list, METH_VARARGS | METH_KEYWORDS, "Run Prim's algorithm on adjacency list"},
     {"shortest_paths_dijkstra_adjacency_list", (PyCFunction)shortest_paths_dijkstra_adjacency_list, METH_VARARGS | METH_KEYWORDS, "Dijkstra's algorithm for adjacency list graphs"},
+    {"bfs_csr", (PyCFunction)breadth_first_search_csr, METH_VARARGS | METH_KEYWORDS, "Run BFS on compressed sparse row graph with callback"},
+    {"minimum_spanning_tree_prim_csr", (PyCFunction)minimum_spanning_tree_prim_csr, METH_VARARGS | METH_KEYWORDS, "Run Prim's algorithm on compressed sparse row graph"},
+    {"shortest_paths_dijkstra_csr", (PyCFunction)shortest_paths_dijkstra_csr, METH_VARARGS | METH_KEYWORDS, "Dijkstra's algorithm for compressed sparse row graphs"},
+    {"shortest_paths_bidirectional_dijkstra_adjacency_list", (PyCFunction)shortest_paths_bidirectional_dijkstra_adjacency_list, METH_VARARGS | METH_KEYWORDS, "Bidirectional Dijkstra's algorithm for adjacency list graphs"},
+    {"shortest_paths_bidirectional_dijkstra_csr", (PyCFunction)shortest_paths_bidirectional_dijkstra_csr, METH_VARARGS | METH_KEYWORDS, "Bidirectional Dijkstra's algorithm for compressed sparse row graphs"},
+    {"shortest_paths_a_star_adjacency_list", (PyCFunction)shortest_paths_a_star_adjacency_list, METH_VARARGS | METH_KEYWORDS, "A* search for adjacency list graphs"},
+    {"shortest_paths_a_star_csr", (PyCFunction)shortest_paths_a_star_csr, METH_VARARGS | METH_KEYWORDS, "A* search for compressed sparse row graphs"},
+    {"bfs_parallel_adjacency_list", (PyCFunction)breadth_first_search_parallel_adjacency_list, METH_VARARGS | METH_KEYWORDS, "Run level synchronous parallel BFS on adjacency list with callback"},
+    {"bfs_parallel_csr", (PyCFunction)breadth_first_search_parallel_csr, METH_VARARGS | METH_KEYWORDS, "Run level synchronous parallel BFS on compressed sparse row graph with callback"},
+    {"bfs_levels_adjacency_list", (PyCFunction)breadth_first_search_levels_adjacency_list, METH_VARARGS | METH_KEYWORDS, "Run direction optimizing BFS on adjacency list returning the search tree"},
+    {"bfs_levels_csr", (PyCFunction)breadth_first_search_levels_csr, METH_VARARGS | METH_KEYWORDS, "Run direction optimizing BFS on compressed sparse row graph returning the search tree"},
+    {"bfs_levels_adjacency_matrix", (PyCFunction)breadth_first_search_levels_adjacency_matrix, METH_VARARGS | METH_KEYWORDS, "Run direction optimizing BFS on adjacency matrix returning the search tree"},
+    {"dfs_tree_adjacency_list", (PyCFunction)depth_first_search_tree_adjacency_list, METH_VARARGS | METH_KEYWORDS, "Run DFS on adjacency list returning the search tree"},
+    {"dfs_tree_adjacency_matrix", (PyCFunction)depth_first_search_tree_adjacency_matrix, METH_VARARGS | METH_KEYWORDS, "Run DFS on adjacency matrix returning the search tree"},
+    {"dfs_tree_csr", (PyCFunction)depth_first_search_tree_csr, METH_VARARGS | METH_KEYWORDS, "Run DFS on compressed sparse row graph returning the search tree"},
+    {"bfs_iterator_adjacency_list", (PyCFunction)bfs_iterator_adjacency_list, METH_VARARGS | METH_KEYWORDS, "Iterate lazily over a BFS on adjacency list"},
+    {"bfs_iterator_adjacency_matrix", (PyCFunction)bfs_iterator_adjacency_matrix, METH_VARARGS | METH_KEYWORDS, "Iterate lazily over a BFS on adjacency matrix"},
+    {"bfs_iterator_csr", (PyCFunction)bfs_iterator_csr, METH_VARARGS | METH_KEYWORDS, "Iterate lazily over a BFS on compressed sparse row graph"},
+    {"dfs_iterator_adjacency_list", (PyCFunction)dfs_iterator_adjacency_list, METH_VARARGS | METH_KEYWORDS, "Iterate lazily over a DFS on adjacency list"},
+    {"dfs_iterator_adjacency_matrix", (PyCFunction)dfs_iterator_adjacency_matrix, METH_VARARGS | METH_KEYWORDS, "Iterate lazily over a DFS on adjacency matrix"},
+    {"dfs_iterator_csr", (PyCFunction)dfs_iterator_csr, METH_VARARGS | METH_KEYWORDS, "Iterate lazily over a DFS on compressed sparse row graph"},
+    {"shortest_paths_delta_stepping_adjacency_list", (PyCFunction)shortest_paths_delta_stepping_adjacency_list, METH_VARARGS | METH_KEYWORDS, "Delta-stepping algorithm for adjacency list graphs"},
+    {"shortest_paths_delta_stepping_csr", (PyCFunction)shortest_paths_delta_stepping_csr, METH_VARARGS | METH_KEYWORDS, "Delta-stepping algorithm for compressed sparse row graphs"},
+    {"all_pair_shortest_paths_floyd_warshall_adjacency_list", (PyCFunction)all_pair_shortest_paths_floyd_warshall_adjacency_list, METH_VARARGS | METH_KEYWORDS, "Floyd-Warshall algorithm for adjacency list graphs"},
+    {"all_pair_shortest_paths_floyd_warshall_csr", (PyCFunction)all_pair_shortest_paths_floyd_warshall_csr, METH_VARARGS | METH_KEYWORDS, "Floyd-Warshall algorithm for compressed sparse row graphs"},
+    {"all_pair_shortest_paths_johnson_adjacency_list", (PyCFunction)all_pair_shortest_paths_johnson_adjacency_list, METH_VARARGS | METH_KEYWORDS, "Johnson's algorithm for adjacency list graphs"},
+    {"all_pair_shortest_paths_johnson_csr", (PyCFunction)all_pair_shortest_paths_johnson_csr, METH_VARARGS | METH_KEYWORDS, "Johnson's algorithm for compressed sparse row graphs"},
+    {"max_flow_edmonds_karp_adjacency_list", (PyCFunction)max_flow_edmonds_karp_adjacency_list, METH_VARARGS | METH_KEYWORDS, "Edmonds-Karp algorithm for adjacency list graphs"},
+    {"max_flow_edmonds_karp_adjacency_matrix", (PyCFunction)max_flow_edmonds_karp_adjacency_matrix, METH_VARARGS | METH_KEYWORDS, "Edmonds-Karp algorithm for adjacency matrix graphs"},
+    {"max_flow_edmonds_karp_csr", (PyCFunction)max_flow_edmonds_karp_csr, METH_VARARGS | METH_KEYWORDS, "Edmonds-Karp algorithm for compressed sparse row graphs"},
+    {"max_flow_dinic_adjacency_list", (PyCFunction)max_flow_dinic_adjacency_list, METH_VARARGS | METH_KEYWORDS, "Dinic algorithm for adjacency list graphs"},
+    {"max_flow_dinic_adjacency_matrix", (PyCFunction)max_flow_dinic_adjacency_matrix, METH_VARARGS | METH_KEYWORDS, "Dinic algorithm for adjacency matrix graphs"},
+    {"max_flow_dinic_csr", (PyCFunction)max_flow_dinic_csr, METH_VARARGS | METH_KEYWORDS, "Dinic algorithm for compressed sparse row graphs"},
+    {"max_flow_push_relabel_adjacency_list", (PyCFunction)max_flow_push_relabel_adjacency_list, METH_VARARGS | METH_KEYWORDS, "Push-relabel algorithm for adjacency list graphs"},
+    {"max_flow_push_relabel_adjacency_matrix", (PyCFunction)max_flow_push_relabel_adjacency_matrix, METH_VARARGS | METH_KEYWORDS, "Push-relabel algorithm for adjacency matrix graphs"},
+    {"max_flow_push_relabel_csr", (PyCFunction)max_flow_push_relabel_csr, METH_VARARGS | METH_KEYWORDS, "Push-relabel algorithm for compressed sparse row graphs"},
+    {"strongly_connected_components_kosaraju_adjacency_list", (PyCFunction)strongly_connected_components_kosaraju_adjacency_list, METH_VARARGS | METH_KEYWORDS, "Kosaraju's algorithm for adjacency list graphs"},
+    {"strongly_connected_components_kosaraju_adjacency_matrix", (PyCFunction)strongly_connected_components_kosaraju_adjacency_matrix, METH_VARARGS | METH_KEYWORDS, "Kosaraju's algorithm for adjacency matrix graphs"},
+    {"strongly_connected_components_kosaraju_csr", (PyCFunction)strongly_connected_components_kosaraju_csr, METH_VARARGS | METH_KEYWORDS, "Kosaraju's algorithm for compressed sparse row graphs"},
+    {"strongly_connected_components_tarjan_adjacency_list", (PyCFunction)strongly_connected_components_tarjan_adjacency_list, METH_VARARGS | METH_KEYWORDS, "Tarjan's algorithm for adjacency list graphs"},
+    {"strongly_connected_components_tarjan_adjacency_matrix", (PyCFunction)strongly_connected_components_tarjan_adjacency_matrix, METH_VARARGS | METH_KEYWORDS, "Tarjan's algorithm for adjacency matrix graphs"},
+    {"strongly_connected_components_tarjan_csr", (PyCFunction)strongly_connected_components_tarjan_csr, METH_VARARGS | METH_KEYWORDS, "Tarjan's algorithm for compressed sparse row graphs"},
+    {"find_bridges_adjacency_list", (PyCFunction)find_bridges_adjacency_list, METH_VARARGS | METH_KEYWORDS, "Bridges of adjacency list graphs"},
+    {"find_bridges_adjacency_matrix", (PyCFunction)find_bridges_adjacency_matrix, METH_VARARGS | METH_KEYWORDS, "Bridges of adjacency matrix graphs"},
+    {"find_bridges_csr", (PyCFunction)find_bridges_csr, METH_VARARGS | METH_KEYWORDS, "Bridges of compressed sparse row graphs"},
+    {"find_articulation_points_adjacency_list", (PyCFunction)find_articulation_points_adjacency_list, METH_VARARGS | METH_KEYWORDS, "Articulation points of adjacency list graphs"},
+    {"find_articulation_points_adjacency_matrix", (PyCFunction)find_articulation_points_adjacency_matrix, METH_VARARGS | METH_KEYWORDS, "Articulation points of adjacency matrix graphs"},
+    {"find_articulation_points_csr", (PyCFunction)find_articulation_points_csr, METH_VARARGS | METH_KEYWORDS, "Articulation points of compressed sparse row graphs"},
+    {"biconnected_components_adjacency_list", (PyCFunction)biconnected_components_adjacency_list, METH_VARARGS | METH_KEYWORDS, "Biconnected components of adjacency list graphs"},
+    {"biconnected_components_adjacency_matrix", (PyCFunction)biconnected_components_adjacency_matrix, METH_VARARGS | METH_KEYWORDS, "Biconnected components of adjacency matrix graphs"},
+    {"biconnected_components_csr", (PyCFunction)biconnected_components_csr, METH_VARARGS | METH_KEYWORDS, "Biconnected components of compressed sparse row graphs"},
+    {"minimum_spanning_tree_parallel_boruvka_adjacency_list", (PyCFunction)minimum_spanning_tree_parallel_boruvka_adjacency_list, METH_VARARGS | METH_KEYWORDS, "Run Boruvka's algorithm in parallel on adjacency list graphs"},
+    {"minimum_spanning_tree_parallel_boruvka_adjacency_matrix", (PyCFunction)minimum_spanning_tree_parallel_boruvka_adjacency_matrix, METH_VARARGS | METH_KEYWORDS, "Run Boruvka's algorithm in parallel on adjacency matrix graphs"},
+    {"minimum_spanning_tree_parallel_boruvka_csr", (PyCFunction)minimum_spanning_tree_parallel_boruvka_csr, METH_VARARGS | METH_KEYWORDS, "Run Boruvka's algorithm in parallel on compressed sparse row graphs"},
+    {"minimum_spanning_tree_kruskal_csr", (PyCFunction)minimum_spanning_tree_kruskal_csr, METH_VARARGS | METH_KEYWORDS, "Run Kruskal's algorithm on compressed sparse row graph"},
+    {"topological_sort_parallel_kahn_adjacency_list", (PyCFunction)topological_sort_parallel_kahn_adjacency_list, METH_VARARGS | METH_KEYWORDS, "Run Kahn's algorithm in parallel on adjacency list graphs"},
+    {"topological_sort_parallel_kahn_adjacency_matrix", (PyCFunction)topological_sort_parallel_kahn_adjacency_matrix, METH_VARARGS | METH_KEYWORDS, "Run Kahn's algorithm in parallel on adjacency matrix graphs"},
+    {"topological_sort_parallel_kahn_csr", (PyCFunction)topological_sort_parallel_kahn_csr, METH_VARARGS | METH_KEYWORDS, "Run Kahn's algorithm in parallel on compressed sparse row graphs"},
     {NULL, NULL, 0, NULL}
 };
 
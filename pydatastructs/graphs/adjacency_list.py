@@ -1,7 +1,9 @@
+from array import array
 from pydatastructs.graphs.graph import Graph
 from pydatastructs.graphs._backend.cpp import _graph
 from pydatastructs.utils.misc_util import (
-    GraphEdge, Backend, raise_if_backend_is_not_python)
+    GraphEdge, Backend, AdjacencyListGraphNode,
+    raise_if_backend_is_not_python)
 
 __all__ = [
     'AdjacencyList'
@@ -11,6 +13,25 @@ class AdjacencyList(Graph):
     """
     Adjacency list implementation of graphs.
 
+    Every vertex is given an integer id when it is added.
+    Weighted edges are indexed by the pair of ids of their
+    end points, packed as ``source_id << 32 | target_id``,
+    so that algorithms can look up edge weights without
+    building strings.
+
+    The number of edges and the numbers of edges leaving and
+    entering every vertex, by id, are counted as edges are
+    added and removed, so that `num_edges`, `degree` and
+    `in_degree` take constant time.
+
+    If the graph is created with ``in_neighbors=True``, the
+    names of the sources of the incoming edges of every vertex
+    are kept as well, so that `predecessors` and
+    `remove_vertex` take time proportional to the degree of the
+    vertex instead of scanning the whole graph, and traversals
+    of the reversed graph read its edges from them. The graph
+    must then be modified only through its methods.
+
     See also
     ========
 
@@ -21,14 +42,23 @@ class AdjacencyList(Graph):
         backend = kwargs.get('backend', Backend.PYTHON)
         if backend == Backend.PYTHON:
             obj = object.__new__(cls)
-            for vertex in vertices:
-                obj.__setattr__(vertex.name, vertex)
-            obj.vertices = [vertex.name for vertex in vertices]
-            obj.edge_weights = {}
+            obj.vertices = []
+            obj._ids = {}
+            obj._next_id = 0
+            obj._edges = {}
+            obj._edge_weights = None
+            obj._version = 0
+            obj._cache = None
+            obj._in = {} if kwargs.get('in_neighbors', False) else None
+            obj._num_edges = 0
+            obj._out_degrees, obj._in_degrees = array('q'), array('q')
             obj._impl = 'adjacency_list'
+            for vertex in vertices:
+                obj.add_vertex(vertex)
             return obj
         else:
-            graph = _graph.AdjacencyListGraph()
+            graph = _graph.AdjacencyListGraph(
+                in_neighbors=kwargs.get('in_neighbors', False))
             for vertice in vertices:
                 graph.add_vertex(vertice)
             return graph
@@ -37,7 +67,9 @@ class AdjacencyList(Graph):
     def methods(self):
         return ['is_adjacent', 'neighbors',
                 'add_vertex', 'remove_vertex', 'add_edge',
-                'get_edge', 'remove_edge', '__new__']
+                'get_edge', 'remove_edge', 'add_vertices_from',
+                'add_edges_from', 'predecessors', 'in_degree',
+                'num_edges', 'degree', 'degrees', '__new__']
 
     def is_adjacent(self, node1, node2):
         node1 = self.__getattribute__(node1)
@@ -47,25 +79,99 @@ class AdjacencyList(Graph):
         return len(self.vertices)
 
     def num_edges(self):
-        return sum(len(self.neighbors(v)) for v in self.vertices)
+        return self._num_edges
+
+    def _id(self, name):
+        u = self._ids.get(name, None)
+        if u is None:
+            raise KeyError("Vertex %s is not present in the graph." % (name))
+        return u
+
+    def degree(self, node):
+        return self._out_degrees[self._id(node)]
+
+    def in_degree(self, node):
+        return self._in_degrees[self._id(node)]
+
+    def degrees(self, incoming=False):
+        degrees = self._in_degrees if incoming else self._out_degrees
+        if len(self.vertices) == self._next_id:
+            return degrees[:]
+        return array('q', map(degrees.__getitem__,
+                              map(self._ids.__getitem__, self.vertices)))
 
     def neighbors(self, node):
         node = self.__getattribute__(node)
         return [self.__getattribute__(name) for name in node.adjacent]
 
+    def _sources(self, name):
+        """
+        Names of the vertices with an edge to the given one, read
+        from the in-neighbor sets if they are kept, otherwise found
+        by scanning every vertex.
+        """
+        self._id(name)
+        if self._in is not None:
+            return self._in[name]
+        return [v for v in self.vertices
+                if hasattr(self.__getattribute__(v), name)]
+
+    def predecessors(self, node):
+        return [self.__getattribute__(name) for name in self._sources(node)]
+
+    @property
+    def edge_weights(self):
+        """
+        Dictionary of weighted edges keyed by ``source_target``,
+        materialized from the edge index on first access after
+        a modification.
+        """
+        if self._edge_weights is None:
+            self._edge_weights = {
+                edge.source.name + "_" + edge.target.name: edge
+                for edge in self._edges.values()}
+        return self._edge_weights
+
     def add_vertex(self, node):
         if not hasattr(self, node.name):
             self.vertices.append(node.name)
             self.__setattr__(node.name, node)
+            self._ids[node.name] = self._next_id
+            self._next_id += 1
+            self._version += 1
+            self._out_degrees.append(0)
+            self._in_degrees.append(0)
+            if self._in is not None:
+                self._in[node.name] = {}
 
     def remove_vertex(self, name):
+        node = self.__getattribute__(name)
+        sources = list(self._sources(name))
+        k, ids, edges = self._ids.pop(name), self._ids, self._edges
+        incoming, out_degrees, in_degrees = \
+            self._in, self._out_degrees, self._in_degrees
+        self._num_edges -= len(node.adjacent)
+        for target in node.adjacent:
+            edges.pop(k << 32 | ids.get(target, k), None)
+            if target != name:
+                in_degrees[ids[target]] -= 1
+                if incoming is not None:
+                    del incoming[target][name]
+        if incoming is not None:
+            del incoming[name]
         delattr(self, name)
         self.vertices.remove(name)
-        for node in self.vertices:
-            node_obj = self.__getattribute__(node)
-            if hasattr(node_obj, name):
+        for source in sources:
+            if source != name:
+                node_obj = self.__getattribute__(source)
                 delattr(node_obj, name)
                 node_obj.adjacent.remove(name)
+                edges.pop(ids[source] << 32 | k, None)
+                out_degrees[ids[source]] -= 1
+                self._num_edges -= 1
+        out_degrees[k] = in_degrees[k] = 0
+        self._edge_weights = None
+        self._version += 1
 
     def add_edge(self, source, target, cost=None):
         source, target = str(source), str(target)
@@ -83,19 +189,93 @@ class AdjacencyList(Graph):
 
         source, target = self.__getattribute__(source), \
             self.__getattribute__(target)
+        if not hasattr(source, target.name):
+            self._num_edges += 1
+            self._out_degrees[self._ids[source.name]] += 1
+            self._in_degrees[self._ids[target.name]] += 1
+            if self._in is not None:
+                self._in[target.name][source.name] = None
         source.add_adjacent_node(target.name)
+        self._version += 1
         if cost is not None:
-            self.edge_weights[source.name + "_" + target.name] = \
+            self._edges[self._ids[source.name] << 32 | self._ids[target.name]] = \
                 GraphEdge(source, target, cost)
+            self._edge_weights = None
+
+    def add_vertices_from(self, names):
+        vertices, ids = self.vertices, self._ids
+        for name in names:
+            name = str(name)
+            if not hasattr(self, name):
+                vertices.append(name)
+                self.__setattr__(name, AdjacencyListGraphNode(name))
+                ids[name] = self._next_id
+                self._next_id += 1
+                self._version += 1
+                self._out_degrees.append(0)
+                self._in_degrees.append(0)
+                if self._in is not None:
+                    self._in[name] = {}
+
+    def add_edges_from(self, sources, targets, weights=None):
+        sources, targets = list(map(str, sources)), list(map(str, targets))
+        if weights is not None:
+            weights = list(weights)
+        if len(sources) != len(targets) or \
+            (weights is not None and len(weights) != len(sources)):
+            raise ValueError("sources, targets and weights "
+                             "must have the same length.")
+
+        nodes = {}
+        for name in set(sources).union(targets):
+            if not hasattr(self, name):
+                raise ValueError("Vertex %s is not present in the graph."
+                                 "Call Graph.add_vertices_from to add new "
+                                 "vertices." % (name))
+            nodes[name] = self.__getattribute__(name)
+
+        lengths = {name: len(node.adjacent) for name, node in nodes.items()}
+        for source, target in zip(sources, targets):
+            nodes[source].add_adjacent_node(target)
+        # The new edges are the ones appended to the adjacency.
+        ids, incoming = self._ids, self._in
+        out_degrees, in_degrees = self._out_degrees, self._in_degrees
+        for name, node in nodes.items():
+            added = node.adjacent[lengths[name]:]
+            if added:
+                self._num_edges += len(added)
+                out_degrees[ids[name]] += len(added)
+                for target in added:
+                    in_degrees[ids[target]] += 1
+                if incoming is not None:
+                    for target in added:
+                        incoming[target][name] = None
+        self._version += 1
+        if weights is not None:
+            edges = self._edges
+            for source, target, cost in zip(sources, targets, weights):
+                if cost is not None:
+                    edges[ids[source] << 32 | ids[target]] = \
+                        GraphEdge(nodes[source], nodes[target], cost)
+            self._edge_weights = None
 
     def get_edge(self, source, target):
-        return self.edge_weights.get(
-            source + "_" + target,
-            None)
+        ids = self._ids
+        source, target = str(source), str(target)
+        if source not in ids or target not in ids:
+            return None
+        return self._edges.get(ids[source] << 32 | ids[target], None)
 
     def remove_edge(self, source, target):
         source, target = self.__getattribute__(source), \
                          self.__getattribute__(target)
         source.remove_adjacent_node(target.name)
-        self.edge_weights.pop(source.name + "_" + target.name,
-                                None)
+        self._num_edges -= 1
+        self._out_degrees[self._ids[source.name]] -= 1
+        self._in_degrees[self._ids[target.name]] -= 1
+        if self._in is not None:
+            del self._in[target.name][source.name]
+        self._edges.pop(self._ids[source.name] << 32 |
+                        self._ids[target.name], None)
+        self._edge_weights = None
+        self._version += 1
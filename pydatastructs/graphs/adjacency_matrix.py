@@ -1,3 +1,4 @@
+from array import array
 from pydatastructs.graphs.graph import Graph
 from pydatastructs.graphs._backend.cpp import _graph
 from pydatastructs.utils.misc_util import (
@@ -12,6 +13,14 @@ class AdjacencyMatrix(Graph):
     """
     Adjacency matrix implementation of graphs.
 
+    Weighted edges are indexed by the pair of ids of their
+    end points, packed as ``source_id << 32 | target_id``,
+    where the id of a vertex is its position in ``vertices``.
+
+    The number of edges and the numbers of edges leaving and
+    entering every vertex, by id, are counted as edges are
+    added and removed.
+
     See also
     ========
 
@@ -27,7 +36,14 @@ class AdjacencyMatrix(Graph):
             obj.matrix = {}
             for vertex in vertices:
                 obj.matrix[vertex.name] = {}
-            obj.edge_weights = {}
+            obj._ids = {name: i for i, name in enumerate(obj.vertices)}
+            obj._edges = {}
+            obj._edge_weights = None
+            obj._version = 0
+            obj._cache = None
+            obj._num_edges = 0
+            obj._out_degrees = array('q', [0])*len(vertices)
+            obj._in_degrees = array('q', [0])*len(vertices)
             obj._impl = 'adjacency_matrix'
             return obj
         else:
@@ -37,8 +53,23 @@ class AdjacencyMatrix(Graph):
     def methods(self):
         return ['is_adjacent', 'neighbors',
         'add_edge', 'get_edge', 'remove_edge',
+        'add_vertices_from', 'add_edges_from',
+        'num_edges', 'degree', 'in_degree', 'degrees',
         '__new__']
 
+    @property
+    def edge_weights(self):
+        """
+        Dictionary of weighted edges keyed by ``source_target``,
+        materialized from the edge index on first access after
+        a modification.
+        """
+        if self._edge_weights is None:
+            self._edge_weights = {
+                edge.source.name + "_" + edge.target.name: edge
+                for edge in self._edges.values()}
+        return self._edge_weights
+
     def is_adjacent(self, node1, node2):
         node1, node2 = str(node1), str(node2)
         row = self.matrix.get(node1, {})
@@ -48,7 +79,22 @@ class AdjacencyMatrix(Graph):
         return len(self.vertices)
 
     def num_edges(self):
-        return sum(len(v) for v in self.matrix.values())
+        return self._num_edges
+
+    def _id(self, name):
+        u = self._ids.get(str(name), None)
+        if u is None:
+            raise KeyError("Vertex %s is not present in the graph." % (name))
+        return u
+
+    def degree(self, node):
+        return self._out_degrees[self._id(node)]
+
+    def in_degree(self, node):
+        return self._in_degrees[self._id(node)]
+
+    def degrees(self, incoming=False):
+        return (self._in_degrees if incoming else self._out_degrees)[:]
 
     def neighbors(self, node):
         node = str(node)
@@ -82,19 +128,69 @@ class AdjacencyMatrix(Graph):
         if target not in self.matrix:
             raise ValueError(error_msg % (target))
 
+        if not self.matrix[source].get(target, False):
+            self._count_edge(source, target, 1)
         self.matrix[source][target] = True
+        self._version += 1
         if cost is not None:
-            self.edge_weights[source + "_" + target] = \
+            self._edges[self._ids[source] << 32 | self._ids[target]] = \
                 GraphEdge(self.__getattribute__(source),
                           self.__getattribute__(target),
                           cost)
+            self._edge_weights = None
+
+    def _count_edge(self, source, target, change):
+        self._num_edges += change
+        self._out_degrees[self._ids[source]] += change
+        self._in_degrees[self._ids[target]] += change
+
+    def add_vertices_from(self, names):
+        raise NotImplementedError("Currently we allow "
+                "adjacency matrix for static graphs only.")
+
+    def add_edges_from(self, sources, targets, weights=None):
+        sources, targets = list(map(str, sources)), list(map(str, targets))
+        if weights is not None:
+            weights = list(weights)
+        if len(sources) != len(targets) or \
+            (weights is not None and len(weights) != len(sources)):
+            raise ValueError("sources, targets and weights "
+                             "must have the same length.")
+
+        matrix = self.matrix
+        for name in set(sources).union(targets):
+            if name not in matrix:
+                raise ValueError("Vertex %s is not present in the graph."
+                                 % (name))
+
+        for source, target in zip(sources, targets):
+            row = matrix[source]
+            if not row.get(target, False):
+                self._count_edge(source, target, 1)
+                row[target] = True
+        self._version += 1
+        if weights is not None:
+            ids, edges = self._ids, self._edges
+            for source, target, cost in zip(sources, targets, weights):
+                if cost is not None:
+                    edges[ids[source] << 32 | ids[target]] = \
+                        GraphEdge(self.__getattribute__(source),
+                                  self.__getattribute__(target),
+                                  cost)
+            self._edge_weights = None
 
     def get_edge(self, source, target):
-        return self.edge_weights.get(
-            str(source) + "_" + str(target),
-            None)
+        ids = self._ids
+        source, target = str(source), str(target)
+        if source not in ids or target not in ids:
+            return None
+        return self._edges.get(ids[source] << 32 | ids[target], None)
 
     def remove_edge(self, source, target):
         source, target = str(source), str(target)
+        if self.matrix[source].get(target, False):
+            self._count_edge(source, target, -1)
         self.matrix[source][target] = False
-        self.edge_weights.pop(str(source) + "_" + str(target), None)
+        self._edges.pop(self._ids[source] << 32 | self._ids[target], None)
+        self._edge_weights = None
+        self._version += 1
@@ -2,12 +2,15 @@
 Contains algorithms associated with graph
 data structure.
 """
+from array import array
 from collections import deque
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from heapq import heappush, heappop
+from math import isnan, sqrt
 from pydatastructs.utils.misc_util import (
-    _comp, raise_if_backend_is_not_python, Backend, AdjacencyListGraphNode)
-from pydatastructs.miscellaneous_data_structures import (
-    DisjointSetForest, PriorityQueue)
+    _comp, raise_if_backend_is_not_python, Backend, AdjacencyListGraphNode,
+    AdjacencyMatrixGraphNode)
+from pydatastructs.miscellaneous_data_structures import PriorityQueue
 from pydatastructs.graphs.graph import Graph
 from pydatastructs.linear_data_structures.algorithms import merge_sort_parallel
 from pydatastructs import PriorityQueue
@@ -19,18 +22,32 @@ __all__ = [
     'minimum_spanning_tree_parallel',
     'strongly_connected_components',
     'depth_first_search',
+    'iter_bfs',
+    'iter_dfs',
     'shortest_paths',
     'all_pair_shortest_paths',
     'topological_sort',
     'topological_sort_parallel',
     'max_flow',
-    'find_bridges'
+    'find_bridges',
+    'find_articulation_points',
+    'biconnected_components'
 ]
 
 Stack = Queue = deque
 
+def _cached(graph, key, compute):
+    """
+    Returns the result of compute, memoized under key if
+    the cache of the graph is enabled.
+    """
+    cache = getattr(graph, '_cache', None)
+    if cache is None:
+        return compute()
+    return cache.lookup(key, graph._version, compute)
+
 def breadth_first_search(
-    graph, source_node, operation, *args, **kwargs):
+    graph, source_node, operation=None, *args, **kwargs):
     """
     Implementation of serial breadth first search(BFS)
     algorithm.
@@ -53,11 +70,37 @@ def breadth_first_search(
         current node and the node next to current node.
         The rest of the arguments are optional and you can
         provide your own stuff there.
+        Optional, if not provided then the search tree
+        is returned as arrays, see below.
+    direction_optimizing: bool
+        If `True`, the search switches from expanding the
+        frontier (top down) to scanning the incoming edges
+        of the unvisited vertices (bottom up) for the levels
+        in which the frontier has more outgoing edges than
+        a fraction of the unvisited part of the graph, and
+        back once the frontier becomes small again [1].
+        This avoids checking most edges of low diameter
+        graphs, whose middle levels contain most vertices.
+        Optional, by default, `False`.
     backend: pydatastructs.Backend
         The backend to be used.
         Optional, by default, the best available
         backend is used.
 
+    Returns
+    =======
+
+    visit_order, parent, depth: array
+        Only if `operation` is not provided. Vertices are
+        numbered in the order in which they were added to
+        the graph. `visit_order` contains the numbers of the
+        reached vertices in the order of their discovery,
+        `parent[v]` is the number of the vertex from which
+        `v` was discovered and `depth[v]` is its number of
+        edges from the source. Both are `-1` for vertices
+        which are not reachable and `parent` maps the
+        source to itself.
+
     Note
     ====
 
@@ -65,6 +108,10 @@ def breadth_first_search(
     to use in the prototype of your `operation` after
     passing the operation function.
 
+    If `direction_optimizing` is `True`, then the whole
+    search is performed before `operation` is called
+    for the discovered vertices in their order of discovery.
+
     Examples
     ========
 
@@ -80,10 +127,39 @@ def breadth_first_search(
     >>> G.add_edge(V1.name, V2.name)
     >>> G.add_edge(V2.name, V3.name)
     >>> breadth_first_search(G, V1.name, f, V3.name)
+    >>> G = Graph(V1, V2, V3, implementation='csr')
+    >>> G.add_edge(V1.name, V2.name)
+    >>> G.add_edge(V2.name, V3.name)
+    >>> visit_order, parent, depth = breadth_first_search(
+    ...     G, V1.name, direction_optimizing=True)
+    >>> list(parent), list(depth)
+    ([0, 0, 1], [0, 1, 2])
+
+    References
+    ==========
+
+    .. [1] https://doi.org/10.1109/SC.2012.50
     """
     backend = kwargs.get('backend', Backend.PYTHON)
+    direction_optimizing = kwargs.pop('direction_optimizing', False)
+    search = "direction optimizing breadth first search" \
+        if direction_optimizing else "breadth first search without an operation"
     if backend == Backend.PYTHON:
         import pydatastructs.graphs.algorithms as algorithms
+        if operation is None or direction_optimizing:
+            func = "_breadth_first_search_levels_" + graph._impl
+            if not hasattr(algorithms, func):
+                raise NotImplementedError(
+                "Currently %s isn't implemented for "
+                "%s graphs."%(search, graph._impl))
+            if operation is None:
+                return _cached(graph, ('breadth_first_search', str(source_node),
+                                       direction_optimizing),
+                    lambda: getattr(algorithms, func)(graph, source_node,
+                        direction_optimizing, operation, *args, **kwargs))
+            return getattr(algorithms, func)(
+                graph, source_node, direction_optimizing,
+                operation, *args, **kwargs)
         func = "_breadth_first_search_" + graph._impl
         if not hasattr(algorithms, func):
             raise NotImplementedError(
@@ -92,13 +168,26 @@ def breadth_first_search(
         return getattr(algorithms, func)(
             graph, source_node, operation, *args, **kwargs)
     else:
-        from pydatastructs.graphs._backend.cpp._graph import bfs_adjacency_list, bfs_adjacency_matrix
+        from pydatastructs.graphs._backend.cpp import _graph
+        if operation is None or direction_optimizing:
+            func = "bfs_levels_" + graph._impl
+            if not hasattr(_graph, func):
+                raise NotImplementedError(
+                "Currently %s isn't implemented for "
+                "%s graphs."%(search, graph._impl))
+            return getattr(_graph, func)(
+                graph, source_node, direction_optimizing, operation, args)
+        from pydatastructs.graphs._backend.cpp._graph import (
+            bfs_adjacency_list, bfs_adjacency_matrix, bfs_csr)
         if (graph._impl == "adjacency_list"):
             extra_args = args if args else ()
             return bfs_adjacency_list(graph, source_node, operation, extra_args)
         if (graph._impl == "adjacency_matrix"):
             extra_args = args if args else ()
             return bfs_adjacency_matrix(graph, source_node, operation, extra_args)
+        if (graph._impl == "csr"):
+            extra_args = args if args else ()
+            return bfs_csr(graph, source_node, operation, extra_args)
 
 def _breadth_first_search_adjacency_list(
     graph, source_node, operation, *args, **kwargs):
@@ -124,11 +213,162 @@ def _breadth_first_search_adjacency_list(
 
 _breadth_first_search_adjacency_matrix = _breadth_first_search_adjacency_list
 
+def _breadth_first_search_csr(
+    graph, source_node, operation, *args, **kwargs):
+    offsets, targets, names = graph.offsets(), graph.targets(), graph.vertices
+    source = graph._ids[source_node]
+    visited = bytearray(len(names))
+    visited[source] = True
+    bfs_queue = Queue([source])
+    while len(bfs_queue) != 0:
+        u = bfs_queue.popleft()
+        lo, hi = offsets[u], offsets[u + 1]
+        if lo == hi:
+            status = operation(names[u], "", *args, **kwargs)
+            if not status:
+                return None
+            continue
+        for v in targets[lo:hi]:
+            if not visited[v]:
+                status = operation(names[u], names[v], *args, **kwargs)
+                if not status:
+                    return None
+                bfs_queue.append(v)
+                visited[v] = True
+
+def _direction_optimizing_bfs(offsets, targets, source, direction_optimizing,
+                              transpose, alpha=14, beta=24):
+    """
+    Breadth first search over the arrays of a CSR graph which, if
+    `direction_optimizing` is set, performs the levels whose
+    frontier has more than 1/alpha of the unchecked edges bottom
+    up and returns to top down steps once the frontier has fewer
+    than 1/beta of the vertices. The parameters are the ones
+    suggested by Beamer et al. `transpose()` gives the incoming
+    edges for the bottom up levels.
+    """
+    V = len(offsets) - 1
+    parent, depth = array('q', [-1])*V, array('q', [-1])*V
+    parent[source], depth[source] = source, 0
+    visit_order = array('q', [source])
+    unchecked_edges = len(targets) - (offsets[source + 1] - offsets[source])
+    frontier_edges = offsets[source + 1] - offsets[source]
+    in_offsets = in_targets = None
+    bottom_up, head, level = False, 0, 0
+    while head < len(visit_order):
+        lo, hi = head, len(visit_order)
+        if direction_optimizing:
+            if not bottom_up and frontier_edges > unchecked_edges / alpha:
+                bottom_up = True
+            elif bottom_up and hi - lo < V / beta:
+                bottom_up = False
+        if bottom_up:
+            if in_offsets is None:
+                in_offsets, in_targets = transpose()
+            for v in range(V):
+                if parent[v] != -1:
+                    continue
+                for u in in_targets[in_offsets[v]:in_offsets[v + 1]]:
+                    if depth[u] == level:
+                        parent[v], depth[v] = u, level + 1
+                        visit_order.append(v)
+                        break
+        else:
+            for k in range(lo, hi):
+                u = visit_order[k]
+                for v in targets[offsets[u]:offsets[u + 1]]:
+                    if parent[v] == -1:
+                        parent[v], depth[v] = u, level + 1
+                        visit_order.append(v)
+        head, level = hi, level + 1
+        frontier_edges = 0
+        for k in range(hi, len(visit_order)):
+            u = visit_order[k]
+            frontier_edges += offsets[u + 1] - offsets[u]
+        unchecked_edges -= frontier_edges
+    return visit_order, parent, depth
+
+def _neighbor_arrays(graph, adjacent):
+    """
+    Returns the offsets and targets of the edges of the graph
+    grouped by vertex number, as in the CSR implementation,
+    along with the names of the vertices by number.
+    `adjacent(name)` gives the names of the neighbors of a vertex.
+    """
+    ids = graph._ids
+    size = getattr(graph, '_next_id', len(graph.vertices))
+    names, rows = [None]*size, [()]*size
+    for name in graph.vertices:
+        u = ids[name]
+        names[u] = name
+        rows[u] = [ids[v] for v in adjacent(name)]
+    offsets, targets = array('q', [0]), array('q')
+    for row in rows:
+        targets.extend(row)
+        offsets.append(len(targets))
+    return offsets, targets, names
+
+def _neighbor_arrays_adjacency_list(graph):
+    return _neighbor_arrays(
+        graph, lambda name: graph.__getattribute__(name).adjacent)
+
+def _neighbor_arrays_adjacency_matrix(graph):
+    return _neighbor_arrays(
+        graph, lambda name: [v for v, presence in graph.matrix[name].items()
+                             if presence])
+
+def _search_tree_result(tree, source, offsets, names, operation, *args, **kwargs):
+    """
+    Returns the (visit_order, parent, depth) arrays of a search if
+    `operation` is None, otherwise calls it for the discovered
+    vertices in their order of discovery.
+    """
+    if operation is None:
+        return tree
+    visit_order, parent, _ = tree
+    for v in visit_order:
+        if v != source:
+            if not operation(names[parent[v]], names[v], *args, **kwargs):
+                return None
+        if offsets[v] == offsets[v + 1]:
+            if not operation(names[v], "", *args, **kwargs):
+                return None
+
+def _breadth_first_search_levels_adjacency_list(
+    graph, source_node, direction_optimizing, operation, *args, **kwargs):
+    import pydatastructs.graphs.algorithms as algorithms
+    offsets, targets, names = \
+        getattr(algorithms, "_neighbor_arrays_" + graph._impl)(graph)
+    source = graph._ids[source_node]
+    tree = _direction_optimizing_bfs(
+        offsets, targets, source, direction_optimizing,
+        lambda: _reversed_arrays(graph, offsets, targets))
+    return _search_tree_result(tree, source, offsets, names,
+                               operation, *args, **kwargs)
+
+_breadth_first_search_levels_adjacency_matrix = \
+    _breadth_first_search_levels_adjacency_list
+
+def _breadth_first_search_levels_csr(
+    graph, source_node, direction_optimizing, operation, *args, **kwargs):
+    offsets, targets, names = graph.offsets(), graph.targets(), graph.vertices
+    source = graph._ids[source_node]
+    tree = _direction_optimizing_bfs(
+        offsets, targets, source, direction_optimizing, graph._transpose)
+    return _search_tree_result(tree, source, offsets, names,
+                               operation, *args, **kwargs)
+
 def breadth_first_search_parallel(
     graph, source_node, num_threads, operation, *args, **kwargs):
     """
     Parallel implementation of breadth first search on graphs.
 
+    The graph is explored one level at a time by a pool of
+    ``num_threads`` workers which is created once for the whole
+    traversal. Each worker expands a block of the current level
+    into its own buffer and the buffers are merged into the next
+    level once all the workers are done.
+
     Parameters
     ==========
 
@@ -161,6 +401,14 @@ def breadth_first_search_parallel(
     to use in the prototype of your `operation` after
     passing the operation function.
 
+    With the Python backend, `operation` is called by the
+    workers and so it may run concurrently for vertices of
+    the same level. With the C++ backend, the levels are
+    computed without holding the GIL and `operation` is then
+    called for each new level from the calling thread. In
+    both cases, no further levels are explored once
+    `operation` returns a falsy value.
+
     Examples
     ========
 
@@ -177,107 +425,226 @@ def breadth_first_search_parallel(
     >>> G.add_edge(V2.name, V3.name)
     >>> breadth_first_search_parallel(G, V1.name, 3, f, V3.name)
     """
-    raise_if_backend_is_not_python(
-        breadth_first_search_parallel, kwargs.get('backend', Backend.PYTHON))
-    import pydatastructs.graphs.algorithms as algorithms
-    func = "_breadth_first_search_parallel_" + graph._impl
-    if not hasattr(algorithms, func):
-        raise NotImplementedError(
-        "Currently breadth first search isn't implemented for "
-        "%s graphs."%(graph._impl))
-    return getattr(algorithms, func)(
-           graph, source_node, num_threads, operation, *args, **kwargs)
-
-def _generate_layer(**kwargs):
-    _args, _kwargs = kwargs.get('args'), kwargs.get('kwargs')
-    (graph, curr_node, next_layer, visited, operation) = _args[0:5]
-    op_args, op_kwargs = _args[5:], _kwargs
-    next_nodes = graph.neighbors(curr_node)
-    status = True
-    if len(next_nodes) != 0:
-        for next_node in next_nodes:
-            if visited.get(next_node, False) is False:
-                status = status and operation(curr_node, next_node.name, *op_args, **op_kwargs)
-                next_layer.add(next_node.name)
-                visited[next_node.name] = True
+    backend = kwargs.get('backend', Backend.PYTHON)
+    if backend == Backend.PYTHON:
+        import pydatastructs.graphs.algorithms as algorithms
+        func = "_breadth_first_search_parallel_" + graph._impl
+        if not hasattr(algorithms, func):
+            raise NotImplementedError(
+            "Currently breadth first search isn't implemented for "
+            "%s graphs."%(graph._impl))
+        return getattr(algorithms, func)(
+               graph, source_node, num_threads, operation, *args, **kwargs)
     else:
-        status = status and operation(curr_node, "", *op_args, **op_kwargs)
-    return status
+        from pydatastructs.graphs._backend.cpp import _graph
+        func = "bfs_parallel_" + graph._impl
+        if not hasattr(_graph, func):
+            raise NotImplementedError(
+            "Currently breadth first search isn't implemented for "
+            "%s graphs."%(graph._impl))
+        return getattr(_graph, func)(
+               graph, source_node, num_threads, operation, args)
+
+def _expand_frontier(chunk, neighbors, visited, stop, operation, args, kwargs):
+    """
+    Expands a block of the current frontier into a private buffer.
+    A vertex is claimed by the first worker whose ``setdefault``
+    stores its token in ``visited``, which is atomic for dicts.
+    """
+    token, buffer = object(), []
+    for curr_node in chunk:
+        if stop:
+            break
+        next_nodes = neighbors(curr_node)
+        if len(next_nodes) == 0:
+            if not operation(curr_node, "", *args, **kwargs):
+                stop.append(True)
+            continue
+        for next_node in next_nodes:
+            if visited.setdefault(next_node, token) is token:
+                buffer.append(next_node)
+                if not operation(curr_node, next_node, *args, **kwargs):
+                    stop.append(True)
+                    break
+    return buffer
+
+def _breadth_first_search_parallel(
+    neighbors, source_node, num_threads, operation, *args, **kwargs):
+    visited, stop = {source_node: None}, []
+    frontier = [source_node]
+    with ThreadPoolExecutor(max_workers=num_threads) as Executor:
+        while len(frontier) != 0:
+            size = -(-len(frontier) // num_threads)
+            buffers = [Executor.submit(
+                       _expand_frontier, frontier[i:i + size], neighbors,
+                       visited, stop, operation, args, kwargs)
+                       for i in range(0, len(frontier), size)]
+            frontier = []
+            for buffer in buffers:
+                frontier.extend(buffer.result())
+            if stop:
+                return None
 
 def _breadth_first_search_parallel_adjacency_list(
     graph, source_node, num_threads, operation, *args, **kwargs):
-    visited, layers = {}, {}
-    layers[0] = set()
-    layers[0].add(source_node)
-    visited[source_node] = True
-    layer = 0
-    while len(layers[layer]) != 0:
-        layers[layer+1] = set()
-        with ThreadPoolExecutor(max_workers=num_threads) as Executor:
-            for node in layers[layer]:
-                status = Executor.submit(
-                         _generate_layer, args=
-                         (graph, node, layers[layer+1], visited,
-                          operation, *args), kwargs=kwargs).result()
-        layer += 1
-        if not status:
-            return None
+    def neighbors(node):
+        return [next_node.name for next_node in graph.neighbors(node)]
+    return _breadth_first_search_parallel(
+        neighbors, source_node, num_threads, operation, *args, **kwargs)
 
 _breadth_first_search_parallel_adjacency_matrix = _breadth_first_search_parallel_adjacency_list
 
-def _generate_mst_object(graph):
-    mst = Graph(*[getattr(graph, str(v)) for v in graph.vertices])
-    return mst
+def _breadth_first_search_parallel_csr(
+    graph, source_node, num_threads, operation, *args, **kwargs):
+    offsets, targets, names = graph.offsets(), graph.targets(), graph.vertices
+    ids = graph._ids
+    def neighbors(node):
+        u = ids[node]
+        return [names[v] for v in targets[offsets[u]:offsets[u + 1]]]
+    return _breadth_first_search_parallel(
+        neighbors, source_node, num_threads, operation, *args, **kwargs)
+
+def _fresh_mst_object(graph):
+    """
+    Returns a graph over new nodes with the names and data of the
+    vertices of the graph, so that adding the edges of a spanning
+    tree to it leaves the nodes of the graph unchanged.
+    """
+    node_type = AdjacencyMatrixGraphNode \
+        if graph._impl == 'adjacency_matrix' else AdjacencyListGraphNode
+    return Graph(*[node_type(name, getattr(graph, name).data)
+                   for name in graph.vertices])
 
-def _sort_edges(graph, num_threads=None):
-    edges = list(graph.edge_weights.items())
+def _edge_arrays(graph):
+    """
+    Returns the sources, targets and weights of the edges of an
+    adjacency list or adjacency matrix graph as typed arrays,
+    numbered in the order of `graph.edge_weights`, with `nan` as
+    the weight of unweighted edges.
+    """
+    edges = graph._edges
+    keys = array('q', edges)
+    sources = array('q', [key >> 32 for key in keys])
+    targets = array('q', [key & 0xffffffff for key in keys])
+    weights = array('d', [float('nan') if edge.value is None else edge.value
+                          for edge in edges.values()])
+    return sources, targets, weights
+
+def _kruskal_forest(sources, targets, weights, V, num_threads=None):
+    """
+    Returns the typed array of the indices of the edges of a minimum
+    spanning forest of the undirected graph given by the parallel
+    arrays of sources, targets and weights over vertices numbered
+    from 0 to V - 1, in the order Kruskal's algorithm picks them.
+    Edges with `nan` weights are ignored.
+
+    The indices are sorted by weight, ties by index, and the edges
+    are joined in a union-find forest on vertex numbers kept in an
+    array instead of a `DisjointSetForest` keyed by names.
+    """
+    order = [e for e in range(len(weights)) if not isnan(weights[e])]
     if num_threads is None:
-        sort_key = lambda item: item[1].value
-        return sorted(edges, key=sort_key)
-
-    merge_sort_parallel(edges, num_threads,
-                        comp=lambda u,v: u[1].value <= v[1].value)
-    return edges
-
-def _minimum_spanning_tree_kruskal_adjacency_list(graph):
-    mst = _generate_mst_object(graph)
-    dsf = DisjointSetForest()
-    for v in graph.vertices:
-        dsf.make_set(v)
-    for _, edge in _sort_edges(graph):
+        order.sort(key=weights.__getitem__)
+    else:
+        merge_sort_parallel(order, num_threads,
+                            comp=lambda i, j: weights[i] <= weights[j])
+    parent, forest = array('q', range(V)), array('q')
+    for e in order:
+        u, v = sources[e], targets[e]
+        while parent[u] != u:
+            parent[u] = u = parent[parent[u]]
+        while parent[v] != v:
+            parent[v] = v = parent[parent[v]]
+        if u != v:
+            parent[u] = v
+            forest.append(e)
+            if len(forest) == V - 1:
+                break
+    return forest
+
+def _minimum_spanning_tree_kruskal_adjacency_list(graph, num_threads=None, as_graph=True):
+    sources, targets, weights = _edge_arrays(graph)
+    forest = _kruskal_forest(sources, targets, weights,
+                             getattr(graph, '_next_id', len(graph.vertices)),
+                             num_threads)
+    if not as_graph:
+        return forest
+    mst = _fresh_mst_object(graph)
+    edges = list(graph._edges.values())
+    for e in forest:
+        edge = edges[e]
         u, v = edge.source.name, edge.target.name
-        if dsf.find_root(u) is not dsf.find_root(v):
-            mst.add_edge(u, v, edge.value)
-            mst.add_edge(v, u, edge.value)
-            dsf.union(u, v)
+        mst.add_edge(u, v, edge.value)
+        mst.add_edge(v, u, edge.value)
     return mst
 
 _minimum_spanning_tree_kruskal_adjacency_matrix = \
     _minimum_spanning_tree_kruskal_adjacency_list
 
+def _edge_sources_csr(offsets):
+    sources = array('q')
+    for u in range(len(offsets) - 1):
+        sources.extend(array('q', [u])*(offsets[u + 1] - offsets[u]))
+    return sources
+
+def _minimum_spanning_tree_kruskal_csr(graph, num_threads=None, as_graph=True):
+    offsets, targets, weights = graph.offsets(), graph.targets(), graph.weights()
+    names = graph.vertices
+    sources = _edge_sources_csr(offsets)
+    forest = _kruskal_forest(sources, targets, weights, len(names), num_threads)
+    if not as_graph:
+        return forest
+    mst = Graph(*map(graph._node, range(len(names))), implementation='csr')
+    for e in forest:
+        u, v = sources[e], targets[e]
+        mst.add_edge(names[u], names[v], weights[e])
+        mst.add_edge(names[v], names[u], weights[e])
+    return mst
+
 def _minimum_spanning_tree_prim_adjacency_list(graph):
     q = PriorityQueue(implementation='binomial_heap')
-    e = {}
-    mst = Graph(implementation='adjacency_list')
+    e, visited = {}, set()
+    mst = _fresh_mst_object(graph)
     q.push(next(iter(graph.vertices)), 0)
     while not q.is_empty:
         v = q.pop()
-        if not hasattr(mst, v):
-            mst.add_vertex(graph.__getattribute__(v))
+        if v not in visited:
+            visited.add(v)
             if e.get(v, None) is not None:
                 edge = e[v]
-                mst.add_vertex(edge.target)
                 mst.add_edge(edge.source.name, edge.target.name, edge.value)
                 mst.add_edge(edge.target.name, edge.source.name, edge.value)
             for w_node in graph.neighbors(v):
                 w = w_node.name
-                vw = graph.edge_weights[v + '_' + w]
+                vw = graph.get_edge(v, w)
                 q.push(w, vw.value)
                 if e.get(w, None) is None or \
                     e[w].value > vw.value:
                     e[w] = vw
     return mst
 
+def _minimum_spanning_tree_prim_csr(graph):
+    offsets, targets, weights = graph.offsets(), graph.targets(), graph.weights()
+    names = graph.vertices
+    mst = Graph(*map(graph._node, range(len(names))), implementation='csr')
+    if not names:
+        return mst
+    visited = bytearray(len(names))
+    q = [(0, 0, -1)]
+    while q:
+        w, v, u = heappop(q)
+        if visited[v]:
+            continue
+        visited[v] = True
+        if u != -1:
+            mst.add_edge(names[u], names[v], w)
+            mst.add_edge(names[v], names[u], w)
+        for i in range(offsets[v], offsets[v + 1]):
+            x = targets[i]
+            if not visited[x] and not isnan(weights[i]):
+                heappush(q, (weights[i], x, v))
+    return mst
+
 def minimum_spanning_tree(graph, algorithm, **kwargs):
     """
     Computes a minimum spanning tree for the given
@@ -298,6 +665,14 @@ def minimum_spanning_tree(graph, algorithm, **kwargs):
         'kruskal' -> Kruskal's algorithm as given in [1].
 
         'prim' -> Prim's algorithm as given in [2].
+    as_graph: bool
+        If `False`, Kruskal's algorithm returns the typed
+        array of the indices of the edges of the tree, in
+        the order they are picked, instead of building a
+        graph. Edges are numbered in the order of
+        `graph.edge_weights`, or by their positions in
+        `graph.targets()` for CSR graphs.
+        Optional, by default, `True`.
     backend: pydatastructs.Backend
         The backend to be used.
         Optional, by default, the best available
@@ -323,6 +698,11 @@ def minimum_spanning_tree(graph, algorithm, **kwargs):
     >>> u_n = mst.neighbors(u.name)
     >>> mst.get_edge(u.name, u_n[0].name).value
     3
+    >>> G = Graph(implementation='csr')
+    >>> G.add_vertices_from(['a', 'b', 'c'])
+    >>> G.add_edges_from(['a', 'a', 'b'], ['b', 'c', 'c'], [4, 1, 2])
+    >>> minimum_spanning_tree(G, 'kruskal', as_graph=False)
+    array('q', [1, 2])
 
     References
     ==========
@@ -347,28 +727,29 @@ def minimum_spanning_tree(graph, algorithm, **kwargs):
             "Currently %s algoithm for %s implementation of graphs "
             "isn't implemented for finding minimum spanning trees."
             %(algorithm, graph._impl))
-        return getattr(algorithms, func)(graph)
     else:
-        from pydatastructs.graphs._backend.cpp._graph import minimum_spanning_tree_prim_adjacency_list
-        if graph._impl == "adjacency_list" and algorithm == 'prim':
-            return minimum_spanning_tree_prim_adjacency_list(graph)
+        from pydatastructs.graphs._backend.cpp import _graph as algorithms
+        func = "minimum_spanning_tree_" + algorithm + "_" + graph._impl
+        if not hasattr(algorithms, func):
+            raise NotImplementedError(
+            "Currently %s algoithm for %s implementation of graphs "
+            "isn't implemented for finding minimum spanning trees."
+            %(algorithm, graph._impl))
+    if not kwargs.get('as_graph', True):
+        if algorithm != 'kruskal':
+            raise NotImplementedError(
+            "Currently only kruskal algorithm can return the edges "
+            "of minimum spanning trees.")
+        return getattr(algorithms, func)(graph, as_graph=False)
+    return getattr(algorithms, func)(graph)
 
-def _minimum_spanning_tree_parallel_kruskal_adjacency_list(graph, num_threads):
-    mst = _generate_mst_object(graph)
-    dsf = DisjointSetForest()
-    for v in graph.vertices:
-        dsf.make_set(v)
-    edges = _sort_edges(graph, num_threads)
-    for _, edge in edges:
-        u, v = edge.source.name, edge.target.name
-        if dsf.find_root(u) is not dsf.find_root(v):
-            mst.add_edge(u, v, edge.value)
-            mst.add_edge(v, u, edge.value)
-            dsf.union(u, v)
-    return mst
+_minimum_spanning_tree_parallel_kruskal_adjacency_list = \
+    _minimum_spanning_tree_kruskal_adjacency_list
 
 _minimum_spanning_tree_parallel_kruskal_adjacency_matrix = \
-    _minimum_spanning_tree_parallel_kruskal_adjacency_list
+    _minimum_spanning_tree_kruskal_adjacency_list
+
+_minimum_spanning_tree_parallel_kruskal_csr = _minimum_spanning_tree_kruskal_csr
 
 def _find_min(q, v, i):
     if not q.is_empty:
@@ -379,8 +760,8 @@ def _find_min(q, v, i):
 def _minimum_spanning_tree_parallel_prim_adjacency_list(graph, num_threads):
     q = [PriorityQueue(implementation='binomial_heap') for _ in range(num_threads)]
     e = [{} for _ in range(num_threads)]
-    v2q = {}
-    mst = Graph(implementation='adjacency_list')
+    v2q, visited = {}, set()
+    mst = _fresh_mst_object(graph)
 
     itr = iter(graph.vertices)
     for i in range(len(graph.vertices)):
@@ -404,16 +785,15 @@ def _minimum_spanning_tree_parallel_prim_adjacency_list(graph, num_threads):
         idx = v2q[v]
         q[idx].pop()
 
-        if not hasattr(mst, v):
-            mst.add_vertex(graph.__getattribute__(v))
+        if v not in visited:
+            visited.add(v)
             if e[idx].get(v, None) is not None:
                 edge = e[idx][v]
-                mst.add_vertex(edge.target)
                 mst.add_edge(edge.source.name, edge.target.name, edge.value)
                 mst.add_edge(edge.target.name, edge.source.name, edge.value)
             for w_node in graph.neighbors(v):
                 w = w_node.name
-                vw = graph.edge_weights[v + '_' + w]
+                vw = graph.get_edge(v, w)
                 j = v2q[w]
                 q[j].push(w, vw.value)
                 if e[j].get(w, None) is None or \
@@ -422,6 +802,89 @@ def _minimum_spanning_tree_parallel_prim_adjacency_list(graph, num_threads):
 
     return mst
 
+def _boruvka_forest(sources, targets, weights, V, num_threads):
+    """
+    Returns the indices of the edges of a minimum spanning forest of
+    the undirected graph given by the parallel arrays of sources,
+    targets and weights over vertices numbered from 0 to V - 1.
+    Edges with no weight are ignored.
+
+    Every round of Borůvka's algorithm looks for the cheapest edge
+    leaving each component, splitting the edges still crossing
+    components into one chunk per thread, and contracts the
+    components along them in a union-find forest kept in an array.
+    Ties are broken by edge index, so the chosen edges never close
+    a cycle.
+    """
+    parent, label = array('q', range(V)), array('q', range(V))
+
+    def find(u):
+        while parent[u] != u:
+            parent[u] = parent[parent[u]]
+            u = parent[u]
+        return u
+
+    def cheapest(chunk):
+        kept, best = [], {}
+        for e in chunk:
+            a, b = label[sources[e]], label[targets[e]]
+            if a == b:
+                continue
+            kept.append(e)
+            key = (weights[e], e)
+            for c in (a, b):
+                f = best.get(c, None)
+                if f is None or key < (weights[f], f):
+                    best[c] = e
+        return kept, best
+
+    live = [e for e in range(len(sources)) if sources[e] != targets[e] and
+            weights[e] is not None and not isnan(weights[e])]
+    forest = []
+    with ThreadPoolExecutor(max_workers=num_threads) as Executor:
+        while live:
+            size = -(-len(live) // num_threads)
+            chunks = [live[i:i + size] for i in range(0, len(live), size)]
+            live, best = [], {}
+            for kept, chunk_best in Executor.map(cheapest, chunks):
+                live.extend(kept)
+                for c, e in chunk_best.items():
+                    f = best.get(c, None)
+                    if f is None or (weights[e], e) < (weights[f], f):
+                        best[c] = e
+            for e in sorted(set(best.values())):
+                a, b = find(sources[e]), find(targets[e])
+                if a != b:
+                    parent[a] = b
+                    forest.append(e)
+            for u in range(V):
+                label[u] = find(u)
+    return forest
+
+def _minimum_spanning_tree_parallel_boruvka_adjacency_list(graph, num_threads):
+    offsets, targets, weights, names = _weighted_arrays(graph)
+    sources = _edge_sources_csr(offsets)
+    mst = _fresh_mst_object(graph)
+    for e in _boruvka_forest(sources, targets, weights, len(names), num_threads):
+        u, v = names[sources[e]], names[targets[e]]
+        mst.add_edge(u, v, weights[e])
+        mst.add_edge(v, u, weights[e])
+    return mst
+
+_minimum_spanning_tree_parallel_boruvka_adjacency_matrix = \
+    _minimum_spanning_tree_parallel_boruvka_adjacency_list
+
+def _minimum_spanning_tree_parallel_boruvka_csr(graph, num_threads):
+    offsets, targets, weights = graph.offsets(), graph.targets(), graph.weights()
+    names = graph.vertices
+    sources = _edge_sources_csr(offsets)
+    mst = Graph(*map(graph._node, range(len(names))), implementation='csr')
+    for e in _boruvka_forest(sources, targets, weights, len(names), num_threads):
+        u, v = names[sources[e]], names[targets[e]]
+        mst.add_edge(u, v, weights[e])
+        mst.add_edge(v, u, weights[e])
+    return mst
+
 def minimum_spanning_tree_parallel(graph, algorithm, num_threads, **kwargs):
     """
     Computes a minimum spanning tree for the given
@@ -442,6 +905,12 @@ def minimum_spanning_tree_parallel(graph, algorithm, num_threads, **kwargs):
         'kruskal' -> Kruskal's algorithm as given in [1].
 
         'prim' -> Prim's algorithm as given in [2].
+
+        'boruvka' -> Borůvka's algorithm as given in [3],
+        finding the cheapest edge leaving every component
+        in parallel over chunks of the edges. The C++
+        backend runs it on native threads without holding
+        the GIL.
     num_threads: int
         The number of threads to be used.
     backend: pydatastructs.Backend
@@ -475,6 +944,7 @@ def minimum_spanning_tree_parallel(graph, algorithm, num_threads, **kwargs):
 
     .. [1] https://en.wikipedia.org/wiki/Kruskal%27s_algorithm#Parallel_algorithm
     .. [2] https://en.wikipedia.org/wiki/Prim%27s_algorithm#Parallel_algorithm
+    .. [3] https://en.wikipedia.org/wiki/Bor%C5%AFvka%27s_algorithm
 
     Note
     ====
@@ -484,110 +954,169 @@ def minimum_spanning_tree_parallel(graph, algorithm, num_threads, **kwargs):
     should be used only for such graphs. Using with other
     types of graphs will lead to unwanted results.
     """
-    raise_if_backend_is_not_python(
-        minimum_spanning_tree_parallel, kwargs.get('backend', Backend.PYTHON))
+    backend = kwargs.get('backend', Backend.PYTHON)
+    if backend == Backend.PYTHON:
+        import pydatastructs.graphs.algorithms as algorithms
+        func = "_minimum_spanning_tree_parallel_" + algorithm + "_" + graph._impl
+        if not hasattr(algorithms, func):
+            raise NotImplementedError(
+            "Currently %s algoithm for %s implementation of graphs "
+            "isn't implemented for finding minimum spanning trees."
+            %(algorithm, graph._impl))
+        return getattr(algorithms, func)(graph, num_threads)
+    else:
+        from pydatastructs.graphs._backend.cpp import _graph
+        func = "minimum_spanning_tree_parallel_" + algorithm + "_" + graph._impl
+        if not hasattr(_graph, func):
+            raise NotImplementedError(
+            "Currently %s algoithm for %s implementation of graphs "
+            "isn't implemented for finding minimum spanning trees."
+            %(algorithm, graph._impl))
+        return getattr(_graph, func)(graph, num_threads)
+
+def _transpose_csr(offsets, targets):
+    V = len(offsets) - 1
+    t_offsets = [0]*(V + 1)
+    for v in targets:
+        t_offsets[v + 1] += 1
+    for u in range(V):
+        t_offsets[u + 1] += t_offsets[u]
+    t_targets, cursor = [0]*len(targets), t_offsets[:-1]
+    for u in range(V):
+        for v in targets[offsets[u]:offsets[u + 1]]:
+            t_targets[cursor[v]] = u
+            cursor[v] += 1
+    return t_offsets, t_targets
+
+def _reversed_arrays(graph, offsets, targets):
+    """
+    Returns the offsets and sources of the incoming edges of every
+    vertex, numbered as the outgoing ones. They are read from the
+    in-neighbor sets of adjacency lists which keep them and from
+    the transposed arrays of CSR graphs, otherwise the outgoing
+    edges are transposed.
+    """
+    if graph._impl == 'csr':
+        return graph._transpose()
+    incoming = getattr(graph, '_in', None)
+    if incoming is not None:
+        return _neighbor_arrays(graph, incoming.__getitem__)[:2]
+    return _transpose_csr(offsets, targets)
+
+def _graph_arrays(graph):
+    """
+    Returns the offsets and targets of the edges of the graph
+    grouped by vertex number, along with the names of the
+    vertices by number, None for the numbers of removed ones.
+    """
+    if graph._impl == 'csr':
+        return graph.offsets(), graph.targets(), graph.vertices
     import pydatastructs.graphs.algorithms as algorithms
-    func = "_minimum_spanning_tree_parallel_" + algorithm + "_" + graph._impl
-    if not hasattr(algorithms, func):
-        raise NotImplementedError(
-        "Currently %s algoithm for %s implementation of graphs "
-        "isn't implemented for finding minimum spanning trees."
-        %(algorithm, graph._impl))
-    return getattr(algorithms, func)(graph, num_threads)
-
-def _visit(graph, vertex, visited, incoming, L):
-    stack = [vertex]
-    while stack:
-        top = stack[-1]
-        if not visited.get(top, False):
-            visited[top] = True
-            for node in graph.neighbors(top):
-                if incoming.get(node.name, None) is None:
-                    incoming[node.name] = []
-                incoming[node.name].append(top)
-                if not visited.get(node.name, False):
-                    stack.append(node.name)
-        if top is stack[-1]:
-            L.append(stack.pop())
-
-def _assign(graph, u, incoming, assigned, component):
-    stack = [u]
-    while stack:
-        top = stack[-1]
-        if not assigned.get(top, False):
-            assigned[top] = True
-            component.add(top)
-            for u in incoming[top]:
-                if not assigned.get(u, False):
-                    stack.append(u)
-        if top is stack[-1]:
-            stack.pop()
+    return getattr(algorithms, "_neighbor_arrays_" + graph._impl)(graph)
+
+def _kosaraju_labels(offsets, targets, names, reversed_arrays=None):
+    V = len(names)
+    visited, L = bytearray(V), []
+    for root in range(V):
+        if visited[root] or names[root] is None:
+            continue
+        visited[root] = True
+        stack = [(root, offsets[root])]
+        while stack:
+            u, i = stack[-1]
+            if i < offsets[u + 1]:
+                stack[-1] = (u, i + 1)
+                v = targets[i]
+                if not visited[v]:
+                    visited[v] = True
+                    stack.append((v, offsets[v]))
+            else:
+                L.append(stack.pop()[0])
+
+    t_offsets, t_targets = reversed_arrays or _transpose_csr(offsets, targets)
+    labels, count = array('q', [-1])*V, 0
+    for root in reversed(L):
+        if labels[root] != -1:
+            continue
+        labels[root], stack = count, [root]
+        while stack:
+            u = stack.pop()
+            for v in t_targets[t_offsets[u]:t_offsets[u + 1]]:
+                if labels[v] == -1:
+                    labels[v] = count
+                    stack.append(v)
+        count += 1
+    return labels, count
+
+def _tarjan_labels(offsets, targets, names):
+    V = len(names)
+    indices, low_links = [-1]*V, [0]*V
+    on_stacks, stack = bytearray(V), []
+    labels, index, count = array('q', [-1])*V, 0, 0
+    for root in range(V):
+        if indices[root] != -1 or names[root] is None:
+            continue
+        call_stack = [(root, offsets[root])]
+        indices[root] = low_links[root] = index
+        index += 1
+        stack.append(root)
+        on_stacks[root] = True
+        while call_stack:
+            u, i = call_stack[-1]
+            if i < offsets[u + 1]:
+                call_stack[-1] = (u, i + 1)
+                v = targets[i]
+                if indices[v] == -1:
+                    indices[v] = low_links[v] = index
+                    index += 1
+                    stack.append(v)
+                    on_stacks[v] = True
+                    call_stack.append((v, offsets[v]))
+                elif on_stacks[v]:
+                    low_links[u] = min(low_links[u], indices[v])
+                continue
+            call_stack.pop()
+            if call_stack:
+                parent = call_stack[-1][0]
+                low_links[parent] = min(low_links[parent], low_links[u])
+            if low_links[u] == indices[u]:
+                while True:
+                    w = stack.pop()
+                    on_stacks[w] = False
+                    labels[w] = count
+                    if w == u:
+                        break
+                count += 1
+    return labels, count
+
+def _strongly_connected_components(graph, kernel, labels):
+    offsets, targets, names = _graph_arrays(graph)
+    component_labels, count = kernel(offsets, targets, names)
+    if labels:
+        return component_labels
+    components = [set() for _ in range(count)]
+    for name, label in zip(names, component_labels):
+        if label != -1:
+            components[label].add(name)
+    return components
 
-def _strongly_connected_components_kosaraju_adjacency_list(graph):
-    visited, incoming, L = {}, {}, []
-    for u in graph.vertices:
-        if not visited.get(u, False):
-            _visit(graph, u, visited, incoming, L)
-
-    assigned = {}
-    components = []
-    for i in range(-1, -len(L) - 1, -1):
-        comp = set()
-        if not assigned.get(L[i], False):
-            _assign(graph, L[i], incoming, assigned, comp)
-        if comp:
-            components.append(comp)
+def _strongly_connected_components_kosaraju_adjacency_list(graph, labels):
+    return _strongly_connected_components(
+        graph, lambda offsets, targets, names: _kosaraju_labels(
+            offsets, targets, names,
+            _reversed_arrays(graph, offsets, targets)), labels)
 
-    return components
+def _strongly_connected_components_tarjan_adjacency_list(graph, labels):
+    return _strongly_connected_components(graph, _tarjan_labels, labels)
 
 _strongly_connected_components_kosaraju_adjacency_matrix = \
     _strongly_connected_components_kosaraju_adjacency_list
-
-def _tarjan_dfs(u, graph, index, stack, indices, low_links, on_stacks, components):
-    indices[u] = index[0]
-    low_links[u] = index[0]
-    index[0] += 1
-    stack.append(u)
-    on_stacks[u] = True
-
-    for node in graph.neighbors(u):
-        v = node.name
-        if indices[v] == -1:
-            _tarjan_dfs(v, graph, index, stack, indices, low_links, on_stacks, components)
-            low_links[u] = min(low_links[u], low_links[v])
-        elif on_stacks[v]:
-            low_links[u] = min(low_links[u], low_links[v])
-
-    if low_links[u] == indices[u]:
-        component = set()
-        while stack:
-            w = stack.pop()
-            on_stacks[w] = False
-            component.add(w)
-            if w == u:
-                break
-        components.append(component)
-
-def _strongly_connected_components_tarjan_adjacency_list(graph):
-    index = [0] # mutable object
-    stack = Stack([])
-    indices, low_links, on_stacks = {}, {}, {}
-
-    for u in graph.vertices:
-        indices[u] = -1
-        low_links[u] = -1
-        on_stacks[u] = False
-
-    components = []
-
-    for u in graph.vertices:
-        if indices[u] == -1:
-            _tarjan_dfs(u, graph, index, stack, indices, low_links, on_stacks, components)
-
-    return components
-
+_strongly_connected_components_kosaraju_csr = \
+    _strongly_connected_components_kosaraju_adjacency_list
 _strongly_connected_components_tarjan_adjacency_matrix = \
     _strongly_connected_components_tarjan_adjacency_list
+_strongly_connected_components_tarjan_csr = \
+    _strongly_connected_components_tarjan_adjacency_list
 
 def strongly_connected_components(graph, algorithm, **kwargs):
     """
@@ -608,6 +1137,10 @@ def strongly_connected_components(graph, algorithm, **kwargs):
 
         'kosaraju' -> Kosaraju's algorithm as given in [1].
         'tarjan' -> Tarjan's algorithm as given in [2].
+    labels: bool
+        If `True`, the components are returned as an array
+        of labels instead of a list of sets.
+        Optional, by default, `False`.
     backend: pydatastructs.Backend
         The backend to be used.
         Optional, by default, the best available
@@ -618,6 +1151,13 @@ def strongly_connected_components(graph, algorithm, **kwargs):
 
     components: list
         Python list with each element as set of vertices.
+        Only if `labels` is `False`.
+    labels: array
+        Only if `labels` is `True`. Vertices are numbered in
+        the order in which they were added to the graph and
+        `labels[v]` is the position of the component of `v` in
+        the list which is returned otherwise. Components are
+        numbered from 0 and removed vertices are labelled -1.
 
     Examples
     ========
@@ -632,6 +1172,8 @@ def strongly_connected_components(graph, algorithm, **kwargs):
     >>> scc = strongly_connected_components(g, 'kosaraju')
     >>> scc == [{'2', '0', '1'}]
     True
+    >>> list(strongly_connected_components(g, 'tarjan', labels=True))
+    [0, 0, 0]
 
     References
     ==========
@@ -640,19 +1182,29 @@ def strongly_connected_components(graph, algorithm, **kwargs):
     .. [2] https://en.wikipedia.org/wiki/Tarjan%27s_strongly_connected_components_algorithm
 
     """
-    raise_if_backend_is_not_python(
-        strongly_connected_components, kwargs.get('backend', Backend.PYTHON))
-    import pydatastructs.graphs.algorithms as algorithms
-    func = "_strongly_connected_components_" + algorithm + "_" + graph._impl
-    if not hasattr(algorithms, func):
-        raise NotImplementedError(
-        "Currently %s algoithm for %s implementation of graphs "
-        "isn't implemented for finding strongly connected components."
-        %(algorithm, graph._impl))
-    return getattr(algorithms, func)(graph)
+    backend = kwargs.get('backend', Backend.PYTHON)
+    labels = kwargs.get('labels', False)
+    if backend == Backend.PYTHON:
+        import pydatastructs.graphs.algorithms as algorithms
+        func = "_strongly_connected_components_" + algorithm + "_" + graph._impl
+        if not hasattr(algorithms, func):
+            raise NotImplementedError(
+            "Currently %s algoithm for %s implementation of graphs "
+            "isn't implemented for finding strongly connected components."
+            %(algorithm, graph._impl))
+        return getattr(algorithms, func)(graph, labels)
+    else:
+        from pydatastructs.graphs._backend.cpp import _graph
+        func = "strongly_connected_components_" + algorithm + "_" + graph._impl
+        if not hasattr(_graph, func):
+            raise NotImplementedError(
+            "Currently %s algoithm for %s implementation of graphs "
+            "isn't implemented for finding strongly connected components."
+            %(algorithm, graph._impl))
+        return getattr(_graph, func)(graph, labels)
 
 def depth_first_search(
-    graph, source_node, operation, *args, **kwargs):
+    graph, source_node, operation=None, *args, **kwargs):
     """
     Implementation of depth first search (DFS)
     algorithm.
@@ -675,11 +1227,21 @@ def depth_first_search(
         current node and the node next to current node.
         The rest of the arguments are optional and you can
         provide your own stuff there.
+        Optional, if not provided then the search tree
+        is returned as arrays, see below.
     backend: pydatastructs.Backend
         The backend to be used.
         Optional, by default, the best available
         backend is used.
 
+    Returns
+    =======
+
+    visit_order, parent, depth: array
+        Only if `operation` is not provided. Same as for
+        `breadth_first_search`, with `depth[v]` being the
+        depth of `v` in the depth first search tree.
+
     Note
     ====
 
@@ -687,6 +1249,10 @@ def depth_first_search(
     to use in the prototype of your `operation` after
     passing the operation function.
 
+    With the C++ backend, the whole search is performed
+    before `operation` is called for the discovered
+    vertices in their order of discovery.
+
     Examples
     ========
 
@@ -702,22 +1268,36 @@ def depth_first_search(
     >>> G.add_edge(V1.name, V2.name)
     >>> G.add_edge(V2.name, V3.name)
     >>> depth_first_search(G, V1.name, f, V3.name)
+    >>> visit_order, parent, depth = depth_first_search(G, V1.name)
+    >>> list(visit_order), list(depth)
+    ([0, 1, 2], [0, 1, 2])
 
     References
     ==========
 
     .. [1] https://en.wikipedia.org/wiki/Depth-first_search
     """
-    raise_if_backend_is_not_python(
-        depth_first_search, kwargs.get('backend', Backend.PYTHON))
-    import pydatastructs.graphs.algorithms as algorithms
-    func = "_depth_first_search_" + graph._impl
-    if not hasattr(algorithms, func):
-        raise NotImplementedError(
-        "Currently depth first search isn't implemented for "
-        "%s graphs."%(graph._impl))
-    return getattr(algorithms, func)(
-           graph, source_node, operation, *args, **kwargs)
+    backend = kwargs.get('backend', Backend.PYTHON)
+    if backend == Backend.PYTHON:
+        import pydatastructs.graphs.algorithms as algorithms
+        if operation is None:
+            func = "_depth_first_search_tree_" + graph._impl
+        else:
+            func = "_depth_first_search_" + graph._impl
+        if not hasattr(algorithms, func):
+            raise NotImplementedError(
+            "Currently depth first search isn't implemented for "
+            "%s graphs."%(graph._impl))
+        return getattr(algorithms, func)(
+               graph, source_node, operation, *args, **kwargs)
+    else:
+        from pydatastructs.graphs._backend.cpp import _graph
+        func = "dfs_tree_" + graph._impl
+        if not hasattr(_graph, func):
+            raise NotImplementedError(
+            "Currently depth first search isn't implemented for "
+            "%s graphs."%(graph._impl))
+        return getattr(_graph, func)(graph, source_node, operation, args)
 
 def _depth_first_search_adjacency_list(
     graph, source_node, operation, *args, **kwargs):
@@ -743,30 +1323,74 @@ def _depth_first_search_adjacency_list(
 
 _depth_first_search_adjacency_matrix = _depth_first_search_adjacency_list
 
-def shortest_paths(graph: Graph, algorithm: str,
-                   source: str, target: str="",
-                   **kwargs) -> tuple:
+def _depth_first_search_csr(
+    graph, source_node, operation, *args, **kwargs):
+    offsets, targets, names = graph.offsets(), graph.targets(), graph.vertices
+    source = graph._ids[source_node]
+    visited = bytearray(len(names))
+    visited[source] = True
+    dfs_stack = Stack([source])
+    while len(dfs_stack) != 0:
+        u = dfs_stack.pop()
+        lo, hi = offsets[u], offsets[u + 1]
+        if lo == hi:
+            status = operation(names[u], "", *args, **kwargs)
+            if not status:
+                return None
+            continue
+        for v in targets[lo:hi]:
+            if not visited[v]:
+                status = operation(names[u], names[v], *args, **kwargs)
+                if not status:
+                    return None
+                dfs_stack.append(v)
+                visited[v] = True
+
+def _depth_first_search_tree(offsets, targets, source):
+    V = len(offsets) - 1
+    parent, depth = array('q', [-1])*V, array('q', [-1])*V
+    parent[source], depth[source] = source, 0
+    visit_order, dfs_stack = array('q', [source]), Stack([source])
+    while len(dfs_stack) != 0:
+        u = dfs_stack.pop()
+        for v in targets[offsets[u]:offsets[u + 1]]:
+            if parent[v] == -1:
+                parent[v], depth[v] = u, depth[u] + 1
+                visit_order.append(v)
+                dfs_stack.append(v)
+    return visit_order, parent, depth
+
+def _depth_first_search_tree_adjacency_list(
+    graph, source_node, operation, *args, **kwargs):
+    import pydatastructs.graphs.algorithms as algorithms
+    offsets, targets, _ = \
+        getattr(algorithms, "_neighbor_arrays_" + graph._impl)(graph)
+    return _depth_first_search_tree(offsets, targets, graph._ids[source_node])
+
+_depth_first_search_tree_adjacency_matrix = _depth_first_search_tree_adjacency_list
+
+def _depth_first_search_tree_csr(
+    graph, source_node, operation, *args, **kwargs):
+    return _depth_first_search_tree(
+        graph.offsets(), graph.targets(), graph._ids[source_node])
+
+def iter_bfs(graph, source_node, **kwargs):
     """
-    Finds shortest paths in the given graph from a given source.
+    Lazily iterates over the vertices reachable from a source
+    in breadth first order.
 
     Parameters
     ==========
 
     graph: Graph
-        The graph under consideration.
-    algorithm: str
-        The algorithm to be used. Currently, the following algorithms
-        are implemented,
-
-        'bellman_ford' -> Bellman-Ford algorithm as given in [1]
-
-        'dijkstra' -> Dijkstra algorithm as given in [2].
-    source: str
-        The name of the source the node.
-    target: str
-        The name of the target node.
-        Optional, by default, all pair shortest paths
-        are returned.
+        The graph on which BFS is to be performed.
+    source_node: str
+        The name of the source node from where the BFS is
+        to be initiated.
+    batch_size: int
+        The number of vertices discovered by the C++ backend
+        each time it resumes the search.
+        Optional, by default, 1024.
     backend: pydatastructs.Backend
         The backend to be used.
         Optional, by default, the best available
@@ -775,51 +1399,297 @@ def shortest_paths(graph: Graph, algorithm: str,
     Returns
     =======
 
-    (distances, predecessors): (dict, dict)
-        If target is not provided and algorithm used
-        is 'bellman_ford'/'dijkstra'.
-    (distances[target], predecessors): (float, dict)
-        If target is provided and algorithm used is
-        'bellman_ford'/'dijkstra'.
+    iterator
+        An iterator over `(vertex, parent, depth)` tuples, where
+        `vertex` is the name of a reached vertex, `parent` is the
+        name of the vertex from which it was discovered, `None`
+        for the source, and `depth` is its number of edges from
+        the source. The search only advances as the iterator is
+        consumed, so it can simply be abandoned once enough
+        vertices have been seen.
+
+    Note
+    ====
+
+    The graph should not be modified while it is being
+    iterated over.
 
     Examples
     ========
 
-    >>> from pydatastructs import Graph, AdjacencyListGraphNode
-    >>> from pydatastructs import shortest_paths
+    >>> from pydatastructs import Graph, AdjacencyListGraphNode, iter_bfs
     >>> V1 = AdjacencyListGraphNode("V1")
     >>> V2 = AdjacencyListGraphNode("V2")
     >>> V3 = AdjacencyListGraphNode("V3")
     >>> G = Graph(V1, V2, V3)
-    >>> G.add_edge('V2', 'V3', 10)
-    >>> G.add_edge('V1', 'V2', 11)
-    >>> shortest_paths(G, 'bellman_ford', 'V1')
-    ({'V1': 0, 'V2': 11, 'V3': 21}, {'V1': None, 'V2': 'V1', 'V3': 'V2'})
-    >>> shortest_paths(G, 'dijkstra', 'V1')
-    ({'V2': 11, 'V3': 21, 'V1': 0}, {'V1': None, 'V2': 'V1', 'V3': 'V2'})
+    >>> G.add_edge(V1.name, V2.name)
+    >>> G.add_edge(V1.name, V3.name)
+    >>> for vertex, parent, depth in iter_bfs(G, V1.name):
+    ...     print(vertex, parent, depth)
+    V1 None 0
+    V2 V1 1
+    V3 V1 1
+    """
+    return _iter_search(graph, source_node, "bfs", **kwargs)
 
-    References
+def iter_dfs(graph, source_node, **kwargs):
+    """
+    Lazily iterates over the vertices reachable from a source
+    in depth first preorder.
+
+    Parameters
     ==========
 
-    .. [1] https://en.wikipedia.org/wiki/Bellman%E2%80%93Ford_algorithm
-    .. [2] https://en.wikipedia.org/wiki/Dijkstra%27s_algorithm
-    """
-    backend = kwargs.get('backend', Backend.PYTHON)
-    if (backend == Backend.PYTHON):
-        import pydatastructs.graphs.algorithms as algorithms
-        func = "_" + algorithm + "_" + graph._impl
-        if not hasattr(algorithms, func):
-            raise NotImplementedError(
-            "Currently %s algorithm isn't implemented for "
-            "finding shortest paths in graphs."%(algorithm))
-        return getattr(algorithms, func)(graph, source, target)
-    else:
-        from pydatastructs.graphs._backend.cpp._graph import shortest_paths_dijkstra_adjacency_list
-        if graph._impl == "adjacency_list" and algorithm == 'dijkstra':
-            return shortest_paths_dijkstra_adjacency_list(graph, source, target)
+    graph: Graph
+        The graph on which DFS is to be performed.
+    source_node: str
+        The name of the source node from where the DFS is
+        to be initiated.
+    batch_size: int
+        The number of vertices discovered by the C++ backend
+        each time it resumes the search.
+        Optional, by default, 1024.
+    backend: pydatastructs.Backend
+        The backend to be used.
+        Optional, by default, the best available
+        backend is used.
 
-def _bellman_ford_adjacency_list(graph: Graph, source: str, target: str) -> tuple:
-    distances, predecessor, visited, cnts = {}, {}, {}, {}
+    Returns
+    =======
+
+    iterator
+        An iterator over `(vertex, parent, depth)` tuples, see
+        `iter_bfs`. Here, `depth` is the depth of `vertex` in
+        the depth first search tree. Only the current path is
+        kept on the stack, unlike `depth_first_search`.
+
+    Note
+    ====
+
+    The graph should not be modified while it is being
+    iterated over.
+
+    Examples
+    ========
+
+    >>> from pydatastructs import Graph, AdjacencyListGraphNode, iter_dfs
+    >>> V1 = AdjacencyListGraphNode("V1")
+    >>> V2 = AdjacencyListGraphNode("V2")
+    >>> V3 = AdjacencyListGraphNode("V3")
+    >>> G = Graph(V1, V2, V3)
+    >>> G.add_edge(V1.name, V2.name)
+    >>> G.add_edge(V2.name, V3.name)
+    >>> [vertex for vertex, parent, depth in iter_dfs(G, V1.name)]
+    ['V1', 'V2', 'V3']
+    """
+    return _iter_search(graph, source_node, "dfs", **kwargs)
+
+def _iter_search(graph, source_node, search, **kwargs):
+    backend = kwargs.get('backend', Backend.PYTHON)
+    if backend == Backend.PYTHON:
+        import pydatastructs.graphs.algorithms as algorithms
+        func = "_adjacent_" + graph._impl
+        if not hasattr(algorithms, func):
+            raise NotImplementedError(
+            "Currently %s isn't implemented for %s graphs."
+            %("iter_" + search, graph._impl))
+        if source_node not in graph._ids:
+            raise KeyError("Vertex %s is not present in the graph"
+                           %(source_node))
+        return getattr(algorithms, "_iter_" + search)(
+            source_node, getattr(algorithms, func)(graph))
+    else:
+        from pydatastructs.graphs._backend.cpp import _graph
+        func = search + "_iterator_" + graph._impl
+        if not hasattr(_graph, func):
+            raise NotImplementedError(
+            "Currently %s isn't implemented for %s graphs."
+            %("iter_" + search, graph._impl))
+        return getattr(_graph, func)(
+            graph, source_node, kwargs.get('batch_size', 1024))
+
+def _adjacent_adjacency_list(graph):
+    return lambda name: graph.__getattribute__(name).adjacent
+
+def _adjacent_adjacency_matrix(graph):
+    matrix = graph.matrix
+    return lambda name: [v for v, presence in matrix[name].items() if presence]
+
+def _adjacent_csr(graph):
+    offsets, targets, names = graph.offsets(), graph.targets(), graph.vertices
+    ids = graph._ids
+    def adjacent(name):
+        u = ids[name]
+        return [names[v] for v in targets[offsets[u]:offsets[u + 1]]]
+    return adjacent
+
+def _iter_bfs(source_node, adjacent):
+    visited = {source_node}
+    yield source_node, None, 0
+    bfs_queue = Queue([(source_node, 0)])
+    while len(bfs_queue) != 0:
+        curr_node, depth = bfs_queue.popleft()
+        for next_node in adjacent(curr_node):
+            if next_node not in visited:
+                visited.add(next_node)
+                yield next_node, curr_node, depth + 1
+                bfs_queue.append((next_node, depth + 1))
+
+def _iter_dfs(source_node, adjacent):
+    visited = {source_node}
+    yield source_node, None, 0
+    dfs_stack = [(source_node, iter(adjacent(source_node)))]
+    while len(dfs_stack) != 0:
+        curr_node, next_nodes = dfs_stack[-1]
+        for next_node in next_nodes:
+            if next_node not in visited:
+                visited.add(next_node)
+                yield next_node, curr_node, len(dfs_stack)
+                dfs_stack.append((next_node, iter(adjacent(next_node))))
+                break
+        else:
+            dfs_stack.pop()
+
+def shortest_paths(graph: Graph, algorithm: str,
+                   source: str, target: str="",
+                   **kwargs) -> tuple:
+    """
+    Finds shortest paths in the given graph from a given source.
+
+    Parameters
+    ==========
+
+    graph: Graph
+        The graph under consideration.
+    algorithm: str
+        The algorithm to be used. Currently, the following algorithms
+        are implemented,
+
+        'bellman_ford' -> Bellman-Ford algorithm as given in [1]
+
+        'dijkstra' -> Dijkstra algorithm as given in [2].
+
+        'bidirectional_dijkstra' -> Bidirectional Dijkstra algorithm
+        as given in [3]. Requires target.
+
+        'a_star' -> A* search algorithm as given in [4].
+        Requires target.
+
+        'delta_stepping' -> Delta-stepping algorithm as given in [5].
+        Vertices are kept in buckets of width delta by tentative
+        distance and the edges of each bucket are relaxed in
+        parallel, first the light ones, shorter than delta, until
+        the bucket stops changing, and then the heavy ones.
+    source: str
+        The name of the source the node.
+    target: str
+        The name of the target node.
+        Optional, by default, all pair shortest paths
+        are returned.
+    heuristic: function
+        Used by 'a_star'. Called as ``heuristic(v, target)`` to get
+        a lower bound on the distance from vertex ``v`` to the target.
+        Optional, if coordinates are given.
+    coordinates: dict
+        Used by 'a_star' when heuristic isn't given. Maps each vertex
+        name to a sequence of numbers, and the heuristic becomes the
+        euclidean distance between the coordinates of a vertex and
+        of the target. The weights of the edges should not be shorter
+        than the distances between their end points.
+    num_threads: int
+        Used by 'delta_stepping'. The number of threads relaxing
+        the edges of a bucket.
+        Optional, by default, 1.
+    delta: float
+        Used by 'delta_stepping'. The width of the buckets.
+        Optional, by default, the largest edge weight divided by
+        the average out degree.
+    backend: pydatastructs.Backend
+        The backend to be used.
+        Optional, by default, the best available
+        backend is used.
+
+    Returns
+    =======
+
+    (distances, predecessors): (dict, dict)
+        If target is not provided and algorithm used
+        is 'bellman_ford'/'dijkstra'.
+    (distances[target], predecessors): (float, dict)
+        If target is provided. For 'bidirectional_dijkstra' and
+        'a_star', which stop as soon as the shortest path to target
+        is known, only the predecessors along that path are
+        guaranteed to be set.
+
+    Examples
+    ========
+
+    >>> from pydatastructs import Graph, AdjacencyListGraphNode
+    >>> from pydatastructs import shortest_paths
+    >>> V1 = AdjacencyListGraphNode("V1")
+    >>> V2 = AdjacencyListGraphNode("V2")
+    >>> V3 = AdjacencyListGraphNode("V3")
+    >>> G = Graph(V1, V2, V3)
+    >>> G.add_edge('V2', 'V3', 10)
+    >>> G.add_edge('V1', 'V2', 11)
+    >>> shortest_paths(G, 'bellman_ford', 'V1')
+    ({'V1': 0, 'V2': 11, 'V3': 21}, {'V1': None, 'V2': 'V1', 'V3': 'V2'})
+    >>> shortest_paths(G, 'dijkstra', 'V1')
+    ({'V1': 0, 'V2': 11, 'V3': 21}, {'V1': None, 'V2': 'V1', 'V3': 'V2'})
+    >>> shortest_paths(G, 'bidirectional_dijkstra', 'V1', 'V3')
+    (21, {'V1': None, 'V2': 'V1', 'V3': 'V2'})
+    >>> shortest_paths(G, 'a_star', 'V1', 'V3', heuristic=lambda v, t: 0)
+    (21, {'V1': None, 'V2': 'V1', 'V3': 'V2'})
+    >>> shortest_paths(G, 'delta_stepping', 'V1', num_threads=2)
+    ({'V1': 0, 'V2': 11, 'V3': 21}, {'V1': None, 'V2': 'V1', 'V3': 'V2'})
+
+    References
+    ==========
+
+    .. [1] https://en.wikipedia.org/wiki/Bellman%E2%80%93Ford_algorithm
+    .. [2] https://en.wikipedia.org/wiki/Dijkstra%27s_algorithm
+    .. [3] https://en.wikipedia.org/wiki/Bidirectional_search
+    .. [4] https://en.wikipedia.org/wiki/A*_search_algorithm
+    .. [5] https://doi.org/10.1016/S0196-6774(03)00076-2
+    """
+    backend = kwargs.get('backend', Backend.PYTHON)
+    if (backend == Backend.PYTHON):
+        import pydatastructs.graphs.algorithms as algorithms
+        func = "_" + algorithm + "_" + graph._impl
+        if not hasattr(algorithms, func):
+            raise NotImplementedError(
+            "Currently %s algorithm isn't implemented for "
+            "finding shortest paths in graphs."%(algorithm))
+        if algorithm == 'a_star':
+            # The heuristic and the coordinates can't be compared
+            # between calls, so the results aren't memoized.
+            return getattr(algorithms, func)(graph, source, target,
+                kwargs.get('heuristic', None), kwargs.get('coordinates', None))
+        if algorithm == 'delta_stepping':
+            num_threads, delta = kwargs.get('num_threads', 1), kwargs.get('delta', None)
+            return _cached(graph, (algorithm, str(source), str(target),
+                                   num_threads, delta),
+                lambda: getattr(algorithms, func)(graph, source, target,
+                                                  num_threads, delta))
+        return _cached(graph, (algorithm, str(source), str(target)),
+            lambda: getattr(algorithms, func)(graph, source, target))
+    else:
+        from pydatastructs.graphs._backend.cpp import _graph
+        func = "shortest_paths_" + algorithm + "_" + graph._impl
+        if not hasattr(_graph, func):
+            raise NotImplementedError(
+            "Currently %s algorithm isn't implemented for "
+            "finding shortest paths in graphs."%(algorithm))
+        if algorithm == 'a_star':
+            return getattr(_graph, func)(graph, source, target,
+                kwargs.get('heuristic', None), kwargs.get('coordinates', None))
+        if algorithm == 'delta_stepping':
+            return getattr(_graph, func)(graph, source, target,
+                kwargs.get('num_threads', 1), kwargs.get('delta', None))
+        return getattr(_graph, func)(graph, source, target)
+
+def _bellman_ford_adjacency_list(graph: Graph, source: str, target: str) -> tuple:
+    distances, predecessor, visited, cnts = {}, {}, {}, {}
 
     for v in graph.vertices:
         distances[v] = float('inf')
@@ -830,16 +1700,18 @@ def _bellman_ford_adjacency_list(graph: Graph, source: str, target: str) -> tupl
     verticy_num = len(graph.vertices)
 
     que = Queue([source])
+    ids, edges = graph._ids, graph._edges
 
     while que:
         u = que.popleft()
         visited[u] = False
         neighbors = graph.neighbors(u)
+        u_key = ids[u] << 32
         for neighbor in neighbors:
             v = neighbor.name
-            edge_str = u + '_' + v
-            if distances[u] != float('inf') and distances[u] + graph.edge_weights[edge_str].value < distances[v]:
-                distances[v] = distances[u] + graph.edge_weights[edge_str].value
+            w = edges[u_key | ids[v]].value
+            if distances[u] != float('inf') and distances[u] + w < distances[v]:
+                distances[v] = distances[u] + w
                 predecessor[v] = u
                 cnts[v] = cnts[u] + 1
                 if cnts[v] >= verticy_num:
@@ -854,28 +1726,67 @@ def _bellman_ford_adjacency_list(graph: Graph, source: str, target: str) -> tupl
 
 _bellman_ford_adjacency_matrix = _bellman_ford_adjacency_list
 
+def _bellman_ford_csr(graph: Graph, source: str, target: str) -> tuple:
+    offsets, targets, weights = graph.offsets(), graph.targets(), graph.weights()
+    names = graph.vertices
+    V = len(names)
+    distances, predecessor = [float('inf')]*V, [-1]*V
+    queued, cnts = bytearray(V), [0]*V
+    s = graph._ids[source]
+    distances[s] = 0
+
+    que = Queue([s])
+    while que:
+        u = que.popleft()
+        queued[u] = False
+        for i in range(offsets[u], offsets[u + 1]):
+            v, w = targets[i], weights[i]
+            if isnan(w) or distances[u] + w >= distances[v]:
+                continue
+            distances[v] = distances[u] + w
+            predecessor[v] = u
+            cnts[v] = cnts[u] + 1
+            if cnts[v] >= V:
+                raise ValueError("Graph contains a negative weight cycle.")
+            if not queued[v]:
+                que.append(v)
+                queued[v] = True
+
+    return _shortest_paths_result_csr(graph, distances, predecessor, target)
+
+def _shortest_paths_result_csr(graph, distances, predecessor, target):
+    names = graph.vertices
+    pred = {names[v]: (names[p] if p != -1 else None)
+            for v, p in enumerate(predecessor)}
+    if target != "":
+        return (distances[graph._ids[target]], pred)
+    return (dict(zip(names, distances)), pred)
+
 def _dijkstra_adjacency_list(graph: Graph, start: str, target: str):
-    V = len(graph.vertices)
-    visited, dist, pred = {}, {}, {}
+    dist, pred = {}, {}
     for v in graph.vertices:
-        visited[v] = False
+        dist[v] = float('inf')
         pred[v] = None
-        if v != start:
-            dist[v] = float('inf')
     dist[start] = 0
-    pq = PriorityQueue(implementation='binomial_heap')
-    for vertex in dist:
-        pq.push(vertex, dist[vertex])
-    for _ in range(V):
-        u = pq.pop()
-        visited[u] = True
-        for v in graph.vertices:
-            edge_str = u + '_' + v
-            if (edge_str in graph.edge_weights and graph.edge_weights[edge_str].value >= 0 and
-                visited[v] is False and dist[v] > dist[u] + graph.edge_weights[edge_str].value):
-                dist[v] = dist[u] + graph.edge_weights[edge_str].value
+    ids, edges = graph._ids, graph._edges
+    pq = [(0, start)]
+    while pq:
+        d, u = heappop(pq)
+        if d > dist[u]:
+            continue
+        if u == target:
+            break
+        u_key = ids[u] << 32
+        for v_node in graph.neighbors(u):
+            v = v_node.name
+            edge = edges.get(u_key | ids[v], None)
+            if edge is None or edge.value < 0:
+                continue
+            d_v = d + edge.value
+            if d_v < dist[v]:
+                dist[v] = d_v
                 pred[v] = u
-                pq.push(v, dist[v])
+                heappush(pq, (d_v, v))
 
     if target != "":
         return (dist[target], pred)
@@ -883,6 +1794,274 @@ def _dijkstra_adjacency_list(graph: Graph, start: str, target: str):
 
 _dijkstra_adjacency_matrix = _dijkstra_adjacency_list
 
+def _dijkstra_csr(graph: Graph, start: str, target: str):
+    offsets, targets, weights = graph.offsets(), graph.targets(), graph.weights()
+    names = graph.vertices
+    V = len(names)
+    dist, pred = [float('inf')]*V, [-1]*V
+    s = graph._ids[start]
+    t = graph._ids[target] if target != "" else -1
+    dist[s] = 0
+    pq = [(0, s)]
+    while pq:
+        d, u = heappop(pq)
+        if d > dist[u]:
+            continue
+        if u == t:
+            break
+        for i in range(offsets[u], offsets[u + 1]):
+            v, w = targets[i], weights[i]
+            if w >= 0 and d + w < dist[v]:
+                dist[v] = d + w
+                pred[v] = u
+                heappush(pq, (dist[v], v))
+
+    return _shortest_paths_result_csr(graph, dist, pred, target)
+
+def _delta_stepping_requests(chunk, offsets, targets, weights, dist, delta, light):
+    requests = []
+    for u in chunk:
+        d = dist[u]
+        for i in range(offsets[u], offsets[u + 1]):
+            w = weights[i]
+            if w >= 0 and (w <= delta) == light:
+                v = targets[i]
+                if d + w < dist[v]:
+                    requests.append((v, d + w, u))
+    return requests
+
+def _delta_stepping(offsets, targets, weights, source, target,
+                    num_threads, delta):
+    V = len(offsets) - 1
+    if delta is not None and not delta > 0:
+        raise ValueError("delta must be positive.")
+    if delta is None:
+        max_weight = max((w for w in weights if w >= 0), default=0)
+        delta = max_weight * V / max(len(targets), 1) or 1
+    dist, pred = [float('inf')]*V, [-1]*V
+    dist[source] = 0
+    buckets, order = {0: [source]}, [0]
+
+    def relax(Executor, vertices, light):
+        size = max(-(-len(vertices) // num_threads), 1)
+        futures = [Executor.submit(
+                   _delta_stepping_requests, vertices[k:k + size],
+                   offsets, targets, weights, dist, delta, light)
+                   for k in range(0, len(vertices), size)]
+        improved = []
+        for future in futures:
+            for v, d, u in future.result():
+                if d < dist[v]:
+                    dist[v], pred[v] = d, u
+                    improved.append(v)
+        return improved
+
+    def insert(v):
+        b = int(dist[v] // delta)
+        if b not in buckets:
+            buckets[b] = []
+            heappush(order, b)
+        buckets[b].append(v)
+
+    with ThreadPoolExecutor(max_workers=num_threads) as Executor:
+        while order:
+            i = heappop(order)
+            if target != -1 and dist[target] < i*delta:
+                break
+            settled, frontier = {}, buckets.pop(i)
+            while frontier:
+                frontier = [v for v in dict.fromkeys(frontier)
+                            if dist[v] // delta == i]
+                settled.update(dict.fromkeys(frontier))
+                improved, frontier = relax(Executor, frontier, True), []
+                for v in improved:
+                    if dist[v] // delta == i:
+                        frontier.append(v)
+                    else:
+                        insert(v)
+            for v in relax(Executor, list(settled), False):
+                insert(v)
+    return dist, pred
+
+def _weighted_arrays(graph):
+    """
+    Returns the offsets, targets and weights of the weighted edges
+    of the graph grouped by vertex number, as in the CSR
+    implementation, along with the names of the vertices by number.
+    """
+    size = getattr(graph, '_next_id', len(graph.vertices))
+    names, rows = [None]*size, [[] for _ in range(size)]
+    for name, u in graph._ids.items():
+        names[u] = name
+    for key, edge in graph._edges.items():
+        rows[key >> 32].append((key & 0xffffffff, edge.value))
+    offsets, targets, weights = array('q', [0]), array('q'), []
+    for row in rows:
+        for v, w in row:
+            targets.append(v)
+            weights.append(w)
+        offsets.append(len(targets))
+    return offsets, targets, weights, names
+
+def _delta_stepping_adjacency_list(graph: Graph, source: str, target: str,
+                                   num_threads: int, delta: float):
+    offsets, targets, weights, names = _weighted_arrays(graph)
+    ids = graph._ids
+    dist, pred = _delta_stepping(
+        offsets, targets, weights, ids[source],
+        ids[target] if target != "" else -1, num_threads, delta)
+    pred = {v: (names[pred[u]] if pred[u] != -1 else None)
+            for v, u in ids.items()}
+    if target != "":
+        return (dist[ids[target]], pred)
+    return ({v: dist[u] for v, u in ids.items()}, pred)
+
+_delta_stepping_adjacency_matrix = _delta_stepping_adjacency_list
+
+def _delta_stepping_csr(graph: Graph, source: str, target: str,
+                        num_threads: int, delta: float):
+    ids = graph._ids
+    dist, pred = _delta_stepping(
+        graph.offsets(), graph.targets(), graph.weights(), ids[source],
+        ids[target] if target != "" else -1, num_threads, delta)
+    return _shortest_paths_result_csr(graph, dist, pred, target)
+
+def _weighted_neighbors(graph):
+    """
+    Returns a function listing the (neighbor, weight) pairs of a
+    vertex along the edges of graph having non-negative weights.
+    """
+    ids, edges = graph._ids, graph._edges
+
+    def neighbors(u):
+        u_key = ids[u] << 32
+        for v_node in graph.neighbors(u):
+            edge = edges.get(u_key | ids[v_node.name], None)
+            if edge is not None and edge.value >= 0:
+                yield v_node.name, edge.value
+    return neighbors
+
+def _bidirectional_dijkstra(source, target, forward, backward):
+    dist, pred = [{source: 0}, {target: 0}], [{}, {}]
+    pqs, expand = [[(0, source)], [(0, target)]], [forward, backward]
+    best, meet = (0, source) if source == target else (float('inf'), None)
+    while pqs[0] and pqs[1]:
+        if pqs[0][0][0] + pqs[1][0][0] >= best:
+            break
+        side = 0 if pqs[0][0][0] <= pqs[1][0][0] else 1
+        d, u = heappop(pqs[side])
+        if d > dist[side][u]:
+            continue
+        for v, w in expand[side](u):
+            d_v = d + w
+            if d_v < dist[side].get(v, float('inf')):
+                dist[side][v] = d_v
+                pred[side][v] = u
+                heappush(pqs[side], (d_v, v))
+            d_v += dist[1 - side].get(v, float('inf'))
+            if d_v < best:
+                best, meet = d_v, v
+
+    path_pred = {}
+    v = meet
+    while v in pred[0]:
+        path_pred[v] = pred[0][v]
+        v = pred[0][v]
+    v = meet
+    while v in pred[1]:
+        path_pred[pred[1][v]] = v
+        v = pred[1][v]
+    return best, path_pred
+
+def _a_star(source, target, forward, heuristic):
+    dist, pred = {source: 0}, {}
+    pq = [(heuristic(source), 0, source)]
+    while pq:
+        _, d, u = heappop(pq)
+        if d > dist[u]:
+            continue
+        if u == target:
+            return d, pred
+        for v, w in forward(u):
+            d_v = d + w
+            if d_v < dist.get(v, float('inf')):
+                dist[v] = d_v
+                pred[v] = u
+                heappush(pq, (d_v + heuristic(v), d_v, v))
+    return float('inf'), pred
+
+def _a_star_heuristic(target, heuristic, coordinates):
+    if heuristic is not None:
+        return lambda v: heuristic(v, target)
+    if coordinates is None:
+        raise ValueError("a_star requires either a heuristic or coordinates.")
+    goal = coordinates[target]
+    return lambda v: sqrt(sum((x - y)**2 for x, y in zip(coordinates[v], goal)))
+
+def _point_to_point_result(vertices, distance, path_pred):
+    pred = {v: None for v in vertices}
+    pred.update(path_pred)
+    return (distance, pred)
+
+def _bidirectional_dijkstra_adjacency_list(graph: Graph, source: str, target: str):
+    if target == "":
+        raise ValueError("bidirectional_dijkstra requires a target.")
+    reverse = {}
+    for edge in graph._edges.values():
+        if edge.value >= 0:
+            reverse.setdefault(edge.target.name, []).append(
+                (edge.source.name, edge.value))
+    distance, path_pred = _bidirectional_dijkstra(source, target,
+        _weighted_neighbors(graph), lambda v: reverse.get(v, ()))
+    return _point_to_point_result(graph.vertices, distance, path_pred)
+
+_bidirectional_dijkstra_adjacency_matrix = _bidirectional_dijkstra_adjacency_list
+
+def _a_star_adjacency_list(graph: Graph, source: str, target: str,
+                           heuristic=None, coordinates=None):
+    if target == "":
+        raise ValueError("a_star requires a target.")
+    distance, path_pred = _a_star(source, target, _weighted_neighbors(graph),
+        _a_star_heuristic(target, heuristic, coordinates))
+    return _point_to_point_result(graph.vertices, distance, path_pred)
+
+_a_star_adjacency_matrix = _a_star_adjacency_list
+
+def _weighted_neighbors_csr(offsets, targets, weights):
+    def neighbors(u):
+        for i in range(offsets[u], offsets[u + 1]):
+            if weights[i] >= 0:
+                yield targets[i], weights[i]
+    return neighbors
+
+def _bidirectional_dijkstra_csr(graph: Graph, source: str, target: str):
+    if target == "":
+        raise ValueError("bidirectional_dijkstra requires a target.")
+    offsets, targets, weights = graph.offsets(), graph.targets(), graph.weights()
+    names, ids = graph.vertices, graph._ids
+    reverse = [[] for _ in names]
+    for u in range(len(names)):
+        for i in range(offsets[u], offsets[u + 1]):
+            if weights[i] >= 0:
+                reverse[targets[i]].append((u, weights[i]))
+    distance, path_pred = _bidirectional_dijkstra(ids[source], ids[target],
+        _weighted_neighbors_csr(offsets, targets, weights), reverse.__getitem__)
+    return _point_to_point_result(names, distance,
+        {names[v]: names[u] for v, u in path_pred.items()})
+
+def _a_star_csr(graph: Graph, source: str, target: str,
+                heuristic=None, coordinates=None):
+    if target == "":
+        raise ValueError("a_star requires a target.")
+    offsets, targets, weights = graph.offsets(), graph.targets(), graph.weights()
+    names, ids = graph.vertices, graph._ids
+    estimate = _a_star_heuristic(target, heuristic, coordinates)
+    distance, path_pred = _a_star(ids[source], ids[target],
+        _weighted_neighbors_csr(offsets, targets, weights),
+        lambda v: estimate(names[v]))
+    return _point_to_point_result(names, distance,
+        {names[v]: names[u] for v, u in path_pred.items()})
+
 def all_pair_shortest_paths(graph: Graph, algorithm: str,
                             **kwargs) -> tuple:
     """
@@ -899,6 +2078,20 @@ def all_pair_shortest_paths(graph: Graph, algorithm: str,
 
         'floyd_warshall' -> Floyd Warshall algorithm as given in [1].
         'johnson' -> Johnson's Algorithm as given in [2]
+    matrix: bool
+        If `True`, the distances and predecessors are returned
+        as matrices, see below.
+        Optional, by default, `False`.
+    num_workers: int
+        The number of processes, or threads with the C++
+        backend, among which the sources are divided by
+        'johnson'.
+        Optional, by default, 1.
+    stream: bool
+        If `True`, 'johnson' returns an iterator over the rows
+        of the result, see below, computing them a few at a
+        time instead of holding all of them in memory.
+        Optional, by default, `False`.
     backend: pydatastructs.Backend
         The backend to be used.
         Optional, by default, the best available
@@ -908,6 +2101,35 @@ def all_pair_shortest_paths(graph: Graph, algorithm: str,
     =======
 
     (distances, predecessors): (dict, dict)
+        `distances[u][v]` is the length of a shortest path from
+        `u` to `v` and `predecessors[u][v]` is the vertex before
+        `v` on it, for every `v` reachable from `u`.
+    (distances, predecessors): (array, array)
+        If `matrix` is `True`. Vertices are numbered in the
+        order in which they were added to the graph and both
+        are V x V matrices of those numbers stored row by row,
+        with `inf` distances and `-1` predecessors for pairs
+        which are not connected.
+    rows: iterator
+        If `stream` is `True`. Yields `(u, distances[u],
+        predecessors[u])` for every vertex `u` in order, the
+        rows being arrays and `u` the number of the vertex
+        if `matrix` is `True`.
+
+    Note
+    ====
+
+    'floyd_warshall' runs over dense float64 matrices. With
+    the Python backend, each iteration of the outermost loop
+    is performed as a whole matrix operation if NumPy is
+    installed and with the C++ backend, the matrices are
+    processed in cache sized tiles.
+
+    'johnson' leaves the graph unchanged. It reweights a
+    copy of its edges and runs Dijkstra algorithm from every
+    vertex over it, in separate processes if `num_workers`
+    is greater than 1 with the Python backend and in native
+    threads with the C++ backend.
 
     Examples
     ========
@@ -923,9 +2145,17 @@ def all_pair_shortest_paths(graph: Graph, algorithm: str,
     >>> G.add_edge('V3', 'V1', 5)
     >>> dist, _ = all_pair_shortest_paths(G, 'floyd_warshall')
     >>> dist['V1']['V3']
-    21
+    21.0
     >>> dist['V3']['V1']
-    5
+    5.0
+    >>> dist, pred = all_pair_shortest_paths(G, 'floyd_warshall', matrix=True)
+    >>> list(dist[0:3]), list(pred[0:3])
+    ([0.0, 11.0, 21.0], [0, 0, 1])
+    >>> for u, dist, pred in all_pair_shortest_paths(G, 'johnson', stream=True):
+    ...     print(u, dist['V1'], pred['V1'])
+    V1 0.0 V1
+    V2 15.0 V3
+    V3 5.0 V3
 
     References
     ==========
@@ -933,91 +2163,257 @@ def all_pair_shortest_paths(graph: Graph, algorithm: str,
     .. [1] https://en.wikipedia.org/wiki/Floyd%E2%80%93Warshall_algorithm
     .. [2] https://en.wikipedia.org/wiki/Johnson's_algorithm
     """
-    raise_if_backend_is_not_python(
-        all_pair_shortest_paths, kwargs.get('backend', Backend.PYTHON))
-    import pydatastructs.graphs.algorithms as algorithms
-    func = "_" + algorithm + "_" + graph._impl
-    if not hasattr(algorithms, func):
-        raise NotImplementedError(
-        "Currently %s algorithm isn't implemented for "
-        "finding shortest paths in graphs."%(algorithm))
-    return getattr(algorithms, func)(graph)
-
-def _floyd_warshall_adjacency_list(graph: Graph):
-    dist, next_vertex = {}, {}
-    V, E = graph.vertices, graph.edge_weights
+    backend = kwargs.get('backend', Backend.PYTHON)
+    matrix = kwargs.get('matrix', False)
+    if backend == Backend.PYTHON:
+        import pydatastructs.graphs.algorithms as algorithms
+        func = "_" + algorithm + "_" + graph._impl
+        if not hasattr(algorithms, func):
+            raise NotImplementedError(
+            "Currently %s algorithm isn't implemented for "
+            "finding shortest paths in graphs."%(algorithm))
+        if algorithm == 'johnson':
+            rows = getattr(algorithms, func)(graph, matrix,
+                                             kwargs.get('num_workers', 1))
+        else:
+            return getattr(algorithms, func)(graph, matrix)
+    else:
+        from pydatastructs.graphs._backend.cpp import _graph
+        func = "all_pair_shortest_paths_" + algorithm + "_" + graph._impl
+        if not hasattr(_graph, func):
+            raise NotImplementedError(
+            "Currently %s algorithm isn't implemented for "
+            "finding shortest paths in graphs."%(algorithm))
+        if algorithm == 'johnson':
+            rows = getattr(_graph, func)(graph, matrix,
+                                         kwargs.get('num_workers', 1))
+        else:
+            return getattr(_graph, func)(graph, matrix)
+    if kwargs.get('stream', False):
+        return rows
+    return _all_pair_shortest_paths_rows(rows, matrix)
+
+def _floyd_warshall_rows(dist, pred):
+    inf = float('inf')
+    for k, (dist_k, pred_k) in enumerate(zip(dist, pred)):
+        through_k = [(j, d) for j, d in enumerate(dist_k) if d != inf]
+        for dist_i, pred_i in zip(dist, pred):
+            d_ik = dist_i[k]
+            if d_ik == inf:
+                continue
+            for j, d_kj in through_k:
+                if d_ik + d_kj < dist_i[j]:
+                    dist_i[j] = d_ik + d_kj
+                    pred_i[j] = pred_k[j]
+    return (array('d', [d for row in dist for d in row]),
+            array('q', [p for row in pred for p in row]))
+
+def _floyd_warshall_numpy(numpy, dist, pred):
+    dist = numpy.array(dist, dtype=numpy.float64)
+    pred = numpy.array(pred, dtype=numpy.int64)
+    through_k = numpy.empty_like(dist)
+    shorter = numpy.empty(dist.shape, dtype=bool)
+    for k in range(len(dist)):
+        numpy.add(dist[:, k, None], dist[k], out=through_k)
+        numpy.less(through_k, dist, out=shorter)
+        numpy.copyto(dist, through_k, where=shorter)
+        numpy.copyto(pred, pred[k].copy(), where=shorter)
+    return array('d', dist.tobytes()), array('q', pred.tobytes())
+
+def _floyd_warshall(offsets, targets, weights, names, matrix):
+    """
+    Floyd Warshall algorithm over dense distance and predecessor
+    matrices indexed by vertex number, given the edges grouped by
+    vertex as in the CSR implementation and the names of the
+    vertices by number, None for removed ones. If NumPy is
+    installed, the matrices are updated through each vertex as
+    whole, otherwise row by row skipping unreachable pairs.
+    """
+    V, inf = len(names), float('inf')
+    dist = [[inf]*V for _ in range(V)]
+    pred = [[-1]*V for _ in range(V)]
+    for u in range(V):
+        if names[u] is not None:
+            dist[u][u], pred[u][u] = 0.0, u
+        for i in range(offsets[u], offsets[u + 1]):
+            v, w = targets[i], weights[i]
+            if w is not None and w < dist[u][v]:
+                dist[u][v], pred[u][v] = float(w), u
+
+    try:
+        import numpy
+    except ImportError:
+        numpy = None
+    if numpy is None or V == 0:
+        dist, pred = _floyd_warshall_rows(dist, pred)
+    else:
+        dist, pred = _floyd_warshall_numpy(numpy, dist, pred)
+
+    if any(dist[u*V + u] < 0 for u in range(V)):
+        raise ValueError("Graph contains a negative weight cycle.")
+    if matrix:
+        return (dist, pred)
+    dist_dict, pred_dict = {}, {}
+    for u, name in enumerate(names):
+        if name is None:
+            continue
+        dist_row = dist_dict[name] = {}
+        pred_row = pred_dict[name] = {}
+        for v in range(V):
+            d = dist[u*V + v]
+            if d != inf:
+                dist_row[names[v]] = d
+                pred_row[names[v]] = names[pred[u*V + v]]
+    return (dist_dict, pred_dict)
+
+def _floyd_warshall_adjacency_list(graph: Graph, matrix: bool):
+    offsets, targets, weights, names = _weighted_arrays(graph)
+    return _floyd_warshall(offsets, targets, weights, names, matrix)
 
-    for v in V:
-        dist[v] = {}
-        next_vertex[v] = {}
+_floyd_warshall_adjacency_matrix = _floyd_warshall_adjacency_list
 
-    for name, edge in E.items():
-        dist[edge.source.name][edge.target.name] = edge.value
-        next_vertex[edge.source.name][edge.target.name] = edge.source.name
+def _floyd_warshall_csr(graph: Graph, matrix: bool):
+    return _floyd_warshall(graph.offsets(), graph.targets(),
+                           graph.weights(), graph.vertices, matrix)
 
-    for v in V:
-        dist[v][v] = 0
-        next_vertex[v][v] = v
+def _johnson_snapshot(offsets, targets, weights):
+    """
+    Returns the offsets, targets and weights of the weighted edges
+    among the given ones, the latter made non-negative using the
+    potentials of the vertices found by Bellman Ford algorithm from
+    a virtual vertex joined to all of them, along with the potentials.
+    """
+    V = len(offsets) - 1
+    snapshot_offsets, snapshot_targets, snapshot_weights = [0], [], []
+    for u in range(V):
+        for i in range(offsets[u], offsets[u + 1]):
+            w = weights[i]
+            if w is not None and not isnan(w):
+                snapshot_targets.append(targets[i])
+                snapshot_weights.append(w)
+        snapshot_offsets.append(len(snapshot_targets))
+
+    potentials = [0]*V
+    for _ in range(V + 1):
+        changed = False
+        for u in range(V):
+            h_u = potentials[u]
+            for i in range(snapshot_offsets[u], snapshot_offsets[u + 1]):
+                v = snapshot_targets[i]
+                if h_u + snapshot_weights[i] < potentials[v]:
+                    potentials[v] = h_u + snapshot_weights[i]
+                    changed = True
+        if not changed:
+            break
+    else:
+        raise ValueError("Graph contains a negative weight cycle.")
 
-    for k in V:
-        for i in V:
-            for j in V:
-                dist_i_j = dist.get(i, {}).get(j, float('inf'))
-                dist_i_k = dist.get(i, {}).get(k, float('inf'))
-                dist_k_j = dist.get(k, {}).get(j, float('inf'))
-                next_i_k = next_vertex.get(i + '_' + k, None)
-                if dist_i_j > dist_i_k + dist_k_j:
-                    dist[i][j] = dist_i_k + dist_k_j
-                    next_vertex[i][j] = next_i_k
+    for u in range(V):
+        for i in range(snapshot_offsets[u], snapshot_offsets[u + 1]):
+            snapshot_weights[i] = max(snapshot_weights[i] + potentials[u] -
+                                      potentials[snapshot_targets[i]], 0)
+    return snapshot_offsets, snapshot_targets, snapshot_weights, potentials
 
-    return (dist, next_vertex)
+_johnson_worker_snapshot = None
 
-_floyd_warshall_adjacency_matrix = _floyd_warshall_adjacency_list
+def _johnson_init(snapshot):
+    global _johnson_worker_snapshot
+    _johnson_worker_snapshot = snapshot
 
-def _johnson_adjacency_list(graph: Graph):
-    new_vertex = AdjacencyListGraphNode('__q__')
-    graph.add_vertex(new_vertex)
-
-    for vertex in graph.vertices:
-        if vertex != '__q__':
-            graph.add_edge('__q__', vertex, 0)
-
-    distances, predecessors = shortest_paths(graph, 'bellman_ford', '__q__')
-
-    edges_to_remove = []
-    for edge in graph.edge_weights:
-        edge_node = graph.edge_weights[edge]
-        if edge_node.source.name == '__q__':
-            edges_to_remove.append((edge_node.source.name, edge_node.target.name))
-
-    for u, v in edges_to_remove:
-        graph.remove_edge(u, v)
-    graph.remove_vertex('__q__')
-
-    for edge in graph.edge_weights:
-        edge_node = graph.edge_weights[edge]
-        u, v = edge_node.source.name, edge_node.target.name
-        graph.edge_weights[edge].value += (distances[u] - distances[v])
-
-    all_distances = {}
-    all_next_vertex = {}
-
-    for vertex in graph.vertices:
-        u = vertex
-        dijkstra_dist, dijkstra_pred = shortest_paths(graph, 'dijkstra', u)
-        all_distances[u] = {}
-        all_next_vertex[u] = {}
-        for v in graph.vertices:
-            if dijkstra_pred[v] is None or dijkstra_pred[v] == u :
-                all_next_vertex[u][v] = u
-            else:
-                all_next_vertex[u][v] = None
-            if v in dijkstra_dist:
-                all_distances[u][v] = dijkstra_dist[v] - distances[u] + distances[v]
+def _johnson_chunk(sources, snapshot=None):
+    """
+    Runs Dijkstra algorithm from each of the given sources over the
+    reweighted edges of the snapshot, by default the one given to
+    the worker process, and returns the (source, distances,
+    predecessors) rows in the original weights as typed arrays,
+    which are cheap to send back from the worker.
+    """
+    offsets, targets, weights, potentials = \
+        snapshot or _johnson_worker_snapshot
+    V, inf, rows = len(offsets) - 1, float('inf'), []
+    for s in sources:
+        dist, pred = [inf]*V, [-1]*V
+        dist[s], pred[s] = 0, s
+        pq = [(0, s)]
+        while pq:
+            d, u = heappop(pq)
+            if d > dist[u]:
+                continue
+            for i in range(offsets[u], offsets[u + 1]):
+                v = targets[i]
+                if d + weights[i] < dist[v]:
+                    dist[v] = d + weights[i]
+                    pred[v] = u
+                    heappush(pq, (dist[v], v))
+        h_s = potentials[s]
+        rows.append((s, array('d', [d - h_s + h_v if d != inf else inf
+                                    for d, h_v in zip(dist, potentials)]),
+                     array('q', pred)))
+    return rows
+
+def _johnson_rows(snapshot, names, matrix, num_workers):
+    """
+    Yields the rows of the result of Johnson's algorithm for the
+    vertices in order. At most two chunks of sources per worker
+    are computed ahead of the consumer.
+    """
+    inf, size = float('inf'), 32
+    sources = [u for u, name in enumerate(names) if name is not None]
+    chunks = [sources[k:k + size] for k in range(0, len(sources), size)]
+
+    def convert(rows):
+        for u, dist, pred in rows:
+            if matrix:
+                yield (u, dist, pred)
             else:
-                all_distances[u][v] = float('inf')
-
-    return (all_distances, all_next_vertex)
+                yield (names[u],
+                       {names[v]: d for v, d in enumerate(dist) if d != inf},
+                       {names[v]: names[p] for v, p in enumerate(pred) if p != -1})
+
+    if num_workers <= 1:
+        for chunk in chunks:
+            yield from convert(_johnson_chunk(chunk, snapshot))
+        return
+    with ProcessPoolExecutor(max_workers=num_workers, initializer=_johnson_init,
+                             initargs=(snapshot,)) as Executor:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(Executor.submit(_johnson_chunk, chunk))
+            if len(pending) == 2*num_workers:
+                yield from convert(pending.popleft().result())
+        while pending:
+            yield from convert(pending.popleft().result())
+
+def _johnson_adjacency_list(graph: Graph, matrix: bool, num_workers: int):
+    offsets, targets, weights, names = _weighted_arrays(graph)
+    return _johnson_rows(_johnson_snapshot(offsets, targets, weights),
+                         names, matrix, num_workers)
+
+_johnson_adjacency_matrix = _johnson_adjacency_list
+
+def _johnson_csr(graph: Graph, matrix: bool, num_workers: int):
+    snapshot = _johnson_snapshot(graph.offsets(), graph.targets(),
+                                 graph.weights())
+    return _johnson_rows(snapshot, graph.vertices, matrix, num_workers)
+
+def _all_pair_shortest_paths_rows(rows, matrix):
+    """
+    Collects the rows yielded by Johnson's algorithm into the
+    result of all_pair_shortest_paths.
+    """
+    if not matrix:
+        dist, pred = {}, {}
+        for name, dist_row, pred_row in rows:
+            dist[name], pred[name] = dist_row, pred_row
+        return (dist, pred)
+    dist, pred = array('d'), array('q')
+    for u, dist_row, pred_row in rows:
+        V = len(dist_row)
+        if len(dist) == 0:
+            dist = array('d', [float('inf')])*(V*V)
+            pred = array('q', [-1])*(V*V)
+        dist[u*V:(u + 1)*V], pred[u*V:(u + 1)*V] = dist_row, pred_row
+    return (dist, pred)
 
 def topological_sort(graph: Graph, algorithm: str,
                      **kwargs) -> list:
@@ -1097,6 +2493,26 @@ def _kahn_adjacency_list(graph: Graph) -> list:
         raise ValueError("Graph is not acyclic.")
     return L
 
+def _kahn_csr(graph: Graph) -> list:
+    offsets, targets, names = graph.offsets(), graph.targets(), graph.vertices
+    in_degree = [0]*len(names)
+    for v in targets:
+        in_degree[v] += 1
+    S = Queue([u for u in range(len(names)) if in_degree[u] == 0])
+
+    L = []
+    while S:
+        n = S.popleft()
+        L.append(names[n])
+        for m in targets[offsets[n]:offsets[n + 1]]:
+            in_degree[m] -= 1
+            if in_degree[m] == 0:
+                S.append(m)
+
+    if len(L) != len(names):
+        raise ValueError("Graph is not acyclic.")
+    return L
+
 def topological_sort_parallel(graph: Graph, algorithm: str, num_threads: int,
                               **kwargs) -> list:
     """
@@ -1115,6 +2531,14 @@ def topological_sort_parallel(graph: Graph, algorithm: str, num_threads: int,
         'kahn' -> Kahn's algorithm as given in [1].
     num_threads: int
         The maximum number of threads to be used.
+    waves: bool
+        If `True`, the vertices are returned grouped in
+        waves, every wave holding the vertices whose
+        predecessors all lie in earlier waves, so that
+        the vertices of a wave can be processed together.
+        The order of the vertices within a wave may vary
+        from one call to another.
+        Optional, by default, `False`.
     backend: pydatastructs.Backend
         The backend to be used.
         Optional, by default, the best available
@@ -1124,7 +2548,8 @@ def topological_sort_parallel(graph: Graph, algorithm: str, num_threads: int,
     =======
 
     list
-        The list of topologically sorted vertices.
+        The list of topologically sorted vertices, or
+        the list of waves if `waves` is `True`.
 
     Examples
     ========
@@ -1136,161 +2561,529 @@ def topological_sort_parallel(graph: Graph, algorithm: str, num_threads: int,
     >>> graph.add_edge('v_1', 'v_2')
     >>> topological_sort_parallel(graph, 'kahn', 1)
     ['v_1', 'v_2']
+    >>> graph.add_vertex(AdjacencyListGraphNode('v_3'))
+    >>> topological_sort_parallel(graph, 'kahn', 2, waves=True)
+    [['v_1', 'v_3'], ['v_2']]
+
+    Note
+    ====
+
+    The graph is not modified. In-degrees are counted
+    once and every wave is processed by a pool of
+    threads kept for the whole sort; the C++ backend
+    lowers them with atomic operations without holding
+    the GIL.
 
     References
     ==========
 
     .. [1] https://en.wikipedia.org/wiki/Topological_sorting#Kahn's_algorithm
     """
-    raise_if_backend_is_not_python(
-        topological_sort_parallel, kwargs.get('backend', Backend.PYTHON))
-    import pydatastructs.graphs.algorithms as algorithms
-    func = "_" + algorithm + "_" + graph._impl + '_parallel'
-    if not hasattr(algorithms, func):
-        raise NotImplementedError(
-        "Currently %s algorithm isn't implemented for "
-        "performing topological sort on %s graphs."%(algorithm, graph._impl))
-    return getattr(algorithms, func)(graph, num_threads)
-
-def _kahn_adjacency_list_parallel(graph: Graph, num_threads: int) -> list:
-    num_vertices = len(graph.vertices)
-
-    def _collect_source_nodes(graph: Graph) -> list:
-        S = []
-        in_degree = {u: 0 for u in graph.vertices}
-        for u in graph.vertices:
-            for v in graph.neighbors(u):
-                in_degree[v.name] += 1
-        for u in in_degree:
-            if in_degree[u] == 0:
-                S.append(u)
-        return list(S)
-
-    def _job(graph: Graph, u: str):
-        for v in graph.neighbors(u):
-            graph.remove_edge(u, v.name)
+    backend = kwargs.get('backend', Backend.PYTHON)
+    waves = kwargs.get('waves', False)
+    if backend == Backend.PYTHON:
+        import pydatastructs.graphs.algorithms as algorithms
+        func = "_" + algorithm + "_" + graph._impl + '_parallel'
+        if not hasattr(algorithms, func):
+            raise NotImplementedError(
+            "Currently %s algorithm isn't implemented for "
+            "performing topological sort on %s graphs."%(algorithm, graph._impl))
+        return getattr(algorithms, func)(graph, num_threads, waves)
+    else:
+        from pydatastructs.graphs._backend.cpp import _graph
+        func = "topological_sort_parallel_" + algorithm + "_" + graph._impl
+        if not hasattr(_graph, func):
+            raise NotImplementedError(
+            "Currently %s algorithm isn't implemented for "
+            "performing topological sort on %s graphs."%(algorithm, graph._impl))
+        return getattr(_graph, func)(graph, num_threads, waves)
 
-    L = []
-    source_nodes = _collect_source_nodes(graph)
-    while source_nodes:
-        with ThreadPoolExecutor(max_workers=num_threads) as Executor:
-            for node in source_nodes:
-                L.append(node)
-                Executor.submit(_job, graph, node)
-        for node in source_nodes:
-            graph.remove_vertex(node)
-        source_nodes = _collect_source_nodes(graph)
-
-    if len(L) != num_vertices:
+def _kahn_waves(offsets, targets, names, num_threads):
+    """
+    Returns the waves of Kahn's algorithm over the edges grouped by
+    vertex number in offsets and targets, each wave being the list
+    of the numbers of the vertices whose in-degree drops to zero once
+    the previous waves are removed.
+
+    In-degrees are counted once. Every wave is split into one chunk
+    per thread of a pool kept for the whole sort, each thread
+    gathering the targets of the edges leaving its chunk, and the
+    counts are then lowered by the calling thread, so the graph
+    itself is never modified.
+    """
+    V = len(names)
+    in_degree = array('q', [0])*V
+    for v in targets:
+        if v >= 0:
+            in_degree[v] += 1
+    wave = [u for u in range(V) if names[u] is not None and in_degree[u] == 0]
+
+    def _gather(chunk):
+        heads = array('q')
+        for u in chunk:
+            heads.extend(targets[offsets[u]:offsets[u + 1]])
+        return heads
+
+    waves, count = [], 0
+    with ThreadPoolExecutor(max_workers=num_threads) as Executor:
+        while wave:
+            waves.append(wave)
+            count += len(wave)
+            size = -(-len(wave) // num_threads)
+            chunks = [wave[i:i + size] for i in range(0, len(wave), size)]
+            wave = []
+            for heads in Executor.map(_gather, chunks):
+                for v in heads:
+                    if v >= 0:
+                        in_degree[v] -= 1
+                        if in_degree[v] == 0:
+                            wave.append(v)
+    if count != V - names.count(None):
         raise ValueError("Graph is not acyclic.")
-    return L
+    return waves
 
+def _kahn_parallel(graph: Graph, num_threads: int, waves: bool = False) -> list:
+    offsets, targets, names = _graph_arrays(graph)
+    result = [[names[u] for u in wave]
+              for wave in _kahn_waves(offsets, targets, names, num_threads)]
+    if waves:
+        return result
+    return [name for wave in result for name in wave]
 
-def _breadth_first_search_max_flow(graph: Graph, source_node, sink_node, flow_passed, for_dinic=False):
-    bfs_queue = Queue()
-    parent, currentPathC = {}, {}
-    currentPathC[source_node] = float('inf')
-    bfs_queue.append(source_node)
-    while len(bfs_queue) != 0:
-        curr_node = bfs_queue.popleft()
-        next_nodes = graph.neighbors(curr_node)
-        if len(next_nodes) != 0:
-            for next_node in next_nodes:
-                capacity = graph.get_edge(curr_node, next_node.name).value
-                fp = flow_passed.get((curr_node, next_node.name), 0)
-                if capacity and parent.get(next_node.name, False) is False and capacity - fp > 0:
-                    parent[next_node.name] = curr_node
-                    next_flow = min(currentPathC[curr_node], capacity - fp)
-                    currentPathC[next_node.name] = next_flow
-                    if next_node.name == sink_node and not for_dinic:
-                        return (next_flow, parent)
-                    bfs_queue.append(next_node.name)
-    return (0, parent)
+_kahn_adjacency_list_parallel = _kahn_parallel
+
+_kahn_adjacency_matrix_parallel = _kahn_parallel
 
+_kahn_csr_parallel = _kahn_parallel
 
-def _max_flow_edmonds_karp_(graph: Graph, source, sink):
+
+def _group_arcs(heads, V):
+    """
+    Returns the offsets and numbers of the arcs leaving every
+    vertex, for arcs paired with their reverses so that the tail
+    of arc ``a`` is the head of arc ``a ^ 1``.
+    """
+    arc_offsets = array('q', [0])*(V + 1)
+    for v in heads:
+        arc_offsets[v + 1] += 1
+    for u in range(V):
+        arc_offsets[u + 1] += arc_offsets[u]
+    arcs, cursor = array('q', [0])*len(heads), arc_offsets[:-1]
+    for a in range(len(heads)):
+        u = heads[a ^ 1]
+        arcs[cursor[u]] = a
+        cursor[u] += 1
+    return arc_offsets, arcs
+
+def _residual_network(offsets, targets, weights, V):
+    """
+    Builds the residual network of the edges grouped by vertex
+    number in offsets, targets and weights. Arc ``2*i`` is the
+    ``i``-th edge and arc ``2*i + 1`` is its reverse, so the reverse
+    of any arc ``a`` is ``a ^ 1``. The arcs leaving the vertex ``u``
+    are ``arcs[arc_offsets[u]:arc_offsets[u + 1]]``. Capacities are
+    kept in a typed array, of integers if all the weights are.
+    """
+    E = len(targets)
+    integral = all(isinstance(w, int) for w in weights)
+    heads, capacity = array('q', [0])*(2*E), \
+        array('q' if integral else 'd', [0])*(2*E)
+    for u in range(V):
+        for i in range(offsets[u], offsets[u + 1]):
+            v, w = targets[i], weights[i]
+            heads[2*i], heads[2*i + 1] = v, u
+            capacity[2*i] = 0 if isnan(w) else w
+    arc_offsets, arcs = _group_arcs(heads, V)
+    return arc_offsets, arcs, heads, capacity
+
+
+def _max_flow_network(graph):
+    if graph._impl == 'csr':
+        return _residual_network(graph.offsets(), graph.targets(),
+                                 graph.weights(), len(graph.vertices))
+    offsets, targets, weights, names = _weighted_arrays(graph)
+    return _residual_network(offsets, targets, weights, len(names))
+
+
+def _edmonds_karp(network, s, t):
+    arc_offsets, arcs, heads, capacity = network
+    V = len(arc_offsets) - 1
     m_flow = 0
-    flow_passed = {}
-    new_flow, parent = _breadth_first_search_max_flow(graph, source, sink, flow_passed)
-    while new_flow != 0:
+    while s != t:
+        parent_arc = [-1]*V
+        parent_arc[s] = -2
+        bfs_queue = Queue([s])
+        while bfs_queue and parent_arc[t] == -1:
+            u = bfs_queue.popleft()
+            for a in arcs[arc_offsets[u]:arc_offsets[u + 1]]:
+                v = heads[a]
+                if parent_arc[v] == -1 and capacity[a] > 0:
+                    parent_arc[v] = a
+                    bfs_queue.append(v)
+        if parent_arc[t] == -1:
+            break
+
+        new_flow, v = float('inf'), t
+        while v != s:
+            a = parent_arc[v]
+            new_flow = min(new_flow, capacity[a])
+            v = heads[a ^ 1]
+        v = t
+        while v != s:
+            a = parent_arc[v]
+            capacity[a] -= new_flow
+            capacity[a ^ 1] += new_flow
+            v = heads[a ^ 1]
         m_flow += new_flow
-        current = sink
-        while current != source:
-            prev = parent[current]
-            fp = flow_passed.get((prev, current), 0)
-            flow_passed[(prev, current)] = fp + new_flow
-            fp = flow_passed.get((current, prev), 0)
-            flow_passed[(current, prev)] = fp - new_flow
-            current = prev
-        new_flow, parent = _breadth_first_search_max_flow(graph, source, sink, flow_passed)
     return m_flow
 
 
-def _depth_first_search_max_flow_dinic(graph: Graph, u, parent, sink_node, flow, flow_passed):
-    if u == sink_node:
-        return flow
-
-    next_nodes = graph.neighbors(u)
-    if len(next_nodes) != 0:
-        for next_node in next_nodes:
-            capacity = graph.get_edge(u, next_node.name).value
-            fp = flow_passed.get((u, next_node.name), 0)
-            parent_cond = parent.get(next_node.name, None)
-            if parent_cond and parent_cond == u and capacity - fp > 0:
-                path_flow = _depth_first_search_max_flow_dinic(graph,
-                                                               next_node.name,
-                                                               parent, sink_node,
-                                min(flow, capacity - fp), flow_passed)
-                if path_flow > 0:
-                    fp = flow_passed.get((u, next_node.name), 0)
-                    flow_passed[(u, next_node.name)] = fp + path_flow
-                    fp = flow_passed.get((next_node.name, u), 0)
-                    flow_passed[(next_node.name, u)] = fp - path_flow
-                    return path_flow
-    return 0
-
-
-def _max_flow_dinic_(graph: Graph, source, sink):
+def _dinic(network, s, t):
+    arc_offsets, arcs, heads, capacity = network
+    V = len(arc_offsets) - 1
     max_flow = 0
-    flow_passed = {}
-    while True:
-        next_flow, parent = _breadth_first_search_max_flow(graph, source, sink, flow_passed, True)
-        if parent.get(sink, False) is False:
+    while s != t:
+        level = [-1]*V
+        level[s] = 0
+        bfs_queue = Queue([s])
+        while bfs_queue:
+            u = bfs_queue.popleft()
+            for a in arcs[arc_offsets[u]:arc_offsets[u + 1]]:
+                v = heads[a]
+                if level[v] == -1 and capacity[a] > 0:
+                    level[v] = level[u] + 1
+                    bfs_queue.append(v)
+        if level[t] == -1:
             break
 
-        while True:
-            path_flow = _depth_first_search_max_flow_dinic(graph, source,
-                                                           parent, sink,
-                                                           float('inf'),
-                                                           flow_passed)
-            if path_flow <= 0:
-                break
-            max_flow += path_flow
-
+        current = arc_offsets[:-1]
+        stack, path = [s], []
+        while stack:
+            u = stack[-1]
+            if u == t:
+                path_flow = min(capacity[a] for a in path)
+                for a in path:
+                    capacity[a] -= path_flow
+                    capacity[a ^ 1] += path_flow
+                max_flow += path_flow
+                stack, path = [s], []
+                continue
+            while current[u] < arc_offsets[u + 1]:
+                a = arcs[current[u]]
+                v = heads[a]
+                if capacity[a] > 0 and level[v] == level[u] + 1:
+                    stack.append(v)
+                    path.append(a)
+                    break
+                current[u] += 1
+            else:
+                level[u] = -1
+                stack.pop()
+                if path:
+                    path.pop()
+                    current[stack[-1]] += 1
     return max_flow
 
 
+def _push_relabel_heights(network, s, t, height, count, buckets, excess):
+    """
+    Sets the height of every vertex to its distance to t in the
+    residual network, or to the number of vertices if t is not
+    reachable from it, refills the buckets of active vertices and
+    returns the highest of their heights, or -1 if there are none.
+    """
+    arc_offsets, arcs, heads, capacity = network
+    V = len(height)
+    for v in range(V):
+        height[v], count[v] = V, 0
+        buckets[v] = []
+    height[t], count[0] = 0, 1
+    highest, bfs_queue = -1, Queue([t])
+    while bfs_queue:
+        u = bfs_queue.popleft()
+        h = height[u] + 1
+        for a in arcs[arc_offsets[u]:arc_offsets[u + 1]]:
+            v = heads[a]
+            if height[v] == V and v != s and capacity[a ^ 1] > 0:
+                height[v] = h
+                count[h] += 1
+                bfs_queue.append(v)
+                if excess[v] > 0:
+                    buckets[h].append(v)
+                    highest = h
+    return highest
+
+
+def _push_relabel(network, s, t):
+    """
+    First phase of the highest label push-relabel algorithm, which
+    stops once no vertex with excess can reach t anymore, leaving
+    the value of a maximum flow as the excess of t.
+    """
+    arc_offsets, arcs, heads, capacity = network
+    V = len(arc_offsets) - 1
+    if s == t:
+        return 0
+    excess = [0]*V
+    for a in arcs[arc_offsets[s]:arc_offsets[s + 1]]:
+        f = capacity[a]
+        capacity[a] -= f
+        capacity[a ^ 1] += f
+        excess[heads[a]] += f
+
+    height, count, buckets = [V]*V, [0]*V, [[] for _ in range(V)]
+    highest = _push_relabel_heights(network, s, t, height, count, buckets, excess)
+    current, relabels = arc_offsets[:-1], 0
+    while highest >= 0:
+        if not buckets[highest]:
+            highest -= 1
+            continue
+        u = buckets[highest].pop()
+        if height[u] != highest or excess[u] == 0:
+            continue
+        end = arc_offsets[u + 1]
+        while excess[u] > 0:
+            if current[u] == end:
+                old = height[u]
+                count[old] -= 1
+                if count[old] == 0:
+                    # Gap heuristic, no vertex above the emptied
+                    # height can reach t anymore.
+                    for v in range(V):
+                        if old < height[v] < V:
+                            count[height[v]] -= 1
+                            height[v] = V
+                    height[u] = V
+                    break
+                new = V
+                for a in arcs[arc_offsets[u]:end]:
+                    if capacity[a] > 0 and height[heads[a]] < new - 1:
+                        new = height[heads[a]] + 1
+                height[u], current[u] = new, arc_offsets[u]
+                relabels += 1
+                if new == V:
+                    break
+                count[new] += 1
+                continue
+            a = arcs[current[u]]
+            v = heads[a]
+            if capacity[a] > 0 and height[u] == height[v] + 1:
+                f = min(excess[u], capacity[a])
+                capacity[a] -= f
+                capacity[a ^ 1] += f
+                excess[u] -= f
+                if excess[v] == 0 and v != t:
+                    buckets[height[v]].append(v)
+                excess[v] += f
+            else:
+                current[u] += 1
+        if relabels >= V:
+            # Global relabeling heuristic, recompute exact heights
+            # once relabels might have drifted far below them.
+            relabels, current = 0, arc_offsets[:-1]
+            highest = _push_relabel_heights(network, s, t, height, count,
+                                            buckets, excess)
+        else:
+            highest = max(highest, min(height[u], V - 1))
+    return excess[t]
+
+
+def _max_flow_edmonds_karp_adjacency_list(graph: Graph, source, sink):
+    return _edmonds_karp(_max_flow_network(graph),
+                         graph._ids[source], graph._ids[sink])
+
+
+def _max_flow_dinic_adjacency_list(graph: Graph, source, sink):
+    return _dinic(_max_flow_network(graph),
+                  graph._ids[source], graph._ids[sink])
+
+
+def _max_flow_push_relabel_adjacency_list(graph: Graph, source, sink):
+    return _push_relabel(_max_flow_network(graph),
+                         graph._ids[source], graph._ids[sink])
+
+
+_max_flow_edmonds_karp_adjacency_matrix = _max_flow_edmonds_karp_adjacency_list
+_max_flow_dinic_adjacency_matrix = _max_flow_dinic_adjacency_list
+_max_flow_push_relabel_adjacency_matrix = _max_flow_push_relabel_adjacency_list
+_max_flow_edmonds_karp_csr = _max_flow_edmonds_karp_adjacency_list
+_max_flow_dinic_csr = _max_flow_dinic_adjacency_list
+_max_flow_push_relabel_csr = _max_flow_push_relabel_adjacency_list
+
+
 def max_flow(graph, source, sink, algorithm='edmonds_karp', **kwargs):
-    raise_if_backend_is_not_python(
-        max_flow, kwargs.get('backend', Backend.PYTHON))
+    """
+    Computes the value of a maximum flow from source to sink,
+    taking the weights of the edges as their capacities.
 
-    import pydatastructs.graphs.algorithms as algorithms
-    func = "_max_flow_" + algorithm + "_"
-    if not hasattr(algorithms, func):
-        raise NotImplementedError(
-        f"Currently {algorithm} algorithm isn't implemented for "
-        "performing max flow on graphs.")
-    return getattr(algorithms, func)(graph, source, sink)
+    Parameters
+    ==========
+
+    graph: Graph
+        The graph under consideration. Edges without
+        weights are ignored.
+    source: str
+        The name of the source node.
+    sink: str
+        The name of the sink node.
+    algorithm: str
+        The algorithm to be used. Currently, the following
+        algorithms are supported,
+
+        'edmonds_karp' -> Edmonds-Karp algorithm as given in [1].
+
+        'dinic' -> Dinic algorithm as given in [2].
+
+        'push_relabel' -> Highest label push-relabel algorithm
+        as given in [3], with the gap and global relabeling
+        heuristics.
+
+        Optional, by default, 'edmonds_karp'.
+    backend: pydatastructs.Backend
+        The backend to be used.
+        Optional, by default, the best available
+        backend is used.
+
+    Returns
+    =======
+
+    flow: int or float
+        The value of a maximum flow. An integer if all
+        capacities are integers, except with the C++
+        backend, which always returns a float.
+
+    Examples
+    ========
+
+    >>> from pydatastructs import Graph, max_flow
+    >>> G = Graph(implementation='csr')
+    >>> G.add_vertices_from(['s', 'a', 'b', 't'])
+    >>> G.add_edges_from(['s', 's', 'a', 'a', 'b'], ['a', 'b', 'b', 't', 't'],
+    ...                  [3, 2, 1, 2, 3])
+    >>> max_flow(G, 's', 't', 'push_relabel')
+    5.0
+
+    References
+    ==========
+
+    .. [1] https://en.wikipedia.org/wiki/Edmonds%E2%80%93Karp_algorithm
+    .. [2] https://en.wikipedia.org/wiki/Dinic%27s_algorithm
+    .. [3] https://doi.org/10.1007/PL00009180
+    """
+    backend = kwargs.get('backend', Backend.PYTHON)
+    if backend == Backend.PYTHON:
+        import pydatastructs.graphs.algorithms as algorithms
+        func = "_max_flow_" + algorithm + "_" + graph._impl
+        if not hasattr(algorithms, func):
+            raise NotImplementedError(
+            f"Currently {algorithm} algorithm isn't implemented for "
+            "performing max flow on graphs.")
+        return getattr(algorithms, func)(graph, source, sink)
+    else:
+        from pydatastructs.graphs._backend.cpp import _graph
+        func = "max_flow_" + algorithm + "_" + graph._impl
+        if not hasattr(_graph, func):
+            raise NotImplementedError(
+            f"Currently {algorithm} algorithm isn't implemented for "
+            "performing max flow on graphs.")
+        return getattr(_graph, func)(graph, source, sink)
 
 
-def find_bridges(graph):
+def _undirected_arcs(offsets, targets, V):
+    """
+    Returns the arcs of the undirected graph underlying the edges
+    grouped by vertex number in offsets and targets, laid out as by
+    `_residual_network`, with a single pair of arcs for every pair of
+    adjacent vertices whichever directions they are joined in.
+    Self loops are dropped.
+    """
+    seen, heads = set(), array('q')
+    for u in range(V):
+        for v in targets[offsets[u]:offsets[u + 1]]:
+            key = u*V + v if u < v else v*V + u
+            if u != v and key not in seen:
+                seen.add(key)
+                heads.append(v)
+                heads.append(u)
+    arc_offsets, arcs = _group_arcs(heads, V)
+    return arc_offsets, arcs, heads
+
+def _low_links(graph):
+    """
+    Runs an iterative depth first search over the undirected graph
+    underlying the given one, computing the discovery times and low
+    links of the vertices, and returns its bridges, its articulation
+    points and its biconnected components, as lists of vertex
+    numbers, along with the names of the vertices by number.
+    """
+    offsets, targets, names = _graph_arrays(graph)
+    V = len(names)
+    arc_offsets, arcs, heads = _undirected_arcs(offsets, targets, V)
+    disc, low = [-1]*V, [0]*V
+    cut, bridges, components, edge_stack = bytearray(V), [], [], []
+    time = 0
+    for root in range(V):
+        if disc[root] != -1 or names[root] is None:
+            continue
+        disc[root] = low[root] = time
+        time += 1
+        children, stack = 0, [(root, -1, arc_offsets[root])]
+        while stack:
+            u, parent_arc, i = stack[-1]
+            if i < arc_offsets[u + 1]:
+                stack[-1] = (u, parent_arc, i + 1)
+                a = arcs[i]
+                v = heads[a]
+                if a ^ 1 == parent_arc:
+                    continue
+                if disc[v] == -1:
+                    disc[v] = low[v] = time
+                    time += 1
+                    edge_stack.append(a >> 1)
+                    stack.append((v, a, arc_offsets[v]))
+                elif disc[v] < disc[u]:
+                    low[u] = min(low[u], disc[v])
+                    edge_stack.append(a >> 1)
+                continue
+            stack.pop()
+            if not stack:
+                break
+            p = stack[-1][0]
+            low[p] = min(low[p], low[u])
+            if low[u] > disc[p]:
+                bridges.append((p, u))
+            if low[u] >= disc[p]:
+                if p == root:
+                    children += 1
+                else:
+                    cut[p] = True
+                component = set()
+                while True:
+                    e = edge_stack.pop()
+                    component.add(heads[2*e])
+                    component.add(heads[2*e + 1])
+                    if e == parent_arc >> 1:
+                        break
+                components.append(component)
+        if children > 1:
+            cut[root] = True
+    points = [u for u in range(V) if cut[u]]
+    return bridges, points, components, names
+
+def find_bridges(graph, **kwargs):
     """
     Finds all bridges in an undirected graph using Tarjan's Algorithm.
 
     Parameters
     ==========
     graph : Graph
-        An undirected graph instance.
+        An undirected graph instance. Every edge joins its end
+        points whichever direction it was added in, and edges
+        joining the same pair of vertices count as one.
+    backend: pydatastructs.Backend
+        The backend to be used.
+        Optional, by default, the best available
+        backend is used.
 
     Returns
     ==========
@@ -1319,68 +3112,103 @@ def find_bridges(graph):
 
     .. [1] https://en.wikipedia.org/wiki/Bridge_(graph_theory)
     """
+    backend = kwargs.get('backend', Backend.PYTHON)
+    if backend == Backend.PYTHON:
+        bridges, _, _, names = _low_links(graph)
+        bridges = [(names[u], names[v]) if names[u] <= names[v] else
+                   (names[v], names[u]) for u, v in bridges]
+        bridges.sort()
+        return bridges
+    return _low_links_cpp(graph, "find_bridges_")
+
+def find_articulation_points(graph, **kwargs):
+    """
+    Finds all articulation points in an undirected graph, i.e.,
+    the vertices whose removal increases the number of connected
+    components, using Tarjan's Algorithm.
 
-    vertices = list(graph.vertices)
-    processed_vertices = []
-    for v in vertices:
-        if hasattr(v, "name"):
-            processed_vertices.append(v.name)
-        else:
-            processed_vertices.append(v)
-
-    n = len(processed_vertices)
-    adj = {v: [] for v in processed_vertices}
-    for v in processed_vertices:
-        for neighbor in graph.neighbors(v):
-            if hasattr(neighbor, "name"):
-                nbr = neighbor.name
-            else:
-                nbr = neighbor
-            adj[v].append(nbr)
-
-    mapping = {v: idx for idx, v in enumerate(processed_vertices)}
-    inv_mapping = {idx: v for v, idx in mapping.items()}
-
-    n_adj = [[] for _ in range(n)]
-    for v in processed_vertices:
-        idx_v = mapping[v]
-        for u in adj[v]:
-            idx_u = mapping[u]
-            n_adj[idx_v].append(idx_u)
-
-    visited = [False] * n
-    disc = [0] * n
-    low = [0] * n
-    parent = [-1] * n
-    bridges_idx = []
-    time = 0
+    Parameters
+    ==========
+    graph : Graph
+        An undirected graph instance, read as by `find_bridges`.
+    backend: pydatastructs.Backend
+        The backend to be used.
+        Optional, by default, the best available
+        backend is used.
 
-    def dfs(u):
-        nonlocal time
-        visited[u] = True
-        disc[u] = low[u] = time
-        time += 1
-        for v in n_adj[u]:
-            if not visited[v]:
-                parent[v] = u
-                dfs(v)
-                low[u] = min(low[u], low[v])
-                if low[v] > disc[u]:
-                    bridges_idx.append((u, v))
-            elif v != parent[u]:
-                low[u] = min(low[u], disc[v])
-
-    for i in range(n):
-        if not visited[i]:
-            dfs(i)
-
-    bridges = []
-    for u, v in bridges_idx:
-        a = inv_mapping[u]
-        b = inv_mapping[v]
-        if a <= b:
-            bridges.append((a, b))
-        else:
-            bridges.append((b, a))
-    bridges.sort()
-    return bridges
+    Returns
+    ==========
+    List[str]
+        The sorted names of the articulation points.
+
+    Example
+    ========
+    >>> from pydatastructs import Graph, find_articulation_points
+    >>> graph = Graph()
+    >>> graph.add_vertices_from(range(5))
+    >>> graph.add_edges_from([0, 1, 2, 2, 3], [1, 2, 0, 3, 4])
+    >>> find_articulation_points(graph)
+    ['2', '3']
+
+    References
+    ==========
+
+    .. [1] https://en.wikipedia.org/wiki/Biconnected_component
+    """
+    backend = kwargs.get('backend', Backend.PYTHON)
+    if backend == Backend.PYTHON:
+        _, points, _, names = _low_links(graph)
+        return sorted(names[u] for u in points)
+    return _low_links_cpp(graph, "find_articulation_points_")
+
+def biconnected_components(graph, **kwargs):
+    """
+    Finds the biconnected components of an undirected graph, i.e.,
+    its maximal subgraphs which remain connected after removing any
+    one of their vertices, using Tarjan's Algorithm.
+
+    Parameters
+    ==========
+    graph : Graph
+        An undirected graph instance, read as by `find_bridges`.
+    backend: pydatastructs.Backend
+        The backend to be used.
+        Optional, by default, the best available
+        backend is used.
+
+    Returns
+    ==========
+    List[set]
+        The sets of names of the vertices of every component.
+        Every edge belongs to exactly one component, so isolated
+        vertices belong to none, and articulation points belong
+        to several.
+
+    Example
+    ========
+    >>> from pydatastructs import Graph, biconnected_components
+    >>> graph = Graph()
+    >>> graph.add_vertices_from(range(5))
+    >>> graph.add_edges_from([0, 1, 2, 2, 3], [1, 2, 0, 3, 4])
+    >>> sorted(sorted(c) for c in biconnected_components(graph))
+    [['0', '1', '2'], ['2', '3'], ['3', '4']]
+
+    References
+    ==========
+
+    .. [1] https://en.wikipedia.org/wiki/Biconnected_component
+    """
+    backend = kwargs.get('backend', Backend.PYTHON)
+    if backend == Backend.PYTHON:
+        _, _, components, names = _low_links(graph)
+        return [{names[u] for u in component} for component in components]
+    return _low_links_cpp(graph, "biconnected_components_")
+
+def _low_links_cpp(graph, prefix):
+    from pydatastructs.graphs._backend.cpp import _graph
+    func = prefix + graph._impl
+    if not hasattr(_graph, func):
+        raise NotImplementedError(
+        "Currently %s isn't implemented for %s graphs."
+        %(prefix[:-1], graph._impl))
+    return getattr(_graph, func)(graph)
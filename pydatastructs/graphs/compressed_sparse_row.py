@@ -0,0 +1,356 @@
+from array import array
+from bisect import bisect_left
+from math import isnan
+from operator import sub
+from pydatastructs.graphs.graph import Graph
+from pydatastructs.graphs._backend.cpp import _graph
+from pydatastructs.utils.misc_util import (
+    GraphEdge, Backend, AdjacencyListGraphNode)
+
+__all__ = [
+    'CompressedSparseRow'
+]
+
+class CompressedSparseRow(Graph):
+    """
+    Compressed sparse row (CSR) implementation of graphs.
+
+    Vertices are numbered in the order in which they are
+    added. The targets and weights of the edges leaving
+    the vertex numbered ``i`` occupy the slots from
+    ``offsets[i]`` to ``offsets[i + 1] - 1`` of the
+    ``targets`` and ``weights`` arrays, sorted by target.
+    All three are contiguous typed arrays. Unweighted
+    edges are stored with ``nan`` as their weight.
+
+    Edges added using ``add_edge`` are buffered and merged
+    into the arrays the next time the graph is queried, so
+    this implementation is best suited for graphs which are
+    built once and then queried many times.
+
+    Graphs read by `Graph.load` with `mmap=True` keep their
+    arrays as read-only views of the mapped file, which are
+    copied into typed arrays when the graph is first modified.
+    The nodes of the vertices read by `Graph.load` or added by
+    `add_vertices_from` are created on first use.
+
+    See also
+    ========
+
+    pydatastructs.graphs.graph.Graph
+    """
+    def __new__(cls, *vertices, **kwargs):
+        backend = kwargs.get('backend', Backend.PYTHON)
+        if backend == Backend.PYTHON:
+            obj = object.__new__(cls)
+            obj.vertices = []
+            obj._nodes = []
+            obj._ids = {}
+            obj._offsets = array('q', [0])
+            obj._targets = array('q')
+            obj._weights = array('d')
+            obj._pending_sources = array('q')
+            obj._pending_targets = array('q')
+            obj._pending_weights = array('d')
+            obj._transposed = None
+            obj._version = 0
+            obj._cache = None
+            obj._impl = 'csr'
+            for vertex in vertices:
+                obj.add_vertex(vertex)
+            return obj
+        else:
+            return _graph.CompressedSparseRowGraph(*vertices)
+
+    @classmethod
+    def _from_arrays(cls, names, offsets, targets, weights):
+        """
+        Returns a graph over the named vertices with the given
+        edge arrays, which may be views of a mapped file.
+        """
+        obj = cls()
+        obj.vertices = names
+        obj._nodes = [None]*len(names)
+        obj._ids = dict(zip(names, range(len(names))))
+        obj._offsets, obj._targets, obj._weights = offsets, targets, weights
+        return obj
+
+    @classmethod
+    def methods(self):
+        return ['is_adjacent', 'neighbors',
+                'add_vertex', 'remove_vertex', 'add_edge',
+                'get_edge', 'remove_edge', 'num_vertices',
+                'num_edges', 'offsets', 'targets', 'weights',
+                'add_vertices_from', 'add_edges_from', 'degree',
+                'in_degree', 'degrees', '__new__']
+
+    def _node(self, u):
+        node = self._nodes[u]
+        if node is None:
+            node = self._nodes[u] = AdjacencyListGraphNode(self.vertices[u])
+        return node
+
+    def _own(self):
+        """
+        Copies arrays which are views of a mapped file into typed
+        arrays before they are modified in place.
+        """
+        if not isinstance(self._offsets, array):
+            self._offsets = array('q', self._offsets.tobytes())
+            self._targets = array('q', self._targets.tobytes())
+            self._weights = array('d', self._weights.tobytes())
+
+    def _build(self):
+        if len(self._pending_targets) == 0:
+            return
+        updates = {}
+        for u, v, w in zip(self._pending_sources,
+                           self._pending_targets,
+                           self._pending_weights):
+            row = updates.get(u, None)
+            if row is None:
+                row = updates[u] = {}
+            row[v] = w
+
+        old_offsets, old_targets, old_weights = \
+            self._offsets, self._targets, self._weights
+        offsets, targets, weights = array('q', [0]), array('q'), array('d')
+        for u in range(len(self.vertices)):
+            lo, hi = old_offsets[u], old_offsets[u + 1]
+            row = updates.get(u, None)
+            if row is None:
+                targets.extend(old_targets[lo:hi])
+                weights.extend(old_weights[lo:hi])
+            else:
+                merged = dict(zip(old_targets[lo:hi], old_weights[lo:hi]))
+                merged.update(row)
+                for v in sorted(merged):
+                    targets.append(v)
+                    weights.append(merged[v])
+            offsets.append(len(targets))
+
+        self._offsets, self._targets, self._weights = \
+            offsets, targets, weights
+        self._pending_sources = array('q')
+        self._pending_targets = array('q')
+        self._pending_weights = array('d')
+        self._transposed = None
+
+    def _transpose(self):
+        """
+        Returns the offsets and sources of the incoming edges of
+        every vertex, grouped like the outgoing ones. They are
+        kept until the graph is modified.
+        """
+        self._build()
+        if self._transposed is None:
+            offsets, targets = self._offsets, self._targets
+            V = len(self.vertices)
+            in_offsets = array('q', [0])*(V + 1)
+            for v in targets:
+                in_offsets[v + 1] += 1
+            for v in range(V):
+                in_offsets[v + 1] += in_offsets[v]
+            in_targets, cursor = array('q', [0])*len(targets), in_offsets[:-1]
+            for u in range(V):
+                for v in targets[offsets[u]:offsets[u + 1]]:
+                    in_targets[cursor[v]] = u
+                    cursor[v] += 1
+            self._transposed = (in_offsets, in_targets)
+        return self._transposed
+
+    def _slot(self, source, target):
+        self._build()
+        u, v = self._ids[source], self._ids.get(target, None)
+        if v is None:
+            return -1
+        lo, hi = self._offsets[u], self._offsets[u + 1]
+        i = bisect_left(self._targets, v, lo, hi)
+        if i < hi and self._targets[i] == v:
+            return i
+        return -1
+
+    def offsets(self):
+        """
+        Returns the typed array of row offsets.
+        """
+        self._build()
+        return self._offsets
+
+    def targets(self):
+        """
+        Returns the typed array of edge targets.
+        """
+        self._build()
+        return self._targets
+
+    def weights(self):
+        """
+        Returns the typed array of edge weights.
+        """
+        self._build()
+        return self._weights
+
+    def is_adjacent(self, node1, node2):
+        return self._slot(str(node1), str(node2)) != -1
+
+    def num_vertices(self):
+        return len(self.vertices)
+
+    def num_edges(self):
+        self._build()
+        return len(self._targets)
+
+    def degree(self, node):
+        self._build()
+        u = self._ids[str(node)]
+        return self._offsets[u + 1] - self._offsets[u]
+
+    def in_degree(self, node):
+        in_offsets = self._transpose()[0]
+        u = self._ids[str(node)]
+        return in_offsets[u + 1] - in_offsets[u]
+
+    def degrees(self, incoming=False):
+        self._build()
+        offsets = self._transpose()[0] if incoming else self._offsets
+        return array('q', map(sub, offsets[1:], offsets[:-1]))
+
+    def neighbors(self, node):
+        self._build()
+        u = self._ids[str(node)]
+        return [self._node(v) for v in
+                self._targets[self._offsets[u]:self._offsets[u + 1]]]
+
+    def add_vertex(self, node):
+        if node.name not in self._ids:
+            self._own()
+            self._ids[node.name] = len(self.vertices)
+            self.vertices.append(node.name)
+            self._nodes.append(node)
+            self._offsets.append(self._offsets[-1])
+            self._transposed = None
+            self._version += 1
+
+    def remove_vertex(self, name):
+        self._build()
+        k = self._ids.pop(name)
+        self.vertices.pop(k)
+        self._nodes.pop(k)
+        for i in range(k, len(self.vertices)):
+            self._ids[self.vertices[i]] = i
+
+        old_offsets, old_targets, old_weights = \
+            self._offsets, self._targets, self._weights
+        offsets, targets, weights = array('q', [0]), array('q'), array('d')
+        for u in range(len(old_offsets) - 1):
+            if u == k:
+                continue
+            for i in range(old_offsets[u], old_offsets[u + 1]):
+                v = old_targets[i]
+                if v != k:
+                    targets.append(v - (v > k))
+                    weights.append(old_weights[i])
+            offsets.append(len(targets))
+        self._offsets, self._targets, self._weights = \
+            offsets, targets, weights
+        self._transposed = None
+        self._version += 1
+
+    def add_edge(self, source, target, cost=None):
+        source, target = str(source), str(target)
+        error_msg = ("Vertex %s is not present in the graph."
+                     "Call Graph.add_vertex to add a new"
+                     "vertex. Graph.add_edge is only responsible"
+                     "for adding edges and it will not add new"
+                     "vertices on its own. This is done to maintain"
+                     "clear separation between the functionality of"
+                     "these two methods.")
+        if source not in self._ids:
+            raise ValueError(error_msg % (source))
+        if target not in self._ids:
+            raise ValueError(error_msg % (target))
+
+        self._pending_sources.append(self._ids[source])
+        self._pending_targets.append(self._ids[target])
+        self._pending_weights.append(
+            float('nan') if cost is None else cost)
+        self._version += 1
+
+    def add_vertices_from(self, names):
+        self._own()
+        ids, vertices, nodes, offsets = \
+            self._ids, self.vertices, self._nodes, self._offsets
+        for name in map(str, names):
+            if name not in ids:
+                ids[name] = len(vertices)
+                vertices.append(name)
+                nodes.append(None)
+                offsets.append(offsets[-1])
+        self._transposed = None
+        self._version += 1
+
+    def add_edges_from(self, sources, targets, weights=None):
+        ids = self._ids
+        try:
+            source_ids = array('q', map(ids.__getitem__, map(str, sources)))
+            target_ids = array('q', map(ids.__getitem__, map(str, targets)))
+        except KeyError as e:
+            raise ValueError("Vertex %s is not present in the graph."
+                             % (e.args[0]))
+        if weights is None:
+            weights = array('d', [float('nan')]) * len(source_ids)
+        else:
+            weights = array('d', [float('nan') if w is None else w
+                                  for w in weights])
+        if len(source_ids) != len(target_ids) or \
+            len(weights) != len(source_ids):
+            raise ValueError("sources, targets and weights "
+                             "must have the same length.")
+
+        self._pending_sources.extend(source_ids)
+        self._pending_targets.extend(target_ids)
+        self._pending_weights.extend(weights)
+        self._version += 1
+
+    def get_edge(self, source, target):
+        source, target = str(source), str(target)
+        i = self._slot(source, target)
+        if i == -1 or isnan(self._weights[i]):
+            return None
+        return GraphEdge(self._node(self._ids[source]),
+                         self._node(self._ids[target]),
+                         self._weights[i])
+
+    def remove_edge(self, source, target):
+        source, target = str(source), str(target)
+        i = self._slot(source, target)
+        if i == -1:
+            return
+        self._own()
+        del self._targets[i]
+        del self._weights[i]
+        offsets = self._offsets
+        for u in range(self._ids[source] + 1, len(offsets)):
+            offsets[u] -= 1
+        self._transposed = None
+        self._version += 1
+
+    @property
+    def edge_weights(self):
+        """
+        Dictionary of weighted edges keyed by ``source_target``,
+        materialized from the arrays for compatibility with the
+        other implementations.
+        """
+        self._build()
+        edge_weights = {}
+        offsets, targets, weights = \
+            self._offsets, self._targets, self._weights
+        for u in range(len(self.vertices)):
+            for i in range(offsets[u], offsets[u + 1]):
+                if not isnan(weights[i]):
+                    source, target = self._node(u), self._node(targets[i])
+                    edge_weights[source.name + "_" + target.name] = \
+                        GraphEdge(source, target, weights[i])
+        return edge_weights
@@ -0,0 +1,227 @@
+from array import array
+from pydatastructs.graphs.algorithms import _neighbor_arrays_adjacency_list
+from pydatastructs.utils.misc_util import (
+    Backend, raise_if_backend_is_not_python)
+
+__all__ = [
+    'DynamicTopologicalOrder'
+]
+
+class DynamicTopologicalOrder(object):
+    """
+    Maintains a topological order of a directed acyclic graph
+    while edges are inserted into it one at a time.
+
+    The order is computed once, with Kahn's algorithm, when the
+    structure is created. After that, inserting an edge which
+    agrees with the current order costs nothing beyond the
+    insertion itself, and an edge which does not only reorders
+    the vertices lying between its end points which are reachable
+    from its target or reach its source, as given in [1]. An
+    edge which would close a cycle is detected by the same search
+    and rejected.
+
+    The graph must be modified only through this structure,
+    which keeps the successors and predecessors of every vertex
+    by vertex id.
+
+    Parameters
+    ==========
+
+    graph: Graph
+        The acyclic graph, using the adjacency list
+        implementation.
+    backend: pydatastructs.Backend
+        The backend to be used.
+        Optional, by default, the best available
+        backend is used.
+
+    Raises
+    ======
+
+    ValueError
+        If the graph contains a cycle.
+
+    Examples
+    ========
+
+    >>> from pydatastructs import Graph, DynamicTopologicalOrder
+    >>> G = Graph()
+    >>> G.add_vertices_from(['a', 'b', 'c'])
+    >>> order = DynamicTopologicalOrder(G)
+    >>> order.add_edge('c', 'b')
+    >>> order.add_edge('b', 'a')
+    >>> order.order()
+    ['c', 'b', 'a']
+    >>> order.position('a')
+    2
+    >>> order.add_edge('a', 'c')
+    Traceback (most recent call last):
+    ...
+    ValueError: Edge from a to c would create a cycle.
+
+    References
+    ==========
+
+    .. [1] https://doi.org/10.1145/1187436.1210590
+
+    See also
+    ========
+
+    pydatastructs.topological_sort
+    """
+
+    __slots__ = ['_graph', '_succ', '_pred', '_position', '_at', '_order',
+                 '_names', '_stamp', '_epoch']
+
+    def __new__(cls, graph, **kwargs):
+        raise_if_backend_is_not_python(
+            cls, kwargs.get('backend', Backend.PYTHON))
+        if graph._impl != 'adjacency_list':
+            raise NotImplementedError(
+                "Currently dynamic topological orders are only "
+                "implemented for adjacency list graphs.")
+        obj = object.__new__(cls)
+        offsets, targets, names = _neighbor_arrays_adjacency_list(graph)
+        size = len(names)
+        obj._graph, obj._names = graph, names
+        obj._succ = [list(targets[offsets[u]:offsets[u + 1]]) for u in range(size)]
+        obj._pred = [[] for _ in range(size)]
+        for u in range(size):
+            for v in obj._succ[u]:
+                obj._pred[v].append(u)
+        in_degree = [len(pred) for pred in obj._pred]
+        at = [u for u in range(size) if names[u] is not None and in_degree[u] == 0]
+        for u in at:
+            for v in obj._succ[u]:
+                in_degree[v] -= 1
+                if in_degree[v] == 0:
+                    at.append(v)
+        if len(at) != len(graph.vertices):
+            raise ValueError("Graph contains a cycle.")
+        obj._at, obj._order = at, [names[u] for u in at]
+        obj._position = array('q', [-1])*size
+        for i, u in enumerate(at):
+            obj._position[u] = i
+        obj._stamp = array('q', [0])*size
+        obj._epoch = 0
+        return obj
+
+    @classmethod
+    def methods(cls):
+        return ['__new__', 'add_vertex', 'add_edge', 'remove_edge',
+                'order', 'position']
+
+    def _id(self, name):
+        u = self._graph._ids.get(str(name), None)
+        if u is None:
+            raise ValueError("Vertex %s is not present in the graph." % (name))
+        return u
+
+    def _search(self, start, succ, inside, stop=-1):
+        """
+        Returns the vertices reachable from start along succ
+        through vertices for which inside holds, or None if stop
+        is one of them.
+        """
+        stamp, epoch = self._stamp, self._epoch
+        stamp[start] = epoch
+        found, stack = [start], [start]
+        while stack:
+            for w in succ[stack.pop()]:
+                if w == stop:
+                    return None
+                if stamp[w] != epoch and inside(w):
+                    stamp[w] = epoch
+                    found.append(w)
+                    stack.append(w)
+        return found
+
+    def add_vertex(self, node):
+        """
+        Adds a vertex to the graph, placing it last in the order.
+        """
+        graph = self._graph
+        if node.name in graph._ids:
+            return
+        graph.add_vertex(node)
+        u = graph._ids[node.name]
+        while len(self._names) <= u:
+            self._succ.append([])
+            self._pred.append([])
+            self._names.append(None)
+            self._position.append(-1)
+            self._stamp.append(0)
+        self._names[u] = node.name
+        self._position[u] = len(self._at)
+        self._at.append(u)
+        self._order.append(node.name)
+
+    def add_edge(self, source, target, cost=None):
+        """
+        Adds an edge to the graph, reordering the vertices if the
+        edge does not agree with the current order.
+
+        Raises
+        ======
+
+        ValueError
+            If the edge would create a cycle, in which case
+            neither the graph nor the order is changed.
+        """
+        u, v = self._id(source), self._id(target)
+        position = self._position
+        lower, upper = position[v], position[u]
+        if lower <= upper:
+            self._epoch += 1
+            forward = None if u == v else \
+                self._search(v, self._succ, lambda w: position[w] < upper, u)
+            if forward is None:
+                raise ValueError("Edge from %s to %s would create a cycle."
+                                 % (source, target))
+            self._epoch += 1
+            backward = self._search(u, self._pred,
+                                    lambda w: position[w] > lower)
+            self._reorder(backward, forward)
+        if not self._graph.is_adjacent(self._names[u], self._names[v]):
+            self._succ[u].append(v)
+            self._pred[v].append(u)
+        self._graph.add_edge(self._names[u], self._names[v], cost)
+
+    def _reorder(self, backward, forward):
+        """
+        Moves the vertices reaching the source of the new edge
+        before the ones reachable from its target, reusing the
+        positions they occupied.
+        """
+        position, at = self._position, self._at
+        backward.sort(key=position.__getitem__)
+        forward.sort(key=position.__getitem__)
+        slots = sorted(position[w] for w in backward + forward)
+        for w, i in zip(backward + forward, slots):
+            position[w], at[i] = i, w
+            self._order[i] = self._names[w]
+
+    def remove_edge(self, source, target):
+        """
+        Removes an edge from the graph. The order stays valid.
+        """
+        u, v = self._id(source), self._id(target)
+        if self._graph.is_adjacent(self._names[u], self._names[v]):
+            self._succ[u].remove(v)
+            self._pred[v].remove(u)
+        self._graph.remove_edge(self._names[u], self._names[v])
+
+    def order(self):
+        """
+        Returns the names of the vertices in topological order.
+        The list is updated in place by later insertions and must
+        not be modified.
+        """
+        return self._order
+
+    def position(self, vertex):
+        """
+        Returns the position of the vertex in the order.
+        """
+        return self._position[self._id(vertex)]
@@ -0,0 +1,204 @@
+from array import array
+from operator import itemgetter
+from os import PathLike
+from time import perf_counter
+from pydatastructs.graphs.graph import Graph
+from pydatastructs.graphs._backend.cpp import _graph
+from pydatastructs.utils.misc_util import Backend
+
+__all__ = [
+    'read_edgelist'
+]
+
+def _chunks(file, size):
+    """
+    Yields the contents of the file in pieces of about `size`
+    bytes, each ending at the end of a line.
+    """
+    while True:
+        data = file.read(size)
+        if not data:
+            return
+        yield data + file.readline()
+
+def _fields(data, delimiter, columns, comments, first_line):
+    """
+    Returns the lists of the first, second and, up to `columns`,
+    following fields of the lines of data, skipping blank lines
+    and comments. Every line must have at least `columns` fields.
+
+    Chunks in which every line has exactly `columns` fields, the
+    common case, are split at once with a marker ending every
+    line, which avoids creating a list per line.
+    """
+    if '\r' in data:
+        data = data.replace('\r\n', '\n')
+    if not data.endswith('\n'):
+        data += '\n'
+    num_lines = data.count('\n')
+    if '\0' not in data and not (comments and comments in data):
+        separator = ' ' if delimiter is None else delimiter
+        tokens = data.replace('\n', separator + '\0' + separator).split(delimiter)
+        if delimiter is not None:
+            tokens.pop()
+        width = columns + 1
+        if len(tokens) == width*num_lines and \
+            tokens[columns::width].count('\0') == num_lines:
+            return [tokens[k::width] for k in range(columns)]
+
+    rows = []
+    for number, line in enumerate(data.split('\n'), first_line):
+        stripped = line.strip()
+        if not stripped or (comments and stripped.startswith(comments)):
+            continue
+        row = line.split(delimiter)
+        if len(row) < columns:
+            raise ValueError("Line %d has %d fields, expected at least %d."
+                             % (number, len(row), columns))
+        rows.append(row)
+    return [list(map(itemgetter(k), rows)) for k in range(columns)]
+
+def _weights(data, delimiter, comments, fields, first_line):
+    try:
+        return array('d', map(float, fields))
+    except ValueError:
+        for number, line in enumerate(data.split('\n'), first_line):
+            stripped = line.strip()
+            if not stripped or (comments and stripped.startswith(comments)):
+                continue
+            weight = line.split(delimiter)[2].strip()
+            try:
+                float(weight)
+            except ValueError:
+                raise ValueError("Line %d has an invalid weight '%s'."
+                                 % (number, weight))
+        raise
+
+def _add_chunk(graph, data, delimiter, comments, weighted, directed, first_line):
+    fields = _fields(data, delimiter, 3 if weighted else 2, comments, first_line)
+    sources, targets = fields[0], fields[1]
+    weights = _weights(data, delimiter, comments, fields[2], first_line) \
+        if weighted else None
+    graph.add_vertices_from(sources)
+    graph.add_vertices_from(targets)
+    if not directed:
+        sources, targets = sources + targets, targets + sources
+        weights = weights + weights if weighted else None
+    graph.add_edges_from(sources, targets, weights)
+
+def read_edgelist(path_or_file, delimiter=None, weighted=False,
+                  directed=True, **kwargs):
+    """
+    Reads a graph from a text file listing one edge per line.
+
+    The file is parsed in chunks which are added to the graph
+    before the next one is read, so the edges of the whole file
+    never exist as Python objects at the same time. Every vertex
+    name is added to the graph once, when it is first seen.
+    With the C++ backend, the chunks are split and their names
+    looked up natively, without creating Python objects for
+    the fields.
+
+    Parameters
+    ==========
+
+    path_or_file: str, os.PathLike or file
+        The path of the file, or a file object opened for
+        reading in binary or text mode.
+    delimiter: str
+        The string separating the fields of a line.
+        Optional, by default, any whitespace.
+    weighted: bool
+        If `True`, the third field of every line is the
+        weight of the edge. The fields after the ones used
+        are ignored.
+        Optional, by default, `False`.
+    directed: bool
+        If `False`, every line adds the edges in both
+        directions.
+        Optional, by default, `True`.
+    implementation: str
+        The implementation of the graph, either
+        'adjacency_list' or 'csr'.
+        Optional, by default, 'adjacency_list'.
+    comments: str
+        Lines starting with this string, after leading
+        whitespace, are skipped, like blank lines.
+        Optional, by default, '#'.
+    chunk_size: int
+        The approximate number of bytes parsed at once.
+        Optional, by default, 4 MiB.
+    progress: function
+        Called after every chunk as `progress(lines, bytes,
+        seconds)` with the numbers of lines and bytes read so
+        far and the seconds elapsed, from which the throughput
+        can be reported. For files opened in text mode the
+        number of characters is given instead of bytes.
+        Optional.
+    backend: pydatastructs.Backend
+        The backend of the graph.
+        Optional, by default, the best available
+        backend is used.
+
+    Returns
+    =======
+
+    Graph
+
+    Raises
+    ======
+
+    ValueError
+        If a line has too few fields or an invalid weight.
+    NotImplementedError
+        If the backend can't read edge lists into graphs of
+        the given implementation.
+
+    Examples
+    ========
+
+    >>> from io import StringIO
+    >>> from pydatastructs import read_edgelist
+    >>> lines = "# source target weight\\na b 1.5\\nb c 2\\n"
+    >>> G = read_edgelist(StringIO(lines), weighted=True, directed=False)
+    >>> G.vertices
+    ['a', 'b', 'c']
+    >>> G.get_edge('c', 'b').value
+    2.0
+    """
+    backend = kwargs.get('backend', Backend.PYTHON)
+    implementation = kwargs.get('implementation', 'adjacency_list')
+    comments = kwargs.get('comments', '#')
+    chunk_size = kwargs.get('chunk_size', 1 << 22)
+    progress = kwargs.get('progress', None)
+    if backend == Backend.CPP and \
+        not hasattr(_graph, "read_edgelist_chunk_" + implementation):
+        raise NotImplementedError(
+        "Currently reading edge lists isn't implemented for "
+        "%s graphs."%(implementation))
+    if isinstance(path_or_file, (str, bytes, PathLike)):
+        with open(path_or_file, 'rb') as file:
+            return read_edgelist(file, delimiter, weighted, directed,
+                                 **dict(kwargs, backend=backend))
+
+    graph = Graph(implementation=implementation, backend=backend)
+    num_lines, num_bytes = 0, 0
+    start = perf_counter()
+    for data in _chunks(path_or_file, chunk_size):
+        num_bytes += len(data)
+        if backend == Backend.CPP:
+            if isinstance(data, str):
+                data = data.encode('utf-8')
+            getattr(_graph, "read_edgelist_chunk_" + implementation)(
+                graph, data, delimiter, comments, weighted, directed,
+                num_lines + 1)
+            num_lines += data.count(b'\n') + (not data.endswith(b'\n'))
+        else:
+            if isinstance(data, bytes):
+                data = data.decode('utf-8')
+            _add_chunk(graph, data, delimiter, comments, weighted, directed,
+                       num_lines + 1)
+            num_lines += data.count('\n') + (not data.endswith('\n'))
+        if progress is not None:
+            progress(num_lines, num_bytes, perf_counter() - start)
+    return graph
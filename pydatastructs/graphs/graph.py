@@ -1,10 +1,120 @@
 
+import sys
+from array import array
+from collections import OrderedDict, namedtuple
+from operator import le
+from mmap import mmap as MemoryMap, ACCESS_READ
+from struct import Struct
 from pydatastructs.utils.misc_util import Backend, raise_if_backend_is_not_python
 
 __all__ = [
     'Graph'
 ]
 
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+def _copy_result(result):
+    """
+    Copies the dictionaries and arrays of a result, so that
+    changing the copy does not change the cached original.
+    """
+    if isinstance(result, tuple):
+        return tuple(_copy_result(item) for item in result)
+    if isinstance(result, (dict, array)):
+        return result.copy() if isinstance(result, dict) else result[:]
+    return result
+
+# Header of the files written by Graph.save, followed by the
+# offsets, targets and weights of the edges, the offsets of the
+# vertex names and the names themselves, all little endian.
+_FORMAT = Struct('<8sIIqqq')
+_FORMAT_MAGIC = b'PYDSGRPH'
+_FORMAT_VERSION = 1
+
+def _saved_arrays(graph):
+    """
+    Returns the offsets, targets and weights of the edges of an
+    adjacency list or adjacency matrix graph as in the CSR
+    implementation, rows sorted by target and vertices numbered
+    without gaps, along with the names of the vertices by number.
+    """
+    from pydatastructs.graphs.algorithms import _graph_arrays
+    old_offsets, old_targets, old_names = _graph_arrays(graph)
+    ids, names = array('q', [-1])*len(old_names), []
+    for u, name in enumerate(old_names):
+        if name is not None:
+            ids[u] = len(names)
+            names.append(name)
+    edges, nan = graph._edges, float('nan')
+    offsets, targets, weights = array('q', [0]), array('q'), array('d')
+    for u, name in enumerate(old_names):
+        if name is None:
+            continue
+        for v in sorted(old_targets[old_offsets[u]:old_offsets[u + 1]],
+                        key=ids.__getitem__):
+            edge = edges.get(u << 32 | v, None)
+            targets.append(ids[v])
+            weights.append(nan if edge is None or edge.value is None
+                           else edge.value)
+        offsets.append(len(targets))
+    return offsets, targets, weights, names
+
+def _nondecreasing(values):
+    return all(map(le, values[:-1], values[1:]))
+
+def _little_endian(values, typecode):
+    if sys.byteorder != 'little':
+        values = array(typecode, values)
+        values.byteswap()
+    return values
+
+def _loaded_array(view, typecode, mapped):
+    """
+    Returns the section of a loaded file as a read-only view of
+    the mapping if `mapped` is `True` and the host is little
+    endian, otherwise as a typed array.
+    """
+    if mapped and sys.byteorder == 'little':
+        return view.cast(typecode)
+    values = array(typecode)
+    values.frombytes(view)
+    if sys.byteorder != 'little':
+        values.byteswap()
+    return values
+
+class _ResultCache(object):
+    """
+    Least recently used results of algorithms, keyed by
+    algorithm, source, target and the parameters which
+    change the result. All of them are discarded
+    once the version of the graph they were computed for
+    changes.
+    """
+
+    __slots__ = ['maxsize', 'hits', 'misses', 'version', 'results']
+
+    def __init__(self, maxsize, version):
+        self.maxsize, self.hits, self.misses = maxsize, 0, 0
+        self.version, self.results = version, OrderedDict()
+
+    def lookup(self, key, version, compute):
+        results = self.results
+        if version != self.version:
+            results.clear()
+            self.version = version
+        result = results.get(key, None)
+        if result is not None:
+            self.hits += 1
+            results.move_to_end(key)
+            return _copy_result(result)
+        self.misses += 1
+        result = compute()
+        if self.maxsize > 0:
+            results[key] = _copy_result(result)
+            if len(results) > self.maxsize:
+                results.popitem(last=False)
+        return result
+
 class Graph(object):
     """
     Represents generic concept of graphs.
@@ -22,10 +132,17 @@ class Graph(object):
 
         'adjacency_matrix' -> Adjacency matrix implementation.
 
+        'csr' -> Compressed sparse row implementation.
+
         By default, 'adjacency_list'.
     vertices: GraphNode(s)
-        For AdjacencyList implementation vertices
-        can be passed for initializing the graph.
+        For AdjacencyList and CompressedSparseRow
+        implementations vertices can be passed for initializing the graph.
+    in_neighbors: bool
+        For the AdjacencyList implementation, if `True`, the
+        sources of the incoming edges of every vertex are
+        kept, see `AdjacencyList`.
+        Optional, by default, `False`.
     backend: pydatastructs.Backend
         The backend to be used.
         Optional, by default, the best available
@@ -51,6 +168,22 @@ class Graph(object):
     >>> g.is_adjacent('v_2', 'v_1')
     True
 
+    Results of `shortest_paths`, except for 'a_star', and of
+    `breadth_first_search` without an operation can be memoized
+    on a graph by calling
+    `enable_cache`. Every modification of the graph increments
+    its version, which discards the memoized results.
+
+    >>> from pydatastructs import shortest_paths
+    >>> g.add_edge('v_1', 'v_2', 3)
+    >>> g.enable_cache(maxsize=16)
+    >>> shortest_paths(g, 'dijkstra', 'v_1')[0]
+    {'v_1': 0, 'v_2': 3}
+    >>> shortest_paths(g, 'dijkstra', 'v_1')[0]
+    {'v_1': 0, 'v_2': 3}
+    >>> g.cache_info()
+    CacheInfo(hits=1, misses=1, maxsize=16, currsize=1)
+
     References
     ==========
 
@@ -84,10 +217,132 @@ class Graph(object):
             from pydatastructs.graphs.adjacency_matrix import AdjacencyMatrix
             obj = AdjacencyMatrix(*args, **kwargs)
             return obj
+        elif implementation == 'csr':
+            from pydatastructs.graphs.compressed_sparse_row import CompressedSparseRow
+            obj = CompressedSparseRow(*args, **kwargs)
+            return obj
         else:
             raise NotImplementedError("%s implementation is not a part "
                                       "of the library currently."%(implementation))
 
+    def enable_cache(self, maxsize=128):
+        """
+        Starts memoizing the results of `shortest_paths` and
+        of `breadth_first_search` without an operation, keeping
+        at most `maxsize` of them and discarding the least
+        recently used ones first. Results are copied in and out
+        of the cache, so changing a returned dictionary or array
+        does not change the memoized one.
+        """
+        self._cache = _ResultCache(maxsize, self._version)
+
+    def disable_cache(self):
+        """
+        Stops memoizing results and discards the memoized ones.
+        """
+        self._cache = None
+
+    def cache_info(self):
+        """
+        Returns the numbers of hits and misses, the maximum and the
+        current size of the cache as a `CacheInfo`, or `None` if
+        the cache is not enabled.
+        """
+        cache = self._cache
+        if cache is None:
+            return None
+        if cache.version != self._version:
+            cache.results.clear()
+            cache.version = self._version
+        return CacheInfo(cache.hits, cache.misses, cache.maxsize,
+                         len(cache.results))
+
+    def save(self, path):
+        """
+        Writes the graph to the file at `path` in a versioned
+        binary format which `Graph.load` reads back. The file
+        holds the names of the vertices and the offsets, targets
+        and weights of the edges, as in the CSR implementation.
+        The data of the vertices is not saved.
+        """
+        if self._impl == 'csr':
+            offsets, targets, weights = \
+                self.offsets(), self.targets(), self.weights()
+            names = self.vertices
+        else:
+            offsets, targets, weights, names = _saved_arrays(self)
+        encoded = [name.encode('utf-8') for name in names]
+        name_offsets = array('q', [0])
+        for name in encoded:
+            name_offsets.append(name_offsets[-1] + len(name))
+        with open(path, 'wb') as file:
+            file.write(_FORMAT.pack(_FORMAT_MAGIC, _FORMAT_VERSION, 0,
+                                    len(names), len(targets),
+                                    name_offsets[-1]))
+            file.write(_little_endian(offsets, 'q'))
+            file.write(_little_endian(targets, 'q'))
+            file.write(_little_endian(weights, 'd'))
+            file.write(_little_endian(name_offsets, 'q'))
+            file.write(b''.join(encoded))
+
+    @staticmethod
+    def load(path, mmap=True, **kwargs):
+        """
+        Reads a graph written by `Graph.save` and returns it
+        using the CSR implementation.
+
+        If `mmap` is `True`, the offsets, targets and weights are
+        read-only views of a memory mapping of the file, so that
+        processes loading the same file share one copy of it in
+        the page cache and the algorithms run on the mapped
+        arrays directly. They are copied into typed arrays the
+        first time the graph is modified. Otherwise, the file is
+        read into typed arrays.
+
+        Raises
+        ======
+
+        ValueError
+            If the file is not a saved graph, was saved in an
+            unsupported version of the format, or its offsets
+            or targets are out of range.
+        """
+        raise_if_backend_is_not_python(
+            Graph.load, kwargs.get('backend', Backend.PYTHON))
+        with open(path, 'rb') as file:
+            data = MemoryMap(file.fileno(), 0, access=ACCESS_READ) \
+                if mmap else file.read()
+        view = memoryview(data)
+        if len(view) < _FORMAT.size or \
+            _FORMAT.unpack_from(view)[0] != _FORMAT_MAGIC:
+            raise ValueError("%s is not a saved graph." % (path))
+        _, version, _, V, E, names_size = _FORMAT.unpack_from(view)
+        if version != _FORMAT_VERSION:
+            raise ValueError("Version %d of the graph format is not "
+                             "supported." % (version))
+        sections, start = [], _FORMAT.size
+        for size in (8*(V + 1), 8*E, 8*E, 8*(V + 1), names_size):
+            sections.append(view[start:start + size])
+            start += size
+        if start != len(view):
+            raise ValueError("%s is truncated or corrupted." % (path))
+        offsets = _loaded_array(sections[0], 'q', mmap)
+        targets = _loaded_array(sections[1], 'q', mmap)
+        weights = _loaded_array(sections[2], 'd', mmap)
+        name_offsets = _loaded_array(sections[3], 'q', False)
+        # The arrays are checked once here, so that the algorithms
+        # can index with them without checking bounds.
+        if offsets[0] != 0 or offsets[V] != E or name_offsets[0] != 0 or \
+            name_offsets[V] != names_size or not _nondecreasing(offsets) or \
+            not _nondecreasing(name_offsets) or \
+            (E > 0 and (min(targets) < 0 or max(targets) >= V)):
+            raise ValueError("%s is truncated or corrupted." % (path))
+        blob = sections[4].tobytes()
+        names = [blob[name_offsets[u]:name_offsets[u + 1]].decode('utf-8')
+                 for u in range(V)]
+        from pydatastructs.graphs.compressed_sparse_row import CompressedSparseRow
+        return CompressedSparseRow._from_arrays(names, offsets, targets, weights)
+
     def is_adjacent(self, node1, node2):
         """
         Checks if the nodes with the given
@@ -105,6 +360,22 @@ class Graph(object):
         raise NotImplementedError(
             "This is an abstract method.")
 
+    def predecessors(self, node):
+        """
+        Lists the vertices with an edge to
+        the node with given name.
+        """
+        raise NotImplementedError(
+            "This is an abstract method.")
+
+    def in_degree(self, node):
+        """
+        Number of edges ending at the node
+        with given name.
+        """
+        raise NotImplementedError(
+            "This is an abstract method.")
+
     def add_vertex(self, node):
         """
         Adds the input vertex to the node, or does nothing
@@ -121,6 +392,14 @@ class Graph(object):
         raise NotImplementedError(
             "This is an abstract method.")
 
+    def add_vertices_from(self, names):
+        """
+        Adds a vertex for each of the given names
+        which is not already in the graph.
+        """
+        raise NotImplementedError(
+            "This is an abstract method.")
+
     def add_edge(self, source, target, cost=None):
         """
         Adds the edge starting at first parameter
@@ -130,6 +409,14 @@ class Graph(object):
         raise NotImplementedError(
             "This is an abstract method.")
 
+    def add_edges_from(self, sources, targets, weights=None):
+        """
+        Adds the edges from sources[i] to targets[i]
+        with cost weights[i], if weights are given.
+        """
+        raise NotImplementedError(
+            "This is an abstract method.")
+
     def get_edge(self, source, target):
         """
         Returns GraphEdge object if there
@@ -161,3 +448,21 @@ class Graph(object):
         """
         raise NotImplementedError(
             "This is an abstract method.")
+
+    def degree(self, node):
+        """
+        Number of edges starting at the node
+        with given name.
+        """
+        raise NotImplementedError(
+            "This is an abstract method.")
+
+    def degrees(self, incoming=False):
+        """
+        Returns the numbers of edges starting at,
+        or if `incoming` is `True` ending at, the
+        vertices as a typed array, in the order of
+        the vertices of the graph.
+        """
+        raise NotImplementedError(
+            "This is an abstract method.")
@@ -0,0 +1,258 @@
+from array import array
+from heapq import heappush, heappop
+from math import isnan
+from pydatastructs.graphs.algorithms import _weighted_arrays
+from pydatastructs.utils.misc_util import Backend
+
+__all__ = [
+    'ShortestPathEngine'
+]
+
+class _Search(object):
+    """
+    Scratch space of a Dijkstra search over a snapshot. An entry
+    of `dist` and `pred` is valid only if the matching entry of
+    `stamp` equals `epoch`, and a vertex is settled only if its
+    entry of `done` does, so starting a new search only takes
+    incrementing `epoch` instead of clearing arrays sized to the
+    whole graph.
+    """
+
+    __slots__ = ['offsets', 'targets', 'weights', 'dist', 'pred',
+                 'stamp', 'done', 'epoch', 'heap', 'source']
+
+    def __init__(self, offsets, targets, weights):
+        V = len(offsets) - 1
+        self.offsets, self.targets, self.weights = offsets, targets, weights
+        self.dist = array('d', [0.0])*V
+        self.pred = array('q', [-1])*V
+        self.stamp = array('q', [0])*V
+        self.done = array('q', [0])*V
+        self.epoch, self.heap, self.source = 0, [], -1
+
+    def start(self, source):
+        self.epoch += 1
+        self.source = source
+        self.dist[source], self.pred[source] = 0.0, -1
+        self.stamp[source] = self.epoch
+        self.heap = [(0.0, source)]
+
+    def distance(self, v):
+        return self.dist[v] if self.stamp[v] == self.epoch else float('inf')
+
+    def settle(self):
+        """
+        Settles the closest unsettled vertex and returns it, or
+        -1 if there are none left.
+        """
+        heap, dist, stamp, done, epoch = \
+            self.heap, self.dist, self.stamp, self.done, self.epoch
+        while heap:
+            d, u = heappop(heap)
+            if done[u] == epoch:
+                continue
+            done[u] = epoch
+            offsets, targets, weights = self.offsets, self.targets, self.weights
+            for i in range(offsets[u], offsets[u + 1]):
+                v, d_v = targets[i], d + weights[i]
+                if stamp[v] != epoch or d_v < dist[v]:
+                    stamp[v], dist[v], self.pred[v] = epoch, d_v, u
+                    heappush(heap, (d_v, v))
+            return u
+        return -1
+
+    def path(self, v):
+        path = [v]
+        while self.pred[path[-1]] != -1:
+            path.append(self.pred[path[-1]])
+        return path
+
+class ShortestPathEngine(object):
+    """
+    Answers repeated shortest path queries on a graph which
+    does not change.
+
+    The weighted edges of the graph are copied into arrays
+    indexed by vertex number when the engine is created, and
+    the distances and predecessors of the searches are kept
+    in arrays allocated once and stamped with the query they
+    belong to, so a query only touches the vertices it visits.
+    Changes made to the graph later are not seen by the engine.
+
+    Parameters
+    ==========
+
+    graph: Graph
+        The graph to be queried.
+    algorithm: str
+        The algorithm to be used. Currently, the following
+        algorithms are supported,
+
+        'dijkstra' -> Dijkstra algorithm. Consecutive queries,
+        after grouping them by source in `query_many`, from the
+        same source continue the same search.
+
+        'bidirectional_dijkstra' -> Dijkstra algorithm from the
+        source and, along the reversed edges, from the target,
+        meeting in the middle.
+
+        Edges with negative or no weights are ignored, as by
+        `shortest_paths` with Dijkstra algorithm.
+    backend: pydatastructs.Backend
+        The backend to be used.
+        Optional, by default, the best available
+        backend is used.
+
+    Examples
+    ========
+
+    >>> from pydatastructs import Graph, ShortestPathEngine
+    >>> G = Graph(implementation='csr')
+    >>> G.add_vertices_from(['a', 'b', 'c', 'd'])
+    >>> G.add_edges_from(['a', 'b', 'a'], ['b', 'c', 'c'], [1, 2, 5])
+    >>> engine = ShortestPathEngine(G, 'dijkstra')
+    >>> engine.query('a', 'c')
+    (3.0, ['a', 'b', 'c'])
+    >>> engine.query('c', 'a')
+    (inf, [])
+    >>> list(engine.query_many(['a', 'a', 'b'], ['c', 'b', 'c']))
+    [3.0, 1.0, 2.0]
+
+    See also
+    ========
+
+    pydatastructs.shortest_paths
+    """
+
+    __slots__ = ['_names', '_ids', '_bidirectional', '_forward', '_backward']
+
+    def __new__(cls, graph, algorithm, **kwargs):
+        backend = kwargs.get('backend', Backend.PYTHON)
+        if backend == Backend.CPP:
+            from pydatastructs.graphs._backend.cpp import _graph
+            return _graph.ShortestPathEngine(graph, algorithm)
+        if algorithm not in ('dijkstra', 'bidirectional_dijkstra'):
+            raise NotImplementedError(
+                "Currently %s algorithm isn't implemented for "
+                "shortest path engines." % (algorithm))
+        obj = object.__new__(cls)
+        if graph._impl == 'csr':
+            offsets, targets, weights = \
+                graph.offsets(), graph.targets(), graph.weights()
+            names = list(graph.vertices)
+        else:
+            offsets, targets, weights, names = _weighted_arrays(graph)
+        V = len(names)
+        arcs = [(u, targets[i], weights[i]) for u in range(V)
+                for i in range(offsets[u], offsets[u + 1])
+                if weights[i] is not None and not isnan(weights[i]) and
+                weights[i] >= 0]
+        obj._names = names
+        obj._ids = {name: u for u, name in enumerate(names) if name is not None}
+        obj._bidirectional = algorithm == 'bidirectional_dijkstra'
+        obj._forward = _Search(*cls._group(arcs, V, 0))
+        obj._backward = _Search(*cls._group(arcs, V, 1)) \
+            if obj._bidirectional else None
+        return obj
+
+    @classmethod
+    def methods(cls):
+        return ['__new__', 'query', 'query_many']
+
+    @staticmethod
+    def _group(arcs, V, side):
+        offsets = array('q', [0])*(V + 1)
+        for arc in arcs:
+            offsets[arc[side] + 1] += 1
+        for u in range(V):
+            offsets[u + 1] += offsets[u]
+        targets, weights = array('q', [0])*len(arcs), array('d', [0.0])*len(arcs)
+        cursor = offsets[:-1]
+        for arc in arcs:
+            u = arc[side]
+            targets[cursor[u]], weights[cursor[u]] = arc[1 - side], arc[2]
+            cursor[u] += 1
+        return offsets, targets, weights
+
+    def _id(self, name):
+        u = self._ids.get(str(name), None)
+        if u is None:
+            raise ValueError("Vertex %s is not present in the graph." % (name))
+        return u
+
+    def _unidirectional(self, s, t):
+        forward = self._forward
+        if forward.source != s:
+            forward.start(s)
+        while forward.done[t] != forward.epoch:
+            if forward.settle() == -1:
+                return float('inf'), []
+        return forward.dist[t], forward.path(t)[::-1]
+
+    def _meet(self, s, t):
+        forward, backward = self._forward, self._backward
+        forward.start(s)
+        backward.start(t)
+        best, middle = float('inf'), -1
+        while forward.heap and backward.heap and \
+            forward.heap[0][0] + backward.heap[0][0] < best:
+            if forward.heap[0][0] <= backward.heap[0][0]:
+                side, other = forward, backward
+            else:
+                side, other = backward, forward
+            u = side.settle()
+            if u == -1:
+                break
+            for v in [u] + list(side.targets[side.offsets[u]:side.offsets[u + 1]]):
+                d = side.distance(v) + other.distance(v)
+                if d < best:
+                    best, middle = d, v
+        # Invalidate the forward search, which query_many may
+        # otherwise try to continue.
+        forward.source = -1
+        if middle == -1:
+            return float('inf'), []
+        return best, forward.path(middle)[::-1] + backward.path(middle)[1:]
+
+    def _query(self, s, t):
+        if self._bidirectional:
+            return self._meet(s, t)
+        return self._unidirectional(s, t)
+
+    def query(self, source, target):
+        """
+        Returns the length of a shortest path from source to
+        target, along with the names of its vertices, or
+        `(inf, [])` if target is not reachable.
+        """
+        distance, path = self._query(self._id(source), self._id(target))
+        return distance, [self._names[v] for v in path]
+
+    def query_many(self, sources, targets, paths=False):
+        """
+        Answers the queries from `sources[i]` to `targets[i]`
+        for all `i` together, grouping them by source.
+
+        Returns the typed array of distances, `inf` for the
+        targets which are not reachable. If `paths` is `True`,
+        the offsets and vertices of the paths are returned as
+        well, the numbers of the vertices of the path of query
+        `i` occupying the slots from `offsets[i]` to
+        `offsets[i + 1] - 1` of the latter.
+        """
+        s_ids = [self._id(u) for u in sources]
+        t_ids = [self._id(v) for v in targets]
+        if len(s_ids) != len(t_ids):
+            raise ValueError("sources and targets must have the same length.")
+        n = len(s_ids)
+        distances = array('d', [float('inf')])*n
+        found = [None]*n
+        for i in sorted(range(n), key=s_ids.__getitem__):
+            distances[i], found[i] = self._query(s_ids[i], t_ids[i])
+        if not paths:
+            return distances
+        offsets, vertices = array('q', [0]), array('q')
+        for path in found:
+            vertices.extend(path)
+            offsets.append(len(vertices))
+        return distances, offsets, vertices
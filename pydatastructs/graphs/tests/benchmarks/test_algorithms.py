@@ -0,0 +1,156 @@
+import random, timeit, functools, os, pytest
+from pydatastructs import (Graph, shortest_paths, breadth_first_search, max_flow,
+    minimum_spanning_tree, minimum_spanning_tree_parallel, Backend)
+
+def _random_graph(num_edges, backend, seed=0, implementation='adjacency_list'):
+    rng = random.Random(seed)
+    num_vertices = max(2, num_edges // 10)
+    sources = [rng.randrange(num_vertices) for _ in range(num_edges)]
+    targets = [rng.randrange(num_vertices) for _ in range(num_edges)]
+    weights = [rng.randint(1, 100) for _ in range(num_edges)]
+    graph = Graph(implementation=implementation, backend=backend)
+    graph.add_vertices_from(range(num_vertices))
+    graph.add_edges_from(sources, targets, weights)
+    return graph
+
+def _test_shortest_paths_dijkstra(num_edges):
+    repeat = 1
+    number = 1
+
+    graph_python = _random_graph(num_edges, Backend.PYTHON)
+    graph_cpp = _random_graph(num_edges, Backend.CPP)
+
+    timer_python = timeit.Timer(functools.partial(
+        shortest_paths, graph_python, 'dijkstra', '0'))
+    python_backend = min(timer_python.repeat(repeat, number))
+
+    timer_cpp = timeit.Timer(functools.partial(
+        shortest_paths, graph_cpp, 'dijkstra', '0', backend=Backend.CPP))
+    cpp_backend = min(timer_cpp.repeat(repeat, number))
+
+    assert cpp_backend < python_backend
+    assert shortest_paths(graph_python, 'dijkstra', '0')[0] == \
+        shortest_paths(graph_cpp, 'dijkstra', '0', backend=Backend.CPP)[0]
+
+@pytest.mark.xfail
+def test_shortest_paths_dijkstra():
+    size = int(os.environ.get("PYDATASTRUCTS_BENCHMARK_SIZE", "100000"))
+    _test_shortest_paths_dijkstra(size)
+    _test_shortest_paths_dijkstra(10*size)
+
+def _test_breadth_first_search_direction_optimizing(num_edges):
+    repeat = 1
+    number = 1
+
+    graph = _random_graph(num_edges, Backend.CPP, implementation='csr')
+    breadth_first_search(graph, '0', direction_optimizing=True,
+                         backend=Backend.CPP)
+
+    timer_top_down = timeit.Timer(functools.partial(
+        breadth_first_search, graph, '0', backend=Backend.CPP))
+    top_down = min(timer_top_down.repeat(repeat, number))
+
+    timer_direction_optimizing = timeit.Timer(functools.partial(
+        breadth_first_search, graph, '0', direction_optimizing=True,
+        backend=Backend.CPP))
+    direction_optimizing = min(timer_direction_optimizing.repeat(repeat, number))
+
+    assert direction_optimizing < top_down
+    assert breadth_first_search(graph, '0', backend=Backend.CPP)[2] == \
+        breadth_first_search(graph, '0', direction_optimizing=True,
+                             backend=Backend.CPP)[2]
+
+@pytest.mark.xfail
+def test_breadth_first_search_direction_optimizing():
+    size = int(os.environ.get("PYDATASTRUCTS_BENCHMARK_SIZE", "100000"))
+    _test_breadth_first_search_direction_optimizing(size)
+    _test_breadth_first_search_direction_optimizing(10*size)
+
+def _test_shortest_paths_delta_stepping(num_edges):
+    repeat = 1
+    number = 1
+
+    graph = _random_graph(num_edges, Backend.CPP, implementation='csr')
+
+    timer_single = timeit.Timer(functools.partial(
+        shortest_paths, graph, 'delta_stepping', '0', num_threads=1,
+        backend=Backend.CPP))
+    single = min(timer_single.repeat(repeat, number))
+
+    timer_parallel = timeit.Timer(functools.partial(
+        shortest_paths, graph, 'delta_stepping', '0', num_threads=4,
+        backend=Backend.CPP))
+    parallel = min(timer_parallel.repeat(repeat, number))
+
+    assert parallel < single
+    assert shortest_paths(graph, 'dijkstra', '0', backend=Backend.CPP)[0] == \
+        shortest_paths(graph, 'delta_stepping', '0', num_threads=4,
+                       backend=Backend.CPP)[0]
+
+@pytest.mark.xfail
+def test_shortest_paths_delta_stepping():
+    size = int(os.environ.get("PYDATASTRUCTS_BENCHMARK_SIZE", "100000"))
+    _test_shortest_paths_delta_stepping(size)
+    _test_shortest_paths_delta_stepping(10*size)
+
+def _test_max_flow_push_relabel(num_edges):
+    repeat = 1
+    number = 1
+
+    graph_python = _random_graph(num_edges, Backend.PYTHON, implementation='csr')
+    graph_cpp = _random_graph(num_edges, Backend.CPP, implementation='csr')
+    sink = str(max(2, num_edges // 10) - 1)
+
+    timer_dinic = timeit.Timer(functools.partial(
+        max_flow, graph_python, '0', sink, 'dinic'))
+    dinic = min(timer_dinic.repeat(repeat, number))
+
+    timer_python = timeit.Timer(functools.partial(
+        max_flow, graph_python, '0', sink, 'push_relabel'))
+    python_backend = min(timer_python.repeat(repeat, number))
+
+    timer_cpp = timeit.Timer(functools.partial(
+        max_flow, graph_cpp, '0', sink, 'push_relabel', backend=Backend.CPP))
+    cpp_backend = min(timer_cpp.repeat(repeat, number))
+
+    assert cpp_backend < python_backend < dinic
+    assert max_flow(graph_python, '0', sink, 'push_relabel') == \
+        max_flow(graph_cpp, '0', sink, 'dinic', backend=Backend.CPP)
+
+@pytest.mark.xfail
+def test_max_flow_push_relabel():
+    size = int(os.environ.get("PYDATASTRUCTS_BENCHMARK_SIZE", "100000"))
+    _test_max_flow_push_relabel(size)
+    _test_max_flow_push_relabel(10*size)
+
+def _test_minimum_spanning_tree_parallel_boruvka(num_edges):
+    repeat = 1
+    number = 1
+
+    graph_python = _random_graph(num_edges, Backend.PYTHON, implementation='csr')
+    graph_cpp = _random_graph(num_edges, Backend.CPP, implementation='csr')
+
+    timer_kruskal = timeit.Timer(functools.partial(
+        minimum_spanning_tree_parallel, graph_python, 'kruskal', 4))
+    kruskal = min(timer_kruskal.repeat(repeat, number))
+
+    timer_python = timeit.Timer(functools.partial(
+        minimum_spanning_tree_parallel, graph_python, 'boruvka', 4))
+    python_backend = min(timer_python.repeat(repeat, number))
+
+    timer_cpp = timeit.Timer(functools.partial(
+        minimum_spanning_tree_parallel, graph_cpp, 'boruvka', 4, backend=Backend.CPP))
+    cpp_backend = min(timer_cpp.repeat(repeat, number))
+
+    assert cpp_backend < python_backend < kruskal
+    mst = minimum_spanning_tree_parallel(graph_python, 'boruvka', 4)
+    assert sum(mst.weights()) == \
+        sum(minimum_spanning_tree(graph_python, 'kruskal').weights())
+    assert mst.num_edges() == minimum_spanning_tree_parallel(
+        graph_cpp, 'boruvka', 4, backend=Backend.CPP).num_edges()
+
+@pytest.mark.xfail
+def test_minimum_spanning_tree_parallel_boruvka():
+    size = int(os.environ.get("PYDATASTRUCTS_BENCHMARK_SIZE", "100000"))
+    _test_minimum_spanning_tree_parallel_boruvka(size)
+    _test_minimum_spanning_tree_parallel_boruvka(10*size)
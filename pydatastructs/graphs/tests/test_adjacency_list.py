@@ -81,3 +81,228 @@ def test_adjacency_list():
     assert g2.is_adjacent('v_4', 'v') is False
     g2.remove_vertex('v')
     assert raises(ValueError, lambda: g2.add_edge('v_4', 'v'))
+
+def test_AdjacencyList_bulk_insertion():
+    from array import array
+
+    g = Graph(implementation='adjacency_list')
+    g.add_vertices_from(range(4))
+    g.add_vertices_from(['3', 'a'])
+    assert g.vertices == ['0', '1', '2', '3', 'a']
+    g.add_edges_from(array('q', [0, 0, 1]), (1, 2, 3))
+    g.add_edges_from(['2', '3'], ['a', 'a'], [5, None])
+    assert g.is_adjacent('0', '1') is True
+    assert g.is_adjacent('0', '2') is True
+    assert g.is_adjacent('1', '3') is True
+    assert g.is_adjacent('3', 'a') is True
+    assert g.is_adjacent('1', '0') is False
+    assert g.get_edge('0', '1') is None
+    assert g.get_edge('3', 'a') is None
+    e = g.get_edge('2', 'a')
+    assert (e.source.name, e.target.name, e.value) == ('2', 'a', 5)
+    assert g.num_edges() == 5
+    assert raises(ValueError, lambda: g.add_edges_from(['0'], ['1', '2']))
+    assert raises(ValueError, lambda: g.add_edges_from(['0'], ['x']))
+    assert raises(ValueError, lambda: g.add_edges_from(['0'], ['1'], [1, 2]))
+
+    g2 = Graph(implementation='adjacency_list', backend=Backend.CPP)
+    g2.add_vertices_from(range(4))
+    g2.add_vertices_from(['3', 'a'])
+    assert g2.num_vertices() == 5
+    g2.add_edges_from(array('q', [0, 0, 1]), (1, 2, 3))
+    g2.add_edges_from(['2', '3'], ['a', 'a'], array('d', [5, 1.5]))
+    assert g2.is_adjacent('0', '1') is True
+    assert g2.is_adjacent('1', '3') is True
+    assert g2.is_adjacent('1', '0') is False
+    assert str(g2.get_edge('2', 'a')) == "('2', 'a', 5.000000)"
+    assert str(g2.get_edge('3', 'a')) == "('3', 'a', 1.500000)"
+    assert g2.num_edges() == 5
+    assert raises(ValueError, lambda: g2.add_edges_from(['0'], ['1', '2']))
+    assert raises(ValueError, lambda: g2.add_edges_from(['0'], ['x']))
+    assert g2.num_edges() == 5
+
+def test_AdjacencyList_edge_index():
+    from pydatastructs import shortest_paths
+
+    for backend in [Backend.PYTHON, Backend.CPP]:
+        a, a_b, b, b_c = [AdjacencyListGraphNode(name, backend=backend)
+                          for name in ['a', 'a_b', 'b', 'b_c']]
+        g = Graph(a, a_b, b, b_c, backend=backend)
+        g.add_edge('a_b', 'b_c', 1)
+        g.add_edge('a', 'b_c', 5)
+        g.add_edge('a', 'a_b', 2)
+        assert g.get_edge('a_b', 'b_c').value == 1
+        assert g.get_edge('a', 'b_c').value == 5
+        assert g.get_edge('a_b', 'c') is None
+        dist, pred = shortest_paths(g, 'dijkstra', 'a', backend=backend)
+        assert dist['b_c'] == 3
+        assert pred['b_c'] == 'a_b'
+        g.remove_vertex('a_b')
+        assert g.get_edge('a', 'a_b') is None
+        assert g.get_edge('a', 'b_c').value == 5
+        assert g.num_vertices() == 3
+
+        # Adding the nodes to another graph doesn't change their
+        # ids in the first one.
+        a, b = [AdjacencyListGraphNode(name, backend=backend)
+                for name in ['a', 'b']]
+        g = Graph(a, b, backend=backend)
+        Graph(b, backend=backend)
+        g.add_edge('a', 'b', 5)
+        assert g.get_edge('a', 'b').value == 5
+        assert g.get_edge('a', 'a') is None
+        assert list(g.degrees(incoming=True)) == [0, 1]
+        assert shortest_paths(g, 'dijkstra', 'a', backend=backend)[0]['b'] == 5
+        g.remove_edge('a', 'b')
+        assert g.num_edges() == 0 and g.in_degree('b') == 0
+
+    g = Graph(AdjacencyListGraphNode('x_1'), AdjacencyListGraphNode('x'))
+    g.add_edge('x_1', 'x', 2)
+    assert list(g.edge_weights) == ['x_1_x']
+    g.add_edge('x', 'x_1', 3)
+    assert sorted(g.edge_weights) == ['x_1_x', 'x_x_1']
+    g.remove_edge('x_1', 'x')
+    assert list(g.edge_weights) == ['x_x_1']
+
+def test_AdjacencyList_result_cache():
+    from pydatastructs import shortest_paths, breadth_first_search
+
+    g = Graph()
+    g.add_vertices_from(['a', 'b', 'c'])
+    g.add_edges_from(['a', 'b'], ['b', 'c'], [1, 2])
+    assert g.cache_info() is None
+    g.enable_cache(maxsize=2)
+    dist, pred = shortest_paths(g, 'dijkstra', 'a')
+    assert dist == {'a': 0, 'b': 1, 'c': 3}
+    dist['c'] = -1
+    assert shortest_paths(g, 'dijkstra', 'a')[0]['c'] == 3
+    assert shortest_paths(g, 'bidirectional_dijkstra', 'a', 'c')[0] == 3
+    assert tuple(g.cache_info()) == (1, 2, 2, 2)
+
+    visit_order, parent, depth = breadth_first_search(g, 'a')
+    assert list(depth) == [0, 1, 2]
+    depth[2] = 7
+    assert list(breadth_first_search(g, 'a')[2]) == [0, 1, 2]
+    assert tuple(g.cache_info()) == (2, 3, 2, 2)
+    assert shortest_paths(g, 'dijkstra', 'a')[0]['c'] == 3
+    assert g.cache_info().misses == 4
+
+    for modify, expected in [(lambda: g.add_edge('a', 'c', 1), 1),
+                             (lambda: g.remove_edge('a', 'c'), 3),
+                             (lambda: g.add_vertex(AdjacencyListGraphNode('d')), 3),
+                             (lambda: g.remove_vertex('d'), 3)]:
+        shortest_paths(g, 'dijkstra', 'a')
+        modify()
+        assert g.cache_info().currsize == 0
+        misses = g.cache_info().misses
+        assert shortest_paths(g, 'dijkstra', 'a')[0]['c'] == expected
+        assert g.cache_info().misses == misses + 1
+
+    g.disable_cache()
+    assert g.cache_info() is None
+    assert shortest_paths(g, 'dijkstra', 'a')[0]['c'] == 3
+
+    # Results depending on a heuristic aren't memoized, the others
+    # are kept apart by the parameters of the algorithm.
+    g.add_edge('a', 'c', 4)
+    g.enable_cache(maxsize=4)
+    assert shortest_paths(g, 'a_star', 'a', 'c',
+                          heuristic=lambda v, t: 0)[0] == 3
+    assert shortest_paths(g, 'a_star', 'a', 'c',
+                          heuristic=lambda v, t: 9 if v == 'b' else 0)[0] == 4
+    assert shortest_paths(g, 'a_star', 'a', 'c',
+                          coordinates={'a': (0,), 'b': (0,), 'c': (0,)})[0] == 3
+    assert tuple(g.cache_info()) == (0, 0, 4, 0)
+    shortest_paths(g, 'delta_stepping', 'a', delta=1)
+    shortest_paths(g, 'delta_stepping', 'a', delta=2)
+    shortest_paths(g, 'delta_stepping', 'a', delta=2, num_threads=2)
+    assert tuple(g.cache_info()) == (0, 3, 4, 3)
+    assert shortest_paths(g, 'delta_stepping', 'a', delta=1)[0]['c'] == 3
+    assert g.cache_info().hits == 1
+
+def test_AdjacencyList_in_neighbors():
+    import random
+    from pydatastructs import (breadth_first_search,
+                               strongly_connected_components)
+
+    def names(nodes):
+        return sorted(node.name for node in nodes)
+
+    for backend in [Backend.PYTHON, Backend.CPP]:
+        for in_neighbors in [False, True]:
+            g = Graph(implementation='adjacency_list', backend=backend,
+                      in_neighbors=in_neighbors)
+            g.add_vertices_from(['a', 'b', 'c', 'd'])
+            g.add_edges_from(['a', 'b', 'c', 'c'], ['c', 'c', 'a', 'c'])
+            g.add_edge('d', 'c', 2)
+            assert names(g.predecessors('c')) == ['a', 'b', 'c', 'd']
+            assert g.in_degree('c') == 4
+            assert names(g.predecessors('a')) == ['c']
+            assert g.in_degree('b') == 0
+            g.remove_edge('b', 'c')
+            assert g.in_degree('c') == 3
+            g.remove_vertex('c')
+            assert g.num_vertices() == 3
+            assert g.is_adjacent('a', 'c') is False
+            assert g.get_edge('d', 'c') is None
+            assert g.neighbors('a') == [] and g.neighbors('d') == []
+            assert g.in_degree('a') == 0
+            g.add_vertices_from(['c'])
+            g.add_edge('c', 'a')
+            assert g.is_adjacent('c', 'a') is True
+            assert names(g.predecessors('a')) == ['c']
+            assert g.in_degree('c') == 0
+            assert raises(KeyError, lambda: g.predecessors('x'))
+            assert raises(KeyError, lambda: g.in_degree('x'))
+
+    random.seed(24)
+    V = 60
+    edges = [(str(random.randrange(V)), str(random.randrange(V)))
+             for _ in range(150)]
+    for backend in [Backend.PYTHON, Backend.CPP]:
+        graphs = []
+        for in_neighbors in [False, True]:
+            g = Graph(implementation='adjacency_list', backend=backend,
+                      in_neighbors=in_neighbors)
+            g.add_vertices_from(range(V))
+            g.add_edges_from(*zip(*edges))
+            for u in map(str, range(0, V, 7)):
+                g.remove_vertex(u)
+            graphs.append(g)
+        plain, indexed = graphs
+        for u in map(str, range(V)):
+            if u in map(str, range(0, V, 7)):
+                continue
+            assert names(plain.predecessors(u)) == names(indexed.predecessors(u))
+            assert plain.in_degree(u) == indexed.in_degree(u)
+        for algorithm in ['kosaraju', 'tarjan']:
+            components = [strongly_connected_components(
+                g, algorithm, backend=backend) for g in graphs]
+            assert sorted(map(sorted, components[0])) == \
+                sorted(map(sorted, components[1]))
+        depths = [breadth_first_search(g, '1', direction_optimizing=True,
+                                       backend=backend)[2] for g in graphs]
+        assert list(depths[0]) == list(depths[1])
+
+def test_AdjacencyList_degrees():
+    for backend in [Backend.PYTHON, Backend.CPP]:
+        for in_neighbors in [False, True]:
+            g = Graph(implementation='adjacency_list', backend=backend,
+                      in_neighbors=in_neighbors)
+            g.add_vertices_from(['a', 'b', 'c', 'd'])
+            g.add_edges_from(['a', 'a', 'b', 'c', 'a'], ['b', 'c', 'c', 'c', 'b'])
+            g.add_edge('d', 'a', 1)
+            g.add_edge('d', 'a', 2)
+            assert g.num_edges() == 5
+            assert [g.degree(v) for v in 'abcd'] == [2, 1, 1, 1]
+            assert [g.in_degree(v) for v in 'abcd'] == [1, 1, 3, 0]
+            assert g.degrees().typecode == 'q'
+            assert list(g.degrees()) == [2, 1, 1, 1]
+            assert list(g.degrees(incoming=True)) == [1, 1, 3, 0]
+            g.remove_edge('a', 'b')
+            assert g.num_edges() == 4
+            g.remove_vertex('c')
+            assert g.num_edges() == 1
+            assert list(g.degrees()) == [0, 0, 1]
+            assert list(g.degrees(incoming=True)) == [1, 0, 0]
+            assert raises(KeyError, lambda: g.degree('c'))
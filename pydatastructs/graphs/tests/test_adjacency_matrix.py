@@ -51,3 +51,67 @@ def test_AdjacencyMatrix():
     assert g2.is_adjacent('0', '1') is False
     assert raises(ValueError, lambda: g2.add_edge('u', 'v'))
     assert raises(ValueError, lambda: g2.add_edge('v', 'x'))
+
+def test_AdjacencyMatrix_bulk_insertion():
+    from array import array
+
+    v_0, v_1, v_2 = [AdjacencyMatrixGraphNode(i, i) for i in range(3)]
+    g = Graph(v_0, v_1, v_2)
+    g.add_edges_from(array('q', [0, 1]), [1, 2])
+    g.add_edges_from(('2',), ('0',), (4,))
+    assert g.is_adjacent(0, 1) is True
+    assert g.is_adjacent(1, 2) is True
+    assert g.is_adjacent(2, 0) is True
+    assert g.is_adjacent(1, 0) is False
+    assert g.get_edge(0, 1) is None
+    e = g.get_edge(2, 0)
+    assert (e.source.name, e.target.name, e.value) == ('2', '0', 4)
+    assert raises(ValueError, lambda: g.add_edges_from([0], [3]))
+    assert raises(ValueError, lambda: g.add_edges_from([0], [1, 2]))
+    assert raises(NotImplementedError, lambda: g.add_vertices_from([3]))
+
+    v_3, v_4, v_5 = [AdjacencyMatrixGraphNode(str(i), i, backend = Backend.CPP)
+                     for i in range(3)]
+    g2 = Graph(v_3, v_4, v_5, implementation = 'adjacency_matrix', backend = Backend.CPP)
+    g2.add_edges_from(array('q', [0, 1]), [1, 2])
+    g2.add_edges_from(('2',), ('0',), array('d', [4]))
+    assert g2.is_adjacent('0', '1') is True
+    assert g2.is_adjacent('1', '2') is True
+    assert g2.is_adjacent('2', '0') is True
+    assert g2.is_adjacent('1', '0') is False
+    assert str(g2.get_edge('2', '0')) == "('2', '0', 4.000000)"
+    assert raises(ValueError, lambda: g2.add_edges_from(['0'], ['3']))
+
+def test_AdjacencyMatrix_degrees():
+    for backend in [Backend.PYTHON, Backend.CPP]:
+        g = Graph(*[AdjacencyMatrixGraphNode(name, backend=backend)
+                    for name in 'abc'],
+                  implementation='adjacency_matrix', backend=backend)
+        g.add_edges_from(['a', 'a', 'b', 'a'], ['b', 'c', 'c', 'b'])
+        g.add_edge('c', 'c', 1)
+        assert g.num_edges() == 4
+        assert [g.degree(v) for v in 'abc'] == [2, 1, 1]
+        assert [g.in_degree(v) for v in 'abc'] == [0, 1, 3]
+        assert list(g.degrees()) == [2, 1, 1]
+        assert list(g.degrees(incoming=True)) == [0, 1, 3]
+        g.remove_edge('a', 'c')
+        g.remove_edge('a', 'c')
+        assert g.num_edges() == 3
+        assert g.degrees().typecode == 'q'
+        assert list(g.degrees()) == [1, 1, 1]
+        assert raises(KeyError, lambda: g.degree('d'))
+
+def test_AdjacencyMatrix_result_cache():
+    from pydatastructs import shortest_paths
+
+    g = Graph(*[AdjacencyMatrixGraphNode(name) for name in 'abc'])
+    g.add_edges_from(['a', 'b'], ['b', 'c'], [1, 2])
+    g.enable_cache()
+    assert shortest_paths(g, 'dijkstra', 'a', 'c')[0] == 3
+    assert shortest_paths(g, 'dijkstra', 'a', 'c')[0] == 3
+    assert tuple(g.cache_info()) == (1, 1, 128, 1)
+    g.add_edge('a', 'c', 1)
+    assert shortest_paths(g, 'dijkstra', 'a', 'c')[0] == 1
+    g.remove_edge('a', 'c')
+    assert shortest_paths(g, 'dijkstra', 'a', 'c')[0] == 3
+    assert tuple(g.cache_info()) == (1, 3, 128, 1)
@@ -2,7 +2,9 @@ from pydatastructs import (breadth_first_search, Graph,
 breadth_first_search_parallel, minimum_spanning_tree,
 minimum_spanning_tree_parallel, strongly_connected_components,
 depth_first_search, shortest_paths,all_pair_shortest_paths, topological_sort,
-topological_sort_parallel, max_flow, find_bridges)
+iter_bfs, iter_dfs,
+topological_sort_parallel, max_flow, find_bridges, find_articulation_points,
+biconnected_components, ShortestPathEngine, DynamicTopologicalOrder)
 from pydatastructs.utils.raises_util import raises
 from pydatastructs.utils.misc_util import AdjacencyListGraphNode, AdjacencyMatrixGraphNode
 from pydatastructs.graphs._backend.cpp import _graph
@@ -10,15 +12,16 @@ from pydatastructs.utils.misc_util import Backend
 
 def test_breadth_first_search():
 
-    def _test_breadth_first_search(ds):
+    def _test_breadth_first_search(ds, impl=None):
         import pydatastructs.utils.misc_util as utils
         GraphNode = getattr(utils, "Adjacency" + ds + "GraphNode")
+        impl = impl or ('adjacency_list' if ds == "List" else 'adjacency_matrix')
 
         V1 = GraphNode(0)
         V2 = GraphNode(1)
         V3 = GraphNode(2)
 
-        G1 = Graph(V1, V2, V3)
+        G1 = Graph(V1, V2, V3, implementation=impl)
 
         assert G1.num_vertices() == 3
 
@@ -48,7 +51,7 @@ def test_breadth_first_search():
             V9 = AdjacencyListGraphNode("9",0,backend = Backend.CPP)
             V10 = AdjacencyListGraphNode("10",0,backend = Backend.CPP)
             V11 = AdjacencyListGraphNode("11",0,backend = Backend.CPP)
-            G2 = Graph(V9, V10, V11,implementation = 'adjacency_list', backend = Backend.CPP)
+            G2 = Graph(V9, V10, V11,implementation = impl, backend = Backend.CPP)
             assert G2.num_vertices()==3
             G2.add_edge("9", "10")
             G2.add_edge("10", "11")
@@ -83,7 +86,7 @@ def test_breadth_first_search():
             (V7.name, V8.name)
         ]
 
-        G2 = Graph(V4, V5, V6, V7, V8)
+        G2 = Graph(V4, V5, V6, V7, V8, implementation=impl)
 
         for edge in edges:
             G2.add_edge(*edge)
@@ -111,12 +114,14 @@ def test_breadth_first_search():
 
     _test_breadth_first_search("List")
     _test_breadth_first_search("Matrix")
+    _test_breadth_first_search("List", "csr")
 
 def test_breadth_first_search_parallel():
 
-    def _test_breadth_first_search_parallel(ds):
+    def _test_breadth_first_search_parallel(ds, impl=None):
         import pydatastructs.utils.misc_util as utils
         GraphNode = getattr(utils, "Adjacency" + ds + "GraphNode")
+        impl = impl or ('adjacency_list' if ds == "List" else 'adjacency_matrix')
 
         V1 = GraphNode(0)
         V2 = GraphNode(1)
@@ -128,7 +133,7 @@ def test_breadth_first_search_parallel():
         V8 = GraphNode(7)
 
 
-        G1 = Graph(V1, V2, V3, V4, V5, V6, V7, V8)
+        G1 = Graph(V1, V2, V3, V4, V5, V6, V7, V8, implementation=impl)
 
         edges = [
             (V1.name, V2.name),
@@ -157,16 +162,244 @@ def test_breadth_first_search_parallel():
                 (parent[V6.name] in (V2.name, V3.name)) and
                 (parent[V7.name] in (V3.name, V4.name)) and (parent[V8.name] == V4.name))
 
+        visited = []
+        def stop_at(curr_node, next_node, dest_node, visited):
+            visited.append(next_node)
+            return next_node != dest_node
+
+        breadth_first_search_parallel(G1, V1.name, 2, stop_at, V3.name, visited)
+        assert V3.name in visited and V5.name not in visited
+
+        if ds == "List":
+            nodes = [AdjacencyListGraphNode(str(i), backend=Backend.CPP) for i in range(8)]
+            G2 = Graph(*nodes, implementation=impl, backend=Backend.CPP)
+            for edge in edges:
+                G2.add_edge(*edge)
+            parent = {}
+            breadth_first_search_parallel(G2, "0", 3, bfs_tree, parent,
+                                          backend=Backend.CPP)
+            parent = {v.name: u.name for v, u in parent.items()}
+            assert parent == {'1': '0', '2': '0', '3': '0', '4': '1',
+                              '5': parent['5'], '6': parent['6'], '7': '3'}
+            assert parent['5'] in ('1', '2') and parent['6'] in ('2', '3')
+
+            visited = []
+            breadth_first_search_parallel(G2, "0", 2, stop_at, nodes[2], visited,
+                                          backend=Backend.CPP)
+            assert nodes[2] in visited and nodes[4] not in visited
+
+    def _test_breadth_first_search_parallel_levels(impl, backend):
+        import random
+        rng = random.Random(7)
+        names = [str(i) for i in range(300)]
+        edges = [(rng.choice(names), rng.choice(names)) for _ in range(900)]
+        G = Graph(implementation=impl, backend=backend)
+        G.add_vertices_from(names)
+        G.add_edges_from([u for u, v in edges], [v for u, v in edges])
+
+        depth = {'0': 0}
+        queue = ['0']
+        for u in queue:
+            for v in sorted(set(v for x, v in edges if x == u)):
+                if v not in depth:
+                    depth[v] = depth[u] + 1
+                    queue.append(v)
+
+        parent = {}
+        def bfs_tree(curr_node, next_node, parent):
+            if next_node != "":
+                name = lambda node: getattr(node, 'name', node)
+                parent[name(next_node)] = name(curr_node)
+            return True
+        kwargs = {} if backend == Backend.PYTHON else {'backend': backend}
+        breadth_first_search_parallel(G, '0', 4, bfs_tree, parent, **kwargs)
+        assert len(parent) == len(depth) - 1
+        for v, u in parent.items():
+            assert depth[v] == depth[u] + 1
+
     _test_breadth_first_search_parallel("List")
     _test_breadth_first_search_parallel("Matrix")
+    _test_breadth_first_search_parallel("List", "csr")
+    for impl in ['adjacency_list', 'csr']:
+        for backend in [Backend.PYTHON, Backend.CPP]:
+            _test_breadth_first_search_parallel_levels(impl, backend)
+
+def test_breadth_first_search_direction_optimizing():
+    import random
+    rng = random.Random(11)
+    names = [str(i) for i in range(200)]
+    edges = [(rng.choice(names), rng.choice(names)) for _ in range(4000)]
+    edges.append(('199', 'leaf'))
+    names.append('leaf')
+    names.append('island')
+
+    depth = {'0': 0}
+    queue = ['0']
+    for u in queue:
+        for v in sorted(set(v for x, v in edges if x == u)):
+            if v not in depth:
+                depth[v] = depth[u] + 1
+                queue.append(v)
+
+    for impl, backend in [('csr', Backend.PYTHON), ('csr', Backend.CPP),
+                          ('adjacency_list', Backend.PYTHON),
+                          ('adjacency_list', Backend.CPP)]:
+        G = Graph(implementation=impl, backend=backend)
+        G.add_vertices_from(names)
+        G.add_edges_from([u for u, v in edges], [v for u, v in edges])
+        kwargs = {} if backend == Backend.PYTHON else {'backend': backend}
+        for direction_optimizing in [False, True]:
+            visit_order, parent, d = breadth_first_search(
+                G, '0', direction_optimizing=direction_optimizing, **kwargs)
+            assert len(visit_order) == len(depth)
+            assert [d[v] for v in visit_order] == \
+                sorted(depth[names[v]] for v in visit_order)
+            for i, name in enumerate(names):
+                assert d[i] == depth.get(name, -1)
+                if name == '0':
+                    assert parent[i] == i
+                elif name in depth:
+                    assert (names[parent[i]], name) in edges
+                else:
+                    assert parent[i] == -1
+
+        tree = {}
+        def bfs_tree(curr_node, next_node, tree):
+            if next_node != "":
+                name = lambda node: getattr(node, 'name', node)
+                tree[name(next_node)] = name(curr_node)
+            return True
+        breadth_first_search(G, '0', bfs_tree, tree,
+                             direction_optimizing=True, **kwargs)
+        assert len(tree) == len(depth) - 1
+        for v, u in tree.items():
+            assert depth[v] == depth[u] + 1
+
+        G.add_edge('leaf', 'island')
+        visit_order, parent, d = breadth_first_search(
+            G, '0', direction_optimizing=True, **kwargs)
+        assert d[names.index('island')] == depth['leaf'] + 1
+
+def test_search_tree():
+    import random
+    rng = random.Random(5)
+    names = [str(i) for i in range(60)]
+    edges = list(set((rng.choice(names), rng.choice(names)) for _ in range(150)))
+
+    depth = {'0': 0}
+    queue = ['0']
+    for u in queue:
+        for v in sorted(set(v for x, v in edges if x == u)):
+            if v not in depth:
+                depth[v] = depth[u] + 1
+                queue.append(v)
+
+    def _graph(impl, backend):
+        if impl == 'adjacency_matrix':
+            nodes = [AdjacencyMatrixGraphNode(name, backend=backend) for name in names]
+            G = Graph(*nodes, implementation=impl, backend=backend)
+        else:
+            G = Graph(implementation=impl, backend=backend)
+            G.add_vertices_from(names)
+        G.add_edges_from([u for u, v in edges], [v for u, v in edges])
+        return G
+
+    for impl in ['adjacency_list', 'adjacency_matrix', 'csr']:
+        for backend in [Backend.PYTHON, Backend.CPP]:
+            G = _graph(impl, backend)
+            kwargs = {} if backend == Backend.PYTHON else {'backend': backend}
+            visit_order, parent, d = breadth_first_search(G, '0', **kwargs)
+            assert [names[v] for v in visit_order][0] == '0'
+            assert [d[v] for v in visit_order] == sorted(d[v] for v in visit_order)
+            for i, name in enumerate(names):
+                assert d[i] == depth.get(name, -1)
+
+            visit_order, parent, d = depth_first_search(G, '0', **kwargs)
+            assert sorted(names[v] for v in visit_order) == sorted(depth)
+            assert parent[0] == 0 and d[0] == 0
+            for v in visit_order[1:]:
+                assert (names[parent[v]], names[v]) in edges
+                assert d[v] == d[parent[v]] + 1
+            for i, name in enumerate(names):
+                assert (parent[i] == -1) == (name not in depth)
+
+            tree = {}
+            def dfs_tree(curr_node, next_node, tree):
+                if next_node != "":
+                    name = lambda node: getattr(node, 'name', node)
+                    tree[name(next_node)] = name(curr_node)
+                return True
+            depth_first_search(G, '0', dfs_tree, tree, **kwargs)
+            assert sorted(tree) == sorted(v for v in depth if v != '0')
+
+def test_iter_bfs_dfs():
+    import random
+    from itertools import islice
+    rng = random.Random(3)
+    names = [str(i) for i in range(80)]
+    edges = list(set((rng.choice(names), rng.choice(names)) for _ in range(200)))
+    adjacent = {}
+    for u, v in edges:
+        adjacent.setdefault(u, set()).add(v)
+
+    depth = {'0': 0}
+    queue = ['0']
+    for u in queue:
+        for v in sorted(adjacent.get(u, ())):
+            if v not in depth:
+                depth[v] = depth[u] + 1
+                queue.append(v)
+
+    for impl in ['adjacency_list', 'adjacency_matrix', 'csr']:
+        for backend in [Backend.PYTHON, Backend.CPP]:
+            if impl == 'adjacency_matrix':
+                G = Graph(*[AdjacencyMatrixGraphNode(name, backend=backend)
+                            for name in names], implementation=impl, backend=backend)
+            else:
+                G = Graph(implementation=impl, backend=backend)
+                G.add_vertices_from(names)
+            G.add_edges_from([u for u, v in edges], [v for u, v in edges])
+            kwargs = {'backend': backend}
+            if backend == Backend.CPP:
+                kwargs['batch_size'] = 7
+
+            items = list(iter_bfs(G, '0', **kwargs))
+            assert items[0] == ('0', None, 0)
+            assert sorted(v for v, _, _ in items) == sorted(depth)
+            assert [d for _, _, d in items] == sorted(d for _, _, d in items)
+            for v, u, d in items[1:]:
+                assert v in adjacent[u] and d == depth[v]
+
+            items = list(iter_dfs(G, '0', **kwargs))
+            assert items[0] == ('0', None, 0)
+            assert sorted(v for v, _, _ in items) == sorted(depth)
+            path = []
+            for v, u, d in items[1:]:
+                assert v in adjacent[u]
+                # Preorder: the parent is the last vertex on the current path.
+                del path[d - 1:]
+                assert (path[-1] if path else '0') == u
+                path.append(v)
+
+            assert len(list(islice(iter_bfs(G, '0', **kwargs), 3))) == 3
+            assert raises(KeyError, lambda: iter_dfs(G, 'x', **kwargs))
+
+    G = Graph(implementation='csr', backend=Backend.CPP)
+    G.add_vertices_from(names)
+    G.add_edges_from([u for u, v in edges], [v for u, v in edges])
+    it = iter_bfs(G, '0', batch_size=1, backend=Backend.CPP)
+    assert next(it) == ('0', None, 0)
+    G.add_edge('0', '1')
+    assert raises(RuntimeError, lambda: next(it))
 
 def test_minimum_spanning_tree():
 
-    def _test_minimum_spanning_tree(func, ds, algorithm, *args):
+    def _test_minimum_spanning_tree(func, ds, algorithm, *args, impl=None):
         import pydatastructs.utils.misc_util as utils
         GraphNode = getattr(utils, "Adjacency" + ds + "GraphNode")
+        impl = impl or ('adjacency_list' if ds == "List" else 'adjacency_matrix')
         a, b, c, d, e = [GraphNode(x) for x in [0, 1, 2, 3, 4]]
-        graph = Graph(a, b, c, d, e)
+        graph = Graph(a, b, c, d, e, implementation=impl)
         graph.add_edge(a.name, c.name, 10)
         graph.add_edge(c.name, a.name, 10)
         graph.add_edge(a.name, d.name, 7)
@@ -184,14 +417,14 @@ def test_minimum_spanning_tree():
         for k, v in mst.edge_weights.items():
             assert (k, v.value) in expected_mst
 
-    def _test_minimum_spanning_tree_cpp(ds, algorithm, *args):
-        if (ds == 'List' and algorithm == "prim"):
+    def _test_minimum_spanning_tree_cpp(ds, algorithm, *args, impl='adjacency_list'):
+        if (ds == 'List' and algorithm in ("prim", "kruskal")):
             a1 = AdjacencyListGraphNode('a', 0, backend = Backend.CPP)
             b1 = AdjacencyListGraphNode('b', 0, backend = Backend.CPP)
             c1 = AdjacencyListGraphNode('c', 0, backend = Backend.CPP)
             d1 = AdjacencyListGraphNode('d', 0, backend = Backend.CPP)
             e1 = AdjacencyListGraphNode('e', 0, backend = Backend.CPP)
-            g = Graph(a1, b1, c1, d1, e1, backend = Backend.CPP)
+            g = Graph(a1, b1, c1, d1, e1, implementation = impl, backend = Backend.CPP)
             g.add_edge(a1.name, c1.name, 10)
             g.add_edge(c1.name, a1.name, 10)
             g.add_edge(a1.name, d1.name, 7)
@@ -202,26 +435,34 @@ def test_minimum_spanning_tree():
             g.add_edge(b1.name, d1.name, 32)
             g.add_edge(d1.name, e1.name, 23)
             g.add_edge(e1.name, d1.name, 23)
-            mst = minimum_spanning_tree(g, "prim", backend = Backend.CPP)
+            mst = minimum_spanning_tree(g, algorithm, backend = Backend.CPP)
             expected_mst = ["('a', 'd', 7)", "('d', 'c', 9)", "('e', 'd', 23)", "('b', 'd', 32)",
                         "('d', 'a', 7)", "('c', 'd', 9)", "('d', 'e', 23)", "('d', 'b', 32)"]
+            if impl == 'csr':
+                expected_mst = [e.replace(')', '.000000)') for e in expected_mst]
             assert str(mst.get_edge('a', 'd')) in expected_mst
             assert str(mst.get_edge('e', 'd')) in expected_mst
             assert str(mst.get_edge('d', 'c')) in expected_mst
             assert str(mst.get_edge('b', 'd')) in expected_mst
             assert mst.num_edges() == 8
+            assert [mst.degree(v) for v in 'abcde'] == [1, 1, 1, 4, 1]
+            assert [mst.in_degree(v) for v in 'abcde'] == [1, 1, 1, 4, 1]
+            assert sorted(mst.degrees()) == sorted(mst.degrees(incoming=True)) == \
+                [1, 1, 1, 1, 4]
+            assert g.num_edges() == 10 and g.in_degree('d') == 4
+            assert sorted(n.name for n in g.neighbors('a')) == ['c', 'd']
             a=AdjacencyListGraphNode('0', 0, backend = Backend.CPP)
             b=AdjacencyListGraphNode('1', 0, backend = Backend.CPP)
             c=AdjacencyListGraphNode('2', 0, backend = Backend.CPP)
             d=AdjacencyListGraphNode('3', 0, backend = Backend.CPP)
-            g2 = Graph(a,b,c,d,backend = Backend.CPP)
+            g2 = Graph(a,b,c,d,implementation = impl,backend = Backend.CPP)
             g2.add_edge('0', '1', 74)
             g2.add_edge('1', '0', 74)
             g2.add_edge('0', '3', 55)
             g2.add_edge('3', '0', 55)
             g2.add_edge('1', '2', 74)
             g2.add_edge('2', '1', 74)
-            mst2=minimum_spanning_tree(g2, "prim", backend = Backend.CPP)
+            mst2=minimum_spanning_tree(g2, algorithm, backend = Backend.CPP)
             assert mst2.num_edges() == 6
 
     fmst = minimum_spanning_tree
@@ -233,15 +474,166 @@ def test_minimum_spanning_tree():
     _test_minimum_spanning_tree(fmstp, "Matrix", "kruskal", 3)
     _test_minimum_spanning_tree(fmstp, "List", "prim", 3)
     _test_minimum_spanning_tree_cpp("List", "prim")
+    _test_minimum_spanning_tree(fmst, "List", "kruskal", impl="csr")
+    _test_minimum_spanning_tree(fmst, "List", "prim", impl="csr")
+    _test_minimum_spanning_tree(fmstp, "List", "kruskal", 3, impl="csr")
+    _test_minimum_spanning_tree_cpp("List", "prim", impl="csr")
+    _test_minimum_spanning_tree_cpp("List", "kruskal", impl="csr")
+    _test_minimum_spanning_tree(fmstp, "List", "boruvka", 3)
+    _test_minimum_spanning_tree(fmstp, "Matrix", "boruvka", 3)
+    _test_minimum_spanning_tree(fmstp, "List", "boruvka", 3, impl="csr")
+
+    def _test_boruvka_cpp(ds, impl=None):
+        import pydatastructs.utils.misc_util as utils
+        GraphNode = getattr(utils, "Adjacency" + ds + "GraphNode")
+        impl = impl or ('adjacency_list' if ds == "List" else 'adjacency_matrix')
+        nodes = [GraphNode(x, 0, backend=Backend.CPP) for x in 'abcde']
+        g = Graph(*nodes, implementation=impl, backend=Backend.CPP)
+        for u, v, w in [('a', 'c', 10), ('a', 'd', 7), ('c', 'd', 9),
+                        ('d', 'b', 32), ('d', 'e', 23)]:
+            g.add_edge(u, v, w)
+            g.add_edge(v, u, w)
+        mst = fmstp(g, "boruvka", 3, backend=Backend.CPP)
+        assert mst.num_edges() == 8
+        for u, v, w in [('a', 'd', 7), ('c', 'd', 9), ('d', 'b', 32), ('d', 'e', 23)]:
+            assert mst.get_edge(u, v).value == w
+            assert mst.get_edge(v, u).value == w
+        assert not mst.is_adjacent('a', 'c')
+
+    _test_boruvka_cpp("List")
+    _test_boruvka_cpp("Matrix")
+    _test_boruvka_cpp("List", impl="csr")
+
+    # Kruskal's algorithm on edge indices, with negative, fractional
+    # and repeated weights, picks edges in the same order in both
+    # backends and builds the same graph.
+    import random
+    from bisect import bisect_right
+    rng = random.Random(29)
+    n = 60
+    edges = [(rng.randrange(n), rng.randrange(n),
+              rng.choice([-2.5, -1, 0, 0.5, 3, 3, 7.25, 100]))
+             for _ in range(200)]
+    for impl in ['adjacency_list', 'adjacency_matrix', 'csr']:
+        g = Graph(*[AdjacencyListGraphNode(str(i)) if impl != 'adjacency_matrix'
+                    else AdjacencyMatrixGraphNode(str(i)) for i in range(n)],
+                  implementation=impl)
+        for u, v, w in edges:
+            g.add_edge(str(u), str(v), w)
+        if impl == 'csr':
+            order = g.weights()
+            names = lambda e: (g.vertices[bisect_right(g.offsets(), e) - 1],
+                               g.vertices[g.targets()[e]])
+        else:
+            order = [edge.value for edge in g.edge_weights.values()]
+            names = lambda e: (list(g.edge_weights.values())[e].source.name,
+                               list(g.edge_weights.values())[e].target.name)
+        forest = fmst(g, "kruskal", as_graph=False)
+        assert forest.typecode == 'q'
+        assert [order[e] for e in forest] == sorted(order[e] for e in forest)
+        mst = fmst(g, "kruskal")
+        for e in forest:
+            u, v = names(e)
+            assert mst.get_edge(u, v).value == order[e]
+            assert mst.get_edge(v, u).value == order[e]
+        assert sum(edge.value for edge in mst.edge_weights.values()) == \
+            2*sum(order[e] for e in forest)
+        if impl == 'csr':
+            g_cpp = Graph(implementation='csr', backend=Backend.CPP)
+            g_cpp.add_vertices_from([str(i) for i in range(n)])
+            for u, v, w in edges:
+                g_cpp.add_edge(str(u), str(v), w)
+            assert list(fmst(g_cpp, "kruskal", as_graph=False,
+                             backend=Backend.CPP)) == list(forest)
+            mst_cpp = fmst(g_cpp, "kruskal", backend=Backend.CPP)
+            assert mst_cpp.num_edges() == 2*len(forest)
+    assert raises(NotImplementedError,
+                  lambda: fmst(g, "prim", as_graph=False))
+
+    # Borůvka's algorithm picks the same forest weight as Kruskal's,
+    # with repeated weights and on disconnected graphs.
+    import random
+    rng = random.Random(23)
+    n = 120
+    edges = [(rng.randrange(n), rng.randrange(n), rng.randrange(20))
+             for _ in range(400)]
+    edges += [(n + i, n + i + 1, 5) for i in range(10)]
+    weights = {}
+    for u, v, w in edges:
+        weights[min(u, v), max(u, v)] = w
+    def total(mst):
+        return sum(edge.value for edge in mst.edge_weights.values())/2
+    expected = None
+    for impl in ['adjacency_list', 'csr']:
+        for backend in [Backend.PYTHON, Backend.CPP]:
+            g = Graph(implementation=impl, backend=backend)
+            g.add_vertices_from([str(i) for i in range(n + 11)])
+            sources, targets, costs = [], [], []
+            for (u, v), w in weights.items():
+                sources += [str(u), str(v)]
+                targets += [str(v), str(u)]
+                costs += [w, w]
+            g.add_edges_from(sources, targets, costs)
+            if backend == Backend.PYTHON:
+                forest = fmst(g, "kruskal")
+                if expected is None:
+                    expected = total(forest)
+                    size = len(forest.edge_weights)
+            for num_threads in [1, 4]:
+                mst = fmstp(g, "boruvka", num_threads, backend=backend)
+                forest = [mst.get_edge(str(u), str(v)) for u, v in weights]
+                forest = [edge.value for edge in forest if edge is not None]
+                assert 2*len(forest) == size
+                assert sum(forest) == expected
+
+    # The input graph is left unchanged by Borůvka's algorithm.
+    for ds in ["List", "Matrix"]:
+        import pydatastructs.utils.misc_util as utils
+        GraphNode = getattr(utils, "Adjacency" + ds + "GraphNode")
+        a, b, c = [GraphNode(name, 0) for name in 'abc']
+        g = Graph(a, b, c)
+        g.add_edge('a', 'b', 1)
+        g.add_edge('b', 'c', 2)
+        g.add_edge('a', 'c', 3)
+        mst = fmstp(g, "boruvka", 2)
+        assert mst.get_edge('b', 'a').value == 1
+        assert mst.get_edge('c', 'b').value == 2
+        assert [sorted(n.name for n in g.neighbors(v)) for v in 'abc'] == \
+            [['b', 'c'], ['c'], []]
+        assert g.num_edges() == 3
+        assert list(g.degrees()) == [2, 1, 0]
+        assert g.get_edge('b', 'a') is None
+
+    # So are the other algorithms, and the edges and degrees of the
+    # spanning trees are counted.
+    for ds, func, algorithm, args in [("List", fmst, "kruskal", ()),
+                                      ("Matrix", fmst, "kruskal", ()),
+                                      ("List", fmst, "prim", ()),
+                                      ("List", fmstp, "kruskal", (2,)),
+                                      ("List", fmstp, "prim", (2,))]:
+        GraphNode = getattr(utils, "Adjacency" + ds + "GraphNode")
+        g = Graph(*[GraphNode(name, 0) for name in 'abcd'])
+        for u, v, w in [('a', 'b', 1), ('b', 'c', 2), ('a', 'c', 3), ('c', 'd', 4)]:
+            g.add_edge(u, v, w)
+            g.add_edge(v, u, w)
+        mst = func(g, algorithm, *args)
+        assert mst.num_edges() == len(mst.edge_weights) == 6
+        assert list(mst.degrees()) == list(mst.degrees(incoming=True)) == [1, 2, 2, 1]
+        assert mst.get_edge('a', 'c') is None
+        assert g.num_edges() == 8
+        assert list(g.degrees()) == [2, 2, 3, 1]
+        assert sorted(n.name for n in g.neighbors('a')) == ['b', 'c']
 
 def test_strongly_connected_components():
 
-    def _test_strongly_connected_components(func, ds, algorithm, *args):
+    def _test_strongly_connected_components(func, ds, algorithm, *args, impl=None,
+                                            backend=Backend.PYTHON):
         import pydatastructs.utils.misc_util as utils
         GraphNode = getattr(utils, "Adjacency" + ds + "GraphNode")
+        impl = impl or ('adjacency_list' if ds == "List" else 'adjacency_matrix')
         a, b, c, d, e, f, g, h = \
-        [GraphNode(chr(x)) for x in range(ord('a'), ord('h') + 1)]
-        graph = Graph(a, b, c, d, e, f, g, h)
+        [GraphNode(chr(x), backend=backend) for x in range(ord('a'), ord('h') + 1)]
+        graph = Graph(a, b, c, d, e, f, g, h, implementation=impl, backend=backend)
         graph.add_edge(a.name, b.name)
         graph.add_edge(b.name, c.name)
         graph.add_edge(b.name, f.name)
@@ -256,27 +648,66 @@ def test_strongly_connected_components():
         graph.add_edge(g.name, f.name)
         graph.add_edge(h.name, d.name)
         graph.add_edge(h.name, g.name)
-        comps = func(graph, algorithm)
+        comps = func(graph, algorithm, backend=backend)
         expected_comps = [{'e', 'a', 'b'}, {'d', 'c', 'h'}, {'g', 'f'}]
-        assert comps.sort() == expected_comps.sort()
+        assert sorted(map(sorted, comps)) == sorted(map(sorted, expected_comps))
+        labels = func(graph, algorithm, labels=True, backend=backend)
+        assert [labels[ord(x) - ord('a')] for x in 'abcdefgh'] == \
+            [[i for i, comp in enumerate(comps) if x in comp][0] for x in 'abcdefgh']
 
     scc = strongly_connected_components
-    _test_strongly_connected_components(scc, "List", "kosaraju")
-    _test_strongly_connected_components(scc, "Matrix", "kosaraju")
-    _test_strongly_connected_components(scc, "List", "tarjan")
-    _test_strongly_connected_components(scc, "Matrix", "tarjan")
+    for algorithm in ["kosaraju", "tarjan"]:
+        for backend in [Backend.PYTHON, Backend.CPP]:
+            _test_strongly_connected_components(scc, "List", algorithm, backend=backend)
+            _test_strongly_connected_components(scc, "Matrix", algorithm, backend=backend)
+            _test_strongly_connected_components(scc, "List", algorithm, impl="csr",
+                                                backend=backend)
+
+    import random
+    rng = random.Random(11)
+    n = 200
+    edges = [(rng.randrange(n), rng.randrange(n)) for _ in range(300)]
+    results = []
+    for impl in ['adjacency_list', 'csr']:
+        for backend in [Backend.PYTHON, Backend.CPP]:
+            graph = Graph(implementation=impl, backend=backend)
+            graph.add_vertices_from([str(i) for i in range(n + 1)])
+            graph.remove_vertex('0')
+            graph.add_edges_from([str(u + 1) for u, v in edges],
+                                 [str(v + 1) for u, v in edges])
+            for algorithm in ["kosaraju", "tarjan"]:
+                comps = scc(graph, algorithm, backend=backend)
+                labels = scc(graph, algorithm, labels=True, backend=backend)
+                if impl == 'adjacency_list':
+                    assert labels[0] == -1
+                    labels = labels[1:]
+                assert len(labels) == n
+                assert all(str(v + 1) in comps[labels[v]] for v in range(n))
+                results.append(sorted(map(sorted, comps)))
+    assert all(result == results[0] for result in results)
+
+    # A cycle longer than the recursion limit.
+    n = 5000
+    for impl in ['adjacency_list', 'csr']:
+        graph = Graph(implementation=impl)
+        graph.add_vertices_from([str(i) for i in range(n)])
+        graph.add_edges_from([str(i) for i in range(n)],
+                             [str((i + 1) % n) for i in range(n)])
+        for algorithm in ["kosaraju", "tarjan"]:
+            assert list(scc(graph, algorithm, labels=True)) == [0]*n
 
 def test_depth_first_search():
 
-    def _test_depth_first_search(ds):
+    def _test_depth_first_search(ds, impl=None):
         import pydatastructs.utils.misc_util as utils
         GraphNode = getattr(utils, "Adjacency" + ds + "GraphNode")
+        impl = impl or ('adjacency_list' if ds == "List" else 'adjacency_matrix')
 
         V1 = GraphNode(0)
         V2 = GraphNode(1)
         V3 = GraphNode(2)
 
-        G1 = Graph(V1, V2, V3)
+        G1 = Graph(V1, V2, V3, implementation=impl)
 
         edges = [
             (V1.name, V2.name),
@@ -311,7 +742,7 @@ def test_depth_first_search():
             (V7.name, V8.name)
         ]
 
-        G2 = Graph(V4, V5, V6, V7, V8)
+        G2 = Graph(V4, V5, V6, V7, V8, implementation=impl)
 
         for edge in edges:
             G2.add_edge(*edge)
@@ -337,17 +768,19 @@ def test_depth_first_search():
 
     _test_depth_first_search("List")
     _test_depth_first_search("Matrix")
+    _test_depth_first_search("List", "csr")
 
 def test_shortest_paths():
 
-    def _test_shortest_paths_positive_edges(ds, algorithm):
+    def _test_shortest_paths_positive_edges(ds, algorithm, impl=None):
         import pydatastructs.utils.misc_util as utils
         GraphNode = getattr(utils, "Adjacency" + ds + "GraphNode")
+        impl = impl or ('adjacency_list' if ds == "List" else 'adjacency_matrix')
         vertices = [GraphNode('S'), GraphNode('C'),
                     GraphNode('SLC'), GraphNode('SF'),
                     GraphNode('D')]
 
-        graph = Graph(*vertices)
+        graph = Graph(*vertices, implementation=impl)
         graph.add_edge('S', 'SLC', 2)
         graph.add_edge('C', 'S', 4)
         graph.add_edge('C', 'D', 2)
@@ -370,7 +803,7 @@ def test_shortest_paths():
             vertices2 = [AdjacencyListGraphNode('S', 0, backend = Backend.CPP), AdjacencyListGraphNode('C', 0, backend = Backend.CPP),
                         AdjacencyListGraphNode('SLC', 0, backend = Backend.CPP), AdjacencyListGraphNode('SF', 0, backend = Backend.CPP),
                         AdjacencyListGraphNode('D', 0, backend = Backend.CPP)]
-            graph2 = Graph(*vertices2, backend = Backend.CPP)
+            graph2 = Graph(*vertices2, implementation = impl, backend = Backend.CPP)
             graph2.add_edge('S', 'SLC', 2)
             graph2.add_edge('C', 'S', 4)
             graph2.add_edge('C', 'D', 2)
@@ -385,14 +818,15 @@ def test_shortest_paths():
 
 
 
-    def _test_shortest_paths_negative_edges(ds, algorithm):
+    def _test_shortest_paths_negative_edges(ds, algorithm, impl=None):
         import pydatastructs.utils.misc_util as utils
         GraphNode = getattr(utils, "Adjacency" + ds + "GraphNode")
+        impl = impl or ('adjacency_list' if ds == "List" else 'adjacency_matrix')
         vertices = [GraphNode('s'), GraphNode('a'),
                     GraphNode('b'), GraphNode('c'),
                     GraphNode('d')]
 
-        graph = Graph(*vertices)
+        graph = Graph(*vertices, implementation=impl)
         graph.add_edge('s', 'a', 3)
         graph.add_edge('s', 'b', 2)
         graph.add_edge('a', 'c', 1)
@@ -412,10 +846,124 @@ def test_shortest_paths():
     _test_shortest_paths_negative_edges("Matrix", 'bellman_ford')
     _test_shortest_paths_positive_edges("List", 'dijkstra')
     _test_shortest_paths_positive_edges("Matrix", 'dijkstra')
+    _test_shortest_paths_positive_edges("List", 'bellman_ford', "csr")
+    _test_shortest_paths_negative_edges("List", 'bellman_ford', "csr")
+    _test_shortest_paths_positive_edges("List", 'dijkstra', "csr")
+
+def test_shortest_paths_point_to_point():
+    import random
+
+    def _path(pred, source, target):
+        path = [target]
+        while path[-1] != source:
+            path.append(pred[path[-1]])
+        return path[::-1]
+
+    def _test_point_to_point(impl, backend, algorithm):
+        rng = random.Random(7)
+        n, coordinates = 8, {}
+        graph = Graph(implementation=impl, backend=backend)
+        graph.add_vertices_from(["v_%d_%d" % (x, y) for x in range(n) for y in range(n)])
+        sources, targets, weights = [], [], []
+        for x in range(n):
+            for y in range(n):
+                coordinates["v_%d_%d" % (x, y)] = (x, y)
+                for dx, dy in [(1, 0), (0, 1), (-1, 0), (0, -1)]:
+                    if 0 <= x + dx < n and 0 <= y + dy < n and rng.random() < 0.8:
+                        sources.append("v_%d_%d" % (x, y))
+                        targets.append("v_%d_%d" % (x + dx, y + dy))
+                        weights.append(rng.randint(1, 9))
+        graph.add_edges_from(sources, targets, weights)
+        edges = {(u, v): w for u, v, w in zip(sources, targets, weights)}
+        kwargs = {'coordinates': coordinates} if algorithm == 'a_star' else {}
+
+        dist, _ = shortest_paths(graph, 'dijkstra', 'v_0_0', backend=backend)
+        for target in ['v_7_7', 'v_3_5', 'v_0_1', 'v_0_0']:
+            d, pred = shortest_paths(graph, algorithm, 'v_0_0', target,
+                                     backend=backend, **kwargs)
+            assert d == dist[target]
+            if d != float('inf'):
+                path = _path(pred, 'v_0_0', target)
+                assert sum(edges[e] for e in zip(path, path[1:])) == d
+
+        graph.add_vertices_from(['island'])
+        coordinates['island'] = (100, 100)
+        d, _ = shortest_paths(graph, algorithm, 'v_0_0', 'island',
+                              backend=backend, **kwargs)
+        assert d == float('inf')
+        assert raises(ValueError, lambda: shortest_paths(graph, algorithm,
+                      'v_0_0', backend=backend))
+
+    for impl in ['adjacency_list', 'csr']:
+        for backend in [Backend.PYTHON, Backend.CPP]:
+            _test_point_to_point(impl, backend, 'bidirectional_dijkstra')
+            _test_point_to_point(impl, backend, 'a_star')
+
+    V1, V2, V3 = [AdjacencyListGraphNode(v) for v in ['V1', 'V2', 'V3']]
+    G = Graph(V1, V2, V3)
+    G.add_edge('V1', 'V2', 1)
+    G.add_edge('V2', 'V3', 1)
+    G.add_edge('V1', 'V3', 5)
+    h = {'V1': 2, 'V2': 1, 'V3': 0}
+    assert shortest_paths(G, 'a_star', 'V1', 'V3',
+                          heuristic=lambda v, t: h[v]) == \
+        (2, {'V1': None, 'V2': 'V1', 'V3': 'V2'})
+    assert raises(ValueError, lambda: shortest_paths(G, 'a_star', 'V1', 'V3'))
+
+    # Dijkstra stops once the target is settled, without relaxing
+    # the edges leaving it.
+    for impl in ['adjacency_list', 'csr']:
+        G = Graph(implementation=impl)
+        G.add_vertices_from(['V1', 'V2', 'V3'])
+        G.add_edges_from(['V1', 'V2'], ['V2', 'V3'], [1, 1])
+        assert shortest_paths(G, 'dijkstra', 'V1', 'V2') == \
+            (1, {'V1': None, 'V2': 'V1', 'V3': None})
+
+def test_shortest_paths_delta_stepping():
+    import random
+
+    def _test_delta_stepping(impl, backend):
+        rng = random.Random(11)
+        n = 60
+        Node = AdjacencyMatrixGraphNode if impl == 'adjacency_matrix' \
+            else AdjacencyListGraphNode
+        kwargs = {'backend': backend} if backend == Backend.CPP else {}
+        graph = Graph(*[Node("v_%d" % i, 0, **kwargs) for i in range(n)],
+                      implementation=impl, **kwargs)
+        sources, targets, weights = [], [], []
+        for u in range(n):
+            for v in rng.sample(range(n), 4):
+                if u != v:
+                    sources.append("v_%d" % u)
+                    targets.append("v_%d" % v)
+                    weights.append(rng.randint(0, 20))
+                    graph.add_edge(sources[-1], targets[-1], weights[-1])
+        edges = {(u, v): w for u, v, w in zip(sources, targets, weights)}
+
+        dist, _ = shortest_paths(graph, 'dijkstra', 'v_0', backend=backend)
+        for num_threads in [1, 4]:
+            for delta in [None, 3, 50]:
+                d, pred = shortest_paths(graph, 'delta_stepping', 'v_0',
+                                         num_threads=num_threads, delta=delta,
+                                         backend=backend)
+                assert d == dist
+                for v, u in pred.items():
+                    if u is not None:
+                        assert d[v] == d[u] + edges[(u, v)]
+                assert shortest_paths(graph, 'delta_stepping', 'v_0', 'v_7',
+                                      num_threads=num_threads, delta=delta,
+                                      backend=backend)[0] == dist['v_7']
+        assert raises(ValueError, lambda: shortest_paths(graph, 'delta_stepping',
+                      'v_0', delta=0, backend=backend))
+
+    for impl in ['adjacency_list', 'adjacency_matrix', 'csr']:
+        _test_delta_stepping(impl, Backend.PYTHON)
+    for impl in ['adjacency_list', 'csr']:
+        _test_delta_stepping(impl, Backend.CPP)
 
 def test_all_pair_shortest_paths():
 
-    def _test_shortest_paths_negative_edges(ds, algorithm):
+    def _test_shortest_paths_negative_edges(ds, algorithm, expected_next):
         import pydatastructs.utils.misc_util as utils
         GraphNode = getattr(utils, "Adjacency" + ds + "GraphNode")
         vertices = [GraphNode('1'), GraphNode('2'),
@@ -432,25 +980,195 @@ def test_all_pair_shortest_paths():
                         '2': {'1': 4, '3': 2, '2': 0, '4': 4},
                         '3': {'4': 2, '3': 0, '1': 5, '2': 1},
                         '4': {'2': -1, '4': 0, '1': 3, '3': 1}}
-        assert next_v == {'1': {'3': '1', '1': '1', '4': None, '2': None},
-                          '2': {'1': '2', '3': None, '2': '2', '4': None},
-                          '3': {'4': '3', '3': '3', '1': None, '2': None},
-                          '4': {'2': '4', '4': '4', '1': None, '3': None}}
-
-    _test_shortest_paths_negative_edges("List", 'floyd_warshall')
-    _test_shortest_paths_negative_edges("Matrix", 'floyd_warshall')
-    _test_shortest_paths_negative_edges("List", 'johnson')
+        assert next_v == expected_next
+
+    pred = {'1': {'3': '1', '1': '1', '4': '3', '2': '4'},
+            '2': {'1': '2', '3': '1', '2': '2', '4': '3'},
+            '3': {'4': '3', '3': '3', '1': '2', '2': '4'},
+            '4': {'2': '4', '4': '4', '1': '2', '3': '1'}}
+    _test_shortest_paths_negative_edges("List", 'floyd_warshall', pred)
+    _test_shortest_paths_negative_edges("Matrix", 'floyd_warshall', pred)
+    _test_shortest_paths_negative_edges("List", 'johnson', pred)
+    _test_shortest_paths_negative_edges("Matrix", 'johnson', pred)
+
+def test_floyd_warshall_matrix():
+    import random
+    import pydatastructs.graphs.algorithms as algorithms
+
+    def _test_floyd_warshall(impl, backend):
+        rng = random.Random(5)
+        n = 40
+        graph = Graph(implementation=impl, backend=backend)
+        graph.add_vertices_from(["v_%d" % i for i in range(n + 1)])
+        # Removed vertices keep their numbers in adjacency lists.
+        graph.remove_vertex("v_%d" % n)
+        V = n + 1 if impl == 'adjacency_list' else n
+        edges = {}
+        for _ in range(3*n):
+            u, v = rng.randrange(n), rng.randrange(n)
+            if u != v:
+                edges[(u, v)] = rng.randint(1, 30)
+        graph.add_edges_from(["v_%d" % u for u, v in edges],
+                             ["v_%d" % v for u, v in edges], list(edges.values()))
+
+        dist, pred = all_pair_shortest_paths(graph, 'floyd_warshall',
+                                             backend=backend)
+        dist_m, pred_m = all_pair_shortest_paths(graph, 'floyd_warshall',
+                                                 matrix=True, backend=backend)
+        assert len(dist_m) == len(pred_m) == V*V
+        for u in range(n):
+            source = "v_%d" % u
+            expected, _ = shortest_paths(graph, 'dijkstra', source, backend=backend)
+            assert dist[source] == {v: d for v, d in expected.items()
+                                    if d != float('inf')}
+            for v in range(n):
+                assert dist_m[u*V + v] == expected["v_%d" % v]
+                if v != u and dist_m[u*V + v] != float('inf'):
+                    p = pred_m[u*V + v]
+                    assert dist_m[u*V + v] == dist_m[u*V + p] + edges[(p, v)]
+                    assert pred[source]["v_%d" % v] == "v_%d" % p
+
+    for impl in ['adjacency_list', 'csr']:
+        for backend in [Backend.PYTHON, Backend.CPP]:
+            _test_floyd_warshall(impl, backend)
+
+    inf = float('inf')
+    dist = [[0.0, 2.0, inf], [inf, 0.0, 3.0], [1.0, inf, 0.0]]
+    pred = [[0, 0, -1], [-1, 1, 1], [2, -1, 2]]
+    dist, pred = algorithms._floyd_warshall_rows(dist, pred)
+    assert list(dist) == [0, 2, 5, 4, 0, 3, 1, 3, 0]
+    assert list(pred) == [0, 0, 1, 2, 1, 1, 2, 0, 2]
+
+    for backend in [Backend.PYTHON, Backend.CPP]:
+        graph = Graph(implementation='csr', backend=backend)
+        graph.add_vertices_from(['a', 'b'])
+        graph.add_edges_from(['a', 'b'], ['b', 'a'], [1, -2])
+        assert raises(ValueError, lambda: all_pair_shortest_paths(
+            graph, 'floyd_warshall', backend=backend))
+        assert raises(ValueError, lambda: all_pair_shortest_paths(
+            graph, 'johnson', backend=backend))
+
+def test_johnson():
+    import random
+
+    def _test_johnson(impl, backend):
+        rng = random.Random(9)
+        n = 70
+        graph = Graph(implementation=impl, backend=backend)
+        graph.add_vertices_from(["v_%d" % i for i in range(n + 1)])
+        graph.remove_vertex("v_%d" % n)
+        # Shifting non-negative weights by potentials keeps every
+        # cycle non-negative while making some edges negative.
+        potential = [rng.randint(0, 15) for _ in range(n)]
+        edges = {}
+        for _ in range(4*n):
+            u, v = rng.randrange(n), rng.randrange(n)
+            if u != v:
+                edges[(u, v)] = rng.randint(0, 30) + potential[u] - potential[v]
+        graph.add_edges_from(["v_%d" % u for u, v in edges],
+                             ["v_%d" % v for u, v in edges], list(edges.values()))
+        weights = {(u, v): graph.get_edge("v_%d" % u, "v_%d" % v).value
+                   for u, v in edges}
+
+        expected = all_pair_shortest_paths(graph, 'floyd_warshall', backend=backend)
+        expected_m = all_pair_shortest_paths(graph, 'floyd_warshall', matrix=True,
+                                             backend=backend)
+        for num_workers in [1, 2]:
+            dist, pred = all_pair_shortest_paths(graph, 'johnson', backend=backend,
+                                                 num_workers=num_workers)
+            assert dist == expected[0]
+            for u in dist:
+                for v, p in pred[u].items():
+                    if u != v:
+                        assert dist[u][v] == dist[u][p] + \
+                            weights[(int(p[2:]), int(v[2:]))]
+            dist, pred = all_pair_shortest_paths(graph, 'johnson', matrix=True,
+                backend=backend, num_workers=num_workers)
+            assert dist == expected_m[0]
+            assert len(pred) == len(expected_m[1])
+            rows = all_pair_shortest_paths(graph, 'johnson', stream=True,
+                backend=backend, num_workers=num_workers)
+            assert [u for u, _, _ in rows] == ["v_%d" % i for i in range(n)]
+        assert {(u, v): graph.get_edge("v_%d" % u, "v_%d" % v).value
+                for u, v in edges} == weights
+        assert graph.num_vertices() == n
+
+    for impl in ['adjacency_list', 'csr']:
+        for backend in [Backend.PYTHON, Backend.CPP]:
+            _test_johnson(impl, backend)
+
+def test_shortest_path_engine():
+    import random
+
+    def _test_shortest_path_engine(impl, backend):
+        rng = random.Random(5)
+        n = 60
+        GraphNode = AdjacencyMatrixGraphNode if impl == 'adjacency_matrix' \
+            else AdjacencyListGraphNode
+        graph = Graph(*[GraphNode("v_%d" % i, backend=backend) for i in range(n)],
+                      implementation=impl, backend=backend)
+        edges = {}
+        for _ in range(3*n):
+            u, v = rng.randrange(n), rng.randrange(n)
+            if u != v:
+                edges[(u, v)] = rng.randint(1, 20)
+        for (u, v), w in edges.items():
+            graph.add_edge("v_%d" % u, "v_%d" % v, w)
+
+        reference = Graph(implementation='csr')
+        reference.add_vertices_from(["v_%d" % i for i in range(n)])
+        reference.add_edges_from(["v_%d" % u for u, v in edges],
+                                 ["v_%d" % v for u, v in edges], list(edges.values()))
+
+        sources = [rng.randrange(n) for _ in range(40)]
+        targets = [rng.randrange(n) for _ in range(40)]
+        expected = {}
+        for s in set(sources):
+            dist, _ = shortest_paths(reference, 'dijkstra', "v_%d" % s)
+            expected[s] = dist
+        inf = float('inf')
+        for algorithm in ['dijkstra', 'bidirectional_dijkstra']:
+            engine = ShortestPathEngine(graph, algorithm, backend=backend)
+            for s, t in zip(sources, targets):
+                distance, path = engine.query("v_%d" % s, "v_%d" % t)
+                assert distance == expected[s].get("v_%d" % t, inf)
+                if distance == inf:
+                    assert path == []
+                else:
+                    assert path[0] == "v_%d" % s and path[-1] == "v_%d" % t
+                    assert sum(edges[(int(u[2:]), int(v[2:]))]
+                               for u, v in zip(path, path[1:])) == distance
+            names = ["v_%d" % s for s in sources]
+            distances, offsets, vertices = engine.query_many(
+                names, ["v_%d" % t for t in targets], paths=True)
+            assert list(distances) == [expected[s].get("v_%d" % t, inf)
+                                       for s, t in zip(sources, targets)]
+            assert len(offsets) == len(sources) + 1
+            for i, (s, t) in enumerate(zip(sources, targets)):
+                path = list(vertices[offsets[i]:offsets[i + 1]])
+                if distances[i] != inf:
+                    assert path[0] == s and path[-1] == t
+            assert list(engine.query_many(names, names)) == [0.0]*len(names)
+            assert raises(ValueError, lambda: engine.query("v_0", "x"))
+            assert raises(ValueError, lambda: engine.query_many(["v_0"], []))
+        assert raises(NotImplementedError,
+                      lambda: ShortestPathEngine(graph, 'bellman_ford', backend=backend))
+
+    for impl in ['adjacency_list', 'adjacency_matrix', 'csr']:
+        for backend in [Backend.PYTHON, Backend.CPP]:
+            _test_shortest_path_engine(impl, backend)
 
 def test_topological_sort():
 
-    def _test_topological_sort(func, ds, algorithm, threads=None):
+    def _test_topological_sort(func, ds, algorithm, threads=None, impl=None,
+                               backend=Backend.PYTHON):
         import pydatastructs.utils.misc_util as utils
         GraphNode = getattr(utils, "Adjacency" + ds + "GraphNode")
-        vertices = [GraphNode('2'), GraphNode('3'), GraphNode('5'),
-                    GraphNode('7'), GraphNode('8'), GraphNode('10'),
-                    GraphNode('11'), GraphNode('9')]
+        impl = impl or ('adjacency_list' if ds == "List" else 'adjacency_matrix')
+        vertices = [GraphNode(x, backend=backend)
+                    for x in ['2', '3', '5', '7', '8', '10', '11', '9']]
 
-        graph = Graph(*vertices)
+        graph = Graph(*vertices, implementation=impl, backend=backend)
         graph.add_edge('5', '11')
         graph.add_edge('7', '11')
         graph.add_edge('7', '8')
@@ -461,29 +1179,88 @@ def test_topological_sort():
         graph.add_edge('11', '10')
         graph.add_edge('8', '9')
         if threads is not None:
-            l = func(graph, algorithm, threads)
+            l = func(graph, algorithm, threads, backend=backend)
         else:
             l = func(graph, algorithm)
         assert all([(l1 in l[0:3]) for l1 in ('3', '5', '7')] +
                    [(l2 in l[3:5]) for l2 in ('8', '11')] +
                    [(l3 in l[5:]) for l3 in ('10', '9', '2')])
+        if threads is not None:
+            # The graph is left untouched.
+            assert graph.num_edges() == 9
+            waves = func(graph, algorithm, threads, waves=True, backend=backend)
+            assert [sorted(wave) for wave in waves] == \
+                [['3', '5', '7'], ['11', '8'], ['10', '2', '9']]
+            l = func(graph, algorithm, threads, backend=backend)
+            assert [sorted(l[0:3]), sorted(l[3:5]), sorted(l[5:])] == \
+                [sorted(wave) for wave in waves]
+            graph.add_edge('9', '7')
+            assert raises(ValueError, lambda: func(graph, algorithm, threads,
+                                                   backend=backend))
 
     _test_topological_sort(topological_sort, "List", "kahn")
-    _test_topological_sort(topological_sort_parallel, "List", "kahn", 3)
+    _test_topological_sort(topological_sort, "List", "kahn", impl="csr")
+    for backend in [Backend.PYTHON, Backend.CPP]:
+        for threads in [1, 3]:
+            _test_topological_sort(topological_sort_parallel, "List", "kahn",
+                                   threads, backend=backend)
+            _test_topological_sort(topological_sort_parallel, "Matrix", "kahn",
+                                   threads, backend=backend)
+            _test_topological_sort(topological_sort_parallel, "List", "kahn",
+                                   threads, impl="csr", backend=backend)
+
+    # Random acyclic graphs with a removed vertex give the same
+    # waves in both backends, and a long path gives one wave per
+    # vertex.
+    import random
+    rng = random.Random(37)
+    n = 300
+    edges = [(u, v) for u, v in ((rng.randrange(n), rng.randrange(n))
+                                 for _ in range(900)) if u < v]
+    results = []
+    for impl in ['adjacency_list', 'csr']:
+        for backend in [Backend.PYTHON, Backend.CPP]:
+            graph = Graph(implementation=impl, backend=backend)
+            graph.add_vertices_from([str(i) for i in range(n + 1)])
+            graph.remove_vertex('0')
+            graph.add_edges_from([str(u + 1) for u, v in edges],
+                                 [str(v + 1) for u, v in edges])
+            waves = topological_sort_parallel(graph, "kahn", 4, waves=True,
+                                              backend=backend)
+            results.append([sorted(wave) for wave in waves])
+    assert all(result == results[0] for result in results)
+    level = {}
+    for i, wave in enumerate(results[0]):
+        for name in wave:
+            level[int(name) - 1] = i
+    assert len(level) == n
+    assert all(level[u] < level[v] for u, v in edges)
+    assert all(level[v] == 0 or any(level[u] == level[v] - 1 for u, w in edges if w == v)
+               for v in range(n))
+
+    n = 5000
+    for backend in [Backend.PYTHON, Backend.CPP]:
+        graph = Graph(implementation='csr', backend=backend)
+        graph.add_vertices_from([str(i) for i in range(n)])
+        graph.add_edges_from([str(i + 1) for i in range(n - 1)],
+                             [str(i) for i in range(n - 1)])
+        assert topological_sort_parallel(graph, "kahn", 2, backend=backend) == \
+            [str(i) for i in reversed(range(n))]
 
 
 def test_max_flow():
-    def _test_max_flow(ds, algorithm):
+    def _test_max_flow(ds, algorithm, impl=None, backend=Backend.PYTHON):
         import pydatastructs.utils.misc_util as utils
         GraphNode = getattr(utils, "Adjacency" + ds + "GraphNode")
+        impl = impl or ('adjacency_list' if ds == "List" else 'adjacency_matrix')
 
-        a = GraphNode('a')
-        b = GraphNode('b')
-        c = GraphNode('c')
-        d = GraphNode('d')
-        e = GraphNode('e')
+        a = GraphNode('a', backend=backend)
+        b = GraphNode('b', backend=backend)
+        c = GraphNode('c', backend=backend)
+        d = GraphNode('d', backend=backend)
+        e = GraphNode('e', backend=backend)
 
-        G = Graph(a, b, c, d, e)
+        G = Graph(a, b, c, d, e, implementation=impl, backend=backend)
 
         G.add_edge('a', 'b', 3)
         G.add_edge('a', 'c', 4)
@@ -492,17 +1269,17 @@ def test_max_flow():
         G.add_edge('c', 'd', 1)
         G.add_edge('d', 'e', 6)
 
-        assert max_flow(G, 'a', 'e', algorithm) == 4
-        assert max_flow(G, 'a', 'c', algorithm) == 6
+        assert max_flow(G, 'a', 'e', algorithm, backend=backend) == 4
+        assert max_flow(G, 'a', 'c', algorithm, backend=backend) == 6
 
-        a = GraphNode('a')
-        b = GraphNode('b')
-        c = GraphNode('c')
-        d = GraphNode('d')
-        e = GraphNode('e')
-        f = GraphNode('f')
+        a = GraphNode('a', backend=backend)
+        b = GraphNode('b', backend=backend)
+        c = GraphNode('c', backend=backend)
+        d = GraphNode('d', backend=backend)
+        e = GraphNode('e', backend=backend)
+        f = GraphNode('f', backend=backend)
 
-        G2 = Graph(a, b, c, d, e, f)
+        G2 = Graph(a, b, c, d, e, f, implementation=impl, backend=backend)
 
         G2.add_edge('a', 'b', 16)
         G2.add_edge('a', 'c', 13)
@@ -515,15 +1292,15 @@ def test_max_flow():
         G2.add_edge('e', 'd', 7)
         G2.add_edge('e', 'f', 4)
 
-        assert max_flow(G2, 'a', 'f', algorithm) == 23
-        assert max_flow(G2, 'a', 'd', algorithm) == 19
+        assert max_flow(G2, 'a', 'f', algorithm, backend=backend) == 23
+        assert max_flow(G2, 'a', 'd', algorithm, backend=backend) == 19
 
-        a = GraphNode('a')
-        b = GraphNode('b')
-        c = GraphNode('c')
-        d = GraphNode('d')
+        a = GraphNode('a', backend=backend)
+        b = GraphNode('b', backend=backend)
+        c = GraphNode('c', backend=backend)
+        d = GraphNode('d', backend=backend)
 
-        G3 = Graph(a, b, c, d)
+        G3 = Graph(a, b, c, d, implementation=impl, backend=backend)
 
         G3.add_edge('a', 'b', 3)
         G3.add_edge('a', 'c', 2)
@@ -531,65 +1308,232 @@ def test_max_flow():
         G3.add_edge('b', 'd', 3)
         G3.add_edge('c', 'd', 2)
 
-        assert max_flow(G3, 'a', 'd', algorithm) == 5
-        assert max_flow(G3, 'a', 'b', algorithm) == 3
-
-
-    _test_max_flow("List", "edmonds_karp")
-    _test_max_flow("Matrix", "edmonds_karp")
-    _test_max_flow("List", "dinic")
-    _test_max_flow("Matrix", "dinic")
+        assert max_flow(G3, 'a', 'd', algorithm, backend=backend) == 5
+        assert max_flow(G3, 'a', 'b', algorithm, backend=backend) == 3
+
+
+    for algorithm in ['edmonds_karp', 'dinic', 'push_relabel']:
+        for backend in [Backend.PYTHON, Backend.CPP]:
+            _test_max_flow("List", algorithm, backend=backend)
+            _test_max_flow("Matrix", algorithm, backend=backend)
+            _test_max_flow("List", algorithm, "csr", backend=backend)
+
+    import random
+    rng = random.Random(3)
+    for trial in range(20):
+        n = rng.randint(2, 30)
+        edges = {}
+        for _ in range(rng.randint(0, 4*n)):
+            u, v = rng.randrange(n), rng.randrange(n)
+            edges[(u, v)] = rng.randint(0, 9)
+        flows = set()
+        for impl in ['adjacency_list', 'csr']:
+            for backend in [Backend.PYTHON, Backend.CPP]:
+                G = Graph(implementation=impl, backend=backend)
+                G.add_vertices_from([str(i) for i in range(n)])
+                G.add_edges_from([str(u) for u, v in edges],
+                                 [str(v) for u, v in edges], list(edges.values()))
+                for algorithm in ['edmonds_karp', 'dinic', 'push_relabel']:
+                    flows.add(max_flow(G, '0', str(n - 1), algorithm, backend=backend))
+        assert len(flows) == 1
+
+    # A path longer than the recursion limit, along with a
+    # shortcut which becomes a bottleneck.
+    n = 3000
+    G = Graph(implementation='csr')
+    G.add_vertices_from([str(i) for i in range(n)])
+    G.add_edges_from([str(i) for i in range(n - 1)] + ['0'],
+                     [str(i + 1) for i in range(n - 1)] + [str(n - 1)],
+                     [5]*(n - 1) + [2])
+    for algorithm in ['edmonds_karp', 'dinic', 'push_relabel']:
+        assert max_flow(G, '0', str(n - 1), algorithm) == 7
+        assert max_flow(G, '0', '0', algorithm) == 0
+    assert raises(NotImplementedError, lambda: max_flow(G, '0', '1', 'ford_fulkerson',
+                                                        backend=Backend.CPP))
 
 
 def test_find_bridges():
-    def _test_find_bridges(ds):
+    def _test_find_bridges(ds, impl=None, backend=Backend.PYTHON):
         import pydatastructs.utils.misc_util as utils
         GraphNode = getattr(utils, "Adjacency" + ds + "GraphNode")
 
-        impl = 'adjacency_list' if ds == "List" else 'adjacency_matrix'
+        impl = impl or ('adjacency_list' if ds == "List" else 'adjacency_matrix')
+        find_bridges_ = lambda graph: find_bridges(graph, backend=backend)
 
-        v0 = GraphNode(0)
-        v1 = GraphNode(1)
-        v2 = GraphNode(2)
-        v3 = GraphNode(3)
-        v4 = GraphNode(4)
+        v0 = GraphNode('0', backend=backend)
+        v1 = GraphNode('1', backend=backend)
+        v2 = GraphNode('2', backend=backend)
+        v3 = GraphNode('3', backend=backend)
+        v4 = GraphNode('4', backend=backend)
 
-        G1 = Graph(v0, v1, v2, v3, v4, implementation=impl)
+        G1 = Graph(v0, v1, v2, v3, v4, implementation=impl, backend=backend)
         G1.add_edge(v0.name, v1.name)
         G1.add_edge(v1.name, v2.name)
         G1.add_edge(v2.name, v3.name)
         G1.add_edge(v3.name, v4.name)
 
-        bridges = find_bridges(G1)
+        bridges = find_bridges_(G1)
         expected_bridges = [('0', '1'), ('1', '2'), ('2', '3'), ('3', '4')]
         assert sorted(bridges) == sorted(expected_bridges)
 
-        u0 = GraphNode(0)
-        u1 = GraphNode(1)
-        u2 = GraphNode(2)
+        u0 = GraphNode('0', backend=backend)
+        u1 = GraphNode('1', backend=backend)
+        u2 = GraphNode('2', backend=backend)
 
-        G2 = Graph(u0, u1, u2, implementation=impl)
+        G2 = Graph(u0, u1, u2, implementation=impl, backend=backend)
         G2.add_edge(u0.name, u1.name)
         G2.add_edge(u1.name, u2.name)
         G2.add_edge(u2.name, u0.name)
 
-        bridges = find_bridges(G2)
+        bridges = find_bridges_(G2)
         assert bridges == []
 
-        w0 = GraphNode(0)
-        w1 = GraphNode(1)
-        w2 = GraphNode(2)
-        w3 = GraphNode(3)
-        w4 = GraphNode(4)
+        w0 = GraphNode('0', backend=backend)
+        w1 = GraphNode('1', backend=backend)
+        w2 = GraphNode('2', backend=backend)
+        w3 = GraphNode('3', backend=backend)
+        w4 = GraphNode('4', backend=backend)
 
-        G3 = Graph(w0, w1, w2, w3, w4, implementation=impl)
+        G3 = Graph(w0, w1, w2, w3, w4, implementation=impl, backend=backend)
         G3.add_edge(w0.name, w1.name)
         G3.add_edge(w1.name, w2.name)
         G3.add_edge(w3.name, w4.name)
 
-        bridges = find_bridges(G3)
+        bridges = find_bridges_(G3)
         expected_bridges = [('0', '1'), ('1', '2'), ('3', '4')]
         assert sorted(bridges) == sorted(expected_bridges)
 
-    _test_find_bridges("List")
-    _test_find_bridges("Matrix")
+    for backend in [Backend.PYTHON, Backend.CPP]:
+        _test_find_bridges("List", backend=backend)
+        _test_find_bridges("Matrix", backend=backend)
+        _test_find_bridges("List", impl="csr", backend=backend)
+
+def test_articulation_points_and_biconnected_components():
+
+    def _test(ds, impl=None, backend=Backend.PYTHON):
+        import pydatastructs.utils.misc_util as utils
+        GraphNode = getattr(utils, "Adjacency" + ds + "GraphNode")
+        impl = impl or ('adjacency_list' if ds == "List" else 'adjacency_matrix')
+        nodes = [GraphNode(str(i), backend=backend) for i in range(6)]
+        graph = Graph(*nodes, implementation=impl, backend=backend)
+        # Edges may be stored in either direction, or in both.
+        for u, v in [(0, 1), (1, 2), (2, 0), (3, 2), (3, 4), (4, 3)]:
+            graph.add_edge(str(u), str(v))
+        assert find_bridges(graph, backend=backend) == [('2', '3'), ('3', '4')]
+        assert find_articulation_points(graph, backend=backend) == ['2', '3']
+        comps = biconnected_components(graph, backend=backend)
+        assert sorted(map(sorted, comps)) == \
+            [['0', '1', '2'], ['2', '3'], ['3', '4']]
+
+    for backend in [Backend.PYTHON, Backend.CPP]:
+        _test("List", backend=backend)
+        _test("Matrix", backend=backend)
+        _test("List", impl="csr", backend=backend)
+
+    import random
+    rng = random.Random(17)
+    n = 150
+    edges = [(rng.randrange(n), rng.randrange(n)) for _ in range(180)]
+    results = []
+    for impl in ['adjacency_list', 'csr']:
+        for backend in [Backend.PYTHON, Backend.CPP]:
+            graph = Graph(implementation=impl, backend=backend)
+            graph.add_vertices_from([str(i) for i in range(n + 1)])
+            graph.remove_vertex('0')
+            graph.add_edges_from([str(u + 1) for u, v in edges],
+                                 [str(v + 1) for u, v in edges])
+            results.append((
+                find_bridges(graph, backend=backend),
+                find_articulation_points(graph, backend=backend),
+                sorted(map(sorted, biconnected_components(graph, backend=backend)))))
+    assert all(result == results[0] for result in results)
+    bridges, points, comps = results[0]
+    # Every bridge is a biconnected component of its own.
+    assert all(sorted(bridge) in comps for bridge in bridges)
+    # Articulation points are exactly the vertices shared by components.
+    shared = sorted({v for v in range(1, n + 1)
+                     if sum(str(v) in comp for comp in comps) > 1}, key=str)
+    assert points == [str(v) for v in shared]
+
+    # A path longer than the recursion limit.
+    n = 5000
+    for impl in ['adjacency_list', 'csr']:
+        graph = Graph(implementation=impl)
+        graph.add_vertices_from([str(i) for i in range(n)])
+        graph.add_edges_from([str(i) for i in range(n - 1)],
+                             [str(i + 1) for i in range(n - 1)])
+        assert len(find_bridges(graph)) == n - 1
+        assert len(find_articulation_points(graph)) == n - 2
+        assert len(biconnected_components(graph)) == n - 1
+
+def test_dynamic_topological_order():
+    def is_topological(graph, dto):
+        order = dto.order()
+        assert sorted(order) == sorted(graph.vertices)
+        assert all(dto.position(name) == i for i, name in enumerate(order))
+        return all(dto.position(u) < dto.position(v.name)
+                   for u in graph.vertices for v in graph.neighbors(u))
+
+    graph = Graph(*[AdjacencyListGraphNode(x) for x in 'abcde'])
+    graph.add_edge('a', 'b')
+    graph.add_edge('b', 'c', 5)
+    dto = DynamicTopologicalOrder(graph)
+    assert dto.order() == ['a', 'd', 'e', 'b', 'c']
+    dto.add_edge('e', 'a')
+    assert dto.order() == ['e', 'd', 'a', 'b', 'c']
+    dto.add_edge('c', 'd', 4)
+    assert dto.order() == ['e', 'a', 'b', 'c', 'd']
+    assert graph.get_edge('c', 'd').value == 4
+    assert raises(ValueError, lambda: dto.add_edge('d', 'e'))
+    assert raises(ValueError, lambda: dto.add_edge('b', 'b'))
+    assert not graph.is_adjacent('d', 'e')
+    assert not graph.is_adjacent('b', 'b')
+    assert dto.order() == ['e', 'a', 'b', 'c', 'd']
+    dto.add_edge('a', 'b')
+    dto.remove_edge('c', 'd')
+    dto.add_edge('d', 'e')
+    dto.add_vertex(AdjacencyListGraphNode('f'))
+    dto.add_edge('f', 'd')
+    assert is_topological(graph, dto)
+    assert dto.position('f') < dto.position('d') < dto.position('e')
+    assert raises(ValueError, lambda: dto.position('g'))
+
+    graph.add_edge('c', 'a')
+    assert raises(ValueError, lambda: DynamicTopologicalOrder(graph))
+    assert raises(NotImplementedError, lambda: DynamicTopologicalOrder(
+        Graph(AdjacencyMatrixGraphNode('a'))))
+
+    # Insertions in random order, rejected exactly when the target
+    # already reaches the source.
+    import random
+    rng = random.Random(31)
+    n = 40
+    graph = Graph()
+    graph.add_vertices_from([str(i) for i in range(n + 1)])
+    graph.remove_vertex('0')
+    dto = DynamicTopologicalOrder(graph)
+    def reaches(u, v):
+        seen, stack = {u}, [u]
+        while stack:
+            for w in graph.neighbors(stack.pop()):
+                if w.name not in seen:
+                    seen.add(w.name)
+                    stack.append(w.name)
+        return v in seen
+    for _ in range(300):
+        u, v = str(rng.randrange(n) + 1), str(rng.randrange(n) + 1)
+        if reaches(v, u):
+            assert raises(ValueError, lambda: dto.add_edge(u, v))
+            assert u == v or not graph.is_adjacent(u, v)
+        else:
+            dto.add_edge(u, v)
+        assert is_topological(graph, dto)
+
+    # Every insertion against the current order.
+    n = 500
+    graph = Graph()
+    graph.add_vertices_from([str(i) for i in range(n)])
+    dto = DynamicTopologicalOrder(graph)
+    for i in range(1, n):
+        dto.add_edge(str(i), str(i - 1))
+    assert dto.order() == [str(i) for i in reversed(range(n))]
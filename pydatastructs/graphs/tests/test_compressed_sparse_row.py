@@ -0,0 +1,209 @@
+from pydatastructs.graphs import Graph
+from pydatastructs.utils import AdjacencyListGraphNode
+from pydatastructs.utils.raises_util import raises
+from pydatastructs.utils.misc_util import Backend
+
+def test_CompressedSparseRow():
+    v_1 = AdjacencyListGraphNode('v_1', 1)
+    v_2 = AdjacencyListGraphNode('v_2', 2)
+    g = Graph(v_1, v_2, implementation='csr')
+    v_3 = AdjacencyListGraphNode('v_3', 3)
+    g.add_vertex(v_2)
+    g.add_vertex(v_3)
+    g.add_edge('v_1', 'v_2')
+    g.add_edge('v_2', 'v_3')
+    g.add_edge('v_3', 'v_1')
+    assert g.num_vertices() == 3
+    assert g.num_edges() == 3
+    assert g.is_adjacent('v_1', 'v_2') is True
+    assert g.is_adjacent('v_2', 'v_3') is True
+    assert g.is_adjacent('v_3', 'v_1') is True
+    assert g.is_adjacent('v_2', 'v_1') is False
+    assert g.is_adjacent('v_3', 'v_2') is False
+    assert g.is_adjacent('v_1', 'v_3') is False
+    assert g.neighbors('v_1') == [v_2]
+    assert g.get_edge('v_1', 'v_2') is None
+    v = AdjacencyListGraphNode('v', 4)
+    g.add_vertex(v)
+    g.add_edge('v_1', 'v', 0)
+    g.add_edge('v_2', 'v', 0)
+    g.add_edge('v_3', 'v', 0)
+    g.add_edge('v_3', 'v', 5)
+    assert g.num_edges() == 6
+    assert list(g.offsets()) == [0, 2, 4, 6, 6]
+    assert list(g.targets()) == [1, 3, 2, 3, 0, 3]
+    e1 = g.get_edge('v_1', 'v')
+    e3 = g.get_edge('v_3', 'v')
+    assert (e1.source.name, e1.target.name, e1.value) == ('v_1', 'v', 0)
+    assert (e3.source.name, e3.target.name, e3.value) == ('v_3', 'v', 5)
+    assert sorted(g.edge_weights) == ['v_1_v', 'v_2_v', 'v_3_v']
+    g.remove_edge('v_1', 'v')
+    assert g.is_adjacent('v_1', 'v') is False
+    assert g.is_adjacent('v_2', 'v') is True
+    assert list(g.offsets()) == [0, 1, 3, 5, 5]
+    g.remove_vertex('v_2')
+    assert g.vertices == ['v_1', 'v_3', 'v']
+    assert g.is_adjacent('v_3', 'v_1') is True
+    assert g.is_adjacent('v_3', 'v') is True
+    assert g.neighbors('v_1') == []
+    assert g.num_edges() == 2
+
+    assert raises(ValueError, lambda: g.add_edge('u', 'v'))
+    assert raises(ValueError, lambda: g.add_edge('v', 'x'))
+
+    v_4 = AdjacencyListGraphNode('v_4', 4, backend = Backend.CPP)
+    v_5 = AdjacencyListGraphNode('v_5', 5, backend = Backend.CPP)
+    g2 = Graph(v_4, v_5, implementation = 'csr', backend = Backend.CPP)
+    v_6 = AdjacencyListGraphNode('v_6', 6, backend = Backend.CPP)
+    assert raises(ValueError, lambda: g2.add_vertex(v_5))
+    g2.add_vertex(v_6)
+    g2.add_edge('v_4', 'v_5')
+    g2.add_edge('v_5', 'v_6')
+    g2.add_edge('v_4', 'v_6', 2)
+    g2.add_edge('v_4', 'v_6', 3)
+    assert g2._impl == 'csr'
+    assert g2.is_adjacent('v_4', 'v_5') is True
+    assert g2.is_adjacent('v_5', 'v_6') is True
+    assert g2.is_adjacent('v_4', 'v_6') is True
+    assert g2.is_adjacent('v_5', 'v_4') is False
+    assert g2.is_adjacent('v_6', 'v_4') is False
+    assert g2.num_edges() == 3
+    assert g2.num_vertices() == 3
+    assert g2.neighbors('v_4') == [v_5, v_6]
+    assert str(g2.get_edge('v_4', 'v_6')) == "('v_4', 'v_6', 3.000000)"
+    assert g2.get_edge('v_4', 'v_5') is None
+    g2.remove_edge('v_4', 'v_6')
+    assert g2.is_adjacent('v_4', 'v_6') is False
+    assert g2.num_edges() == 2
+    g2.remove_vertex('v_5')
+    assert g2.num_vertices() == 2
+    assert g2.num_edges() == 0
+    assert g2.neighbors('v_4') == []
+    assert raises(ValueError, lambda: g2.add_edge('v_4', 'v_5'))
+
+def test_CompressedSparseRow_bulk_insertion():
+    from array import array
+
+    for backend in [Backend.PYTHON, Backend.CPP]:
+        g = Graph(implementation='csr', backend=backend)
+        g.add_vertices_from(range(3))
+        g.add_vertices_from(['2', 'a'])
+        assert g.num_vertices() == 4
+        g.add_edges_from(array('q', [0, 0, 1]), (2, 1, 2))
+        g.add_edges_from(['2', '0'], ['a', '1'], array('d', [5, 1.5]))
+        assert g.num_edges() == 4
+        assert g.is_adjacent('0', '1') is True
+        assert g.is_adjacent('1', '0') is False
+        assert g.get_edge('0', '2') is None
+        assert g.get_edge('0', '1').value == 1.5
+        assert g.get_edge('2', 'a').value == 5
+        assert raises(ValueError, lambda: g.add_edges_from(['0'], ['x']))
+        assert raises(ValueError, lambda: g.add_edges_from(['0'], ['1', '2']))
+        assert g.num_edges() == 4
+
+def test_CompressedSparseRow_degrees():
+    for backend in [Backend.PYTHON, Backend.CPP]:
+        g = Graph(implementation='csr', backend=backend)
+        g.add_vertices_from(['a', 'b', 'c'])
+        g.add_edges_from(['a', 'a', 'b', 'c'], ['b', 'c', 'c', 'c'])
+        g.add_edge('a', 'b', 2)
+        assert g.num_edges() == 4
+        assert [g.degree(v) for v in 'abc'] == [2, 1, 1]
+        assert [g.in_degree(v) for v in 'abc'] == [0, 1, 3]
+        assert g.degrees().typecode == 'q'
+        assert list(g.degrees()) == [2, 1, 1]
+        assert list(g.degrees(incoming=True)) == [0, 1, 3]
+        g.remove_vertex('b')
+        assert list(g.degrees()) == [1, 1]
+        assert list(g.degrees(incoming=True)) == [0, 2]
+        assert raises(KeyError, lambda: g.degree('b'))
+
+def test_CompressedSparseRow_save_load():
+    import os, tempfile
+    from pydatastructs.utils import AdjacencyMatrixGraphNode
+    from pydatastructs import (breadth_first_search, shortest_paths,
+                               strongly_connected_components, minimum_spanning_tree)
+
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory, 'graph.bin')
+    for impl in ['adjacency_list', 'adjacency_matrix', 'csr']:
+        Node = AdjacencyMatrixGraphNode if impl == 'adjacency_matrix' \
+            else AdjacencyListGraphNode
+        names = ['v', 'é', 'u', 'w'] if impl == 'adjacency_matrix' \
+            else ['x', 'v', 'é', 'u', 'w']
+        g = Graph(*[Node(name) for name in names], implementation=impl)
+        g.add_edge('u', 'w', 2)
+        g.add_edge('u', 'v', 1)
+        g.add_edge('v', 'w', 3)
+        g.add_edge('w', 'u')
+        g.add_edge('é', 'u', 0.5)
+        if impl != 'adjacency_matrix':
+            g.add_edge('x', 'w')
+            g.remove_vertex('x')
+        g.save(path)
+        for mmap in [True, False]:
+            h = Graph.load(path, mmap=mmap)
+            assert h._impl == 'csr'
+            assert h.vertices == ['v', 'é', 'u', 'w']
+            assert h.num_edges() == 5
+            assert h.get_edge('u', 'v').value == 1
+            assert h.get_edge('é', 'u').value == 0.5
+            assert h.get_edge('w', 'u') is None and h.is_adjacent('w', 'u')
+            assert [n.name for n in h.neighbors('u')] == ['v', 'w']
+            assert shortest_paths(h, 'dijkstra', 'é')[0] == \
+                {'v': 1.5, 'é': 0, 'u': 0.5, 'w': 2.5}
+            assert sorted(map(sorted, strongly_connected_components(
+                h, 'kosaraju'))) == [['u', 'v', 'w'], ['é']]
+            # The mapped arrays are copied before the first change.
+            h.remove_edge('u', 'v')
+            h.add_vertex(AdjacencyListGraphNode('z'))
+            h.add_edge('z', 'é', 4)
+            assert h.num_edges() == 5 and not h.is_adjacent('u', 'v')
+            assert h.get_edge('z', 'é').value == 4
+            h.save(path)
+            assert Graph.load(path).edge_weights.keys() == h.edge_weights.keys()
+            g.save(path)
+
+    # Larger graphs survive the round trip and algorithms give the
+    # same results on the mapped arrays.
+    import random
+    rng = random.Random(5)
+    g = Graph(implementation='csr')
+    g.add_vertices_from(range(1000))
+    g.add_edges_from([rng.randrange(1000) for _ in range(5000)],
+                     [rng.randrange(1000) for _ in range(5000)],
+                     [rng.random() for _ in range(5000)])
+    g.save(path)
+    h = Graph.load(path)
+    assert list(h.offsets()) == list(g.offsets())
+    assert list(h.targets()) == list(g.targets())
+    assert list(h.weights()) == list(g.weights())
+    assert shortest_paths(h, 'dijkstra', '0') == shortest_paths(g, 'dijkstra', '0')
+    assert list(breadth_first_search(h, '0')[0]) == list(breadth_first_search(g, '0')[0])
+    assert minimum_spanning_tree(h, 'kruskal', as_graph=False) == \
+        minimum_spanning_tree(g, 'kruskal', as_graph=False)
+
+    with open(path, 'wb') as file:
+        file.write(b'not a graph at all, just some text')
+    assert raises(ValueError, lambda: Graph.load(path))
+    g.save(path)
+    with open(path, 'r+b') as file:
+        file.seek(8)
+        file.write(b'\x02')
+    assert raises(ValueError, lambda: Graph.load(path, mmap=False))
+    assert raises(ValueError, lambda: Graph.load(path, backend=Backend.CPP))
+
+    # Targets out of range and decreasing offsets are rejected.
+    from struct import pack
+    from pydatastructs.graphs.graph import _FORMAT
+    V = len(g.vertices)
+    for position, value in [(8*(V + 1), -1), (8*(V + 1) + 16, V),
+                            (8, g.num_edges())]:
+        g.save(path)
+        with open(path, 'r+b') as file:
+            file.seek(_FORMAT.size + position)
+            file.write(pack('<q', value))
+        for mmap in [True, False]:
+            assert raises(ValueError, lambda: Graph.load(path, mmap=mmap))
+    os.remove(path)
+    os.rmdir(directory)
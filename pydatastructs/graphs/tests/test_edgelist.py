@@ -0,0 +1,58 @@
+from io import BytesIO, StringIO
+from pydatastructs import read_edgelist
+from pydatastructs.utils.raises_util import raises
+from pydatastructs.utils.misc_util import Backend
+
+def test_read_edgelist():
+    import os, tempfile
+
+    text = "# a comment\na b 1.5\n\n  b\tc 2 extra\r\nc a -1\n  # indented\nd a 3"
+    for backend in [Backend.PYTHON, Backend.CPP]:
+        for impl in ['adjacency_list', 'csr']:
+            for chunk_size in [1, 7, 1 << 22]:
+                for file in [StringIO(text), BytesIO(text.encode())]:
+                    G = read_edgelist(file, weighted=True, implementation=impl,
+                                      chunk_size=chunk_size, backend=backend)
+                    assert G.num_vertices() == 4
+                    assert G.num_edges() == 4
+                    assert G.get_edge('a', 'b').value == 1.5
+                    assert G.get_edge('b', 'c').value == 2
+                    assert G.get_edge('c', 'a').value == -1
+                    assert G.get_edge('d', 'a').value == 3
+                    assert not G.is_adjacent('b', 'a')
+
+            G = read_edgelist(StringIO("x,y\ny,z\nx,y\n"), delimiter=',',
+                              directed=False, implementation=impl,
+                              backend=backend)
+            assert G.num_vertices() == 3
+            assert G.num_edges() == 4
+            assert G.is_adjacent('y', 'x') and G.is_adjacent('z', 'y')
+
+            assert raises(ValueError, lambda: read_edgelist(
+                StringIO("a b\nc\n"), implementation=impl, backend=backend))
+            assert raises(ValueError, lambda: read_edgelist(
+                StringIO("a b x\n"), weighted=True, implementation=impl,
+                backend=backend))
+
+    assert raises(NotImplementedError, lambda: read_edgelist(
+        StringIO("a b\n"), implementation='adjacency_matrix',
+        backend=Backend.CPP))
+
+    # Large files are read in chunks from a path and the progress
+    # is reported after each of them.
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory, 'edges.txt')
+    with open(path, 'w') as file:
+        for i in range(20000):
+            file.write("%d %d %d\n" % (i, (i*7919) % 20000, i % 13))
+    reports = []
+    G = read_edgelist(path, weighted=True, implementation='csr',
+                      chunk_size=1 << 14,
+                      progress=lambda *report: reports.append(report))
+    assert G.num_vertices() == 20000 and G.num_edges() == 20000
+    assert G.get_edge('2', '15838').value == 2
+    assert len(reports) > 1
+    assert reports[-1][:2] == (20000, os.path.getsize(path))
+    assert all(a[0] < b[0] and a[1] < b[1] for a, b in zip(reports, reports[1:]))
+    os.remove(path)
+    os.rmdir(directory)
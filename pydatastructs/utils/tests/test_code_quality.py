@@ -152,6 +152,8 @@ def _apis():
     return [
     pyds.graphs.adjacency_list.AdjacencyList,
     pyds.graphs.adjacency_matrix.AdjacencyMatrix,
+    pyds.graphs.compressed_sparse_row.CompressedSparseRow,
+    pyds.ShortestPathEngine, pyds.DynamicTopologicalOrder,
     pyds.DoublyLinkedList, pyds.SinglyLinkedList,
     pyds.SinglyCircularLinkedList,
     pyds.DoublyCircularLinkedList,
@@ -213,7 +215,8 @@ def test_backend_argument_message():
         pyds.quick_sort,
         pyds.AdjacencyListGraphNode,
         pyds.AdjacencyMatrixGraphNode,
-        pyds.GraphEdge
+        pyds.GraphEdge,
+        pyds.ShortestPathEngine
     ]
 
     def call_and_raise(api, pos_args_count=0):